@@ -35,4 +35,16 @@ proc_name = "epistemix-api"
 
 # StatsD (optional, for monitoring)
 # statsd_host = "localhost:8125"
-# statsd_prefix = "epistemix_api"
\ No newline at end of file
+# statsd_prefix = "epistemix_api"
+
+# Server hooks
+def post_fork(server, worker):  # noqa: ARG001
+    """Give each worker its own database connections.
+
+    With preload_app the application is imported (and the schema gate run) in
+    the master process, so pooled connections opened there must not be shared
+    across forked workers.
+    """
+    from epistemix_platform.repositories.database import reset_database_pools
+
+    reset_database_pools()
@@ -414,3 +414,16 @@ def test_batch_job_role_s3_policies_reference_same_bucket(template):
 
     assert expected_bucket_arn in resources
     assert expected_objects_arn in resources
+
+
+def test_job_definition_mounts_host_population_cache(template):
+    """Job definition should mount a host directory as the shared FRED population cache."""
+    container = template["Resources"]["BatchJobDefinition"]["Properties"]["ContainerProperties"]
+    env_dict = {e["Name"]: e["Value"] for e in container["Environment"]}
+
+    volume = next(v for v in container["Volumes"] if v["Name"] == "fred-population-cache")
+    mount = next(m for m in container["MountPoints"] if m["SourceVolume"] == volume["Name"])
+
+    assert mount["ContainerPath"] == env_dict["POPULATION_CACHE_DIR"]
+    assert volume["Host"]["SourcePath"] == "/var/cache/fred-populations"
+    assert mount["ReadOnly"] is False
@@ -13,8 +13,11 @@ from alembic import context
 # Add the parent directory to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-# Import our database models
-from src.epistemix_platform.repositories.database import Base
+# Import our database models (installed package first, then the source checkout)
+try:
+    from epistemix_platform.repositories.database import Base
+except ImportError:
+    from src.epistemix_platform.repositories.database import Base
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -80,7 +83,15 @@ def run_migrations_online() -> None:
     In this scenario we need to create an Engine
     and associate a connection with the context.
 
+    When the schema gate (repositories/schema.py) runs the upgrade it passes
+    its own connection via config.attributes, which is used as-is.
+
     """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations_with_connection(connection)
+        return
+
     url = get_database_url()
 
     # Configure connection pool based on database type
@@ -89,28 +100,30 @@ def run_migrations_online() -> None:
         connectable = create_engine(
             url,
             poolclass=pool.NullPool,
-            connect_args={
-                "connect_timeout": 10,
-                "application_name": "epistemix_alembic"
-            }
+            connect_args={"connect_timeout": 10, "application_name": "epistemix_alembic"},
         )
     else:
         # SQLite configuration
         connectable = create_engine(url)
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-            compare_server_default=True,
-        )
+        run_migrations_with_connection(connection)
+
+
+def run_migrations_with_connection(connection) -> None:
+    """Run migrations on an existing connection."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+        compare_server_default=True,
+    )
 
-        with context.begin_transaction():
-            context.run_migrations()
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
     run_migrations_offline()
 else:
-    run_migrations_online()
\ No newline at end of file
+    run_migrations_online()
@@ -0,0 +1,29 @@
+"""Add batch_job_id to runs
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # AWS Batch job ID captured at submission; NULL for runs submitted before this
+    # revision, which are still looked up by job name
+    op.add_column("runs", sa.Column("batch_job_id", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("runs", "batch_job_id")
@@ -0,0 +1,29 @@
+"""Add status_synced_at to runs
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Last time the run's status was read from AWS Batch; shared by all API
+    # workers so a poll inside the status TTL is served from the database
+    op.add_column("runs", sa.Column("status_synced_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("runs", "status_synced_at")
@@ -0,0 +1,27 @@
+"""Index runs.batch_job_id
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Batch state-change events identify runs by their AWS Batch job ID
+    op.create_index(op.f("ix_runs_batch_job_id"), "runs", ["batch_job_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_runs_batch_job_id"), table_name="runs")
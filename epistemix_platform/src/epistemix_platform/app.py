@@ -8,13 +8,17 @@ Flask app that implements the Epistemix API based on the Pact contract.
 This app follows Clean Architecture principles with proper separation of concerns.
 """
 
+import hmac
+import json
 import logging
 import os
 import sys
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from functools import wraps
+from typing import Any
 
-from flask import Flask, g, jsonify, request
+from flask import Flask, Response, g, jsonify, request, stream_with_context
 from flask_cors import CORS
 from pydantic import ValidationError
 from returns.pipeline import is_successful
@@ -28,7 +32,7 @@ from epistemix_platform.models.requests import (
     SubmitJobRequest,
     SubmitRunsRequest,
 )
-from epistemix_platform.repositories.database import get_database_manager
+from epistemix_platform.repositories.database import get_database_manager, get_pool_metrics
 from epistemix_platform.utils.get_default_job_controller import create_job_controller
 
 
@@ -61,6 +65,7 @@ def health_check():
             "status": "healthy",
             "service": "epistemix-api",
             "timestamp": datetime.utcnow().isoformat(),
+            "databasePools": get_pool_metrics(),
         }
     ), 200
 
@@ -90,43 +95,66 @@ def handle_general_exception(e):
     return jsonify({"error": "Internal server error"}), 500
 
 
-@app.before_request
-def before_request():
-    """Initialize database session for each request."""
-    database_url = app.config["DATABASE_URL"]
-    db_manager = get_database_manager(database_url)
+def init_database():
+    """
+    Run the one-time schema gate for the configured database.
+
+    The gate (create, verify or migrate, per DATABASE_SCHEMA_MODE) runs once per
+    process; later calls only return the shared DatabaseManager.
+    """
+    db_manager = get_database_manager(app.config["DATABASE_URL"])
+    db_manager.ensure_schema(
+        mode=app.config["DATABASE_SCHEMA_MODE"],
+        script_location=app.config["ALEMBIC_SCRIPT_LOCATION"],
+    )
+    return db_manager
 
-    # TODO: Remove create_tables() in favor of Alembic migrations for production
-    # Note: create_all() is idempotent - only creates tables that don't exist
-    # Safe for SQLite testing but should use proper migrations in production
-    db_manager.create_tables()
 
+@app.before_request
+def before_request():
+    """Bind the request to the worker's scoped database session."""
+    db_manager = init_database()
+    g.db_manager = db_manager
     g.db_session = db_manager.get_session()
 
 
 @app.teardown_appcontext
 def close_db_session(error):
-    """Close database session after each request."""
+    """Commit or roll back the request's session and release it back to the pool."""
     db_session = getattr(g, "db_session", None)
     if db_session is not None:
-        if error:
-            db_session.rollback()
-        else:
-            try:
-                db_session.commit()
-            except Exception:
+        try:
+            if error:
                 db_session.rollback()
-                raise
-        db_session.close()
+            else:
+                try:
+                    db_session.commit()
+                except Exception:
+                    db_session.rollback()
+                    raise
+        finally:
+            g.db_manager.remove_session()
 
 
 def get_job_controller():
-    """Get a JobController instance with the current request's database session."""
+    """Get a JobController instance bound to the current request's scoped session."""
     return create_job_controller(
-        session_factory=lambda: g.db_session,
+        session_factory=g.db_manager.get_session,
         environment=app.config["ENVIRONMENT"],
         bucket_name=app.config["S3_UPLOAD_BUCKET"],
         region_name=app.config["AWS_REGION"],
+        batch_submit_concurrency=app.config["BATCH_SUBMIT_CONCURRENCY"],
+        batch_submission_mode=app.config["BATCH_SUBMISSION_MODE"],
+        run_status_ttl_seconds=app.config["RUN_STATUS_CACHE_TTL"],
+        sync_run_status_on_read=app.config["RUN_STATUS_SYNC_ON_READ"],
+        results_upload_part_size=app.config["RESULTS_UPLOAD_PART_SIZE_MB"] * 1024 * 1024,
+        results_upload_concurrency=app.config["RESULTS_UPLOAD_CONCURRENCY"],
+        results_upload_checkpoint_dir=app.config["RESULTS_UPLOAD_CHECKPOINT_DIR"],
+        results_compression_workers=app.config["RESULTS_COMPRESSION_WORKERS"],
+        presigned_url_cache_size=app.config["PRESIGNED_URL_CACHE_SIZE"],
+        presigned_url_cache_headroom=app.config["PRESIGNED_URL_CACHE_HEADROOM"],
+        archive_concurrency=app.config["ARCHIVE_CONCURRENCY"],
+        archive_batch_operations_threshold=app.config["ARCHIVE_BATCH_OPERATIONS_THRESHOLD"],
     )
 
 
@@ -149,12 +177,13 @@ def require_headers(*headers):
     return decorator
 
 
-def require_json(content_type="application/json"):
+def require_json(content_type="application/json", ignore_parameters=False):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Validate content type
-            if request.headers.get("content-type") != content_type:
+            # Validate content type (optionally ignoring parameters such as charset)
+            actual = request.mimetype if ignore_parameters else request.headers.get("content-type")
+            if actual != content_type:
                 return jsonify({"error": f"Content-Type must be {content_type}"}), 400
 
             # Get and validate JSON data
@@ -186,6 +215,22 @@ def inject_user_token():
     return decorator
 
 
+# Items serialized per chunk of a streamed JSON array
+STREAM_CHUNK_ITEMS = 500
+
+
+def _stream_json_array(field: str, items: Iterable[Any]) -> Iterator[str]:
+    """Yield the JSON document {field: [items...]} in chunks as items are produced."""
+    yield f"{{{json.dumps(field)}: ["
+    chunk = []
+    for index, item in enumerate(items):
+        chunk.append(("," if index else "") + json.dumps(item))
+        if len(chunk) >= STREAM_CHUNK_ITEMS:
+            yield "".join(chunk)
+            chunk = []
+    yield "".join(chunk) + "]}"
+
+
 @app.route("/jobs/register", methods=["POST"])
 @require_headers("Offline-Token", "content-type", "fredcli-version", "user-agent")
 @require_json("application/json")
@@ -301,6 +346,8 @@ def get_job_results():
     Returns a JSON response with presigned S3 URLs for all runs associated with the job.
 
     This endpoint batch-generates presigned URLs by reconstructing S3 keys from job metadata.
+    The {"urls": [...]} body is streamed as the URLs are signed, so jobs with
+    thousands of runs start responding immediately and are never held in memory.
     """
     job_id = request.args.get("job_id")
     if not job_id:
@@ -315,7 +362,7 @@ def get_job_results():
     bucket_name = app.config["S3_UPLOAD_BUCKET"]
 
     # Batch operation: generate presigned URLs for all runs
-    result = job_controller.get_run_results_download(
+    result = job_controller.stream_run_results_download(
         job_id=job_id,
         bucket_name=bucket_name,
     )
@@ -325,8 +372,92 @@ def get_job_results():
         logger.warning(f"Business logic error in get job results: {error_message}")
         return jsonify({"error": error_message}), 400
 
-    urls = result.unwrap()
-    return jsonify({"urls": urls}), 200
+    return Response(
+        stream_with_context(_stream_json_array("urls", result.unwrap())),
+        status=200,
+        mimetype="application/json",
+    )
+
+
+@app.route("/jobs/results/columns", methods=["GET"])
+@require_headers("Offline-Token", "Fredcli-Version")
+def get_job_result_columns():
+    """
+    Read a run's Parquet results without downloading the results ZIP.
+
+    Without a table parameter, lists the run's tables and their columns.
+    With one, returns the requested columns (comma-separated, default all)
+    for the days between start_day and end_day (inclusive), read from S3 with
+    byte-range requests.
+    """
+    params = {}
+    for name in ("job_id", "run_id", "start_day", "end_day"):
+        value = request.args.get(name)
+        if value is None:
+            params[name] = None
+            continue
+        try:
+            params[name] = int(value)
+        except ValueError:
+            return jsonify({"error": f"Invalid {name} parameter"}), 400
+    if params["job_id"] is None or params["run_id"] is None:
+        return jsonify({"error": "Missing job_id or run_id parameter"}), 400
+
+    table = request.args.get("table")
+    columns = request.args.get("columns")
+
+    job_controller = get_job_controller()
+    if table is None:
+        result = job_controller.get_run_columnar_tables(
+            job_id=params["job_id"], run_id=params["run_id"]
+        )
+    else:
+        result = job_controller.read_run_columns(
+            job_id=params["job_id"],
+            run_id=params["run_id"],
+            table=table,
+            columns=columns.split(",") if columns else None,
+            start_day=params["start_day"],
+            end_day=params["end_day"],
+        )
+
+    if not is_successful(result):
+        error_message = result.failure()
+        logger.warning(f"Business logic error in get job result columns: {error_message}")
+        return jsonify({"error": error_message}), 400
+
+    key = "tables" if table is None else "columns"
+    return jsonify({key: result.unwrap()}), 200
+
+
+@app.route("/events/batch", methods=["POST"])
+@require_headers("X-Events-Token", "content-type")
+# EventBridge API destinations send "application/json; charset=utf-8"
+@require_json(ignore_parameters=True)
+def ingest_batch_events(json_data):
+    """
+    Apply AWS Batch job state-change events to runs.
+
+    Receives EventBridge "Batch Job State Change" events (one event or a list)
+    from an API destination, authenticated with a shared token.
+    """
+    expected_token = app.config["BATCH_EVENTS_TOKEN"]
+    if not expected_token:
+        return jsonify({"error": "Batch event ingestion is not enabled"}), 404
+    if not hmac.compare_digest(request.headers["X-Events-Token"], expected_token):
+        return jsonify({"error": "Invalid X-Events-Token header"}), 403
+
+    events = json_data if isinstance(json_data, list) else [json_data]
+
+    job_controller = get_job_controller()
+    result = job_controller.ingest_batch_events(events)
+
+    if not is_successful(result):
+        error_message = result.failure()
+        logger.warning(f"Business logic error in ingest batch events: {error_message}")
+        return jsonify({"error": error_message}), 400
+
+    return jsonify(result.unwrap()), 200
 
 
 @app.route("/", methods=["GET"])
@@ -344,6 +475,8 @@ def root():
                     "POST /runs": "Submit run requests",
                     "GET /runs": "Get runs by job_id",
                     "GET /jobs/results": "Get URLs for runs by job_id",
+                    "GET /jobs/results/columns": "Read columns of a run's Parquet results",
+                    "POST /events/batch": "Ingest AWS Batch job state-change events",
                 },
             }
         ),
@@ -12,28 +12,36 @@ Usage:
     epistemix jobs upload --location=<upload-location>  # Read upload contents
 """
 
+import csv
 import json
 import logging
 import os
 import sys
 import tempfile
+import time
+from datetime import datetime
 from pathlib import Path
 
 import click
 from dotenv import load_dotenv
 from returns.pipeline import is_successful
 
-from epistemix_platform.config import config
+from epistemix_platform.config import get_config
 from epistemix_platform.controllers.job_controller import JobController
 from epistemix_platform.mappers.job_mapper import JobMapper
 from epistemix_platform.mappers.run_mapper import RunMapper
 from epistemix_platform.repositories.database import get_database_manager
 from epistemix_platform.repositories.job_repository import SQLAlchemyJobRepository
 from epistemix_platform.repositories.run_repository import SQLAlchemyRunRepository
+from epistemix_platform.use_cases.download_uploads import DEFAULT_DOWNLOAD_CONCURRENCY
 from epistemix_platform.use_cases.get_job import get_job
 from epistemix_platform.use_cases.get_runs import get_runs_by_job_id
 from epistemix_platform.use_cases.list_jobs import list_jobs
-from epistemix_platform.utils.get_default_job_controller import create_job_controller
+from epistemix_platform.use_cases.reconcile_run_statuses import DEFAULT_RECONCILE_BATCH_SIZE
+from epistemix_platform.utils.batch_event_fixtures import generate_batch_job_events
+from epistemix_platform.utils.get_default_job_controller import (
+    create_job_controller_from_config,
+)
 
 
 # Load configuration from ~/.epistemix/cli.env if it exists
@@ -52,35 +60,34 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def get_config():
+def get_database_manager_for_cli():
     """
-    Get application configuration based on environment.
+    Get the process-wide database manager after running the schema gate once.
 
     Returns:
-        Config class instance (DevelopmentConfig, StagingConfig, or ProductionConfig)
+        DatabaseManager for the configured database URL
     """
-    # Check ENVIRONMENT first (matches Sceptre stack groups),
-    # then FLASK_ENV for backward compatibility
-    env_name = os.getenv("ENVIRONMENT") or os.getenv("FLASK_ENV", "development")
-    return config.get(env_name, config["default"])
+    config_class = get_config()
+    db_manager = get_database_manager(config_class.get_database_url())
+    db_manager.ensure_schema(
+        mode=config_class.DATABASE_SCHEMA_MODE,
+        script_location=config_class.ALEMBIC_SCRIPT_LOCATION,
+    )
+    return db_manager
 
 
 def get_database_session():
     """
-    Get a new database session.
+    Get the database session for the current command.
 
-    Each command gets its own session that should be closed after use.
-    This prevents "Session is closed" errors when multiple commands are run.
+    Sessions come from the process-wide scoped registry, so every call made
+    while a command runs (including the one inside get_job_controller) returns
+    the same session and shares one unit of work.
 
     Returns:
         SQLAlchemy session instance
     """
-    config_class = get_config()
-    database_url = config_class.get_database_url()
-    db_manager = get_database_manager(database_url)
-    # TODO: Remove create_tables() in favor of Alembic migrations for production
-    # Note: create_all() is idempotent - only creates tables that don't exist
-    db_manager.create_tables()
+    db_manager = get_database_manager_for_cli()
     return db_manager.get_session()
 
 
@@ -88,8 +95,8 @@ def get_job_controller() -> JobController:
     """
     Get a new JobController instance.
 
-    Each command gets its own controller with a fresh database session.
-    The session should be closed after the command completes.
+    The controller's repositories use the scoped session from the process-wide
+    registry, which is the same session get_database_session() returns.
 
     Returns:
         Configured JobController instance
@@ -97,16 +104,11 @@ def get_job_controller() -> JobController:
     # Get configuration class
     config_class = get_config()
 
-    # Get database session
-    session = get_database_session()
+    # Get the process-wide database manager (engine is built once per process)
+    db_manager = get_database_manager_for_cli()
 
     # Create and return JobController using shared factory
-    return create_job_controller(
-        session_factory=lambda: session,
-        environment=config_class.ENVIRONMENT,
-        bucket_name=config_class.S3_UPLOAD_BUCKET,
-        region_name=config_class.AWS_REGION,
-    )
+    return create_job_controller_from_config(config_class, db_manager.get_session)
 
 
 def format_job_uploads(uploads: list) -> str:
@@ -431,7 +433,12 @@ def job_uploads():
 @job_uploads.command("list")
 @click.option("--job-id", required=True, type=int, help="Job ID to get uploads for")
 @click.option("--json-output", is_flag=True, help="Output as JSON")
-def list_job_uploads(job_id: int, json_output: bool):
+@click.option(
+    "--content",
+    is_flag=True,
+    help="Include content previews (ZIP entries are read with byte-range requests)",
+)
+def list_job_uploads(job_id: int, json_output: bool, content: bool):
     """List sanitized S3 URLs for all uploads of a job and its runs."""
     session = None
     try:
@@ -443,8 +450,8 @@ def list_job_uploads(job_id: int, json_output: bool):
         env = config_class.ENVIRONMENT
         bucket_name = config_class.S3_UPLOAD_BUCKET
 
-        # Get uploads WITHOUT content (just metadata and sanitized URLs)
-        result = job_controller.get_job_uploads(job_id=job_id, include_content=False)
+        # Get uploads with sanitized URLs, and content previews only if requested
+        result = job_controller.get_job_uploads(job_id=job_id, include_content=content)
 
         if not is_successful(result):
             click.echo(f"Error: {result.failure()}", err=True)
@@ -482,6 +489,11 @@ def list_job_uploads(job_id: int, json_output: bool):
                         prefix = f"[{context}_{upload_type}]"
 
                     click.echo(f"{prefix} {sanitized_url}")
+                    if "content" in upload:
+                        for line in upload["content"]["content"].splitlines():
+                            click.echo(f"    {line}")
+                    elif "error" in upload:
+                        click.echo(f"    [Could not read content: {upload['error']}]")
 
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
@@ -545,12 +557,107 @@ def archive_uploads(
         sys.exit(1)
 
 
+@job_uploads.command("archive-old")
+@click.option(
+    "--job-id",
+    "job_ids",
+    type=int,
+    multiple=True,
+    help="Job ID to archive (repeatable; defaults to all jobs)",
+)
+@click.option("--days-since-create", type=int, help="Archive objects older than specified days")
+@click.option("--hours-since-create", type=int, help="Archive objects older than specified hours")
+@click.option("--dry-run", is_flag=True, help="Show what would be archived without making changes")
+@click.option("--json-output", is_flag=True, help="Output as JSON")
+def archive_old_uploads(
+    job_ids: tuple[int, ...],
+    days_since_create: int | None,
+    hours_since_create: int | None,
+    dry_run: bool,
+    json_output: bool,
+):
+    """Archive every stored object of old jobs to Glacier in one sweep.
+
+    Job prefixes are listed in S3, so no per-object requests are needed to find
+    old objects. Very large sweeps are written to an S3 Batch Operations
+    manifest instead of being copied one by one.
+
+    Examples:
+
+        # Archive everything of all jobs older than 90 days
+        epistemix-cli jobs uploads archive-old --days-since-create 90
+
+        # Preview archiving two jobs
+        epistemix-cli jobs uploads archive-old --job-id 12 --job-id 13 --dry-run
+    """
+    try:
+        config_class = get_config()
+        env = config_class.ENVIRONMENT
+
+        if env == "staging":
+            click.echo("Error: Cannot archive uploads in TESTING mode", err=True)
+            sys.exit(1)
+
+        job_controller = get_job_controller()
+
+        result = job_controller.archive_old_uploads(
+            job_ids=list(job_ids) or None,
+            days_since_create=days_since_create,
+            hours_since_create=hours_since_create,
+            dry_run=dry_run,
+        )
+
+        if not is_successful(result):
+            click.echo(f"Error: {result.failure()}", err=True)
+            sys.exit(1)
+
+        sweep = result.unwrap()
+
+        if json_output:
+            click.echo(json.dumps(sweep, indent=2))
+            return
+
+        action = "Would archive" if dry_run else "Archived"
+        prefixes = ", ".join(sweep["prefixes"])
+        click.echo(f"{action} {len(sweep['archived'])} objects under {prefixes}")
+        click.echo(f"  Already archived: {sweep['alreadyArchived']}")
+        click.echo(f"  Too recent: {sweep['tooRecent']}")
+        if sweep["manifestUrl"]:
+            click.echo(
+                f"\nListed {len(sweep['manifested'])} objects in the S3 Batch Operations manifest "
+                f"{sweep['manifestUrl']} (ETag {sweep['manifestEtag']})."
+            )
+            click.echo("Create a Batch Operations copy job with storage class GLACIER from it.")
+        for error in sweep["errors"]:
+            click.echo(f"  Error: {error}", err=True)
+        if sweep["errors"]:
+            sys.exit(1)
+
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
 @job_uploads.command("download")
 @click.option("--job-id", required=True, type=int, help="Job ID to download uploads for")
 @click.option("--output-dir", help="Directory to download files to (defaults to temp directory)")
 @click.option("-f", "--force", is_flag=True, help="Force overwrite existing files")
-def download_job_uploads(job_id: int, output_dir: str | None, force: bool):
-    """Download all uploads for a job to a local directory."""
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_DOWNLOAD_CONCURRENCY,
+    show_default=True,
+    help="Maximum number of files downloaded at once",
+)
+def download_job_uploads(job_id: int, output_dir: str | None, force: bool, concurrency: int):
+    """Download all uploads for a job to a local directory.
+
+    Files are streamed to disk concurrently. With --force, files unchanged in
+    S3 since their last download (same ETag) are kept instead of re-downloaded.
+    """
     try:
         # Get the singleton JobController
         job_controller = get_job_controller()
@@ -567,27 +674,33 @@ def download_job_uploads(job_id: int, output_dir: str | None, force: bool):
         if not force:
             click.echo("(Use -f/--force to overwrite existing files)")
 
-        # Download uploads using the controller
-        result = job_controller.download_job_uploads(
-            job_id=job_id, base_path=base_path, should_force=force
+        # Stream uploads to disk using the controller
+        result = job_controller.stream_job_uploads(
+            job_id=job_id, base_path=base_path, should_force=force, max_concurrency=concurrency
         )
 
         if not is_successful(result):
             click.echo(f"Error: {result.failure()}", err=True)
             sys.exit(1)
 
-        download_path = result.unwrap()
+        outcome = result.unwrap()
+        click.echo(f"\nSuccessfully downloaded {len(outcome['downloaded'])} files to:")
+        click.echo(f"  {base_path}")
 
-        # List downloaded files
-        downloaded_files = list(Path(download_path).iterdir())
-        click.echo(f"\nSuccessfully downloaded {len(downloaded_files)} files to:")
-        click.echo(f"  {download_path}")
-
-        if downloaded_files:
+        if outcome["downloaded"]:
             click.echo("\nDownloaded files:")
-            for file_path in downloaded_files:
-                file_size = file_path.stat().st_size
-                click.echo(f"  - {file_path.name} ({file_size} bytes)")
+            for file_path in map(Path, outcome["downloaded"]):
+                click.echo(f"  - {file_path.name} ({file_path.stat().st_size} bytes)")
+        if outcome["unchanged"]:
+            click.echo("\nUnchanged files (already up to date):")
+            for file_path in map(Path, outcome["unchanged"]):
+                click.echo(f"  - {file_path.name}")
+        if outcome["skipped"]:
+            click.echo("\nSkipped existing files:")
+            for file_path in map(Path, outcome["skipped"]):
+                click.echo(f"  - {file_path.name}")
+        for error in outcome["errors"]:
+            click.echo(f"Warning: {error}", err=True)
 
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
@@ -612,15 +725,21 @@ def job_results():
     type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
     help="Directory containing FRED simulation output",
 )
-def upload_results(job_id: int, run_id: int, results_dir: Path):
+@click.option(
+    "--columnar-dir",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Directory of Parquet results and manifest.json to upload next to the ZIP",
+)
+def upload_results(job_id: int, run_id: int, results_dir: Path, columnar_dir: Path | None):
     """Upload FRED simulation results to S3 as a ZIP file.
 
     This command:
     1. Validates the results directory contains FRED output (RUN* directories)
     2. Creates a ZIP file preserving the directory structure with RUN*/ at root
     3. Uploads the ZIP to S3 using a presigned URL
-    4. Updates the run record with the results URL and timestamp
-    5. Marks the run as DONE
+    4. Uploads Parquet results next to the ZIP, if --columnar-dir is given
+    5. Updates the run record with the results URL and timestamp
+    6. Marks the run as DONE
 
     The results directory can be either:
     - Parent directory containing RUN* subdirectories: $WORKSPACE_DIR/OUT/run_4/
@@ -646,7 +765,7 @@ def upload_results(job_id: int, run_id: int, results_dir: Path):
 
         # Upload results using the controller
         result = job_controller.upload_results_from_directory(
-            job_id=job_id, run_id=run_id, results_dir=results_dir
+            job_id=job_id, run_id=run_id, results_dir=results_dir, columnar_dir=columnar_dir
         )
 
         if not is_successful(result):
@@ -691,6 +810,283 @@ def upload_results(job_id: int, run_id: int, results_dir: Path):
             session.close()
 
 
+@job_results.command("columns")
+@click.option("--job-id", required=True, type=int, help="Job ID the run belongs to")
+@click.option("--run-id", required=True, type=int, help="Run ID to read results for")
+@click.option("--table", help="Table to read, e.g. RUN1/out (omit to list tables)")
+@click.option("--column", "columns", multiple=True, help="Column to read (repeatable; default all)")
+@click.option("--start-day", type=int, help="First simulation day to include")
+@click.option("--end-day", type=int, help="Last simulation day to include")
+@click.option("--json-output", is_flag=True, help="Output as JSON instead of CSV")
+def read_result_columns(
+    job_id: int,
+    run_id: int,
+    table: str | None,
+    columns: tuple[str, ...],
+    start_day: int | None,
+    end_day: int | None,
+    json_output: bool,
+):
+    """Read columns or day ranges of a run's Parquet results.
+
+    Reads only the requested column chunks of the row groups covering the
+    day range from S3, with byte-range requests, instead of downloading the
+    results ZIP. Runs only have Parquet results if the simulation runner
+    converted them (COLUMNAR_RESULTS=true).
+
+    Examples:
+        # List tables and columns
+        epistemix-cli jobs results columns --job-id 12 --run-id 4
+
+        # Two columns for the first 30 days, as CSV
+        epistemix-cli jobs results columns --job-id 12 --run-id 4 --table RUN1/out \\
+            --column Day --column Influenza.newExposed --start-day 0 --end-day 29
+    """
+    session = None
+    try:
+        job_controller = get_job_controller()
+        session = get_database_session()
+
+        if table is None:
+            result = job_controller.get_run_columnar_tables(job_id=job_id, run_id=run_id)
+        else:
+            result = job_controller.read_run_columns(
+                job_id=job_id,
+                run_id=run_id,
+                table=table,
+                columns=list(columns) or None,
+                start_day=start_day,
+                end_day=end_day,
+            )
+
+        if not is_successful(result):
+            click.echo(f"Error: {result.failure()}", err=True)
+            sys.exit(1)
+
+        data = result.unwrap()
+        if json_output:
+            click.echo(json.dumps(data, indent=2))
+        elif table is None:
+            for name, info in data.items():
+                click.echo(f"{name} ({info['rows']} rows): {', '.join(info['columns'])}")
+        else:
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(data.keys())
+            writer.writerows(zip(*data.values(), strict=True))
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    finally:
+        if session:
+            session.close()
+
+
+@cli.group()
+def runs():
+    """Commands for managing runs."""
+    pass
+
+
+def reconcile_sweep(batch_size: int) -> dict:
+    """
+    Sync every non-terminal run with AWS Batch once, one committed batch at a time.
+
+    Args:
+        batch_size: Maximum number of runs synced (and committed) per batch
+
+    Returns:
+        Totals for the sweep: runs swept and changed, the worst status lag
+        observed, batches and duration
+    """
+    sweep_started = datetime.utcnow()
+    started = time.monotonic()
+    totals = {"swept": 0, "changed": 0, "max_lag_seconds": 0.0, "batches": 0}
+    db_manager = get_database_manager_for_cli()
+
+    while True:
+        job_controller = get_job_controller()
+        session = db_manager.get_session()
+        try:
+            result = job_controller.reconcile_run_statuses(
+                batch_size=batch_size, synced_before=sweep_started
+            )
+            if not is_successful(result):
+                session.rollback()
+                raise RuntimeError(result.failure())
+            session.commit()
+        finally:
+            db_manager.remove_session()
+
+        batch = result.unwrap()
+        totals["swept"] += batch["swept"]
+        totals["changed"] += batch["changed"]
+        totals["max_lag_seconds"] = max(totals["max_lag_seconds"], batch["max_lag_seconds"])
+        totals["batches"] += 1
+        if batch["swept"] < batch_size:
+            break
+
+    totals["duration_seconds"] = round(time.monotonic() - started, 3)
+    return totals
+
+
+@runs.command("reconcile")
+@click.option("--loop", is_flag=True, help="Keep sweeping until interrupted")
+@click.option(
+    "--interval",
+    type=float,
+    default=30.0,
+    show_default=True,
+    help="Seconds between the start of consecutive sweeps with --loop",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_RECONCILE_BATCH_SIZE,
+    show_default=True,
+    help="Runs synced and committed per batch",
+)
+@click.option("--json-output", is_flag=True, help="Output one JSON object per sweep")
+def reconcile_runs(loop: bool, interval: float, batch_size: int, json_output: bool):
+    """Sync non-terminal run statuses with AWS Batch.
+
+    Sweeps every run that AWS Batch may still move (least recently synced
+    first), reading statuses in bulk and saving them in batches. Run it with
+    --loop as a long-lived service and set RUN_STATUS_SYNC_ON_READ=false so
+    GET /runs only reads the database.
+
+    Each sweep reports how many runs were swept and changed and the largest
+    status lag (seconds since a run was last synced) seen before the sweep.
+
+    Examples:
+        epistemix-cli runs reconcile
+        epistemix-cli runs reconcile --loop --interval 15 --json-output
+    """
+    try:
+        while True:
+            started = time.monotonic()
+            try:
+                totals = reconcile_sweep(batch_size)
+            except Exception:
+                if not loop:
+                    raise
+                # A long-lived reconciler outlives transient AWS or database errors
+                logger.exception("Run status reconciliation sweep failed")
+            else:
+                if json_output:
+                    click.echo(json.dumps(totals))
+                else:
+                    click.echo(
+                        f"Reconciled {totals['swept']} runs ({totals['changed']} changed) in "
+                        f"{totals['duration_seconds']:.1f}s, "
+                        f"max status lag {totals['max_lag_seconds']:.1f}s"
+                    )
+
+            if not loop:
+                break
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    except KeyboardInterrupt:
+        click.echo("Reconciler stopped", err=True)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@runs.group("events")
+def run_events():
+    """Commands for AWS Batch job state-change events."""
+    pass
+
+
+def read_batch_events(path: Path) -> list[dict]:
+    """Read events from a file holding one JSON event, a JSON list, or JSON lines."""
+    text = path.read_text()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    return data if isinstance(data, list) else [data]
+
+
+@run_events.command("replay")
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=500,
+    show_default=True,
+    help="Events applied and committed per transaction",
+)
+@click.option("--json-output", is_flag=True, help="Output the event counts as JSON")
+def replay_batch_events(files: tuple[Path, ...], chunk_size: int, json_output: bool):
+    """Apply recorded AWS Batch state-change events to runs.
+
+    Replays events captured from EventBridge (or generated with
+    `runs events fixture`) through the same ingestion path as
+    POST /events/batch. Replaying is idempotent: stale and duplicate events
+    are ignored.
+
+    Examples:
+        epistemix-cli runs events replay events.jsonl
+        epistemix-cli runs events replay archive/*.json --chunk-size 1000
+    """
+    try:
+        events = [event for path in files for event in read_batch_events(path)]
+        db_manager = get_database_manager_for_cli()
+
+        totals = {"received": 0, "applied": 0, "ignored": 0, "invalid": 0}
+        for offset in range(0, len(events), chunk_size):
+            job_controller = get_job_controller()
+            session = db_manager.get_session()
+            try:
+                result = job_controller.ingest_batch_events(events[offset : offset + chunk_size])
+                if not is_successful(result):
+                    session.rollback()
+                    raise RuntimeError(result.failure())
+                session.commit()
+            finally:
+                db_manager.remove_session()
+
+            for key, count in result.unwrap().items():
+                totals[key] += count
+
+        if json_output:
+            click.echo(json.dumps(totals))
+        else:
+            click.echo(
+                f"Replayed {totals['received']} events: {totals['applied']} applied, "
+                f"{totals['ignored']} ignored, {totals['invalid']} invalid"
+            )
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@run_events.command("fixture")
+@click.option("--job-id", required=True, type=int, help="Job ID the runs belong to")
+@click.option(
+    "--run-id", "run_ids", required=True, type=int, multiple=True, help="Run ID (repeatable)"
+)
+@click.option("--failure-rate", type=click.FloatRange(0.0, 1.0), default=0.0, show_default=True)
+@click.option("--shuffle", is_flag=True, help="Shuffle events to mimic out-of-order delivery")
+@click.option("--seed", type=int, help="Seed for reproducible output")
+def generate_batch_events_fixture(
+    job_id: int, run_ids: tuple[int, ...], failure_rate: float, shuffle: bool, seed: int | None
+):
+    """Print synthetic AWS Batch state-change events as JSON lines.
+
+    Examples:
+        epistemix-cli runs events fixture --job-id 12 --run-id 1 --run-id 2 > events.jsonl
+    """
+    events = generate_batch_job_events(
+        job_id, list(run_ids), failure_rate=failure_rate, shuffle=shuffle, seed=seed
+    )
+    for event in events:
+        click.echo(json.dumps(event))
+
+
 @cli.command("version")
 def version():
     """Show CLI version."""
@@ -3,9 +3,17 @@ Configuration settings for the Epistemix API Flask app.
 """
 
 import os
+import tempfile
+from pathlib import Path
 from typing import Any
 
 
+def _source_tree_migrations() -> str | None:
+    """Migrations directory of a source checkout; None when installed from a PEX or wheel."""
+    migrations = Path(__file__).resolve().parents[2] / "migrations"
+    return str(migrations) if migrations.is_dir() else None
+
+
 class Config:
     """Base configuration class."""
 
@@ -52,6 +60,61 @@ class Config:
     DATABASE_MAX_OVERFLOW = int(os.environ.get("DATABASE_MAX_OVERFLOW", "20"))
     DATABASE_POOL_TIMEOUT = int(os.environ.get("DATABASE_POOL_TIMEOUT", "30"))
 
+    # Maximum concurrent AWS Batch submit_job calls per POST /runs request
+    BATCH_SUBMIT_CONCURRENCY = int(os.environ.get("BATCH_SUBMIT_CONCURRENCY", "16"))
+
+    # "per-run" submits one Batch job per run; "array" submits one array job per job
+    BATCH_SUBMISSION_MODE = os.environ.get("BATCH_SUBMISSION_MODE", "per-run")
+
+    # Seconds a non-terminal run status read from AWS Batch is served from the
+    # database before GET /runs asks Batch again; 0 asks on every poll
+    RUN_STATUS_CACHE_TTL = float(os.environ.get("RUN_STATUS_CACHE_TTL", "10"))
+
+    # Set to "false" when `epistemix-cli runs reconcile --loop` keeps run statuses
+    # current, so GET /runs only reads the database
+    RUN_STATUS_SYNC_ON_READ = os.environ.get("RUN_STATUS_SYNC_ON_READ", "true").lower() == "true"
+
+    # Shared secret EventBridge sends in the X-Events-Token header when delivering
+    # Batch job state-change events to POST /events/batch; unset disables the endpoint
+    BATCH_EVENTS_TOKEN = os.environ.get("BATCH_EVENTS_TOKEN", "")
+
+    # Results ZIPs are uploaded to S3 in parts of this many MiB (minimum 5), with up
+    # to RESULTS_UPLOAD_CONCURRENCY parts in flight
+    RESULTS_UPLOAD_PART_SIZE_MB = int(os.environ.get("RESULTS_UPLOAD_PART_SIZE_MB", "16"))
+    RESULTS_UPLOAD_CONCURRENCY = int(os.environ.get("RESULTS_UPLOAD_CONCURRENCY", "8"))
+
+    # Where multipart upload progress is checkpointed so a failed results upload
+    # resumes on retry; empty aborts failed uploads instead
+    RESULTS_UPLOAD_CHECKPOINT_DIR = os.environ.get(
+        "RESULTS_UPLOAD_CHECKPOINT_DIR",
+        os.path.join(tempfile.gettempdir(), "epistemix-results-uploads"),
+    )
+
+    # Files compressed in parallel when packaging results (defaults to one per CPU;
+    # 1 uses zipfile sequentially)
+    RESULTS_COMPRESSION_WORKERS = int(
+        os.environ.get("RESULTS_COMPRESSION_WORKERS", str(os.cpu_count() or 1))
+    )
+
+    # Presigned S3 URLs kept per process and reused while at least
+    # PRESIGNED_URL_CACHE_HEADROOM of their requested validity remains; 0 disables
+    PRESIGNED_URL_CACHE_SIZE = int(os.environ.get("PRESIGNED_URL_CACHE_SIZE", "10000"))
+    PRESIGNED_URL_CACHE_HEADROOM = float(os.environ.get("PRESIGNED_URL_CACHE_HEADROOM", "0.9"))
+
+    # Objects transitioned to Glacier at once by `jobs uploads archive-old`; sweeps of
+    # at least ARCHIVE_BATCH_OPERATIONS_THRESHOLD objects are written to an S3 Batch
+    # Operations manifest instead (0 always copies them directly)
+    ARCHIVE_CONCURRENCY = int(os.environ.get("ARCHIVE_CONCURRENCY", "16"))
+    ARCHIVE_BATCH_OPERATIONS_THRESHOLD = int(
+        os.environ.get("ARCHIVE_BATCH_OPERATIONS_THRESHOLD", "10000")
+    )
+
+    # Schema gate run once at process start: "create", "verify" or "migrate". Without
+    # migrations (a packaged epistemix-cli with no ALEMBIC_SCRIPT_LOCATION), "verify" is
+    # skipped with a warning
+    DATABASE_SCHEMA_MODE = os.environ.get("DATABASE_SCHEMA_MODE", "create")
+    ALEMBIC_SCRIPT_LOCATION = os.environ.get("ALEMBIC_SCRIPT_LOCATION") or _source_tree_migrations()
+
     @staticmethod
     def init_app(app):
         """Initialize app with this configuration."""
@@ -75,6 +138,7 @@ class StagingConfig(Config):
     ENVIRONMENT = "staging"
     DEBUG = False
     TESTING = False
+    DATABASE_SCHEMA_MODE = os.environ.get("DATABASE_SCHEMA_MODE", "verify")
     S3_UPLOAD_BUCKET = os.environ.get("S3_UPLOAD_BUCKET", "epistemix-uploads-staging")
     AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
     WTF_CSRF_ENABLED = True
@@ -86,6 +150,7 @@ class ProductionConfig(Config):
     ENVIRONMENT = "prod"
     DEBUG = False
     TESTING = False
+    DATABASE_SCHEMA_MODE = os.environ.get("DATABASE_SCHEMA_MODE", "verify")
     S3_UPLOAD_BUCKET = os.environ.get("S3_UPLOAD_BUCKET", "epistemix-uploads-prod")
     AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
     WTF_CSRF_ENABLED = True
@@ -100,3 +165,19 @@ config: dict[str, Any] = {
     "production": ProductionConfig,  # Alias for compatibility
     "default": DevelopmentConfig,
 }
+
+
+def get_config() -> type[Config]:
+    """
+    Get the Config class for the current environment.
+
+    Shared by epistemix-cli and in-process callers (such as the simulation
+    runner's platform client) so both select the same class.
+
+    Returns:
+        Config class (DevelopmentConfig, StagingConfig, or ProductionConfig)
+    """
+    # Check ENVIRONMENT first (matches Sceptre stack groups),
+    # then FLASK_ENV for backward compatibility
+    env_name = os.getenv("ENVIRONMENT") or os.getenv("FLASK_ENV", "development")
+    return config.get(env_name, config["default"])
@@ -5,6 +5,8 @@ the web layer and domain models.
 """
 
 import logging
+from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Self
 
@@ -19,18 +21,37 @@ from epistemix_platform.repositories import (
     IUploadLocationRepository,
 )
 from epistemix_platform.repositories.interfaces import IResultsRepository
-from epistemix_platform.use_cases.archive_uploads import create_archive_uploads
+from epistemix_platform.use_cases.archive_uploads import (
+    create_archive_job_prefixes,
+    create_archive_uploads,
+)
+from epistemix_platform.use_cases.download_uploads import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    create_download_uploads,
+)
 from epistemix_platform.use_cases.get_job_uploads import create_get_job_uploads
-from epistemix_platform.use_cases.get_run_results import get_run_results
+from epistemix_platform.use_cases.get_run_results import get_run_results, iter_run_results
 from epistemix_platform.use_cases.get_runs import create_get_runs_by_job_id
-from epistemix_platform.use_cases.read_upload_content import create_read_upload_content
+from epistemix_platform.use_cases.ingest_batch_events import create_ingest_batch_events
+from epistemix_platform.use_cases.read_run_columns import (
+    create_get_run_columnar_tables,
+    create_read_run_columns,
+)
+from epistemix_platform.use_cases.read_upload_content import (
+    create_preview_upload_content,
+    create_read_upload_content,
+)
+from epistemix_platform.use_cases.reconcile_run_statuses import create_reconcile_run_statuses
 from epistemix_platform.use_cases.register_job import create_register_job
-from epistemix_platform.use_cases.run_simulation import create_run_simulation
+from epistemix_platform.use_cases.run_simulation import (
+    create_run_simulation_arrays,
+    create_run_simulations,
+)
 from epistemix_platform.use_cases.submit_job import create_submit_job
 from epistemix_platform.use_cases.submit_job_config import create_submit_job_config
 from epistemix_platform.use_cases.submit_run_config import create_submit_run_config
 from epistemix_platform.use_cases.submit_runs import create_submit_runs
-from epistemix_platform.use_cases.update_run_status import create_update_run_status
+from epistemix_platform.use_cases.update_run_status import create_update_run_statuses
 from epistemix_platform.use_cases.upload_results import create_upload_results
 from epistemix_platform.use_cases.write_to_local import write_to_local
 
@@ -41,6 +62,9 @@ logger = logging.getLogger(__name__)
 class JobController:
     """Controller for job-related operations in epistemix platform."""
 
+    # GET /runs syncs with AWS Batch unless a reconciler keeps statuses current
+    _sync_run_status_on_read: bool = True
+
     def __init__(self):
         """Initialize the job controller without dependencies.
 
@@ -63,11 +87,20 @@ class JobController:
         job_controller._get_runs_by_job_id = Mock(return_value=[])
         job_controller._get_job_uploads = Mock(return_value=[])
         job_controller._read_upload_content = Mock()
+        job_controller._preview_upload_content = Mock()
         job_controller._write_to_local = Mock()
+        job_controller._download_uploads = Mock(return_value=UploadsDownload())
         job_controller._archive_uploads = Mock(return_value=[])
+        job_controller._archive_job_prefixes = Mock(return_value=ArchiveSweep(prefixes=[]))
         job_controller._upload_results = Mock(return_value="http://s3.url/results.zip")
-        job_controller._run_simulation = Mock(return_value=mock_job)
+        job_controller._run_simulations = Mock(return_value={})
+        job_controller._update_run_statuses = Mock(return_value=[])
+        job_controller._reconcile_run_statuses = Mock()
+        job_controller._ingest_batch_events = Mock(return_value={})
         job_controller._get_run_results_download = Mock(return_value={"run_id": 1, "url": "http://s3.url/results.zip"})
+        job_controller._iter_run_results = Mock(return_value=iter([]))
+        job_controller._get_run_columnar_tables = Mock(return_value={})
+        job_controller._read_run_columns = Mock(return_value={})
 
         Use `create_with_repositories` to instantiate with repositories for production use.
         """
@@ -81,6 +114,10 @@ class JobController:
         upload_location_repository: IUploadLocationRepository,
         results_repository: IResultsRepository,
         simulation_runner: ISimulationRunner,
+        batch_submission_mode: str = "per-run",
+        run_status_ttl_seconds: float = 0.0,
+        sync_run_status_on_read: bool = True,
+        results_compression_workers: int = 1,
     ) -> Self:
         """
         Create JobController with repositories.
@@ -91,6 +128,14 @@ class JobController:
             upload_location_repository: Repository for upload locations (handles storage details)
             results_repository: Repository for results uploads
             simulation_runner: Gateway for AWS Batch integration (REQUIRED)
+            batch_submission_mode: "per-run" submits one Batch job per run; "array"
+                submits one Batch array job per job in each POST /runs request
+            run_status_ttl_seconds: How long a run status read from AWS Batch is
+                served from the database before GET /runs reads it again (0 disables)
+            sync_run_status_on_read: Whether GET /runs syncs statuses with AWS Batch;
+                disable when `runs reconcile --loop` keeps them current
+            results_compression_workers: Number of files compressed in parallel when
+                packaging results for upload
 
         Returns:
             Configured JobController instance
@@ -114,16 +159,44 @@ class JobController:
         service._get_runs_by_job_id = create_get_runs_by_job_id(run_repository)
         service._get_job_uploads = create_get_job_uploads(job_repository, run_repository)
         service._read_upload_content = create_read_upload_content(upload_location_repository)
+        service._preview_upload_content = create_preview_upload_content(upload_location_repository)
         service._write_to_local = write_to_local
+        service._download_uploads = create_download_uploads(upload_location_repository)
         service._archive_uploads = create_archive_uploads(upload_location_repository)
+        service._archive_job_prefixes = create_archive_job_prefixes(
+            job_repository, upload_location_repository
+        )
         service._upload_results = create_upload_results(
             run_repository,
             job_repository,
             results_repository,
+            compression_workers=results_compression_workers,
+        )
+        match batch_submission_mode:
+            case "per-run":
+                service._run_simulations = create_run_simulations(simulation_runner, run_repository)
+            case "array":
+                service._run_simulations = create_run_simulation_arrays(
+                    simulation_runner, job_repository, run_repository, upload_location_repository
+                )
+            case _:
+                raise ValueError(f"Unsupported batch submission mode: {batch_submission_mode}")
+        service._update_run_statuses = create_update_run_statuses(
+            simulation_runner, run_repository, status_ttl_seconds=run_status_ttl_seconds
         )
-        service._run_simulation = create_run_simulation(simulation_runner)
-        service._update_run_status = create_update_run_status(simulation_runner, run_repository)
+        service._reconcile_run_statuses = create_reconcile_run_statuses(
+            simulation_runner, run_repository
+        )
+        service._ingest_batch_events = create_ingest_batch_events(run_repository)
+        service._sync_run_status_on_read = sync_run_status_on_read
         service._get_run_results = get_run_results
+        service._iter_run_results = iter_run_results
+        service._get_run_columnar_tables = create_get_run_columnar_tables(
+            job_repository, run_repository, results_repository
+        )
+        service._read_run_columns = create_read_run_columns(
+            job_repository, run_repository, results_repository
+        )
 
         return service
 
@@ -211,7 +284,10 @@ class JobController:
 
         This is a public interface that:
         1. Calls submit_runs use case to create Run records in DB
-        2. Calls run_simulation for each run to submit to AWS Batch
+        2. Calls run_simulations to submit all runs to AWS Batch concurrently
+
+        A run that fails to submit is reported with status ERROR and its errors in
+        the response; the other runs are still submitted.
 
         Args:
             user_token_value: User token value for authentication
@@ -229,10 +305,11 @@ class JobController:
                 epx_version=epx_version,
             )
 
-            for run in runs:
-                self._run_simulation(run=run)
+            submission_errors = self._run_simulations(runs=runs)
 
-            run_responses = [run.to_run_response_dict() for run in runs]
+            run_responses = [
+                run.to_run_response_dict(errors=submission_errors.get(run.id)) for run in runs
+            ]
             return Success(run_responses)
         except ValueError as e:
             logger.exception("Validation error in submit_runs")
@@ -245,6 +322,9 @@ class JobController:
         """
         Get all runs for a specific job with AWS Batch status synchronization.
 
+        When status sync on read is disabled, runs are returned straight from
+        the database as kept current by reconcile_run_statuses.
+
         Args:
             job_id: ID of the job to get runs for
 
@@ -255,8 +335,8 @@ class JobController:
         try:
             runs = self._get_runs_by_job_id(job_id=job_id)
 
-            for run in runs:
-                self._update_run_status(run)
+            if self._sync_run_status_on_read:
+                self._update_run_statuses(runs=runs)
 
             return Success([run.to_dict() for run in runs])
 
@@ -267,6 +347,50 @@ class JobController:
             logger.exception("Unexpected error in get_runs_by_job_id")
             return Failure("An unexpected error occurred while retrieving the runs")
 
+    def reconcile_run_statuses(
+        self, batch_size: int, synced_before: datetime | None = None
+    ) -> Result[dict[str, int | float], str]:
+        """
+        Sync one batch of the stalest non-terminal runs with AWS Batch.
+
+        This is a public interface that delegates to the reconcile_run_statuses use case.
+
+        Args:
+            batch_size: Maximum number of runs to sync
+            synced_before: Only sweep runs not synced since this time
+
+        Returns:
+            Result containing either the reconciliation metrics as a dict (Success)
+            or an error message (Failure)
+        """
+        try:
+            reconciliation = self._reconcile_run_statuses(
+                batch_size=batch_size, synced_before=synced_before
+            )
+            return Success(reconciliation.to_dict())
+        except Exception:
+            logger.exception("Unexpected error in reconcile_run_statuses")
+            return Failure("An unexpected error occurred while reconciling run statuses")
+
+    def ingest_batch_events(self, events: list[dict[str, Any]]) -> Result[dict[str, int], str]:
+        """
+        Apply AWS Batch job state-change events to their runs.
+
+        This is a public interface that delegates to the ingest_batch_events use case.
+
+        Args:
+            events: EventBridge "Batch Job State Change" events
+
+        Returns:
+            Result containing either the received/applied/ignored/invalid event
+            counts (Success) or an error message (Failure)
+        """
+        try:
+            return Success(self._ingest_batch_events(events))
+        except Exception:
+            logger.exception("Unexpected error in ingest_batch_events")
+            return Failure("An unexpected error occurred while ingesting Batch events")
+
     def get_run_results_download(
         self, job_id: int, bucket_name: str, expiration_seconds: int = 86400
     ) -> Result[list[dict[str, Any]], str]:
@@ -314,6 +438,42 @@ class JobController:
             logger.exception(f"Error generating presigned URLs for job {job_id}")
             return Failure(f"Failed to generate download URLs: {e}")
 
+    def stream_run_results_download(
+        self, job_id: int, bucket_name: str, expiration_seconds: int = 86400
+    ) -> Result[Iterator[dict[str, Any]], str]:
+        """
+        Get presigned download URLs for all runs in a job as a lazy iterator.
+
+        The job is validated up front, so a Failure is returned before anything
+        is streamed; the URLs are then signed in bulk as the iterator is consumed.
+
+        Args:
+            job_id: ID of the job
+            bucket_name: S3 bucket name for results
+            expiration_seconds: URL expiration time in seconds (default 24 hours)
+
+        Returns:
+            Result containing either:
+            - Success with an iterator of dicts {"run_id": int, "url": str}
+            - Failure with error message if the job is invalid or signing cannot start
+        """
+        try:
+            run_results = self._iter_run_results(
+                job_id=job_id,
+                job_repository=self.job_repository,
+                run_repository=self.run_repository,
+                results_repository=self.results_repository,
+                bucket_name=bucket_name,
+                expiration_seconds=expiration_seconds,
+            )
+            return Success(result.to_dict() for result in run_results)
+        except ValueError as e:
+            logger.exception(f"Validation error generating presigned URLs for job {job_id}")
+            return Failure(str(e))
+        except Exception as e:
+            logger.exception(f"Error generating presigned URLs for job {job_id}")
+            return Failure(f"Failed to generate download URLs: {e}")
+
     def get_job_uploads(
         self, job_id: int, include_content: bool = True
     ) -> Result[list[dict[str, Any]], str]:
@@ -325,7 +485,9 @@ class JobController:
 
         Args:
             job_id: ID of the job to get uploads for
-            include_content: If True, fetch and include file contents in response
+            include_content: If True, include a preview of each file's contents; ZIP
+                archives are listed with the start of each text entry, read with
+                byte-range requests instead of downloading the archive
 
         Returns:
             Result containing list of uploads with optional content (Success)
@@ -343,8 +505,8 @@ class JobController:
 
                 if include_content:
                     try:
-                        # Read content for this upload
-                        content = self._read_upload_content(upload.location)
+                        # Read a preview of this upload (ZIPs via byte-range requests)
+                        content = self._preview_upload_content(upload.location)
                         upload_dict["content"] = content.to_dict()
                     except ValueError as e:
                         # Include error information if content couldn't be read
@@ -476,6 +638,58 @@ class JobController:
             logger.exception("Unexpected error in download_job_uploads")
             return Failure("An unexpected error occurred while downloading uploads")
 
+    def stream_job_uploads(
+        self,
+        job_id: int,
+        base_path: Path,
+        should_force: bool = False,
+        max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    ) -> Result[dict[str, list[str]], str]:
+        """
+        Stream all uploads associated with a job to a local directory, concurrently.
+
+        Unlike download_job_uploads, objects are written to disk in chunks as
+        they are downloaded, without reading them into memory or parsing them,
+        up to max_concurrency at a time. With should_force, files whose S3
+        object still has the ETag recorded at their last download are kept
+        as they are instead of being downloaded again.
+
+        Args:
+            job_id: ID of the job to download uploads for
+            base_path: Path to the directory where files should be downloaded
+            should_force: If True, overwrite existing files. If False, skip existing files
+            max_concurrency: Maximum number of downloads in flight
+
+        Returns:
+            Result containing the downloaded, unchanged, skipped and errors file
+            lists (Success) or an error message (Failure)
+        """
+        try:
+            uploads = self._get_job_uploads(job_id=job_id)
+
+            if not uploads:
+                return Failure(f"No uploads found for job {job_id}")
+
+            logger.info(
+                f"Streaming job {job_id} uploads to {base_path} "
+                f"(should_force={should_force}, max_concurrency={max_concurrency})"
+            )
+            outcome = self._download_uploads(
+                uploads, base_path, should_force=should_force, max_concurrency=max_concurrency
+            )
+
+            if outcome.errors and not (outcome.downloaded or outcome.unchanged):
+                return Failure(f"Failed to download any files. Errors: {'; '.join(outcome.errors)}")
+
+            return Success(outcome.to_dict())
+
+        except ValueError as e:
+            logger.exception("Validation error in stream_job_uploads")
+            return Failure(str(e))
+        except Exception:
+            logger.exception("Unexpected error in stream_job_uploads")
+            return Failure("An unexpected error occurred while downloading uploads")
+
     def archive_job_uploads(
         self,
         job_id: int,
@@ -541,8 +755,49 @@ class JobController:
             logger.exception("Unexpected error in archive_job_uploads")
             return Failure("An unexpected error occurred while archiving uploads")
 
+    def archive_old_uploads(
+        self,
+        job_ids: list[int] | None = None,
+        days_since_create: int | None = None,
+        hours_since_create: int | None = None,
+        dry_run: bool = False,
+    ) -> Result[dict[str, Any], str]:
+        """
+        Archive every stored object of some jobs, or of all jobs, past an age.
+
+        Unlike archive_job_uploads, which checks a job's recorded uploads one by
+        one, this lists whole job prefixes in S3 and archives everything under
+        them, so it scales to archiving all old jobs in one call.
+
+        Args:
+            job_ids: Jobs to archive; None archives objects of all jobs
+            days_since_create: Optional - only archive objects older than specified days
+            hours_since_create: Optional - only archive objects older than specified hours
+            dry_run: If True, only report what would be archived without making changes
+
+        Returns:
+            Result containing the archive sweep as a dictionary (Success)
+            or an error message (Failure)
+        """
+        try:
+            sweep = self._archive_job_prefixes(
+                job_ids=job_ids,
+                days_since_create=days_since_create,
+                hours_since_create=hours_since_create,
+                dry_run=dry_run,
+            )
+            logger.info(sweep.summary())
+            return Success(sweep.to_dict())
+
+        except ValueError as e:
+            logger.exception("Validation error in archive_old_uploads")
+            return Failure(str(e))
+        except Exception:
+            logger.exception("Unexpected error in archive_old_uploads")
+            return Failure("An unexpected error occurred while archiving uploads")
+
     def upload_results_from_directory(
-        self, job_id: int, run_id: int, results_dir: Path
+        self, job_id: int, run_id: int, results_dir: Path, columnar_dir: Path | None = None
     ) -> Result[str, str]:
         """
         Upload FRED simulation results from a directory to S3.
@@ -554,6 +809,8 @@ class JobController:
             job_id: ID of the job
             run_id: ID of the run
             results_dir: Path to directory containing FRED output files
+            columnar_dir: Optional directory of Parquet results and manifest to upload
+                next to the ZIP
 
         Returns:
             Result containing the S3 URL where results were uploaded (Success)
@@ -567,6 +824,7 @@ class JobController:
                 job_id=job_id,
                 run_id=run_id,
                 results_dir=results_dir,
+                columnar_dir=columnar_dir,
             )
 
             logger.info(f"Successfully uploaded results for run {run_id}: {results_url}")
@@ -578,3 +836,67 @@ class JobController:
         except Exception:
             logger.exception("Unexpected error in upload_results")
             return Failure("An unexpected error occurred while uploading results")
+
+    def get_run_columnar_tables(
+        self, job_id: int, run_id: int
+    ) -> Result[dict[str, dict[str, Any]], str]:
+        """
+        List the Parquet tables stored for a run.
+
+        Args:
+            job_id: ID of the job
+            run_id: ID of the run
+
+        Returns:
+            Result containing table name -> {"rows", "day_column", "columns"} (Success)
+            or an error message (Failure)
+        """
+        try:
+            return Success(self._get_run_columnar_tables(job_id=job_id, run_id=run_id))
+        except ValueError as e:
+            logger.exception("Validation error in get_run_columnar_tables")
+            return Failure(str(e))
+        except Exception:
+            logger.exception("Unexpected error in get_run_columnar_tables")
+            return Failure("An unexpected error occurred while reading columnar results")
+
+    def read_run_columns(
+        self,
+        job_id: int,
+        run_id: int,
+        table: str,
+        columns: list[str] | None = None,
+        start_day: int | None = None,
+        end_day: int | None = None,
+    ) -> Result[dict[str, list], str]:
+        """
+        Read columns and a day range of a run's Parquet results table.
+
+        Args:
+            job_id: ID of the job
+            run_id: ID of the run
+            table: Table name, e.g. "RUN1/out"
+            columns: Columns to read (None reads every column)
+            start_day: First simulation day to include (inclusive)
+            end_day: Last simulation day to include (inclusive)
+
+        Returns:
+            Result containing column name -> values (Success) or an error message (Failure)
+        """
+        try:
+            return Success(
+                self._read_run_columns(
+                    job_id=job_id,
+                    run_id=run_id,
+                    table=table,
+                    columns=columns,
+                    start_day=start_day,
+                    end_day=end_day,
+                )
+            )
+        except ValueError as e:
+            logger.exception("Validation error in read_run_columns")
+            return Failure(str(e))
+        except Exception:
+            logger.exception("Unexpected error in read_run_columns")
+            return Failure("An unexpected error occurred while reading columnar results")
@@ -1,9 +1,9 @@
 """
 Domain exceptions for the Epistemix platform.
 
-This module defines the exception hierarchy for results upload operations,
-following clean architecture principles where domain exceptions are defined
-at the application layer.
+This module defines the exception hierarchy for results upload operations
+and the schema gate, following clean architecture principles where domain
+exceptions are defined at the application layer.
 """
 
 
@@ -93,3 +93,14 @@ class ResultsMetadataError(ResultsUploadError):
         """
         super().__init__(message)
         self.orphaned_s3_url = orphaned_s3_url
+
+
+class SchemaVersionError(Exception):
+    """
+    Raised when the database schema does not match the Alembic migrations head.
+
+    Raised once at process start by the schema gate so the API and CLI fail
+    fast instead of serving requests against an out-of-date schema.
+    """
+
+    pass
@@ -7,7 +7,7 @@ Gateways handle communication with external systems like AWS Batch.
 
 from typing import Protocol
 
-from epistemix_platform.models import Run, RunStatusDetail
+from epistemix_platform.models import Run, RunArrayManifest, RunStatusDetail
 
 
 class ISimulationRunner(Protocol):
@@ -17,20 +17,24 @@ class ISimulationRunner(Protocol):
     Gateways implementing this protocol handle submission and monitoring
     of simulation runs on external compute infrastructure (e.g., AWS Batch).
 
-    AWS Batch is the source of truth for job state. Jobs are tracked by
-    name (run.natural_key) rather than storing job IDs in the database.
+    AWS Batch is the source of truth for job state. Jobs are named by
+    run.natural_key and addressed by the job ID recorded on run.batch_job_id
+    at submission; runs submitted before IDs were stored fall back to name lookup.
     """
 
-    def submit_run(self, run: Run) -> None:
+    def submit_run(self, run: Run) -> str:
         """
         Submit a run for execution.
 
-        Uses run.natural_key as the job name for tracking in AWS Batch.
-        Does not modify the run object; AWS Batch is the source of truth.
+        Uses run.natural_key as the job name for tracking in AWS Batch and
+        records the returned job ID on run.batch_job_id.
 
         Args:
             run: The Run to submit for execution
 
+        Returns:
+            The compute-side job ID
+
         Note:
             Implementation will call aws_batch.submit_job internally with
             jobName=run.natural_key. Job definition ARN and queue name
@@ -38,11 +42,40 @@ class ISimulationRunner(Protocol):
         """
         ...
 
+    def submit_runs(self, runs: list[Run]) -> dict[int, str]:
+        """
+        Submit many runs for execution.
+
+        A failure to submit one run must not prevent the others from being submitted.
+        Submitted runs get their job ID recorded on run.batch_job_id.
+
+        Args:
+            runs: The Runs to submit for execution
+
+        Returns:
+            Error message per failed run, keyed by run ID. Empty if every run was submitted.
+        """
+        ...
+
+    def submit_run_array(self, manifest: RunArrayManifest, manifest_key: str) -> str:
+        """
+        Submit many runs of one job as a single array job.
+
+        Args:
+            manifest: The manifest mapping array indexes to run IDs
+            manifest_key: Storage key of the uploaded manifest
+
+        Returns:
+            The compute-side job ID of the array parent
+        """
+        ...
+
     def describe_run(self, run: Run) -> RunStatusDetail:
         """
         Get current status of a run from AWS Batch.
 
-        Looks up the job by name (run.natural_key), then queries status.
+        Queries the job by run.batch_job_id, looking it up by name
+        (run.natural_key) first for legacy runs without a stored ID.
         AWS Batch is the source of truth for job state.
 
         Args:
@@ -55,9 +88,21 @@ class ISimulationRunner(Protocol):
             ValueError: If job not found in AWS Batch
 
         Note:
-            Implementation will call aws_batch.list_jobs (with name filter)
-            and aws_batch.describe_jobs internally. Maps AWS Batch status
-            to RunStatus enum.
+            Implementation will call aws_batch.describe_jobs internally
+            (preceded by aws_batch.list_jobs with a name filter for legacy
+            runs). Maps AWS Batch status to RunStatus enum.
+        """
+        ...
+
+    def describe_runs(self, runs: list[Run]) -> dict[int, RunStatusDetail]:
+        """
+        Get the current status of many runs in bulk.
+
+        Args:
+            runs: The Runs to query status for
+
+        Returns:
+            RunStatusDetail per run ID. Runs unknown to AWS Batch are omitted.
         """
         ...
 
@@ -65,8 +110,8 @@ class ISimulationRunner(Protocol):
         """
         Cancel a running simulation on AWS Batch.
 
-        Looks up the job by name (run.natural_key), then terminates it.
-        AWS Batch is the source of truth for job state.
+        Terminates the job by run.batch_job_id, looking it up by name
+        (run.natural_key) first for legacy runs without a stored ID.
 
         Args:
             run: The Run to cancel
@@ -75,7 +120,7 @@ class ISimulationRunner(Protocol):
             ValueError: If job not found in AWS Batch
 
         Note:
-            Implementation will call aws_batch.list_jobs (with name filter)
-            and aws_batch.terminate_job internally.
+            Implementation will call aws_batch.terminate_job internally
+            (preceded by aws_batch.list_jobs with a name filter for legacy runs).
         """
         ...
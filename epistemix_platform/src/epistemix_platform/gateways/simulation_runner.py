@@ -7,17 +7,29 @@ Includes retry logic with exponential backoff for resilience (FRED-46).
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 from epistemix_platform.mappers.batch_status_mapper import BatchStatusMapper
-from epistemix_platform.models import PodPhase, Run, RunStatus, RunStatusDetail
+from epistemix_platform.models import (
+    PodPhase,
+    Run,
+    RunArrayManifest,
+    RunStatus,
+    RunStatusDetail,
+)
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SUBMIT_CONCURRENCY = 16
+
+# describe_jobs accepts at most 100 job IDs per call
+DESCRIBE_JOBS_CHUNK_SIZE = 100
+
 
 class AWSBatchSimulationRunner:
     """
@@ -27,7 +39,13 @@ class AWSBatchSimulationRunner:
     on AWS Batch compute infrastructure.
     """
 
-    def __init__(self, batch_client=None, job_queue_name=None, job_definition_name=None):
+    def __init__(
+        self,
+        batch_client=None,
+        job_queue_name=None,
+        job_definition_name=None,
+        max_concurrency: int = DEFAULT_SUBMIT_CONCURRENCY,
+    ):
         """
         Initialize the AWS Batch simulation runner.
 
@@ -36,22 +54,37 @@ class AWSBatchSimulationRunner:
                          If None, creates a new client with timeout configuration.
             job_queue_name: AWS Batch job queue name (set by factory method)
             job_definition_name: AWS Batch job definition name (set by factory method)
+            max_concurrency: Maximum number of concurrent submit_job calls in submit_runs
         """
         if batch_client is None:
-            # Configure boto3 with explicit timeouts to fail fast on network issues
-            config = Config(
-                connect_timeout=5,  # 5 seconds to establish connection
-                read_timeout=60,  # 60 seconds to read response
-                retries={"max_attempts": 3, "mode": "standard"},  # Retry on transient failures
-            )
-            batch_client = boto3.client("batch", config=config)
+            batch_client = boto3.client("batch", config=self._client_config(max_concurrency))
 
         self._batch_client = batch_client
         self._job_queue_name = job_queue_name
         self._job_definition_name = job_definition_name
+        self._max_concurrency = max(1, max_concurrency)
+
+    @staticmethod
+    def _client_config(max_concurrency: int) -> Config:
+        """Build the boto3 client config, sizing the connection pool for concurrent submits."""
+        # Configure boto3 with explicit timeouts to fail fast on network issues
+        return Config(
+            connect_timeout=5,  # 5 seconds to establish connection
+            read_timeout=60,  # 60 seconds to read response
+            # Standard mode retries throttling and transient errors with full-jitter
+            # exponential backoff, so a large sweep does not retry in lockstep
+            retries={"max_attempts": 3, "mode": "standard"},
+            max_pool_connections=max(10, max_concurrency),
+        )
 
     @classmethod
-    def create(cls, environment: str, region: str = "us-east-1", batch_client=None):
+    def create(
+        cls,
+        environment: str,
+        region: str = "us-east-1",
+        batch_client=None,
+        max_concurrency: int = DEFAULT_SUBMIT_CONCURRENCY,
+    ):
         """
         Factory method to create an AWS Batch simulation runner for a specific environment.
 
@@ -59,6 +92,7 @@ class AWSBatchSimulationRunner:
             environment: Environment name (dev, staging, prod)
             region: AWS region (default: us-east-1)
             batch_client: Optional boto3 Batch client (for testing)
+            max_concurrency: Maximum number of concurrent submit_job calls in submit_runs
 
         Returns:
             AWSBatchSimulationRunner configured for the environment
@@ -67,33 +101,31 @@ class AWSBatchSimulationRunner:
         job_definition_name = f"fred-simulation-runner-{environment}"
 
         if batch_client is None:
-            # Configure boto3 with explicit timeouts to fail fast on network issues
-            config = Config(
-                connect_timeout=5,  # 5 seconds to establish connection
-                read_timeout=60,  # 60 seconds to read response
-                retries={"max_attempts": 3, "mode": "standard"},  # Retry on transient failures
+            batch_client = boto3.client(
+                "batch", region_name=region, config=cls._client_config(max_concurrency)
             )
-            batch_client = boto3.client("batch", region_name=region, config=config)
 
         return cls(
             batch_client=batch_client,
             job_queue_name=job_queue_name,
             job_definition_name=job_definition_name,
+            max_concurrency=max_concurrency,
         )
 
-    def submit_run(self, run: Run) -> None:
+    def submit_run(self, run: Run) -> str:
         """
         Submit a run to AWS Batch for execution.
 
         Uses run.natural_key property as the AWS Batch job name for tracking.
-        AWS Batch is the source of truth for job state; no job ID is stored in the database.
+        The returned Batch job ID is recorded on run.batch_job_id so later
+        describes and cancels can address the job directly; the caller is
+        responsible for persisting the run.
 
         Args:
             run: The Run to submit
 
-        Note:
-            Does not modify the run object. AWS Batch maintains job state,
-            and jobs can be looked up by name using run.natural_key property.
+        Returns:
+            The AWS Batch job ID
         """
         # Use natural_key property for job name
         job_name = run.natural_key
@@ -110,20 +142,224 @@ class AWSBatchSimulationRunner:
 
         # Submit job to AWS Batch with command override
         # Environment variables are set in the job definition
-        self._batch_client.submit_job(
+        response = self._batch_client.submit_job(
             jobName=job_name,
             jobQueue=self._job_queue_name,
             jobDefinition=self._job_definition_name,
             containerOverrides={"command": command},
         )
+        run.batch_job_id = response["jobId"]
+        return run.batch_job_id
+
+    def submit_runs(self, runs: list[Run]) -> dict[int, str]:
+        """
+        Submit many runs to AWS Batch concurrently.
+
+        Each run is submitted with submit_run on a bounded thread pool (boto3
+        clients are thread-safe). Throttling and server errors are retried by the
+        client's standard retry mode. A run that still fails, for any reason, is
+        reported without stopping the others, so every submitted run keeps its
+        Batch job ID on run.batch_job_id.
+
+        Args:
+            runs: The Runs to submit
+
+        Returns:
+            Error message per failed run, keyed by run ID. Empty if every run was submitted.
+        """
+        if not runs:
+            return {}
+
+        max_workers = min(self._max_concurrency, len(runs))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="batch-submit") as pool:
+            outcomes = list(pool.map(self._try_submit_run, runs))
+
+        failures = {run.id: error for run, error in zip(runs, outcomes, strict=True) if error}
+        if failures:
+            logger.warning(f"Failed to submit {len(failures)} of {len(runs)} runs to AWS Batch")
+        return failures
+
+    def _try_submit_run(self, run: Run) -> str | None:
+        """
+        Submit a single run, turning any error into a per-run failure.
+
+        Returns:
+            None on success, otherwise the error message for the run
+        """
+        try:
+            self.submit_run(run)
+        except (ClientError, BotoCoreError) as e:
+            logger.exception(f"Failed to submit run {run.id} to AWS Batch")
+            return f"AWS Batch submission failed: {e}"
+        except Exception as e:
+            logger.exception(f"Unexpected error submitting run {run.id} to AWS Batch")
+            return f"Unexpected error submitting run: {e}"
+        return None
+
+    def submit_run_array(self, manifest: RunArrayManifest, manifest_key: str) -> str:
+        """
+        Submit many runs of one job as a single AWS Batch array job.
+
+        Each child container receives AWS_BATCH_JOB_ARRAY_INDEX from Batch and
+        resolves its run ID from the manifest at manifest_key.
+
+        Args:
+            manifest: The manifest mapping array indexes to run IDs
+            manifest_key: S3 key of the uploaded manifest (in the runner's upload bucket)
+
+        Returns:
+            The AWS Batch job ID of the array parent
+        """
+        command = [
+            "run",
+            "--job-id",
+            str(manifest.job_id),
+            "--array-manifest",
+            manifest_key,
+        ]
+
+        response = self._batch_client.submit_job(
+            jobName=manifest.job_name,
+            jobQueue=self._job_queue_name,
+            jobDefinition=self._job_definition_name,
+            arrayProperties={"size": manifest.size},
+            containerOverrides={"command": command},
+        )
+        return response["jobId"]
+
+    def describe_runs(self, runs: list[Run]) -> dict[int, RunStatusDetail]:
+        """
+        Get the current status of many runs from AWS Batch in bulk.
+
+        Runs with a stored batch_job_id, including array children
+        ("{array_job_id}:{index}"), are described directly. Legacy runs
+        submitted before job IDs were stored are resolved once per parent job
+        with a paginated list_jobs call filtered on the job's name prefix
+        (job-{job_id}-run-*). Jobs are then described in chunks of 100.
+
+        Args:
+            runs: The Runs to query
+
+        Returns:
+            RunStatusDetail per run ID. Runs without a Batch job are omitted.
+            If AWS Batch stays unavailable after retries, the affected runs get
+            ERROR status with pod_phase=UNKNOWN (same degradation as describe_run).
+        """
+        if not runs:
+            return {}
+
+        try:
+            batch_job_ids = self._find_batch_job_ids(runs)
+            jobs = self._describe_jobs_in_chunks(list(batch_job_ids))
+        except (ClientError, BotoCoreError) as e:
+            logger.exception(f"AWS Batch unavailable while describing {len(runs)} runs")
+            return {
+                run.id: RunStatusDetail(
+                    status=RunStatus.ERROR,
+                    message=f"AWS Batch API error: {e}",
+                    pod_phase=PodPhase.UNKNOWN,
+                )
+                for run in runs
+            }
+
+        missing = len(runs) - len(batch_job_ids)
+        if missing:
+            logger.warning(f"{missing} of {len(runs)} runs have no AWS Batch job")
+
+        return {batch_job_ids[job["jobId"]]: self._status_detail_from_job(job) for job in jobs}
+
+    def _find_batch_job_ids(self, runs: list[Run]) -> dict[str, int]:
+        """
+        Resolve Batch job IDs for runs, preferring the IDs stored at submission.
+
+        Runs without a stored ID fall back to one paginated list_jobs per parent
+        job. If such a run was submitted more than once, the most recently
+        created Batch job wins.
+
+        Returns:
+            Run ID per Batch job ID
+        """
+        batch_job_ids = {run.batch_job_id: run.id for run in runs if run.batch_job_id}
+        legacy_runs = [run for run in runs if not run.batch_job_id]
+        if legacy_runs:
+            batch_job_ids.update(self._find_batch_job_ids_by_name(legacy_runs))
+        return batch_job_ids
+
+    def _find_batch_job_ids_by_name(self, runs: list[Run]) -> dict[str, int]:
+        """Resolve Batch job IDs by job name, one paginated list_jobs per parent job."""
+        run_ids_by_name = {run.natural_key: run.id for run in runs}
+        latest_by_name: dict[str, tuple[int, str]] = {}
+
+        for job_id in sorted({run.job_id for run in runs}):
+            pages = self._with_retries(
+                lambda job_id=job_id: list(
+                    self._batch_client.get_paginator("list_jobs").paginate(
+                        jobQueue=self._job_queue_name,
+                        filters=[{"name": "JOB_NAME", "values": [f"job-{job_id}-run-*"]}],
+                    )
+                )
+            )
+            for page in pages:
+                for summary in page.get("jobSummaryList", []):
+                    name = summary["jobName"]
+                    if name not in run_ids_by_name:
+                        continue
+                    created_at = summary.get("createdAt", 0)
+                    if name not in latest_by_name or created_at >= latest_by_name[name][0]:
+                        latest_by_name[name] = (created_at, summary["jobId"])
+
+        return {batch_id: run_ids_by_name[name] for name, (_, batch_id) in latest_by_name.items()}
+
+    def _describe_jobs_in_chunks(self, batch_job_ids: list[str]) -> list[dict]:
+        """Describe Batch jobs in chunks of 100 (the describe_jobs maximum), with retries."""
+        jobs: list[dict] = []
+        for start in range(0, len(batch_job_ids), DESCRIBE_JOBS_CHUNK_SIZE):
+            chunk = batch_job_ids[start : start + DESCRIBE_JOBS_CHUNK_SIZE]
+            response = self._with_retries(
+                lambda chunk=chunk: self._batch_client.describe_jobs(jobs=chunk)
+            )
+            jobs.extend(response.get("jobs", []))
+        return jobs
+
+    def _with_retries(self, operation, max_retries: int = 3, base_delay: float = 1.0):
+        """
+        Call operation, retrying AWS errors with exponential backoff (1s, 2s, ...).
+
+        Raises:
+            ClientError | BotoCoreError: The last error once retries are exhausted
+        """
+        for attempt in range(max_retries):
+            try:
+                return operation()
+            except (ClientError, BotoCoreError) as e:
+                if attempt == max_retries - 1:
+                    raise
+                delay = base_delay * (2**attempt)
+                logger.warning(
+                    f"AWS Batch error on attempt {attempt + 1}/{max_retries}, "
+                    f"retrying after {delay}s: {e}"
+                )
+                time.sleep(delay)
+        return None  # max_retries is at least 1, so the loop always returns or raises
+
+    @staticmethod
+    def _status_detail_from_job(job: dict) -> RunStatusDetail:
+        """Map a describe_jobs entry to RunStatusDetail using BatchStatusMapper."""
+        batch_status = job["status"]
+        return RunStatusDetail(
+            status=BatchStatusMapper.batch_status_to_run_status(batch_status),
+            message=job.get("statusReason", ""),
+            pod_phase=BatchStatusMapper.batch_status_to_pod_phase(batch_status),
+        )
 
     def describe_run(self, run: Run) -> RunStatusDetail:
         """
-        Get current status of a run from AWS Batch using name-based lookup with retry logic.
+        Get current status of a run from AWS Batch with retry logic.
 
-        Looks up the job in AWS Batch by natural key (job name), then retrieves
-        detailed status information including both RunStatus and PodPhase.
-        AWS Batch is the source of truth for job state.
+        Describes the job by its stored batch_job_id. Legacy runs without one
+        are looked up by natural key (job name) first. Retrieves detailed status
+        information including both RunStatus and PodPhase. AWS Batch is the
+        source of truth for job state.
 
         Implements simple exponential backoff retry logic for transient failures
         (network errors, throttling, temporary AWS Batch unavailability).
@@ -143,28 +379,13 @@ class AWSBatchSimulationRunner:
             Uses BatchStatusMapper for consistent status mapping (FRED-46).
             Retry logic: 3 attempts with exponential backoff (1s, 2s, 4s delays).
         """
-        # Look up job by name using natural_key property (not method call)
-        job_name = run.natural_key
-
         # Retry configuration (ENGINEER-03 pattern, simplified)
         max_retries = 3
         base_delay = 1.0  # seconds
 
         for attempt in range(max_retries):
             try:
-                # Query AWS Batch to find job by name
-                list_response = self._batch_client.list_jobs(
-                    jobQueue=self._job_queue_name,
-                    filters=[{"name": "JOB_NAME", "values": [job_name]}],
-                )
-
-                job_list = list_response.get("jobSummaryList", [])
-                if not job_list:
-                    # Job not found is not a retryable error
-                    raise ValueError(f"Job not found in AWS Batch: {job_name}")
-
-                # Get the job ID from list_jobs
-                job_id = job_list[0]["jobId"]
+                job_id = run.batch_job_id or self._find_batch_job_id_by_name(run)
 
                 # Query AWS Batch for detailed job status
                 response = self._batch_client.describe_jobs(jobs=[job_id])
@@ -206,10 +427,10 @@ class AWSBatchSimulationRunner:
 
     def cancel_run(self, run: Run) -> None:
         """
-        Cancel a running simulation on AWS Batch using name-based lookup.
+        Cancel a running simulation on AWS Batch.
 
-        Looks up the job in AWS Batch by natural key (job name), then terminates it.
-        AWS Batch is the source of truth for job state.
+        Terminates the job by its stored batch_job_id. Legacy runs without one
+        are looked up by natural key (job name) first.
 
         Args:
             run: The Run to cancel
@@ -217,7 +438,18 @@ class AWSBatchSimulationRunner:
         Raises:
             ValueError: If job not found in AWS Batch
         """
-        # Look up job by name using natural_key property
+        job_id = run.batch_job_id or self._find_batch_job_id_by_name(run)
+
+        # Terminate the Batch job
+        self._batch_client.terminate_job(jobId=job_id, reason="User requested cancellation")
+
+    def _find_batch_job_id_by_name(self, run: Run) -> str:
+        """
+        Look up the Batch job ID of a legacy run by its job name (run.natural_key).
+
+        Raises:
+            ValueError: If job not found in AWS Batch
+        """
         job_name = run.natural_key
 
         list_response = self._batch_client.list_jobs(
@@ -227,10 +459,7 @@ class AWSBatchSimulationRunner:
 
         job_list = list_response.get("jobSummaryList", [])
         if not job_list:
+            # Job not found is not a retryable error
             raise ValueError(f"Job not found in AWS Batch: {job_name}")
 
-        # Get the job ID from list_jobs
-        job_id = job_list[0]["jobId"]
-
-        # Terminate the Batch job
-        self._batch_client.terminate_job(jobId=job_id, reason="User requested cancellation")
+        return job_list[0]["jobId"]
@@ -40,6 +40,8 @@ class RunMapper:
             config_url=run_record.config_url,
             results_url=run_record.results_url,
             results_uploaded_at=run_record.results_uploaded_at,
+            batch_job_id=run_record.batch_job_id,
+            status_synced_at=run_record.status_synced_at,
         )
 
     @staticmethod
@@ -68,6 +70,8 @@ class RunMapper:
             config_url=run.config_url,
             results_url=run.results_url,
             results_uploaded_at=run.results_uploaded_at,
+            batch_job_id=run.batch_job_id,
+            status_synced_at=run.status_synced_at,
         )
 
     @staticmethod
@@ -92,6 +96,8 @@ class RunMapper:
         record.config_url = run.config_url
         record.results_url = run.results_url
         record.results_uploaded_at = run.results_uploaded_at
+        record.batch_job_id = run.batch_job_id
+        record.status_synced_at = run.status_synced_at
 
     @staticmethod
     def _run_status_to_enum(status: RunStatus) -> RunStatusEnum:
@@ -3,25 +3,37 @@ Business models package for the Epistemix API.
 Contains domain entities and value objects following Clean Architecture principles.
 """
 
+from .archive_sweep import ArchiveSweep  # pants: no-infer-dep
+from .batch_job_state_change import BatchJobStateChange  # pants: no-infer-dep
 from .job import Job, JobStatus, JobTag  # pants: no-infer-dep
 from .job_s3_prefix import JobS3Prefix  # pants: no-infer-dep
 from .job_upload import JobUpload  # pants: no-infer-dep
+from .results_manifest import ResultsManifest  # pants: no-infer-dep
 from .run import PodPhase, Run, RunStatus, RunStatusDetail  # pants: no-infer-dep
+from .run_array_manifest import RunArrayManifest  # pants: no-infer-dep
+from .run_reconciliation import RunReconciliation  # pants: no-infer-dep
 from .upload_content import UploadContent, ZipFileEntry  # pants: no-infer-dep
 from .upload_location import UploadLocation  # pants: no-infer-dep
+from .uploads_download import UploadsDownload  # pants: no-infer-dep
 
 
 __all__ = [
+    "ArchiveSweep",
+    "BatchJobStateChange",
     "Job",
     "JobS3Prefix",
     "JobStatus",
     "JobTag",
     "JobUpload",
     "Run",
+    "RunArrayManifest",
+    "RunReconciliation",
     "RunStatus",
     "RunStatusDetail",
     "PodPhase",
+    "ResultsManifest",
     "UploadLocation",
     "UploadContent",
+    "UploadsDownload",
     "ZipFileEntry",
 ]
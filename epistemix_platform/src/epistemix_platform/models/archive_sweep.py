@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class ArchiveSweep:
+    """
+    Outcome of archiving every old object under one or more S3 prefixes.
+
+    Objects are either transitioned directly (archived) or, for very large
+    sweeps, listed in an S3 Batch Operations manifest (manifested) that a
+    Batch Operations copy job transitions instead.
+    """
+
+    prefixes: list[str]
+    dry_run: bool = False
+    archived: list[str] = field(default_factory=list)
+    manifested: list[str] = field(default_factory=list)
+    already_archived: int = 0
+    too_recent: int = 0
+    errors: list[str] = field(default_factory=list)
+    manifest_url: str | None = None
+    manifest_etag: str | None = None
+
+    def summary(self) -> str:
+        """Human-readable counts, e.g. "Archived 12 objects, 3 already archived"."""
+        action = "Would archive" if self.dry_run else "Archived"
+        parts = [f"{action} {len(self.archived)} objects"]
+        if self.manifested:
+            parts.append(f"{len(self.manifested)} listed in a Batch Operations manifest")
+        if self.already_archived:
+            parts.append(f"{self.already_archived} already archived")
+        if self.too_recent:
+            parts.append(f"{self.too_recent} too recent")
+        if self.errors:
+            parts.append(f"{len(self.errors)} errors")
+        return ", ".join(parts)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to dictionary for CLI output."""
+        return {
+            "prefixes": self.prefixes,
+            "dryRun": self.dry_run,
+            "archived": self.archived,
+            "manifested": self.manifested,
+            "alreadyArchived": self.already_archived,
+            "tooRecent": self.too_recent,
+            "errors": self.errors,
+            "manifestUrl": self.manifest_url,
+            "manifestEtag": self.manifest_etag,
+        }
@@ -0,0 +1,95 @@
+"""
+BatchJobStateChange value object for AWS Batch state-change events.
+
+AWS Batch publishes a "Batch Job State Change" event to EventBridge every time
+a job moves between states. This value object holds the fields needed to map
+such an event back to a run and apply its new status.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+
+BATCH_EVENT_SOURCE = "aws.batch"
+BATCH_EVENT_DETAIL_TYPE = "Batch Job State Change"
+
+# Job names given by AWSBatchSimulationRunner.submit_run (Run.natural_key)
+_RUN_JOB_NAME_PATTERN = re.compile(r"^job-(?P<job_id>\d+)-run-(?P<run_id>\d+)$")
+
+
+@dataclass(frozen=True, slots=True)
+class BatchJobStateChange:
+    """
+    A single AWS Batch job state change, parsed from an EventBridge event.
+
+    Array children report the array's job name, a job ID of the form
+    "{parent_job_id}:{index}" and their index; array parents report no index.
+    """
+
+    event_id: str
+    batch_job_id: str
+    job_name: str
+    batch_status: str
+    status_reason: str
+    occurred_at: datetime  # Naive UTC, like the timestamps stored on runs
+    array_index: int | None = None
+    is_array_parent: bool = False
+
+    @classmethod
+    def from_event(cls, event: dict[str, Any]) -> "BatchJobStateChange":
+        """
+        Parse an EventBridge "Batch Job State Change" event.
+
+        Args:
+            event: The event as delivered by EventBridge
+
+        Returns:
+            The parsed state change
+
+        Raises:
+            TypeError: If the event or its detail is not a JSON object
+            ValueError: If the event is not a Batch job state change or is malformed
+        """
+        if not isinstance(event, dict):
+            raise TypeError("Batch event must be a JSON object")
+        if event.get("source") != BATCH_EVENT_SOURCE:
+            raise ValueError(f"Unsupported event source: {event.get('source')}")
+        if event.get("detail-type") != BATCH_EVENT_DETAIL_TYPE:
+            raise ValueError(f"Unsupported event detail-type: {event.get('detail-type')}")
+
+        detail = event.get("detail")
+        if not isinstance(detail, dict):
+            raise TypeError("Batch event detail must be a JSON object")
+
+        try:
+            occurred_at = (
+                datetime.fromisoformat(event["time"].replace("Z", "+00:00"))
+                .astimezone(UTC)
+                .replace(tzinfo=None)
+            )
+            array_properties = detail.get("arrayProperties") or {}
+            return cls(
+                event_id=str(event.get("id", "")),
+                batch_job_id=str(detail["jobId"]),
+                job_name=str(detail["jobName"]),
+                batch_status=str(detail["status"]),
+                status_reason=str(detail.get("statusReason", "")),
+                occurred_at=occurred_at,
+                array_index=array_properties.get("index"),
+                is_array_parent="size" in array_properties,
+            )
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Malformed Batch event {event.get('id')}: missing {e}") from e
+
+    @property
+    def run_id_from_job_name(self) -> int | None:
+        """
+        The run ID encoded in a per-run job name ("job-{job_id}-run-{run_id}").
+
+        Returns:
+            The run ID, or None for array jobs and jobs not submitted by the platform
+        """
+        match = _RUN_JOB_NAME_PATTERN.match(self.job_name)
+        return int(match.group("run_id")) if match else None
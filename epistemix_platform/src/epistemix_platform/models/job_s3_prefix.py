@@ -33,6 +33,8 @@ class JobS3Prefix:
           ├── job_input.zip
           ├── run_4_config.json
           ├── run_4_results.zip
+          ├── run_4_results_manifest.json
+          ├── run_4_columnar/manifest.json
           └── run_5_config.json
 
     Attributes:
@@ -108,6 +110,21 @@ class JobS3Prefix:
         """
         return f"{self.base_prefix}/job_input.zip"
 
+    def run_array_manifest_key(self, first_run_id: int) -> str:
+        """
+        Generate S3 key for an AWS Batch array-job manifest.
+
+        Args:
+            first_run_id: The run ID at array index 0
+
+        Returns:
+            S3 object key for the manifest JSON
+
+        Example:
+            'jobs/12/2025/10/23/211500/run_array_4_manifest.json'
+        """
+        return f"{self.base_prefix}/run_array_{first_run_id}_manifest.json"
+
     # ==========================================================================
     # Run-level artifact keys
     # ==========================================================================
@@ -142,6 +159,36 @@ class JobS3Prefix:
         """
         return f"{self.base_prefix}/run_{run_id}_results.zip"
 
+    def run_results_manifest_key(self, run_id: int) -> str:
+        """
+        Generate S3 key for the content-hash manifest of a run's results ZIP.
+
+        Args:
+            run_id: The run identifier
+
+        Returns:
+            S3 object key for the results manifest JSON
+
+        Example:
+            'jobs/12/2025/10/23/211500/run_4_results_manifest.json'
+        """
+        return f"{self.base_prefix}/run_{run_id}_results_manifest.json"
+
+    def run_columnar_prefix(self, run_id: int) -> str:
+        """
+        Generate S3 prefix for a run's columnar (Parquet) results.
+
+        Args:
+            run_id: The run identifier
+
+        Returns:
+            S3 prefix without trailing slash; holds manifest.json and the Parquet files
+
+        Example:
+            'jobs/12/2025/10/23/211500/run_4_columnar'
+        """
+        return f"{self.base_prefix}/run_{run_id}_columnar"
+
     def run_logs_key(self, run_id: int) -> str:
         """
         Generate S3 key for run logs file.
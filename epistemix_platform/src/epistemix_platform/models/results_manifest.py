@@ -0,0 +1,91 @@
+"""
+ResultsManifest value object for deduplicated results uploads.
+
+The manifest records the SHA-256 of every file packaged into a run's results
+ZIP. It is stored under the job's JobS3Prefix next to the ZIP, so a retried or
+re-run upload whose files are byte-identical can skip re-zipping and
+re-uploading them.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+MANIFEST_FORMAT_VERSION = 1
+HASH_ALGORITHM = "sha256"
+
+
+@dataclass(slots=True, frozen=True)
+class ResultsManifest:
+    """
+    Value object describing the content of a run's results ZIP.
+
+    Example manifest JSON:
+        {
+            "formatVersion": 1,
+            "algorithm": "sha256",
+            "resultsUrl": "https://bucket.s3.amazonaws.com/jobs/12/.../run_4_results.zip",
+            "resultsEtag": "\\"9b2cf535f27731c974343645a3985328\\"",
+            "files": {"RUN1/out.csv": "e3b0c442...", "RUN1/log.txt": "5891b5b5..."}
+        }
+
+    Attributes:
+        files: SHA-256 hex digest of each file, by its archive name in the ZIP
+        results_url: S3 URL of the ZIP the files were uploaded in (None until uploaded)
+        results_etag: ETag of that ZIP object, to detect it being replaced or removed
+    """
+
+    files: Mapping[str, str]
+    results_url: str | None = None
+    results_etag: str | None = None
+
+    def matches(self, other: "ResultsManifest") -> bool:
+        """Check whether both manifests describe exactly the same files and content."""
+        return dict(self.files) == dict(other.files)
+
+    def changed_files(self, previous: "ResultsManifest") -> list[str]:
+        """
+        List the files that are new or whose content differs from a previous manifest.
+
+        Args:
+            previous: Manifest of the earlier upload
+
+        Returns:
+            Sorted archive names of added or modified files
+        """
+        return sorted(
+            name for name, digest in self.files.items() if previous.files.get(name) != digest
+        )
+
+    def removed_files(self, previous: "ResultsManifest") -> list[str]:
+        """List the files of a previous manifest that are no longer present, sorted."""
+        return sorted(name for name in previous.files if name not in self.files)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the manifest JSON structure."""
+        return {
+            "formatVersion": MANIFEST_FORMAT_VERSION,
+            "algorithm": HASH_ALGORITHM,
+            "resultsUrl": self.results_url,
+            "resultsEtag": self.results_etag,
+            "files": dict(sorted(self.files.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ResultsManifest":
+        """
+        Deserialize from the manifest JSON structure.
+
+        Raises:
+            ValueError: If the manifest uses an unsupported format or hash algorithm
+        """
+        if data.get("formatVersion") != MANIFEST_FORMAT_VERSION:
+            raise ValueError(f"Unsupported results manifest version: {data.get('formatVersion')}")
+        if data.get("algorithm") != HASH_ALGORITHM:
+            raise ValueError(f"Unsupported results manifest algorithm: {data.get('algorithm')}")
+        return cls(
+            files={str(name): str(digest) for name, digest in data["files"].items()},
+            results_url=data.get("resultsUrl"),
+            results_etag=data.get("resultsEtag"),
+        )
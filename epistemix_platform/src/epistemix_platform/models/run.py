@@ -24,6 +24,12 @@ class RunStatus(Enum):
     CANCELLED = "Cancelled"  # Maps to ERROR
 
 
+# Statuses AWS Batch never moves a run out of
+TERMINAL_RUN_STATUSES = frozenset(
+    {RunStatus.DONE, RunStatus.ERROR, RunStatus.FAILED, RunStatus.CANCELLED}
+)
+
+
 class PodPhase(Enum):
     """Enumeration of possible pod phases."""
 
@@ -83,6 +89,8 @@ class Run:
     results_url: str | None = None  # Presigned URL for run results ZIP
     results_uploaded_at: datetime | None = None  # Timestamp when results were uploaded
     results_uploaded: bool = False  # CRITICAL: Track if results uploaded to S3
+    batch_job_id: str | None = None  # AWS Batch job ID ("{parent}:{index}" for array children)
+    status_synced_at: datetime | None = None  # Last time status was read from AWS Batch
 
     @classmethod
     def create_unpersisted(
@@ -99,6 +107,8 @@ class Run:
         results_url: str | None = None,
         results_uploaded_at: datetime | None = None,
         results_uploaded: bool = False,
+        batch_job_id: str | None = None,
+        status_synced_at: datetime | None = None,
     ) -> "Run":
         """
         Create a new unpersisted run.
@@ -116,6 +126,8 @@ class Run:
             results_url: Presigned URL for run results ZIP
             results_uploaded_at: Timestamp when results were uploaded
             results_uploaded: Whether results have been uploaded to S3
+            batch_job_id: AWS Batch job ID recorded at submission
+            status_synced_at: Last time status was read from AWS Batch
 
         Returns:
             A new Run instance with id=None
@@ -136,6 +148,8 @@ class Run:
             results_url=results_url,
             results_uploaded_at=results_uploaded_at,
             results_uploaded=results_uploaded,
+            batch_job_id=batch_job_id,
+            status_synced_at=status_synced_at,
         )
 
     @classmethod
@@ -156,6 +170,8 @@ class Run:
         results_url: str | None = None,
         results_uploaded_at: datetime | None = None,
         results_uploaded: bool = False,
+        batch_job_id: str | None = None,
+        status_synced_at: datetime | None = None,
     ) -> "Run":
         """
         Create a persisted run (loaded from repository).
@@ -176,6 +192,8 @@ class Run:
             results_url: Presigned URL for run results ZIP
             results_uploaded_at: Timestamp when results were uploaded
             results_uploaded: Whether results have been uploaded to S3
+            batch_job_id: AWS Batch job ID recorded at submission
+            status_synced_at: Last time status was read from AWS Batch
 
         Returns:
             A new Run instance with the specified ID
@@ -196,6 +214,8 @@ class Run:
             results_url=results_url,
             results_uploaded_at=results_uploaded_at,
             results_uploaded=results_uploaded,
+            batch_job_id=batch_job_id,
+            status_synced_at=status_synced_at,
         )
 
     def is_persisted(self) -> bool:
@@ -210,6 +230,16 @@ class Run:
         """Update the pod phase."""
         self.pod_phase = pod_phase
 
+    @property
+    def is_terminal(self) -> bool:
+        """
+        Whether the run has reached a status AWS Batch will not change.
+
+        ERROR with pod phase UNKNOWN is what the simulation runner reports when
+        AWS Batch itself is unreachable, so it is not treated as terminal.
+        """
+        return self.status in TERMINAL_RUN_STATUSES and self.pod_phase != PodPhase.UNKNOWN
+
     @property
     def natural_key(self) -> str:
         """
@@ -272,10 +302,13 @@ class Run:
             else None,
         }
 
-    def to_run_response_dict(self) -> dict[str, Any]:
+    def to_run_response_dict(self, errors: list[str] | None = None) -> dict[str, Any]:
         """
         Convert the run to a run response dictionary format.
 
+        Args:
+            errors: Optional errors to report for this run (e.g. a failed submission)
+
         Returns:
             Dictionary representation suitable for run responses
         """
@@ -283,7 +316,7 @@ class Run:
             "runId": self.id,
             "jobId": self.job_id,
             "status": self.status.value,
-            "errors": None,
+            "errors": errors or None,
             "runRequest": self.request,
         }
 
@@ -0,0 +1,87 @@
+"""
+RunArrayManifest value object for AWS Batch array-job submissions.
+
+An array job runs one container per child index. The manifest maps each
+AWS_BATCH_JOB_ARRAY_INDEX to the run it executes and is uploaded under the
+job's JobS3Prefix so the simulation runner can resolve its run ID at startup.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+# AWS Batch array jobs must have between 2 and 10,000 children
+MIN_ARRAY_SIZE = 2
+MAX_ARRAY_SIZE = 10_000
+
+
+@dataclass(slots=True, frozen=True)
+class RunArrayManifest:
+    """
+    Value object mapping array child indexes to run IDs for one array job.
+
+    Example manifest JSON:
+        {"jobId": 12, "runIds": [4, 5, 6]}
+
+    Child index 0 runs run 4, index 1 runs run 5, and so on.
+
+    Attributes:
+        job_id: The job all runs belong to
+        run_ids: Run IDs in array index order
+    """
+
+    job_id: int
+    run_ids: tuple[int, ...]
+
+    def __post_init__(self):
+        if not MIN_ARRAY_SIZE <= len(self.run_ids) <= MAX_ARRAY_SIZE:
+            raise ValueError(
+                f"Array job must contain between {MIN_ARRAY_SIZE} and {MAX_ARRAY_SIZE} runs, "
+                f"got {len(self.run_ids)}"
+            )
+
+    @property
+    def first_run_id(self) -> int:
+        """Get the run ID at index 0, which identifies the array within its job."""
+        return self.run_ids[0]
+
+    @property
+    def job_name(self) -> str:
+        """
+        Get the AWS Batch job name for the array job.
+
+        Example:
+            'job-12-array-4'
+        """
+        return f"job-{self.job_id}-array-{self.first_run_id}"
+
+    @property
+    def size(self) -> int:
+        """Get the number of children in the array job."""
+        return len(self.run_ids)
+
+    def run_id_for_index(self, index: int) -> int:
+        """
+        Get the run ID for an array child index.
+
+        Args:
+            index: The AWS_BATCH_JOB_ARRAY_INDEX value
+
+        Returns:
+            The run ID executed by that child
+
+        Raises:
+            ValueError: If the index is outside the array
+        """
+        if not 0 <= index < len(self.run_ids):
+            raise ValueError(f"Array index {index} out of range for {self.job_name}")
+        return self.run_ids[index]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the manifest JSON structure."""
+        return {"jobId": self.job_id, "runIds": list(self.run_ids)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RunArrayManifest":
+        """Deserialize from the manifest JSON structure."""
+        return cls(job_id=int(data["jobId"]), run_ids=tuple(int(r) for r in data["runIds"]))
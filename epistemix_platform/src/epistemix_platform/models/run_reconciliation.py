@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class RunReconciliation:
+    """Outcome of one run-status reconciliation batch against AWS Batch."""
+
+    swept: int
+    changed: int
+    max_lag_seconds: float
+    mean_lag_seconds: float
+    duration_seconds: float
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Serialize to dictionary for CLI output and metrics logging."""
+        return {
+            "swept": self.swept,
+            "changed": self.changed,
+            "max_lag_seconds": round(self.max_lag_seconds, 3),
+            "mean_lag_seconds": round(self.mean_lag_seconds, 3),
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
@@ -128,6 +128,29 @@ class UploadContent:
             summary=summary,
         )
 
+    @classmethod
+    def create_zip_preview(cls, entries: list[ZipFileEntry], summary: str) -> "UploadContent":
+        """Factory method for describing a ZIP archive without its bytes.
+
+        Previews are read with byte-range requests, so only the entry list and
+        summary are known; the summary doubles as raw_content.
+
+        Args:
+            entries: List of file entries in the ZIP
+            summary: Human-readable summary of the ZIP contents
+        """
+        return cls(
+            content_type=ContentType.ZIP_ARCHIVE,
+            raw_content=summary,
+            encoding="utf-8",
+            zip_entries=entries,
+            summary=summary,
+        )
+
+    def is_zip_preview(self) -> bool:
+        """Check if this is a ZIP archive description without the archive bytes."""
+        return self.content_type == ContentType.ZIP_ARCHIVE and self.encoding != "base64"
+
     @classmethod
     def create_binary(cls, hex_preview: str) -> "UploadContent":
         """Factory method for creating binary content representation."""
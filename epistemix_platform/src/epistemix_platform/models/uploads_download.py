@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class UploadsDownload:
+    """Outcome of downloading a job's uploads to a local directory."""
+
+    downloaded: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Human-readable counts, e.g. "Downloaded 3 files, 2 unchanged"."""
+        parts = [f"Downloaded {len(self.downloaded)} files"]
+        if self.unchanged:
+            parts.append(f"{len(self.unchanged)} unchanged")
+        if self.skipped:
+            parts.append(f"skipped {len(self.skipped)} existing files")
+        if self.errors:
+            parts.append(f"{len(self.errors)} errors")
+        return ", ".join(parts)
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """Serialize to dictionary for CLI output."""
+        return {
+            "downloaded": self.downloaded,
+            "unchanged": self.unchanged,
+            "skipped": self.skipped,
+            "errors": self.errors,
+        }
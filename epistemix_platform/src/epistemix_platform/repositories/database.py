@@ -3,18 +3,23 @@ SQLAlchemy database models and configuration for the Epistemix API.
 """
 
 import enum
+import hashlib
+import logging
 import os
+import threading
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, Integer, String, create_engine
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
 
 
 if TYPE_CHECKING:
     from epistemix_platform.config import Config
 
+logger = logging.getLogger(__name__)
+
 Base = declarative_base()
 
 
@@ -79,19 +84,24 @@ class RunRecord(Base):
     __tablename__ = "runs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
     user_id = Column(Integer, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     request = Column(JSON, nullable=False)
     pod_phase = Column(Enum(PodPhaseEnum), nullable=False, default=PodPhaseEnum.RUNNING)
     container_status = Column(String, nullable=True)
-    status = Column(Enum(RunStatusEnum), nullable=False, default=RunStatusEnum.SUBMITTED)
+    status = Column(
+        Enum(RunStatusEnum), nullable=False, default=RunStatusEnum.SUBMITTED, index=True
+    )
     user_deleted = Column(Integer, nullable=False, default=0)  # SQLite doesn't have native boolean
     epx_client_version = Column(String, nullable=False, default="1.2.2")
     config_url = Column(String, nullable=True)  # Presigned URL for run config (renamed from 'url')
     results_url = Column(String, nullable=True)  # Presigned URL for run results ZIP
     results_uploaded_at = Column(DateTime, nullable=True)  # Timestamp when results were uploaded
+    # AWS Batch job ID captured at submission, indexed for state-change event lookups
+    batch_job_id = Column(String, nullable=True, index=True)
+    status_synced_at = Column(DateTime, nullable=True)  # Last AWS Batch status read
 
 
 def create_postgresql_engine(database_url: str, config: "Config") -> Engine:
@@ -297,7 +307,14 @@ def create_engine_from_config(config: "Config" = None, database_url: str = None)
 
 
 class DatabaseManager:
-    """Manages database connections and sessions."""
+    """
+    Manages database connections and sessions.
+
+    A DatabaseManager owns one engine (and therefore one connection pool) plus a
+    thread-scoped session registry. Instances are meant to live for the whole
+    process; use get_database_manager() rather than constructing them directly so
+    that every request and CLI command shares the same pool.
+    """
 
     def __init__(self, database_url: str = None, config: "Config" = None):
         """
@@ -309,29 +326,186 @@ class DatabaseManager:
         """
         self.engine = create_engine_from_config(config, database_url)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.Session = scoped_session(self.SessionLocal)
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
 
     def create_tables(self):
         """Create all database tables."""
         Base.metadata.create_all(bind=self.engine)
+        self._schema_ready = True
+
+    def ensure_schema(self, mode: str = "create", script_location: str | None = None) -> None:
+        """
+        Run the schema gate once for the lifetime of this manager.
+
+        Subsequent calls are a flag check, so callers on the request path never
+        issue catalog queries or DDL after the first one.
 
-    def get_session(self):
-        """Get a new database session."""
-        return self.SessionLocal()
+        Args:
+            mode: "create" (create_all), "verify" (fail fast unless the database
+                is at the Alembic head) or "migrate" (upgrade to head, then verify)
+            script_location: Path to the Alembic migrations directory (required for
+                "migrate"; "verify" without one is skipped with a warning, for
+                packaged installs that ship no migrations)
+
+        Raises:
+            ValueError: If mode is unknown or "migrate" has no script_location
+            SchemaVersionError: If the database is not at the migrations head
+        """
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+
+            from epistemix_platform.repositories.schema import (
+                SchemaMode,
+                migrate_schema,
+                verify_schema,
+            )
+
+            schema_mode = SchemaMode(mode.lower())
+            if schema_mode is SchemaMode.MIGRATE and not script_location:
+                raise ValueError(f"script_location is required for schema mode '{mode}'")
+
+            match schema_mode:
+                case SchemaMode.CREATE:
+                    self.create_tables()
+                case SchemaMode.VERIFY if not script_location:
+                    logger.warning(
+                        "No Alembic migrations installed; skipping schema verification "
+                        "(set ALEMBIC_SCRIPT_LOCATION to verify)"
+                    )
+                case SchemaMode.VERIFY:
+                    verify_schema(self.engine, script_location)
+                case SchemaMode.MIGRATE:
+                    migrate_schema(self.engine, script_location)
+
+            self._schema_ready = True
+
+    def get_session(self) -> Session:
+        """
+        Get the database session scoped to the current thread.
+
+        Repeated calls from the same thread return the same session until
+        remove_session() is called, so a request (or CLI command) shares one
+        unit of work across every repository.
+        """
+        return self.Session()
+
+    def remove_session(self) -> None:
+        """Close the current thread's session and return its connection to the pool."""
+        self.Session.remove()
 
     def drop_tables(self):
         """Drop all database tables (useful for testing)."""
         Base.metadata.drop_all(bind=self.engine)
+        self._schema_ready = False
+
+    def dispose(self) -> None:
+        """Discard the session registry and every pooled connection."""
+        self.Session.remove()
+        self.engine.dispose()
+
+    def pool_status(self) -> dict[str, Any]:
+        """
+        Report connection pool metrics for this manager's engine.
+
+        Returns:
+            Dict with the pool class name and, where the pool supports them,
+            size, checked-in, checked-out and overflow connection counts
+        """
+        pool = self.engine.pool
+        metrics: dict[str, Any] = {"pool": type(pool).__name__}
+        for metric in ("size", "checkedin", "checkedout", "overflow"):
+            reader = getattr(pool, metric, None)
+            if callable(reader):
+                metrics[metric] = reader()
+        return metrics
+
+
+# Process-wide registry of database managers keyed by database URL.
+# Gunicorn workers must call reset_database_pools() after fork so that
+# pooled connections inherited from the master process are never shared.
+_database_managers: dict[str, DatabaseManager] = {}
+_database_managers_lock = threading.Lock()
 
 
 def get_database_manager(database_url: str = None, config: "Config" = None) -> DatabaseManager:
     """
-    Get or create a database manager instance.
+    Get or create the process-wide database manager for a database URL.
+
+    The first call for a URL builds the engine and connection pool; every later
+    call returns the same manager so that pooled connections are reused.
 
     Args:
         database_url: Optional SQLAlchemy database URL
         config: Optional configuration object
 
     Returns:
-        DatabaseManager instance
+        DatabaseManager instance shared by the whole process
+    """
+    if database_url is None:
+        if config is None:
+            from epistemix_platform.config import Config
+
+            config = Config
+        database_url = config.get_database_url()
+
+    manager = _database_managers.get(database_url)
+    if manager is not None:
+        return manager
+
+    with _database_managers_lock:
+        manager = _database_managers.get(database_url)
+        if manager is None:
+            manager = DatabaseManager(database_url, config)
+            _database_managers[database_url] = manager
+            logger.info("Created database engine for %s", manager.engine.url)
+    return manager
+
+
+def reset_database_pools() -> None:
+    """
+    Drop pooled connections inherited from a parent process.
+
+    Call this in a forked child (e.g. Gunicorn post_fork). Managers stay
+    registered, so the schema gate that ran in the parent is not repeated,
+    but each worker opens its own connections. Parent sockets are left open
+    for the parent to keep using.
+    """
+    with _database_managers_lock:
+        for manager in _database_managers.values():
+            manager.Session.remove()
+            manager.engine.dispose(close=False)
+
+
+def dispose_database_managers() -> None:
+    """Dispose every registered database manager and clear the registry."""
+    with _database_managers_lock:
+        for manager in _database_managers.values():
+            manager.dispose()
+        _database_managers.clear()
+
+
+def get_pool_metrics() -> dict[str, dict[str, Any]]:
+    """
+    Get connection pool metrics for every registered database manager.
+
+    Pools are keyed by an opaque label derived from the database URL, so the
+    metrics can be served unauthenticated without revealing host, user or
+    database name.
+
+    Returns:
+        Mapping of pool label ("db-" plus a short URL hash) to pool metrics
     """
-    return DatabaseManager(database_url, config)
+    return {
+        _pool_label(database_url): manager.pool_status()
+        for database_url, manager in list(_database_managers.items())
+    }
+
+
+def _pool_label(database_url: str) -> str:
+    """Build a stable label for a database URL that does not reveal it."""
+    return f"db-{hashlib.sha256(database_url.encode()).hexdigest()[:8]}"
@@ -3,13 +3,18 @@ Repository interfaces for the Epistemix API.
 Defines contracts for data persistence using Protocol for type safety.
 """
 
+from collections.abc import Iterable, Iterator
 from datetime import datetime
-from typing import Protocol, runtime_checkable
+from pathlib import Path
+from typing import Any, BinaryIO, Protocol, runtime_checkable
 
+from epistemix_platform.models.archive_sweep import ArchiveSweep
 from epistemix_platform.models.job import Job, JobStatus
 from epistemix_platform.models.job_s3_prefix import JobS3Prefix
 from epistemix_platform.models.job_upload import JobUpload
+from epistemix_platform.models.results_manifest import ResultsManifest
 from epistemix_platform.models.run import Run, RunStatus
+from epistemix_platform.models.run_array_manifest import RunArrayManifest
 from epistemix_platform.models.upload_content import UploadContent
 from epistemix_platform.models.upload_location import UploadLocation
 
@@ -136,6 +141,24 @@ class IRunRepository(Protocol):
         """
         ...
 
+    def save_all(self, runs: list[Run]) -> list[Run]:
+        """
+        Save multiple runs to the repository in bulk.
+
+        Behaves like calling save() for each run, but implementations should
+        insert new runs and update existing runs in as few round trips as possible.
+
+        Args:
+            runs: The runs to save
+
+        Returns:
+            The saved runs, in the same order, with IDs assigned to unpersisted runs
+
+        Raises:
+            ValueError: If a persisted run does not exist in the repository
+        """
+        ...
+
     def find_by_id(self, run_id: int) -> Run | None:
         """
         Find a run by its ID.
@@ -184,6 +207,48 @@ class IRunRepository(Protocol):
         """
         ...
 
+    def find_by_ids(self, run_ids: list[int]) -> list[Run]:
+        """
+        Find many runs by ID in one query.
+
+        Args:
+            run_ids: The IDs of the runs to find
+
+        Returns:
+            The runs that exist; unknown IDs are skipped
+        """
+        ...
+
+    def find_by_batch_job_ids(self, batch_job_ids: list[str]) -> list[Run]:
+        """
+        Find many runs by the AWS Batch job ID recorded at submission, in one query.
+
+        Args:
+            batch_job_ids: AWS Batch job IDs ("{parent}:{index}" for array children)
+
+        Returns:
+            The runs submitted as those Batch jobs; unknown IDs are skipped
+        """
+        ...
+
+    def find_unfinished(
+        self, synced_before: datetime | None = None, limit: int | None = None
+    ) -> list[Run]:
+        """
+        Find runs that AWS Batch may still move to another status.
+
+        Terminal runs (see Run.is_terminal) are excluded. Runs are ordered by
+        status_synced_at, never-synced runs first, so the stalest come first.
+
+        Args:
+            synced_before: Only include runs not synced since this time
+            limit: Maximum number of runs to return
+
+        Returns:
+            List of non-terminal runs, stalest first
+        """
+        ...
+
     def exists(self, run_id: int) -> bool:
         """
         Check if a run exists.
@@ -252,6 +317,50 @@ class IUploadLocationRepository(Protocol):
         """
         ...
 
+    def preview_content(self, location: UploadLocation) -> UploadContent:
+        """
+        Read a preview of the content of an upload location.
+
+        Unlike read_content, archives are described from their directory and
+        the start of each entry without transferring the whole object, so the
+        returned content may not carry the archive bytes.
+
+        Args:
+            location: The upload location to read from
+
+        Returns:
+            UploadContent domain model
+
+        Raises:
+            ValueError: If the content cannot be read
+        """
+        ...
+
+    def download_to_file(
+        self, location: UploadLocation, file_path: Path, etag: str | None = None
+    ) -> str | None:
+        """
+        Stream the content of an upload location to a local file, unparsed.
+
+        The object is written in chunks to a temporary file next to file_path
+        and moved into place once complete, so it is never held in memory and
+        a failed download leaves any existing file untouched.
+
+        Args:
+            location: The upload location to download
+            file_path: Where to write the file
+            etag: ETag of the copy already at file_path; the download is skipped
+                if the object still has this ETag
+
+        Returns:
+            The ETag of the downloaded object, or None if etag still matched
+            and file_path was left as is
+
+        Raises:
+            ValueError: If the object cannot be downloaded
+        """
+        ...
+
     def filter_by_age(
         self, upload_locations: list[UploadLocation], age_threshold: datetime | None
     ) -> list[UploadLocation]:
@@ -284,6 +393,49 @@ class IUploadLocationRepository(Protocol):
         """
         ...
 
+    def archive_prefixes(
+        self, prefixes: list[str], age_threshold: datetime | None, dry_run: bool = False
+    ) -> ArchiveSweep:
+        """
+        Archive every stored object under the given key prefixes older than age_threshold.
+
+        Unlike archive_uploads, objects are found by listing the prefixes, so their
+        ages need no per-object metadata request.
+
+        Args:
+            prefixes: Key prefixes to sweep (a job's prefix, or the prefix of all jobs)
+            age_threshold: Optional datetime to filter objects by age
+            dry_run: If True, only report what would be archived
+
+        Returns:
+            ArchiveSweep describing what was (or would be) archived
+
+        Raises:
+            ValueError: If the prefixes cannot be swept
+        """
+        ...
+
+    def write_run_array_manifest(
+        self, manifest: RunArrayManifest, s3_prefix: JobS3Prefix
+    ) -> UploadLocation:
+        """
+        Write an AWS Batch array-job manifest next to the job's other artifacts.
+
+        This is a server-side write; the simulation runner reads the manifest to
+        map its array index to a run ID.
+
+        Args:
+            manifest: The manifest mapping array indexes to run IDs
+            s3_prefix: JobS3Prefix for consistent timestamp across all job artifacts
+
+        Returns:
+            UploadLocation with the URL of the written manifest
+
+        Raises:
+            ValueError: If the manifest cannot be written
+        """
+        ...
+
 
 @runtime_checkable
 class IResultsRepository(Protocol):
@@ -298,7 +450,7 @@ class IResultsRepository(Protocol):
     """
 
     def upload_results(
-        self, job_id: int, run_id: int, zip_content: bytes, s3_prefix: "JobS3Prefix"
+        self, job_id: int, run_id: int, zip_content: bytes | BinaryIO, s3_prefix: "JobS3Prefix"
     ) -> UploadLocation:
         """
         Upload simulation results ZIP directly to S3 using boto3 with IAM credentials.
@@ -309,7 +461,8 @@ class IResultsRepository(Protocol):
         Args:
             job_id: ID of the job
             run_id: ID of the run
-            zip_content: Binary ZIP content to upload
+            zip_content: ZIP content to upload, as bytes or a binary file object
+                streamed from its current position
 
         Returns:
             UploadLocation with the S3 URL where results were uploaded
@@ -319,6 +472,38 @@ class IResultsRepository(Protocol):
         """
         ...
 
+    def get_results_manifest(
+        self, run_id: int, s3_prefix: "JobS3Prefix"
+    ) -> "ResultsManifest | None":
+        """
+        Fetch the content-hash manifest of a run's last results upload.
+
+        Args:
+            run_id: ID of the run
+            s3_prefix: JobS3Prefix of the run's job
+
+        Returns:
+            The manifest, or None if there is none or the ZIP it describes has changed
+        """
+        ...
+
+    def save_results_manifest(
+        self, job_id: int, run_id: int, manifest: "ResultsManifest", s3_prefix: "JobS3Prefix"
+    ) -> "ResultsManifest":
+        """
+        Store the content-hash manifest of the run's results ZIP just uploaded.
+
+        Args:
+            job_id: ID of the job
+            run_id: ID of the run
+            manifest: Content hashes of the files in the uploaded ZIP
+            s3_prefix: JobS3Prefix for consistent path generation
+
+        Returns:
+            The stored manifest, stamped with the ZIP's URL and ETag
+        """
+        ...
+
     def get_download_url(self, results_url: str, expiration_seconds: int = 3600) -> UploadLocation:
         """
         Generate a presigned GET URL for downloading results.
@@ -334,3 +519,82 @@ class IResultsRepository(Protocol):
             ValueError: If URL generation fails
         """
         ...
+
+    def get_download_urls(
+        self, objects: Iterable[tuple[str, str]], expiration_seconds: int = 3600
+    ) -> Iterator[str]:
+        """
+        Generate presigned GET URLs for many objects with one credential snapshot.
+
+        Args:
+            objects: (bucket, key) pairs to sign
+            expiration_seconds: How long the presigned URLs should be valid (default 1 hour)
+
+        Returns:
+            Iterator of presigned URLs in the order of objects, produced lazily
+        """
+        ...
+
+    def upload_columnar_results(
+        self, job_id: int, run_id: int, columnar_dir: Path, s3_prefix: "JobS3Prefix"
+    ) -> UploadLocation:
+        """
+        Upload a run's Parquet results and their manifest next to the results ZIP.
+
+        Args:
+            job_id: ID of the job
+            run_id: ID of the run
+            columnar_dir: Directory holding manifest.json and the Parquet files
+            s3_prefix: JobS3Prefix of the job
+
+        Returns:
+            UploadLocation with the S3 URL of the manifest
+
+        Raises:
+            ValueError: If the directory has no manifest
+        """
+        ...
+
+    def get_columnar_manifest(self, run_id: int, s3_prefix: "JobS3Prefix") -> dict[str, Any]:
+        """
+        Fetch the manifest describing a run's Parquet results.
+
+        Args:
+            run_id: ID of the run
+            s3_prefix: JobS3Prefix of the job
+
+        Returns:
+            Manifest dict with a "tables" mapping
+
+        Raises:
+            ValueError: If the run has no columnar results
+        """
+        ...
+
+    def read_columnar_table(
+        self,
+        run_id: int,
+        s3_prefix: "JobS3Prefix",
+        table: str,
+        columns: list[str] | None = None,
+        start_day: int | None = None,
+        end_day: int | None = None,
+    ) -> dict[str, list]:
+        """
+        Read columns and a day range of a Parquet results table with byte-range requests.
+
+        Args:
+            run_id: ID of the run
+            s3_prefix: JobS3Prefix of the job
+            table: Table name from the manifest, e.g. "RUN1/out"
+            columns: Columns to read (None reads every column)
+            start_day: First simulation day to include (inclusive)
+            end_day: Last simulation day to include (inclusive)
+
+        Returns:
+            Column name -> list of values
+
+        Raises:
+            ValueError: If the run, table or a column does not exist
+        """
+        ...
@@ -0,0 +1,180 @@
+"""
+Process-wide cache of presigned S3 URLs.
+
+epx clients poll GET /jobs/results, and every poll used to re-sign the same
+24-hour URLs. A presigned URL stays valid until it expires, so handing back
+one issued a little earlier is as good as signing a new one. This cache keeps
+recently issued URLs by HTTP method and object and reuses them while enough of
+the requested validity remains.
+
+Signed URLs carry credentials in their query strings; the cache never logs
+them, only the method and object they grant access to.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_HEADROOM = 0.9
+
+
+@dataclass(slots=True, frozen=True)
+class _CachedUrl:
+    url: str
+    expires_at: float
+
+
+class PresignedUrlCache:
+    """
+    LRU cache of presigned URLs keyed by method, bucket, key and signing credentials.
+
+    A cached URL is returned only while at least `headroom` of the requested
+    validity is left: with the default 0.9, a 24-hour URL is reused for up to
+    2.4 hours after it was signed, so callers always get at least 21.6 hours.
+    Entries are also keyed by the signing access key, so URLs signed with
+    temporary credentials stop being served once the credentials rotate.
+    The least recently used entry is evicted beyond max_entries.
+
+    Safe to share between threads.
+
+    Attributes:
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to sign a new URL
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        headroom: float = DEFAULT_HEADROOM,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of URLs kept
+            headroom: Fraction (0-1] of the requested validity a cached URL must
+                still have to be reused
+            clock: Monotonic time source in seconds (for tests)
+
+        Raises:
+            ValueError: If max_entries < 1 or headroom is outside (0, 1]
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        if not 0 < headroom <= 1:
+            raise ValueError(f"headroom must be in (0, 1], got {headroom}")
+
+        self.max_entries = max_entries
+        self.headroom = headroom
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[tuple, _CachedUrl] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_sign(
+        self,
+        method: str,
+        bucket: str,
+        key: str,
+        expiration_seconds: int,
+        sign: Callable[[], str],
+        credential_scope: Any = None,
+    ) -> str:
+        """
+        Return a cached URL for the object, or sign and cache a new one.
+
+        Args:
+            method: HTTP method the URL grants ("GET", "PUT")
+            bucket: Bucket name
+            key: Object key
+            expiration_seconds: Validity the caller asked for
+            sign: Signs a new URL valid for expiration_seconds
+            credential_scope: Identifies the signing credentials (e.g. the access key)
+
+        Returns:
+            A presigned URL with at least headroom x expiration_seconds of validity left
+        """
+        cache_key = (method, bucket, key, credential_scope)
+        now = self._clock()
+
+        with self._lock:
+            cached = self._entries.get(cache_key)
+            if cached is not None:
+                if cached.expires_at - now >= self.headroom * expiration_seconds:
+                    self._entries.move_to_end(cache_key)
+                    self.hits += 1
+                    return cached.url
+                del self._entries[cache_key]
+            self.misses += 1
+
+        # Sign outside the lock; concurrent misses for one key just both sign
+        url = sign()
+        with self._lock:
+            self._entries[cache_key] = _CachedUrl(url=url, expires_at=now + expiration_seconds)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        logger.debug(f"Cached presigned {method} URL for s3://{bucket}/{key}")
+        return url
+
+    def clear(self) -> None:
+        """Drop every cached URL."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide caches keyed by (max_entries, headroom): controllers and their
+# repositories are built per request, so the cache must outlive them
+_caches: dict[tuple[int, float], PresignedUrlCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_presigned_url_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES, headroom: float = DEFAULT_HEADROOM
+) -> PresignedUrlCache | None:
+    """
+    Get or create the process-wide presigned URL cache for a configuration.
+
+    Args:
+        max_entries: Maximum number of URLs kept; 0 or less disables caching
+        headroom: Fraction of the requested validity a cached URL must still have
+
+    Returns:
+        The shared PresignedUrlCache, or None when caching is disabled
+    """
+    if max_entries <= 0:
+        return None
+
+    with _caches_lock:
+        cache = _caches.get((max_entries, headroom))
+        if cache is None:
+            cache = PresignedUrlCache(max_entries=max_entries, headroom=headroom)
+            _caches[(max_entries, headroom)] = cache
+    return cache
+
+
+def signing_credential_scope(session: Any) -> str | None:
+    """
+    Get the access key a session currently signs with, refreshing expiring credentials.
+
+    Args:
+        session: boto3 Session the S3 client was created from
+
+    Returns:
+        The access key ID, or None if the session has no credentials
+    """
+    credentials = session.get_credentials()
+    return None if credentials is None else credentials.access_key
@@ -3,12 +3,14 @@ SQLAlchemy implementation of the Run repository.
 """
 
 from collections.abc import Callable
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
-from epistemix_platform.models.run import Run, RunStatus
-from epistemix_platform.repositories.database import RunRecord
+from epistemix_platform.models.run import TERMINAL_RUN_STATUSES, Run, RunStatus
+from epistemix_platform.repositories.database import PodPhaseEnum, RunRecord
 
 
 if TYPE_CHECKING:
@@ -50,6 +52,43 @@ class SQLAlchemyRunRepository:
 
         return run
 
+    def save_all(self, runs: list[Run]) -> list[Run]:
+        """
+        Save multiple runs to the database in bulk.
+
+        New runs are added together and flushed once, which SQLAlchemy emits as a
+        batched INSERT ... RETURNING. Existing runs are loaded with a single IN
+        query and updated in the same flush.
+        """
+        if not runs:
+            return []
+
+        session = self.session_factory()
+
+        persisted_ids = [run.id for run in runs if run.is_persisted()]
+        if persisted_ids:
+            records_by_id = {
+                record.id: record
+                for record in session.query(RunRecord).filter(RunRecord.id.in_(persisted_ids))
+            }
+            missing_ids = sorted(set(persisted_ids) - records_by_id.keys())
+            if missing_ids:
+                raise ValueError(f"Runs with IDs {missing_ids} not found")
+            for run in runs:
+                if run.is_persisted():
+                    self._run_mapper.update_record_from_domain(records_by_id[run.id], run)
+
+        new_records = [
+            (run, self._run_mapper.domain_to_record(run)) for run in runs if not run.is_persisted()
+        ]
+        session.add_all(record for _, record in new_records)
+        session.flush()  # Get the IDs without committing
+
+        for run, record in new_records:
+            run.id = record.id
+
+        return runs
+
     def find_by_id(self, run_id: int) -> Run | None:
         """Find a run by its ID."""
         session = self.session_factory()
@@ -81,6 +120,54 @@ class SQLAlchemyRunRepository:
 
         return [self._run_mapper.record_to_domain(record) for record in run_records]
 
+    def find_by_ids(self, run_ids: list[int]) -> list[Run]:
+        """Find many runs by ID with a single IN query."""
+        if not run_ids:
+            return []
+        session = self.session_factory()
+        run_records = session.query(RunRecord).filter(RunRecord.id.in_(run_ids)).all()
+
+        return [self._run_mapper.record_to_domain(record) for record in run_records]
+
+    def find_by_batch_job_ids(self, batch_job_ids: list[str]) -> list[Run]:
+        """Find many runs by AWS Batch job ID with a single IN query."""
+        if not batch_job_ids:
+            return []
+        session = self.session_factory()
+        run_records = (
+            session.query(RunRecord).filter(RunRecord.batch_job_id.in_(batch_job_ids)).all()
+        )
+
+        return [self._run_mapper.record_to_domain(record) for record in run_records]
+
+    def find_unfinished(
+        self, synced_before: datetime | None = None, limit: int | None = None
+    ) -> list[Run]:
+        """Find non-terminal runs, least recently synced first (served by ix_runs_status)."""
+        session = self.session_factory()
+        terminal_statuses = [
+            self._run_mapper._run_status_to_enum(status) for status in TERMINAL_RUN_STATUSES
+        ]
+        query = session.query(RunRecord).filter(
+            or_(
+                RunRecord.status.notin_(terminal_statuses),
+                # ERROR/Unknown means AWS Batch was unreachable, not that the run ended
+                RunRecord.pod_phase == PodPhaseEnum.UNKNOWN,
+            )
+        )
+        if synced_before is not None:
+            query = query.filter(
+                or_(
+                    RunRecord.status_synced_at.is_(None),
+                    RunRecord.status_synced_at < synced_before,
+                )
+            )
+        query = query.order_by(RunRecord.status_synced_at.asc().nulls_first(), RunRecord.id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [self._run_mapper.record_to_domain(record) for record in query.all()]
+
     def exists(self, run_id: int) -> bool:
         """Check if a run exists."""
         session = self.session_factory()
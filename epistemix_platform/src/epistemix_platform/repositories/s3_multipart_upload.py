@@ -0,0 +1,294 @@
+"""
+Parallel, resumable S3 multipart uploads.
+
+This module implements the multipart engine used by S3ResultsRepository to send
+large results archives: parts are uploaded concurrently on a thread pool, and the
+upload ID and completed parts can be checkpointed to disk so a failed upload is
+resumed instead of restarted. Without a checkpoint directory, a failed upload is
+aborted so no orphaned parts are left behind in S3.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from botocore.exceptions import ClientError
+
+
+logger = logging.getLogger(__name__)
+
+# S3 limits: parts other than the last must be at least 5 MiB, at most 10,000 parts
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PART_COUNT = 10_000
+
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@dataclass(slots=True)
+class MultipartUploadCheckpoint:
+    """
+    Progress of a multipart upload, persisted so it can be resumed.
+
+    Attributes:
+        bucket: Destination bucket
+        key: Destination object key
+        upload_id: S3 multipart upload ID
+        part_size: Size of every part but the last, in bytes
+        total_size: Size of the object being uploaded, in bytes
+        parts: ETag of each completed part, by part number (as a string for JSON)
+    """
+
+    bucket: str
+    key: str
+    upload_id: str
+    part_size: int
+    total_size: int
+    parts: dict[str, str] = field(default_factory=dict)
+
+
+class S3MultipartUploader:
+    """
+    Uploads file objects to S3 with concurrent multipart uploads.
+
+    Objects no larger than one part are sent with a single put_object. Larger
+    objects are split into part_size parts (grown if needed to stay within
+    10,000 parts) and max_concurrency parts are uploaded at a time, so memory
+    use is bounded by part_size x max_concurrency.
+
+    With a checkpoint_dir, the upload ID and completed parts are saved after
+    every part. A later upload of the same bucket/key resumes that upload,
+    re-sending only the parts S3 does not already hold with a matching MD5.
+    Uploads left incomplete are removed by the bucket's
+    AbortIncompleteMultipartUpload lifecycle rule.
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        checkpoint_dir: Path | None = None,
+    ):
+        """
+        Initialize the multipart uploader.
+
+        Args:
+            s3_client: boto3 S3 client
+            part_size: Bytes per part (at least 5 MiB)
+            max_concurrency: Maximum number of parts uploaded at once
+            checkpoint_dir: Directory for resume checkpoints; None aborts failed uploads
+
+        Raises:
+            ValueError: If part_size is below the S3 minimum or max_concurrency < 1
+        """
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes, got {part_size}")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        self.s3_client = s3_client
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.checkpoint_dir = checkpoint_dir
+
+    def upload(
+        self, fileobj: BinaryIO, bucket: str, key: str, content_type: str | None = None
+    ) -> None:
+        """
+        Upload a seekable binary file object to s3://bucket/key.
+
+        Args:
+            fileobj: Seekable binary file object; read from offset 0
+            bucket: Destination bucket
+            key: Destination object key
+            content_type: Content-Type of the object
+
+        Raises:
+            ClientError: If an S3 call fails (the upload is aborted unless resumable)
+        """
+        total_size = fileobj.seek(0, 2)
+        fileobj.seek(0)
+        extra_args = {"ContentType": content_type} if content_type else {}
+
+        if total_size <= self.part_size:
+            self.s3_client.put_object(Bucket=bucket, Key=key, Body=fileobj.read(), **extra_args)
+            return
+
+        part_size = max(self.part_size, math.ceil(total_size / MAX_PART_COUNT))
+        checkpoint = self._resume(bucket, key, part_size, total_size)
+        if checkpoint is None:
+            response = self.s3_client.create_multipart_upload(Bucket=bucket, Key=key, **extra_args)
+            checkpoint = MultipartUploadCheckpoint(
+                bucket=bucket,
+                key=key,
+                upload_id=response["UploadId"],
+                part_size=part_size,
+                total_size=total_size,
+            )
+            self._save_checkpoint(checkpoint)
+
+        part_count = math.ceil(total_size / part_size)
+        logger.info(
+            f"Uploading s3://{bucket}/{key} in {part_count} parts of {part_size} bytes "
+            f"({len(checkpoint.parts)} already uploaded)"
+        )
+
+        try:
+            self._upload_parts(fileobj, checkpoint, part_count)
+            self.s3_client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=checkpoint.upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": int(number), "ETag": etag}
+                        for number, etag in sorted(
+                            checkpoint.parts.items(), key=lambda part: int(part[0])
+                        )
+                    ]
+                },
+            )
+        except Exception:
+            if self.checkpoint_dir is None:
+                self._abort(checkpoint)
+            else:
+                logger.warning(
+                    f"Multipart upload of s3://{bucket}/{key} failed after "
+                    f"{len(checkpoint.parts)}/{part_count} parts; it will resume on retry"
+                )
+            raise
+
+        self._delete_checkpoint(bucket, key)
+
+    def _upload_parts(
+        self, fileobj: BinaryIO, checkpoint: MultipartUploadCheckpoint, part_count: int
+    ) -> None:
+        """
+        Upload every part not already held by S3 on the thread pool.
+
+        A part recorded in the checkpoint is skipped only if its ETag matches
+        the MD5 of the local bytes, so a resumed upload never mixes content.
+        """
+        read_lock = threading.Lock()
+        checkpoint_lock = threading.Lock()
+
+        def upload_part(part_number: int) -> None:
+            # Parts are read under a lock because the file object is shared
+            with read_lock:
+                fileobj.seek((part_number - 1) * checkpoint.part_size)
+                body = fileobj.read(checkpoint.part_size)
+
+            uploaded_etag = checkpoint.parts.get(str(part_number))
+            if uploaded_etag == f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"':
+                return
+
+            response = self.s3_client.upload_part(
+                Bucket=checkpoint.bucket,
+                Key=checkpoint.key,
+                UploadId=checkpoint.upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            with checkpoint_lock:
+                checkpoint.parts[str(part_number)] = response["ETag"]
+                self._save_checkpoint(checkpoint)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = [executor.submit(upload_part, number) for number in range(1, part_count + 1)]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # Do not start parts still queued once one has failed
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _resume(
+        self, bucket: str, key: str, part_size: int, total_size: int
+    ) -> MultipartUploadCheckpoint | None:
+        """
+        Load the checkpoint for bucket/key if its upload can be continued.
+
+        Completed parts are taken from S3 (list_parts), not from the checkpoint,
+        so parts uploaded just before a crash are kept too. A checkpoint for a
+        different object size or part size is discarded and its upload aborted.
+        """
+        checkpoint = self._load_checkpoint(bucket, key)
+        if checkpoint is None:
+            return None
+
+        if checkpoint.part_size != part_size or checkpoint.total_size != total_size:
+            logger.info(f"Discarding stale multipart checkpoint for s3://{bucket}/{key}")
+            self._abort(checkpoint)
+            self._delete_checkpoint(bucket, key)
+            return None
+
+        try:
+            paginator = self.s3_client.get_paginator("list_parts")
+            checkpoint.parts = {
+                str(part["PartNumber"]): part["ETag"]
+                for page in paginator.paginate(
+                    Bucket=bucket, Key=key, UploadId=checkpoint.upload_id
+                )
+                for part in page.get("Parts", [])
+            }
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                raise
+            logger.info(f"Multipart upload for s3://{bucket}/{key} no longer exists")
+            self._delete_checkpoint(bucket, key)
+            return None
+
+        return checkpoint
+
+    def _abort(self, checkpoint: MultipartUploadCheckpoint) -> None:
+        """Abort the multipart upload so its parts do not linger in the bucket."""
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=checkpoint.bucket, Key=checkpoint.key, UploadId=checkpoint.upload_id
+            )
+            logger.info(f"Aborted multipart upload of s3://{checkpoint.bucket}/{checkpoint.key}")
+        except ClientError:
+            logger.warning(
+                f"Could not abort multipart upload of s3://{checkpoint.bucket}/{checkpoint.key}; "
+                "the bucket lifecycle rule will remove it"
+            )
+
+    def _checkpoint_path(self, bucket: str, key: str) -> Path | None:
+        if self.checkpoint_dir is None:
+            return None
+        digest = hashlib.sha256(f"{bucket}/{key}".encode()).hexdigest()
+        return self.checkpoint_dir / f"{digest}.json"
+
+    def _load_checkpoint(self, bucket: str, key: str) -> MultipartUploadCheckpoint | None:
+        path = self._checkpoint_path(bucket, key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return MultipartUploadCheckpoint(**json.loads(path.read_text()))
+        except (ValueError, TypeError):
+            logger.warning(f"Ignoring unreadable multipart checkpoint {path}")
+            return None
+
+    def _save_checkpoint(self, checkpoint: MultipartUploadCheckpoint) -> None:
+        path = self._checkpoint_path(checkpoint.bucket, checkpoint.key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a crash never leaves a truncated checkpoint
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(asdict(checkpoint)))
+        temporary_path.replace(path)
+
+    def _delete_checkpoint(self, bucket: str, key: str) -> None:
+        path = self._checkpoint_path(bucket, key)
+        if path is not None:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,89 @@
+"""
+Seekable file object over an S3 object, backed by HTTP range requests.
+
+Parquet readers seek to the footer and then to the column chunks they need.
+Handing them an S3RangeReader turns each of those reads into a ranged GET, so
+reading one column or a few row groups transfers only those bytes instead of
+the whole object.
+"""
+
+import io
+import logging
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+class S3RangeReader(io.RawIOBase):
+    """
+    Read-only, seekable view of s3://bucket/key that fetches bytes on demand.
+
+    Every read issues one get_object call with a Range header covering just
+    the requested bytes. The object size must be known up front (from a
+    manifest or a HEAD request) so seeks relative to the end need no request.
+
+    Attributes:
+        request_count: Number of ranged GETs issued so far
+        bytes_fetched: Total bytes transferred so far
+    """
+
+    def __init__(self, s3_client: Any, bucket: str, key: str, size: int):
+        """
+        Initialize the reader.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Bucket holding the object
+            key: Object key
+            size: Object size in bytes
+        """
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.request_count = 0
+        self.bytes_fetched = 0
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), self.size - self._position)
+        if length <= 0:
+            return 0
+
+        end = self._position + length - 1
+        response = self.s3_client.get_object(
+            Bucket=self.bucket, Key=self.key, Range=f"bytes={self._position}-{end}"
+        )
+        data = response["Body"].read()
+        self.request_count += 1
+        self.bytes_fetched += len(data)
+        logger.debug(f"Fetched bytes {self._position}-{end} of s3://{self.bucket}/{self.key}")
+
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
@@ -9,20 +9,35 @@ SECURITY NOTE: This repository handles AWS credentials and MUST sanitize
 all error messages before logging or raising exceptions.
 """
 
+import functools
+import json
 import logging
 import re
-from typing import Any
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
 
 from botocore.exceptions import ClientError
 
 from epistemix_platform.exceptions import ResultsStorageError
 from epistemix_platform.models.job_s3_prefix import JobS3Prefix
+from epistemix_platform.models.results_manifest import ResultsManifest
 from epistemix_platform.models.upload_location import UploadLocation
-from epistemix_platform.utils.s3_client import create_s3_client
+from epistemix_platform.repositories.presigned_url_cache import (
+    PresignedUrlCache,
+    signing_credential_scope,
+)
+from epistemix_platform.repositories.s3_multipart_upload import S3MultipartUploader
+from epistemix_platform.repositories.s3_range_reader import S3RangeReader
+from epistemix_platform.repositories.s3_url_signer import S3UrlSigner
+from epistemix_platform.utils.s3_client import create_s3_client, get_aws_session
 
 
 logger = logging.getLogger(__name__)
 
+COLUMNAR_MANIFEST_NAME = "manifest.json"
+_PARQUET_MAGIC = b"PAR1"
+
 
 class S3ResultsRepository:
     """
@@ -49,6 +64,9 @@ class S3ResultsRepository:
         bucket_name: str,
         region_name: str | None = None,
         s3_client: Any | None = None,
+        multipart_uploader: S3MultipartUploader | None = None,
+        url_cache: PresignedUrlCache | None = None,
+        session: Any | None = None,
     ):
         """
         Initialize S3 results repository.
@@ -66,13 +84,25 @@ class S3ResultsRepository:
             region_name: AWS region name (optional, will use default region from config/environment)
             s3_client: Optional S3 client instance (for testing).
                 If not provided, creates a new one via create_s3_client().
+            multipart_uploader: Engine for streamed uploads (part size, concurrency,
+                resume checkpoints). Defaults to an S3MultipartUploader on s3_client.
+            url_cache: Shared cache of presigned download URLs, so repeated requests
+                for the same results reuse still-valid URLs (None signs every time)
+            session: boto3 Session whose credentials sign download URLs (defaults to
+                the process-wide session for region_name). The S3 client is created
+                from it when s3_client is not given.
         """
         self.bucket_name = bucket_name
-        self.s3_client = create_s3_client(region_name=region_name, s3_client=s3_client)
+        self.session = session or get_aws_session(region_name)
+        self.s3_client = create_s3_client(
+            region_name=region_name, s3_client=s3_client, session=self.session
+        )
+        self.multipart_uploader = multipart_uploader or S3MultipartUploader(self.s3_client)
+        self.url_cache = url_cache
         logger.info(f"S3ResultsRepository configured for bucket: {bucket_name}")
 
     def upload_results(
-        self, job_id: int, run_id: int, zip_content: bytes, s3_prefix: JobS3Prefix
+        self, job_id: int, run_id: int, zip_content: bytes | BinaryIO, s3_prefix: JobS3Prefix
     ) -> UploadLocation:
         """
         Upload simulation results ZIP to S3 using IAM credentials.
@@ -84,10 +114,15 @@ class S3ResultsRepository:
         Example: jobs/12/2025/10/23/211500/run_4_results.zip
         Content-Type: application/zip
 
+        Bytes are sent with a single put_object. A file object is streamed by
+        the multipart uploader: parts are uploaded concurrently, a failed upload
+        is aborted (or checkpointed for resume), and multi-GB results are never
+        read into memory or limited by the 5 GB single-PUT cap.
+
         Args:
             job_id: Job identifier
             run_id: Run identifier
-            zip_content: Binary ZIP file content
+            zip_content: ZIP file content, as bytes or a binary file object
             s3_prefix: JobS3Prefix for consistent path generation
 
         Returns:
@@ -106,12 +141,17 @@ class S3ResultsRepository:
         object_key = s3_prefix.run_results_key(run_id)
 
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=object_key,
-                Body=zip_content,
-                ContentType="application/zip",
-            )
+            if isinstance(zip_content, bytes):
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    Body=zip_content,
+                    ContentType="application/zip",
+                )
+            else:
+                self.multipart_uploader.upload(
+                    zip_content, self.bucket_name, object_key, content_type="application/zip"
+                )
             logger.info(
                 f"Successfully uploaded results to S3: s3://{self.bucket_name}/{object_key}"
             )
@@ -136,6 +176,100 @@ class S3ResultsRepository:
 
         return UploadLocation(url=results_url)
 
+    def get_results_manifest(self, run_id: int, s3_prefix: JobS3Prefix) -> ResultsManifest | None:
+        """
+        Fetch the content-hash manifest of a run's last results upload.
+
+        The manifest is only returned while the ZIP it describes is still in
+        place: if the ZIP is missing or has been replaced (its ETag differs),
+        None is returned so the results are uploaded again.
+
+        Args:
+            run_id: Run identifier
+            s3_prefix: JobS3Prefix of the run's job
+
+        Returns:
+            The manifest, or None if there is no usable manifest for the run
+
+        Raises:
+            ResultsStorageError: If an S3 request fails (with sanitized error message)
+        """
+        manifest_key = s3_prefix.run_results_manifest_key(run_id)
+        results_key = s3_prefix.run_results_key(run_id)
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=manifest_key)
+            manifest = ResultsManifest.from_dict(json.loads(response["Body"].read()))
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=results_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            sanitized_message = self._sanitize_credentials(str(e))
+            raise ResultsStorageError(
+                f"Failed to read results manifest: {sanitized_message}", sanitized=True
+            ) from e
+        except (ValueError, KeyError) as e:
+            logger.warning(
+                f"Ignoring unreadable results manifest s3://{self.bucket_name}/{manifest_key}: {e}"
+            )
+            return None
+
+        if manifest.results_etag != head["ETag"]:
+            logger.info(f"Results ZIP for run {run_id} changed since its manifest was written")
+            return None
+        return manifest
+
+    def save_results_manifest(
+        self, job_id: int, run_id: int, manifest: ResultsManifest, s3_prefix: JobS3Prefix
+    ) -> ResultsManifest:
+        """
+        Store the content-hash manifest of the run's results ZIP just uploaded.
+
+        The manifest is stamped with the ZIP's URL and current ETag, so a later
+        get_results_manifest can tell whether the ZIP is still the one it describes.
+
+        Args:
+            job_id: Job identifier
+            run_id: Run identifier
+            manifest: Content hashes of the files in the uploaded ZIP
+            s3_prefix: JobS3Prefix for consistent path generation
+
+        Returns:
+            The stored manifest, with results_url and results_etag set
+
+        Raises:
+            ValueError: If job_id does not match s3_prefix.job_id
+            ResultsStorageError: If S3 upload fails (with sanitized error message)
+        """
+        if s3_prefix.job_id != job_id:
+            raise ValueError(
+                f"s3_prefix.job_id ({s3_prefix.job_id}) does not match job_id ({job_id})"
+            )
+
+        results_key = s3_prefix.run_results_key(run_id)
+        manifest_key = s3_prefix.run_results_manifest_key(run_id)
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=results_key)
+            stored = ResultsManifest(
+                files=manifest.files,
+                results_url=f"https://{self.bucket_name}.s3.amazonaws.com/{results_key}",
+                results_etag=head["ETag"],
+            )
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=manifest_key,
+                Body=json.dumps(stored.to_dict()).encode("utf-8"),
+                ContentType="application/json",
+            )
+        except ClientError as e:
+            sanitized_message = self._sanitize_credentials(str(e))
+            logger.error(f"S3 results manifest upload failed: {sanitized_message}")  # noqa: TRY400
+            raise ResultsStorageError(
+                f"Failed to upload results manifest to S3: {sanitized_message}", sanitized=True
+            ) from e
+
+        logger.info(f"Saved results manifest to s3://{self.bucket_name}/{manifest_key}")
+        return stored
+
     def get_download_url(self, results_url: str, expiration_seconds: int = 3600) -> UploadLocation:
         """
         Generate presigned GET URL for downloading results.
@@ -166,8 +300,8 @@ class S3ResultsRepository:
                 f"Presigning URL for different bucket: {bucket} (repo bucket={self.bucket_name})"
             )
 
-        try:
-            presigned_url = self.s3_client.generate_presigned_url(
+        def sign() -> str:
+            return self.s3_client.generate_presigned_url(
                 "get_object",
                 Params={
                     "Bucket": bucket,
@@ -175,6 +309,19 @@ class S3ResultsRepository:
                 },
                 ExpiresIn=expiration_seconds,
             )
+
+        try:
+            if self.url_cache is None:
+                presigned_url = sign()
+            else:
+                presigned_url = self.url_cache.get_or_sign(
+                    "GET",
+                    bucket,
+                    object_key,
+                    expiration_seconds,
+                    sign,
+                    credential_scope=signing_credential_scope(self.session),
+                )
             logger.info(
                 f"Generated presigned download URL for {object_key}, "
                 f"expires in {expiration_seconds}s"
@@ -188,6 +335,259 @@ class S3ResultsRepository:
 
         return UploadLocation(url=presigned_url)
 
+    def get_download_urls(
+        self, objects: Iterable[tuple[str, str]], expiration_seconds: int = 3600
+    ) -> Iterator[str]:
+        """
+        Generate presigned GET URLs for many results objects at once.
+
+        Unlike get_download_url, this takes (bucket, key) pairs directly (no
+        URL parsing) and signs them all with one S3UrlSigner: credentials,
+        date and signing key are resolved once, when this method is called,
+        and each URL then costs a few microseconds. URLs are produced lazily,
+        in the order of objects, so callers can stream them. Buckets are
+        assumed to be in the client's region. With a url_cache, objects signed
+        recently enough are answered from the cache instead.
+
+        Args:
+            objects: (bucket, key) pairs to sign
+            expiration_seconds: URL validity period in seconds (default 1 hour)
+
+        Returns:
+            Iterator of presigned URLs, one per object
+
+        Raises:
+            ValueError: If expiration_seconds is outside 1 second to 7 days
+            ResultsStorageError: If no AWS credentials are available
+        """
+        credentials = self.session.get_credentials()
+        if credentials is None:
+            raise ResultsStorageError("No AWS credentials available to sign download URLs")
+
+        endpoint_url = self.s3_client.meta.endpoint_url
+        signer = S3UrlSigner(
+            credentials,
+            region_name=self.s3_client.meta.region_name or "us-east-1",
+            expiration_seconds=expiration_seconds,
+            # Default AWS endpoints are addressed virtual-hosted style by the signer
+            endpoint_url=None if endpoint_url.endswith(".amazonaws.com") else endpoint_url,
+        )
+        logger.info(f"Signing download URLs, expiring in {expiration_seconds}s")
+        if self.url_cache is None:
+            return (signer.sign(bucket, key) for bucket, key in objects)
+
+        url_cache = self.url_cache
+        access_key = credentials.access_key
+        return (
+            url_cache.get_or_sign(
+                "GET",
+                bucket,
+                key,
+                expiration_seconds,
+                functools.partial(signer.sign, bucket, key),
+                credential_scope=access_key,
+            )
+            for bucket, key in objects
+        )
+
+    def upload_columnar_results(
+        self, job_id: int, run_id: int, columnar_dir: Path, s3_prefix: JobS3Prefix
+    ) -> UploadLocation:
+        """
+        Upload a run's Parquet results and manifest next to its results ZIP.
+
+        Every file under columnar_dir is uploaded below
+        s3_prefix.run_columnar_prefix(run_id), keeping its relative path. The
+        manifest is uploaded last, so readers never see a manifest that points
+        at missing files.
+
+        Args:
+            job_id: Job identifier
+            run_id: Run identifier
+            columnar_dir: Directory holding manifest.json and the Parquet files
+            s3_prefix: JobS3Prefix for consistent path generation
+
+        Returns:
+            UploadLocation with the S3 HTTPS URL of the manifest
+
+        Raises:
+            ValueError: If job_id does not match s3_prefix.job_id or the manifest is missing
+            ResultsStorageError: If S3 upload fails (with sanitized error message)
+        """
+        if s3_prefix.job_id != job_id:
+            raise ValueError(
+                f"s3_prefix.job_id ({s3_prefix.job_id}) does not match job_id ({job_id})"
+            )
+        manifest_path = columnar_dir / COLUMNAR_MANIFEST_NAME
+        if not manifest_path.is_file():
+            raise ValueError(f"No {COLUMNAR_MANIFEST_NAME} in columnar results: {columnar_dir}")
+
+        prefix = s3_prefix.run_columnar_prefix(run_id)
+        data_files = [
+            path
+            for path in sorted(columnar_dir.rglob("*"))
+            if path.is_file() and path != manifest_path
+        ]
+
+        try:
+            for path in data_files:
+                with path.open("rb") as f:
+                    self.multipart_uploader.upload(
+                        f,
+                        self.bucket_name,
+                        f"{prefix}/{path.relative_to(columnar_dir).as_posix()}",
+                        content_type="application/vnd.apache.parquet",
+                    )
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=f"{prefix}/{COLUMNAR_MANIFEST_NAME}",
+                Body=manifest_path.read_bytes(),
+                ContentType="application/json",
+            )
+        except ClientError as e:
+            sanitized_message = self._sanitize_credentials(str(e))
+            logger.error(f"S3 columnar upload failed: {sanitized_message}")  # noqa: TRY400
+            raise ResultsStorageError(
+                f"Failed to upload columnar results to S3: {sanitized_message}", sanitized=True
+            ) from e
+
+        logger.info(
+            f"Uploaded {len(data_files)} columnar files to s3://{self.bucket_name}/{prefix}/"
+        )
+        return UploadLocation(
+            url=f"https://{self.bucket_name}.s3.amazonaws.com/{prefix}/{COLUMNAR_MANIFEST_NAME}"
+        )
+
+    def get_columnar_manifest(self, run_id: int, s3_prefix: JobS3Prefix) -> dict[str, Any]:
+        """
+        Fetch the manifest describing a run's Parquet results.
+
+        Args:
+            run_id: Run identifier
+            s3_prefix: JobS3Prefix of the run's job
+
+        Returns:
+            Manifest dict with a "tables" mapping (see simulation_runner.columnar)
+
+        Raises:
+            ValueError: If the run has no columnar results
+            ResultsStorageError: If the S3 request fails
+        """
+        key = f"{s3_prefix.run_columnar_prefix(run_id)}/{COLUMNAR_MANIFEST_NAME}"
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                raise ValueError(f"No columnar results for run {run_id}") from e
+            sanitized_message = self._sanitize_credentials(str(e))
+            raise ResultsStorageError(
+                f"Failed to read columnar manifest: {sanitized_message}", sanitized=True
+            ) from e
+        return json.loads(response["Body"].read())
+
+    def read_columnar_table(
+        self,
+        run_id: int,
+        s3_prefix: JobS3Prefix,
+        table: str,
+        columns: list[str] | None = None,
+        start_day: int | None = None,
+        end_day: int | None = None,
+    ) -> dict[str, list]:
+        """
+        Read columns and a day range of one Parquet results table with range requests.
+
+        Row groups outside [start_day, end_day] are skipped using the day
+        ranges in the manifest. The Parquet footer is fetched from the range
+        the manifest records, then only the requested column chunks of the
+        remaining row groups are fetched from S3.
+
+        Args:
+            run_id: Run identifier
+            s3_prefix: JobS3Prefix of the run's job
+            table: Table name from the manifest, e.g. "RUN1/out"
+            columns: Columns to read (None reads every column)
+            start_day: First simulation day to include (inclusive)
+            end_day: Last simulation day to include (inclusive)
+
+        Returns:
+            Column name -> list of values, in day order
+
+        Raises:
+            ValueError: If the run, table or a column does not exist, or a day
+                range is requested for a table without a day column
+            ResultsStorageError: If an S3 request fails
+        """
+        # Imported here so only the opt-in columnar reader pays for loading pyarrow
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        manifest = self.get_columnar_manifest(run_id, s3_prefix)
+        table_info = manifest["tables"].get(table)
+        if table_info is None:
+            raise ValueError(
+                f"Unknown table {table!r}; available: {', '.join(sorted(manifest['tables']))}"
+            )
+
+        available = [column["name"] for column in table_info["columns"]]
+        unknown = [column for column in columns or [] if column not in available]
+        if unknown:
+            raise ValueError(f"Unknown columns for table {table!r}: {', '.join(unknown)}")
+        selected = list(columns) if columns else available
+
+        day_column = table_info["day_column"]
+        day_filtered = start_day is not None or end_day is not None
+        if day_filtered and day_column is None:
+            raise ValueError(f"Table {table!r} has no day column to filter on")
+
+        row_groups = [
+            index
+            for index, group in enumerate(table_info["row_groups"])
+            if not day_filtered or _row_group_overlaps(group, start_day, end_day)
+        ]
+        read_columns = (
+            selected + [day_column] if day_filtered and day_column not in selected else selected
+        )
+        if not row_groups:
+            return {column: [] for column in selected}
+
+        reader = S3RangeReader(
+            self.s3_client,
+            self.bucket_name,
+            f"{s3_prefix.run_columnar_prefix(run_id)}/{table_info['path']}",
+            table_info["size"],
+        )
+        try:
+            # The manifest locates the footer, so the metadata is one small GET
+            # instead of the tail read a Parquet reader would otherwise make
+            footer = table_info["footer"]
+            reader.seek(footer["offset"])
+            metadata = pq.read_metadata(
+                pa.BufferReader(_PARQUET_MAGIC + reader.read(footer["length"]))
+            )
+            arrow_table = pq.ParquetFile(reader, metadata=metadata).read_row_groups(
+                row_groups, columns=read_columns
+            )
+        except ClientError as e:
+            sanitized_message = self._sanitize_credentials(str(e))
+            raise ResultsStorageError(
+                f"Failed to read columnar results: {sanitized_message}", sanitized=True
+            ) from e
+
+        # Row groups at either end of the range may hold days outside it
+        if start_day is not None:
+            arrow_table = arrow_table.filter(pc.greater_equal(arrow_table[day_column], start_day))
+        if end_day is not None:
+            arrow_table = arrow_table.filter(pc.less_equal(arrow_table[day_column], end_day))
+
+        logger.info(
+            f"Read {arrow_table.num_rows} rows x {len(selected)} columns of {table} for run "
+            f"{run_id} in {reader.request_count} range requests ({reader.bytes_fetched} of "
+            f"{table_info['size']} bytes)"
+        )
+        return arrow_table.select(selected).to_pydict()
+
     def _extract_key_from_url(self, s3_url: str) -> str:
         """
         Extract S3 object key from S3 URL (legacy helper).
@@ -345,3 +745,12 @@ class S3ResultsRepository:
         message = re.sub(r'"Signature":\s*"[^"]+"', '"Signature": "[REDACTED]"', message)
 
         return message
+
+
+def _row_group_overlaps(group: dict[str, Any], start_day: int | None, end_day: int | None) -> bool:
+    """Whether a manifest row group may hold days in [start_day, end_day]."""
+    if group["day_min"] is None or group["day_max"] is None:
+        return True
+    if start_day is not None and group["day_max"] < start_day:
+        return False
+    return end_day is None or group["day_min"] <= end_day
@@ -3,22 +3,37 @@ S3-based upload location repository implementation.
 This is a concrete implementation of the IUploadLocationRepository interface using AWS S3.
 """
 
+import hashlib
 import io
+import json
 import logging
+import os
+import shutil
+import tempfile
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 
 from epistemix_platform.models import (
+    ArchiveSweep,  # pants: no-infer-dep
     JobS3Prefix,  # pants: no-infer-dep
+    RunArrayManifest,  # pants: no-infer-dep
     UploadContent,  # pants: no-infer-dep
     UploadLocation,  # pants: no-infer-dep
     ZipFileEntry,  # pants: no-infer-dep
 )
-from epistemix_platform.utils.s3_client import create_s3_client
+from epistemix_platform.repositories.presigned_url_cache import (
+    PresignedUrlCache,
+    signing_credential_scope,
+)
+from epistemix_platform.repositories.s3_zip_inspector import S3ZipInspector
+from epistemix_platform.utils.s3_client import create_s3_client, get_aws_session
 
 
 if TYPE_CHECKING:
@@ -29,6 +44,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from S3 and written to disk at a time by download_to_file
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# ZIP entries previewed in upload content, and how much of each is shown
+PREVIEWABLE_SUFFIXES = (".txt", ".json", ".fred", ".xml", ".csv", ".log", ".py", ".sh")
+ZIP_PREVIEW_CHARS = 500
+# Enough UTF-8 bytes for ZIP_PREVIEW_CHARS characters
+ZIP_PREVIEW_BYTES = 4 * ZIP_PREVIEW_CHARS
+
+# Storage class archive_uploads and archive_prefixes transition objects to, and the
+# classes an object already counts as archived in
+ARCHIVE_STORAGE_CLASS = "GLACIER"
+ARCHIVED_STORAGE_CLASSES = frozenset({"GLACIER", "DEEP_ARCHIVE", "GLACIER_IR"})
+# Objects transitioned at once by archive_prefixes
+DEFAULT_ARCHIVE_CONCURRENCY = 16
+# Sweeps with at least this many objects are written to an S3 Batch Operations
+# manifest instead of being copied one request at a time (0 never writes one)
+DEFAULT_BATCH_OPERATIONS_THRESHOLD = 10_000
+# Where archive_prefixes writes Batch Operations manifests
+BATCH_OPERATIONS_MANIFEST_PREFIX = "batch-operations/archive"
+
 
 class S3UploadLocationRepository:
     """
@@ -45,6 +81,10 @@ class S3UploadLocationRepository:
         region_name: str | None = None,
         expiration_seconds: int = 3600,
         s3_client: Any | None = None,  # Allow injection for testing
+        url_cache: PresignedUrlCache | None = None,
+        archive_concurrency: int = DEFAULT_ARCHIVE_CONCURRENCY,
+        batch_operations_threshold: int = DEFAULT_BATCH_OPERATIONS_THRESHOLD,
+        session: Any | None = None,
     ):
         """
         Initialize the S3 upload location repository.
@@ -63,10 +103,24 @@ class S3UploadLocationRepository:
             expiration_seconds: How long the pre-signed URL should be valid (default: 1 hour)
             s3_client: Optional S3 client instance (for testing).
                 If not provided, creates a new one.
+            url_cache: Shared cache of presigned upload URLs, so re-requesting the
+                location of the same object reuses a still-valid URL (None signs every time)
+            archive_concurrency: Objects transitioned at once by archive_prefixes
+            batch_operations_threshold: Number of objects from which archive_prefixes
+                writes an S3 Batch Operations manifest instead of copying them (0 never does)
+            session: boto3 Session whose credentials sign upload URLs (defaults to
+                the process-wide session for region_name). The S3 client is created
+                from it when s3_client is not given.
         """
         self.bucket_name = bucket_name
         self.expiration_seconds = expiration_seconds
-        self.s3_client = create_s3_client(region_name=region_name, s3_client=s3_client)
+        self.session = session or get_aws_session(region_name)
+        self.s3_client = create_s3_client(
+            region_name=region_name, s3_client=s3_client, session=self.session
+        )
+        self.url_cache = url_cache
+        self.archive_concurrency = archive_concurrency
+        self.batch_operations_threshold = batch_operations_threshold
         logger.info(f"S3UploadLocationRepository configured for bucket: {bucket_name}")
 
     def get_upload_location(
@@ -96,20 +150,7 @@ class S3UploadLocationRepository:
 
         try:
             # Generate pre-signed URL for PUT operation
-            # Note: ServerSideEncryption MUST be included in presigned URL Params
-            # to ensure S3 applies encryption. When included in Params, boto3 signs
-            # it into the URL and S3 applies it automatically - the client does NOT
-            # need to send any x-amz-server-side-encryption headers.
-            presigned_url = self.s3_client.generate_presigned_url(
-                "put_object",
-                Params={
-                    "Bucket": self.bucket_name,
-                    "Key": object_key,
-                    "ServerSideEncryption": "AES256",
-                },
-                ExpiresIn=self.expiration_seconds,
-                HttpMethod="PUT",
-            )
+            presigned_url = self._presign_put(object_key)
 
             # Sanitize URL for logging (remove query string with AWS credentials)
             safe_url, _ = presigned_url.split("?")
@@ -130,6 +171,36 @@ class S3UploadLocationRepository:
             logger.exception(error_message)
             raise ValueError(error_message) from e
 
+    def _presign_put(self, object_key: str) -> str:
+        """Presign a PUT of object_key, reusing a cached URL when one is still valid."""
+
+        def sign() -> str:
+            # Note: ServerSideEncryption MUST be included in presigned URL Params
+            # to ensure S3 applies encryption. When included in Params, boto3 signs
+            # it into the URL and S3 applies it automatically - the client does NOT
+            # need to send any x-amz-server-side-encryption headers.
+            return self.s3_client.generate_presigned_url(
+                "put_object",
+                Params={
+                    "Bucket": self.bucket_name,
+                    "Key": object_key,
+                    "ServerSideEncryption": "AES256",
+                },
+                ExpiresIn=self.expiration_seconds,
+                HttpMethod="PUT",
+            )
+
+        if self.url_cache is None:
+            return sign()
+        return self.url_cache.get_or_sign(
+            "PUT",
+            self.bucket_name,
+            object_key,
+            self.expiration_seconds,
+            sign,
+            credential_scope=signing_credential_scope(self.session),
+        )
+
     def _generate_s3_key_from_upload(
         self, job_upload: "JobUpload", s3_prefix: "JobS3Prefix"
     ) -> str:
@@ -272,6 +343,112 @@ class S3UploadLocationRepository:
             logger.exception(error_message)
             raise ValueError(error_message) from e
 
+    def download_to_file(
+        self, location: "UploadLocation", file_path: Path, etag: str | None = None
+    ) -> str | None:
+        """
+        Stream an S3 object to a local file without parsing it.
+
+        The object is copied in DOWNLOAD_CHUNK_SIZE chunks to a temporary file
+        in the destination directory, then renamed over file_path. With an
+        etag, the GET is conditional (If-None-Match) and S3 answers 304 Not
+        Modified without a body when the object is unchanged.
+
+        Args:
+            location: The upload location containing the URL
+            file_path: Where to write the file
+            etag: ETag of the copy already at file_path
+
+        Returns:
+            The object's ETag, or None if it still matches etag
+
+        Raises:
+            ValueError: If the object cannot be downloaded or written
+        """
+        s3_key = self._extract_s3_key_from_url(location.url)
+        if not s3_key:
+            raise ValueError(f"Could not extract S3 key from URL: {location.url}")
+
+        request = {"Bucket": self.bucket_name, "Key": s3_key}
+        if etag:
+            request["IfNoneMatch"] = etag
+
+        try:
+            response = self.s3_client.get_object(**request)
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            if etag and error.get("Code") in ("304", "NotModified"):
+                logger.info(f"S3 key {s3_key} unchanged (ETag {etag}), keeping {file_path}")
+                return None
+            error_message = f"S3 error ({error.get('Code', 'Unknown')}): {e}"
+            logger.exception(error_message)
+            raise ValueError(error_message) from e
+        except NoCredentialsError as e:
+            error_message = f"AWS credentials error: {e}"
+            logger.exception(error_message)
+            raise ValueError(error_message) from e
+
+        try:
+            _write_atomically(file_path, response["Body"])
+        except Exception as e:
+            error_message = f"Failed to download {s3_key} to {file_path}: {e}"
+            logger.exception(error_message)
+            raise ValueError(error_message) from e
+
+        logger.info(f"Downloaded S3 key {s3_key} to {file_path}")
+        return response.get("ETag")
+
+    def preview_content(self, location: "UploadLocation") -> "UploadContent":
+        """
+        Read a preview of the content of an S3 upload location.
+
+        ZIP uploads (job_input.zip) are inspected with S3 byte-range GETs: the
+        central directory is read from the end of the archive, then only the
+        first ZIP_PREVIEW_BYTES of each previewable entry. The transfer is a few
+        kilobytes however large the archive is, and the result carries the entry
+        list and summary but not the archive bytes. Other uploads (JSON configs)
+        are read in full, as by read_content.
+
+        Args:
+            location: The upload location containing the URL
+
+        Returns:
+            UploadContent domain model
+
+        Raises:
+            ValueError: If the content cannot be read
+        """
+        s3_key = self._extract_s3_key_from_url(location.url)
+        if not s3_key:
+            raise ValueError(f"Could not extract S3 key from URL: {location.url}")
+        if not (s3_key.endswith(".zip") or "job_input" in s3_key):
+            return self.read_content(location)
+
+        inspector = S3ZipInspector(self.s3_client, self.bucket_name, s3_key)
+        try:
+            if not inspector.members():
+                # An empty archive is tiny; read_content handles it as before
+                return self.read_content(location)
+            upload_content = self._preview_zip_members(inspector)
+        except ValueError as e:
+            logger.warning(f"Could not inspect {s3_key} as a ZIP, reading it in full: {e}")
+            return self.read_content(location)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_message = f"S3 error ({error_code}): {e}"
+            logger.exception(error_message)
+            raise ValueError(error_message) from e
+        except NoCredentialsError as e:
+            error_message = f"AWS credentials error: {e}"
+            logger.exception(error_message)
+            raise ValueError(error_message) from e
+
+        logger.info(
+            f"Previewed ZIP S3 key {s3_key} with {inspector.request_count} range requests "
+            f"({inspector.bytes_fetched} bytes)"
+        )
+        return upload_content
+
     def _extract_s3_key_from_url(self, url: str) -> str | None:
         """
         Extract the S3 key from a URL using pattern matching.
@@ -382,47 +559,52 @@ class S3UploadLocationRepository:
         zip_buffer = io.BytesIO(content_bytes)
         with zipfile.ZipFile(zip_buffer, "r") as zip_file:
             entries = []
-            content_parts = [f"[ZIP Archive Contents - {len(zip_file.namelist())} files]"]
-            content_parts.append("=" * 60)
-
-            for file_name in zip_file.namelist():
-                info = zip_file.getinfo(file_name)
-
+            for info in zip_file.infolist():
                 # Create preview for text files
                 preview = None
-                if file_name.endswith(
-                    (".txt", ".json", ".fred", ".xml", ".csv", ".log", ".py", ".sh")
-                ):
+                if info.filename.endswith(PREVIEWABLE_SUFFIXES):
                     try:
-                        with zip_file.open(file_name) as f:
-                            file_content = f.read().decode("utf-8", errors="replace")
-                            preview = file_content[:500]
-                            if len(file_content) > 500:
-                                preview += f"\n... (truncated, {len(file_content)} total chars)"
+                        with zip_file.open(info) as f:
+                            preview = _make_preview(f.read(ZIP_PREVIEW_BYTES), info.file_size)
                     except Exception as e:
                         preview = f"[Could not preview: {e}]"
 
-                entry = ZipFileEntry(
-                    name=file_name,
-                    size=info.file_size,
-                    compressed_size=info.compress_size,
-                    preview=preview,
+                entries.append(
+                    ZipFileEntry(
+                        name=info.filename,
+                        size=info.file_size,
+                        compressed_size=info.compress_size,
+                        preview=preview,
+                    )
                 )
-                entries.append(entry)
-
-                # Build text summary
-                content_parts.append(f"\n📁 {file_name}")
-                content_parts.append(f"   Size: {info.file_size} bytes")
-                content_parts.append(f"   Compressed: {info.compress_size} bytes")
-                if preview:
-                    content_parts.append("   Preview:")
-                    content_parts.append("   " + "-" * 40)
-                    for line in preview.split("\n")[:10]:
-                        content_parts.append(f"   {line}")
-
-            content_summary = "\n".join(content_parts)
+
             # Pass the original binary content along with the summary
-            return UploadContent.create_zip_archive(content_bytes, entries, content_summary)
+            return UploadContent.create_zip_archive(
+                content_bytes, entries, _summarize_zip_entries(entries)
+            )
+
+    def _preview_zip_members(self, inspector: S3ZipInspector) -> "UploadContent":
+        """Describe a ZIP from its central directory and the start of each text entry."""
+        entries = []
+        for member in inspector.members():
+            preview = None
+            if member.name.endswith(PREVIEWABLE_SUFFIXES):
+                try:
+                    prefix = inspector.read_prefix(member, ZIP_PREVIEW_BYTES)
+                    preview = _make_preview(prefix, member.size)
+                except (ValueError, zlib.error) as e:
+                    preview = f"[Could not preview: {e}]"
+
+            entries.append(
+                ZipFileEntry(
+                    name=member.name,
+                    size=member.size,
+                    compressed_size=member.compressed_size,
+                    preview=preview,
+                )
+            )
+
+        return UploadContent.create_zip_preview(entries, _summarize_zip_entries(entries))
 
     def _looks_like_json(self, content: str) -> bool:
         """Check if content looks like JSON."""
@@ -522,7 +704,7 @@ class S3UploadLocationRepository:
                     Bucket=self.bucket_name,
                     Key=s3_key,
                     CopySource=copy_source,
-                    StorageClass="GLACIER",
+                    StorageClass=ARCHIVE_STORAGE_CLASS,
                     MetadataDirective="COPY",
                 )
 
@@ -540,6 +722,157 @@ class S3UploadLocationRepository:
 
         return locations_to_archive
 
+    def archive_prefixes(
+        self, prefixes: list[str], age_threshold: datetime | None, dry_run: bool = False
+    ) -> "ArchiveSweep":
+        """
+        Archive every object under the given prefixes that is older than age_threshold.
+
+        Ages and storage classes come from ListObjectsV2 pages (1000 objects per
+        request) rather than a HEAD per object, and objects already in an archive
+        storage class are left alone. The remaining objects are transitioned on a
+        thread pool, or, from batch_operations_threshold objects, written to a CSV
+        manifest for an S3 Batch Operations copy job to transition.
+
+        Args:
+            prefixes: Key prefixes to sweep, e.g. "jobs/12/2025/10/23/211500/" or "jobs/"
+            age_threshold: Only archive objects last modified before this (None archives all)
+            dry_run: If True, only report what would be archived
+
+        Returns:
+            ArchiveSweep listing the archived (or manifested) object keys
+
+        Raises:
+            ValueError: If a prefix cannot be listed or the manifest cannot be written
+        """
+        sweep = ArchiveSweep(prefixes=list(prefixes), dry_run=dry_run)
+        candidates = []
+        for prefix in dict.fromkeys(prefixes):
+            for obj in self._list_objects(prefix):
+                if obj.get("StorageClass", "STANDARD") in ARCHIVED_STORAGE_CLASSES:
+                    sweep.already_archived += 1
+                # Compared like filter_by_age, without timezone info
+                elif age_threshold and obj["LastModified"].replace(tzinfo=None) >= age_threshold:
+                    sweep.too_recent += 1
+                else:
+                    candidates.append(obj["Key"])
+
+        if dry_run or not candidates:
+            sweep.archived = candidates
+        elif 0 < self.batch_operations_threshold <= len(candidates):
+            sweep.manifest_url, sweep.manifest_etag = self._write_batch_operations_manifest(
+                candidates
+            )
+            sweep.manifested = candidates
+        else:
+            self._transition_objects(candidates, sweep)
+
+        logger.info(f"{sweep.summary()} under {len(sweep.prefixes)} prefixes")
+        return sweep
+
+    def _list_objects(self, prefix: str):
+        """Yield the ListObjectsV2 entries under prefix, one page at a time."""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        try:
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                yield from page.get("Contents", [])
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            raise ValueError(f"Failed to list {prefix}: S3 error ({error_code})") from e
+
+    def _transition_objects(self, keys: list[str], sweep: "ArchiveSweep") -> None:
+        """Copy each object onto itself in the archive storage class, concurrently."""
+
+        def transition(key: str) -> None:
+            self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                CopySource={"Bucket": self.bucket_name, "Key": key},
+                StorageClass=ARCHIVE_STORAGE_CLASS,
+                MetadataDirective="COPY",
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, self.archive_concurrency)) as executor:
+            futures = {key: executor.submit(transition, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    future.result()
+                except ClientError as e:
+                    error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                    msg = f"Failed to archive {key}: {error_code}"
+                    logger.error(msg)  # noqa: TRY400
+                    sweep.errors.append(msg)
+                except Exception as e:
+                    msg = f"Unexpected error archiving {key}: {e}"
+                    logger.error(msg)  # noqa: TRY400
+                    sweep.errors.append(msg)
+                else:
+                    sweep.archived.append(key)
+                    logger.debug(f"Archived to Glacier: {key}")
+
+    def _write_batch_operations_manifest(self, keys: list[str]) -> tuple[str, str]:
+        """
+        Write keys as an S3 Batch Operations CSV manifest (bucket,url-encoded key).
+
+        Returns:
+            The manifest's S3 URL and ETag, which a Batch Operations job needs
+        """
+        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        object_key = f"{BATCH_OPERATIONS_MANIFEST_PREFIX}/{timestamp}.csv"
+        body = "".join(f"{self.bucket_name},{quote(key)}\n" for key in keys)
+
+        try:
+            response = self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=object_key,
+                Body=body.encode("utf-8"),
+                ContentType="text/csv",
+                ServerSideEncryption="AES256",
+            )
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_message = f"S3 error ({error_code}): {e}"
+            logger.exception(error_message)
+            raise ValueError(f"Failed to write archive manifest: {error_message}") from e
+
+        logger.info(f"Wrote Batch Operations manifest of {len(keys)} objects -> {object_key}")
+        return f"s3://{self.bucket_name}/{object_key}", response["ETag"]
+
+    def write_run_array_manifest(
+        self, manifest: "RunArrayManifest", s3_prefix: "JobS3Prefix"
+    ) -> "UploadLocation":
+        """
+        Write an AWS Batch array-job manifest to S3.
+
+        Args:
+            manifest: The manifest mapping array indexes to run IDs
+            s3_prefix: JobS3Prefix for consistent S3 path generation
+
+        Returns:
+            UploadLocation with the S3 URL of the manifest
+
+        Raises:
+            ValueError: If the manifest cannot be written
+        """
+        object_key = s3_prefix.run_array_manifest_key(manifest.first_run_id)
+
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=object_key,
+                Body=json.dumps(manifest.to_dict()).encode("utf-8"),
+                ContentType="application/json",
+                ServerSideEncryption="AES256",
+            )
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            error_message = f"S3 error ({error_code}): {e}"
+            logger.exception(error_message)
+            raise ValueError(f"Failed to write run array manifest: {error_message}") from e
+
+        logger.info(f"Wrote run array manifest for {manifest.job_name} -> {object_key}")
+        return UploadLocation(url=f"https://{self.bucket_name}.s3.amazonaws.com/{object_key}")
+
 
 class DummyS3UploadLocationRepository:
     """
@@ -589,6 +922,40 @@ class DummyS3UploadLocationRepository:
         dummy_content = "This is dummy content for testing purposes."
         return UploadContent.create_text(dummy_content)
 
+    def download_to_file(
+        self, location: "UploadLocation", file_path: Path, etag: str | None = None
+    ) -> str | None:
+        """
+        Write dummy content to file_path for testing.
+
+        Args:
+            location: The upload location (ignored in dummy implementation)
+            file_path: Where to write the file
+            etag: ETag of the copy already at file_path
+
+        Returns:
+            The dummy content's ETag, or None if it matches etag
+        """
+        logger.info(f"Dummy download requested for location: {location.url}")
+        content = b"This is dummy content for testing purposes."
+        dummy_etag = f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+        if etag == dummy_etag:
+            return None
+        _write_atomically(file_path, io.BytesIO(content))
+        return dummy_etag
+
+    def preview_content(self, location: "UploadLocation") -> "UploadContent":
+        """
+        Return dummy content for testing.
+
+        Args:
+            location: The upload location (ignored in dummy implementation)
+
+        Returns:
+            Dummy UploadContent for testing
+        """
+        return self.read_content(location)
+
     def filter_by_age(
         self, upload_locations: list["UploadLocation"], _age_threshold: datetime | None
     ) -> list["UploadLocation"]:
@@ -623,6 +990,40 @@ class DummyS3UploadLocationRepository:
             logger.info(f"  Dummy archived: {location.url}")
         return upload_locations
 
+    def archive_prefixes(
+        self, prefixes: list[str], _age_threshold: datetime | None, dry_run: bool = False
+    ) -> "ArchiveSweep":
+        """
+        Dummy implementation - nothing is stored, so nothing is archived.
+
+        Args:
+            prefixes: Key prefixes to sweep
+            _age_threshold: Optional datetime threshold (ignored in dummy)
+            dry_run: If True, only report what would be archived
+
+        Returns:
+            An empty ArchiveSweep for the prefixes
+        """
+        logger.info(f"Dummy archive_prefixes called with {len(prefixes)} prefixes")
+        return ArchiveSweep(prefixes=list(prefixes), dry_run=dry_run)
+
+    def write_run_array_manifest(
+        self, manifest: "RunArrayManifest", s3_prefix: "JobS3Prefix"
+    ) -> "UploadLocation":
+        """
+        Dummy implementation - returns the key the manifest would be written to.
+
+        Args:
+            manifest: The manifest mapping array indexes to run IDs
+            s3_prefix: JobS3Prefix for consistent S3 path generation
+
+        Returns:
+            UploadLocation pointing at the test URL
+        """
+        object_key = s3_prefix.run_array_manifest_key(manifest.first_run_id)
+        logger.info(f"Dummy write_run_array_manifest called for {object_key}")
+        return UploadLocation(url=f"{self.test_url}/{object_key}")
+
 
 def create_upload_location_repository(
     env: str, bucket_name: str | None = None, region_name: str | None = None, **kwargs
@@ -653,4 +1054,50 @@ def create_upload_location_repository(
                 bucket_name=bucket_name,
                 region_name=region_name,
                 expiration_seconds=kwargs.get("expiration_seconds", 3600),
+                url_cache=kwargs.get("url_cache"),
+                archive_concurrency=kwargs.get("archive_concurrency", DEFAULT_ARCHIVE_CONCURRENCY),
+                batch_operations_threshold=kwargs.get(
+                    "batch_operations_threshold", DEFAULT_BATCH_OPERATIONS_THRESHOLD
+                ),
+                session=kwargs.get("session"),
             )
+
+
+def _make_preview(content: bytes, size: int) -> str:
+    """Decode the start of a ZIP entry into a preview of at most ZIP_PREVIEW_CHARS."""
+    text = content.decode("utf-8", errors="replace")
+    preview = text[:ZIP_PREVIEW_CHARS]
+    if len(text) > ZIP_PREVIEW_CHARS or size > len(content):
+        preview += f"\n... (truncated, {size} total bytes)"
+    return preview
+
+
+def _summarize_zip_entries(entries: list["ZipFileEntry"]) -> str:
+    """Build the human-readable listing shown as a ZIP upload's content."""
+    content_parts = [f"[ZIP Archive Contents - {len(entries)} files]"]
+    content_parts.append("=" * 60)
+    for entry in entries:
+        content_parts.append(f"\n📁 {entry.name}")
+        content_parts.append(f"   Size: {entry.size} bytes")
+        content_parts.append(f"   Compressed: {entry.compressed_size} bytes")
+        if entry.preview:
+            content_parts.append("   Preview:")
+            content_parts.append("   " + "-" * 40)
+            for line in entry.preview.split("\n")[:10]:
+                content_parts.append(f"   {line}")
+    return "\n".join(content_parts)
+
+
+def _write_atomically(file_path: Path, source: Any) -> None:
+    """Copy a readable stream to file_path via a temporary file renamed into place."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".part", delete=False
+    ) as part_file:
+        try:
+            shutil.copyfileobj(source, part_file, DOWNLOAD_CHUNK_SIZE)
+        except BaseException:
+            part_file.close()
+            os.unlink(part_file.name)
+            raise
+    os.replace(part_file.name, file_path)
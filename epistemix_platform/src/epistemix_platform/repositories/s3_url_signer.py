@@ -0,0 +1,130 @@
+"""
+Bulk SigV4 presigning of S3 GET URLs.
+
+boto3's generate_presigned_url validates parameters, serializes a request,
+resolves the endpoint and looks up credentials on every call, which costs
+over 100 microseconds per URL. Signing thousands of result URLs in one
+request only needs that work once: this module snapshots the credentials,
+date and signing key up front and then signs each object with two SHA-256
+HMACs, producing the same AWS Signature Version 4 query-string URLs.
+"""
+
+import hashlib
+import hmac
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import quote
+
+
+_ALGORITHM = "AWS4-HMAC-SHA256"
+_SERVICE = "s3"
+# SigV4 presigned URLs can be valid for at most 7 days
+MAX_EXPIRATION_SECONDS = 7 * 24 * 3600
+
+
+class S3UrlSigner:
+    """
+    Signs GET URLs for many S3 objects with one credential snapshot.
+
+    All URLs from one signer share the same X-Amz-Date and expire together.
+    Objects are addressed virtual-hosted style on AWS
+    (https://{bucket}.s3.amazonaws.com/{key}), or path style under a custom
+    endpoint such as a local S3 stand-in.
+    """
+
+    def __init__(
+        self,
+        credentials: Any,
+        region_name: str,
+        expiration_seconds: int,
+        endpoint_url: str | None = None,
+        now: datetime | None = None,
+    ):
+        """
+        Snapshot the credentials and derive the signing key.
+
+        Args:
+            credentials: botocore Credentials or ReadOnlyCredentials; frozen here so a
+                refresh part-way through a batch cannot mix keys
+            region_name: Region the buckets are in
+            expiration_seconds: How long the URLs are valid
+            endpoint_url: Custom S3 endpoint (path-style URLs); None for AWS
+            now: Signing time (default: current UTC time)
+
+        Raises:
+            ValueError: If expiration_seconds is outside 1 second to 7 days
+        """
+        if not 1 <= expiration_seconds <= MAX_EXPIRATION_SECONDS:
+            raise ValueError(
+                f"expiration_seconds must be between 1 and {MAX_EXPIRATION_SECONDS}, "
+                f"got {expiration_seconds}"
+            )
+        if hasattr(credentials, "get_frozen_credentials"):
+            credentials = credentials.get_frozen_credentials()
+
+        now = (now or datetime.now(UTC)).astimezone(UTC)
+        self.region_name = region_name
+        self.endpoint_url = endpoint_url.rstrip("/") if endpoint_url else None
+        self._amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        scope = f"{now.strftime('%Y%m%d')}/{region_name}/{_SERVICE}/aws4_request"
+        self._scope = scope
+
+        query = {
+            "X-Amz-Algorithm": _ALGORITHM,
+            "X-Amz-Credential": f"{credentials.access_key}/{scope}",
+            "X-Amz-Date": self._amz_date,
+            "X-Amz-Expires": str(expiration_seconds),
+            "X-Amz-SignedHeaders": "host",
+        }
+        if credentials.token:
+            query["X-Amz-Security-Token"] = credentials.token
+        # Same for every object: canonical query strings are sorted by name
+        self._query = "&".join(
+            f"{_encode(name)}={_encode(value)}" for name, value in sorted(query.items())
+        )
+
+        signing_key = f"AWS4{credentials.secret_key}".encode()
+        for part in (now.strftime("%Y%m%d"), region_name, _SERVICE, "aws4_request"):
+            signing_key = hmac.new(signing_key, part.encode(), hashlib.sha256).digest()
+        self._signing_key = signing_key
+
+    def sign(self, bucket: str, key: str) -> str:
+        """
+        Build the presigned GET URL for s3://bucket/key.
+
+        Args:
+            bucket: Bucket name
+            key: Object key
+
+        Returns:
+            HTTPS URL granting GET access until the signer's expiration
+        """
+        if self.endpoint_url is None and _is_virtual_host_compatible(bucket):
+            base_url = f"https://{bucket}.{_aws_host(self.region_name)}"
+            path = f"/{_encode(key, safe='/~')}"
+        else:
+            base_url = self.endpoint_url or f"https://{_aws_host(self.region_name)}"
+            path = f"/{bucket}/{_encode(key, safe='/~')}"
+        host = base_url.split("://", 1)[1]
+
+        canonical_request = f"GET\n{path}\n{self._query}\nhost:{host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign = (
+            f"{_ALGORITHM}\n{self._amz_date}\n{self._scope}\n"
+            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        )
+        signature = hmac.new(self._signing_key, string_to_sign.encode(), hashlib.sha256)
+        return f"{base_url}{path}?{self._query}&X-Amz-Signature={signature.hexdigest()}"
+
+
+def _encode(value: str, safe: str = "~") -> str:
+    """URI-encode per SigV4: everything but unreserved characters (and `safe`)."""
+    return quote(value, safe=safe)
+
+
+def _aws_host(region_name: str) -> str:
+    return "s3.amazonaws.com" if region_name == "us-east-1" else f"s3.{region_name}.amazonaws.com"
+
+
+def _is_virtual_host_compatible(bucket: str) -> bool:
+    """Buckets with dots or uppercase letters break TLS wildcard hostnames."""
+    return "." not in bucket and bucket == bucket.lower()
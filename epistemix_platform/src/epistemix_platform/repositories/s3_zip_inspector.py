@@ -0,0 +1,317 @@
+"""
+Lazy inspection of ZIP archives stored in S3, backed by HTTP range requests.
+
+Listing a ZIP only needs its central directory, which sits at the end of the
+archive, and previewing a member only needs the start of its compressed data.
+S3ZipInspector fetches exactly those byte ranges, so describing a job_input.zip
+costs a few kilobytes of transfer however large the archive is.
+
+Members stored or compressed with deflate (what zipfile and the epx client
+write) can be previewed; encrypted members and other compression methods are
+listed without a preview.
+"""
+
+import logging
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from epistemix_platform.repositories.s3_range_reader import S3RangeReader
+
+
+logger = logging.getLogger(__name__)
+
+# Record layouts, as in the ZIP specification (APPNOTE.TXT) and zipfile
+_END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+_ZIP64_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_END_OF_CENTRAL_DIR = struct.Struct("<4sQ2H2L4Q")
+_CENTRAL_DIR_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_LOCAL_FILE_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+_END_OF_CENTRAL_DIR_SIGNATURE = b"PK\x05\x06"
+_ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+_ZIP64_END_OF_CENTRAL_DIR_SIGNATURE = b"PK\x06\x06"
+_CENTRAL_DIR_SIGNATURE = b"PK\x01\x02"
+_LOCAL_FILE_SIGNATURE = b"PK\x03\x04"
+
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP64_LIMIT = 0xFFFFFFFF
+_FLAG_ENCRYPTED = 0x1
+_FLAG_UTF8 = 0x800
+
+STORED = 0
+DEFLATED = 8
+
+# The end-of-central-directory record is followed by a comment of up to 64 KiB
+_MAX_TAIL_BYTES = _END_OF_CENTRAL_DIR.size + 0xFFFF
+# Fetched by the first request: the end record plus, for archives of up to a couple
+# hundred entries, the whole central directory
+DEFAULT_TAIL_BYTES = 16 * 1024
+# Room for the local header's name and extra field when fetching a member
+_LOCAL_HEADER_SLACK = 256
+# Deflate output can exceed its input by a few bytes per block
+_DEFLATE_SLACK = 1024
+
+
+@dataclass(slots=True, frozen=True)
+class ZipMember:
+    """
+    A file in a ZIP archive, as described by its central directory record.
+
+    Attributes:
+        name: Archive name of the member
+        size: Uncompressed size in bytes
+        compressed_size: Compressed size in bytes
+        compress_type: ZIP compression method (0 stored, 8 deflated)
+        header_offset: Offset of the member's local file header
+        flag_bits: General purpose bit flags
+    """
+
+    name: str
+    size: int
+    compressed_size: int
+    compress_type: int
+    header_offset: int
+    flag_bits: int
+
+    @property
+    def is_encrypted(self) -> bool:
+        return bool(self.flag_bits & _FLAG_ENCRYPTED)
+
+
+class S3ZipInspector:
+    """
+    Reads the member list and member prefixes of s3://bucket/key with ranged GETs.
+
+    The first request fetches the last tail_bytes of the object (which also
+    reveals its size); the central directory is fetched separately only if it
+    does not fit in that tail. Each read_prefix call then fetches the member's
+    local header and just enough compressed data for the requested bytes.
+
+    Attributes:
+        request_count: Number of ranged GETs issued so far
+        bytes_fetched: Total bytes transferred so far
+    """
+
+    def __init__(self, s3_client: Any, bucket: str, key: str, tail_bytes: int = DEFAULT_TAIL_BYTES):
+        """
+        Initialize the inspector; nothing is fetched until members() is called.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Bucket holding the archive
+            key: Object key of the archive
+            tail_bytes: Bytes fetched from the end of the archive by the first request
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.tail_bytes = max(tail_bytes, _END_OF_CENTRAL_DIR.size)
+        self.request_count = 0
+        self.bytes_fetched = 0
+        self._reader: S3RangeReader | None = None
+        self._members: list[ZipMember] | None = None
+
+    def members(self) -> list[ZipMember]:
+        """
+        List the archive's members in central directory order.
+
+        Returns:
+            One ZipMember per central directory record
+
+        Raises:
+            ValueError: If the object is not a ZIP archive or its directory is malformed
+        """
+        if self._members is None:
+            tail, tail_offset = self._fetch_tail()
+            cd_offset, cd_size, count = self._locate_central_directory(tail, tail_offset)
+            if cd_offset >= tail_offset:
+                start = cd_offset - tail_offset
+                directory = tail[start : start + cd_size]
+            else:
+                directory = self._fetch(cd_offset, cd_size)
+            self._members = _parse_central_directory(directory, count)
+            logger.debug(
+                f"Read {len(self._members)} ZIP members of s3://{self.bucket}/{self.key} "
+                f"in {self.request_count} requests ({self.bytes_fetched} bytes)"
+            )
+        return self._members
+
+    def read_prefix(self, member: ZipMember, max_bytes: int) -> bytes:
+        """
+        Read up to max_bytes of a member's uncompressed content from its start.
+
+        Args:
+            member: Member returned by members()
+            max_bytes: Maximum number of uncompressed bytes to return
+
+        Returns:
+            The first min(max_bytes, member.size) bytes of the member
+
+        Raises:
+            ValueError: If the member is encrypted, uses an unsupported compression
+                method, or its local header is malformed
+        """
+        if member.is_encrypted:
+            raise ValueError(f"{member.name} is encrypted")
+        if member.compress_type not in (STORED, DEFLATED):
+            raise ValueError(
+                f"{member.name} uses unsupported compression method {member.compress_type}"
+            )
+        if max_bytes <= 0 or member.size == 0:
+            return b""
+
+        wanted = min(max_bytes, member.size)
+        slack = 0 if member.compress_type == STORED else _DEFLATE_SLACK
+        budget = min(member.compressed_size, wanted + slack)
+        header_guess = _LOCAL_FILE_HEADER.size + len(member.name.encode()) + _LOCAL_HEADER_SLACK
+        data = self._fetch(member.header_offset, header_guess + budget)
+
+        header = _LOCAL_FILE_HEADER.unpack_from(data)
+        if header[0] != _LOCAL_FILE_SIGNATURE:
+            raise ValueError(f"Bad local file header for {member.name}")
+        data_start = member.header_offset + _LOCAL_FILE_HEADER.size + header[10] + header[11]
+        data_end = data_start + member.compressed_size
+        # A local extra field longer than the slack leaves the data unfetched
+        fetched_until = max(member.header_offset + len(data), data_start)
+        chunk = data[data_start - member.header_offset :]
+
+        if member.compress_type == STORED:
+            if len(chunk) < wanted:
+                chunk += self._fetch(fetched_until, wanted - len(chunk))
+            return chunk[:wanted]
+
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        output = bytearray()
+        while True:
+            output += decompressor.decompress(
+                decompressor.unconsumed_tail + chunk, wanted - len(output)
+            )
+            if len(output) >= wanted or decompressor.eof or fetched_until >= data_end:
+                return bytes(output[:wanted])
+            # Poorly compressible data: fetch more compressed bytes, doubling each time
+            length = min(data_end - fetched_until, max(budget, wanted - len(output)))
+            chunk = self._fetch(fetched_until, length)
+            fetched_until += len(chunk)
+            budget *= 2
+
+    def _fetch_tail(self) -> tuple[bytes, int]:
+        """Fetch the last tail_bytes of the object with a suffix range, learning its size."""
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket, Key=self.key, Range=f"bytes=-{self.tail_bytes}"
+            )
+        except ClientError as e:
+            # S3 rejects suffix ranges on empty objects (416 InvalidRange)
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                raise ValueError(f"s3://{self.bucket}/{self.key} is empty") from e
+            raise
+        tail = response["Body"].read()
+        self.request_count += 1
+        self.bytes_fetched += len(tail)
+
+        content_range = response.get("ContentRange")
+        size = int(content_range.rsplit("/", 1)[1]) if content_range else len(tail)
+        self._reader = S3RangeReader(self.s3_client, self.bucket, self.key, size)
+        return tail, size - len(tail)
+
+    def _locate_central_directory(self, tail: bytes, tail_offset: int) -> tuple[int, int, int]:
+        """Find the (ZIP64) end-of-central-directory record; return offset, size, count."""
+        end = tail.rfind(_END_OF_CENTRAL_DIR_SIGNATURE)
+        if end < 0 and self._reader.size > len(tail) and len(tail) < _MAX_TAIL_BYTES:
+            # The archive comment is longer than the tail we fetched
+            tail_offset = max(0, self._reader.size - _MAX_TAIL_BYTES)
+            tail = self._fetch(tail_offset, self._reader.size - tail_offset)
+            end = tail.rfind(_END_OF_CENTRAL_DIR_SIGNATURE)
+        if end < 0 or end + _END_OF_CENTRAL_DIR.size > len(tail):
+            raise ValueError(f"s3://{self.bucket}/{self.key} is not a ZIP archive")
+
+        record = _END_OF_CENTRAL_DIR.unpack_from(tail, end)
+        count, cd_size, cd_offset = record[4], record[5], record[6]
+        if _ZIP64_LIMIT not in (cd_size, cd_offset) and count != 0xFFFF:
+            return cd_offset, cd_size, count
+
+        locator_at = end - _ZIP64_LOCATOR.size
+        if locator_at < 0:
+            locator = self._fetch(tail_offset + locator_at, _ZIP64_LOCATOR.size)
+        else:
+            locator = tail[locator_at:end]
+        signature, _, zip64_end_offset, _ = _ZIP64_LOCATOR.unpack(locator)
+        if signature != _ZIP64_LOCATOR_SIGNATURE:
+            raise ValueError(f"Missing ZIP64 locator in s3://{self.bucket}/{self.key}")
+
+        start = zip64_end_offset - tail_offset
+        if start >= 0:
+            zip64_end = tail[start : start + _ZIP64_END_OF_CENTRAL_DIR.size]
+        else:
+            zip64_end = self._fetch(zip64_end_offset, _ZIP64_END_OF_CENTRAL_DIR.size)
+        record = _ZIP64_END_OF_CENTRAL_DIR.unpack(zip64_end)
+        if record[0] != _ZIP64_END_OF_CENTRAL_DIR_SIGNATURE:
+            raise ValueError(f"Bad ZIP64 end record in s3://{self.bucket}/{self.key}")
+        return record[9], record[8], record[7]
+
+    def _fetch(self, offset: int, length: int) -> bytes:
+        """Fetch bytes [offset, offset + length) with one ranged GET (clipped to the object)."""
+        self._reader.seek(offset)
+        data = self._reader.read(length)
+        self.request_count += 1
+        self.bytes_fetched += len(data)
+        return data
+
+
+def _parse_central_directory(directory: bytes, count: int) -> list[ZipMember]:
+    members = []
+    position = 0
+    for _ in range(count):
+        if directory[position : position + 4] != _CENTRAL_DIR_SIGNATURE:
+            raise ValueError("Bad central directory record")
+        record = _CENTRAL_DIR_HEADER.unpack_from(directory, position)
+        flag_bits, compress_type = record[5], record[6]
+        compressed_size, size = record[10], record[11]
+        name_length, extra_length, comment_length = record[12], record[13], record[14]
+        header_offset = record[18]
+
+        position += _CENTRAL_DIR_HEADER.size
+        raw_name = directory[position : position + name_length]
+        extra = directory[position + name_length : position + name_length + extra_length]
+        position += name_length + extra_length + comment_length
+
+        if _ZIP64_LIMIT in (size, compressed_size, header_offset):
+            size, compressed_size, header_offset = _apply_zip64_extra(
+                extra, size, compressed_size, header_offset
+            )
+        members.append(
+            ZipMember(
+                name=raw_name.decode("utf-8" if flag_bits & _FLAG_UTF8 else "cp437"),
+                size=size,
+                compressed_size=compressed_size,
+                compress_type=compress_type,
+                header_offset=header_offset,
+                flag_bits=flag_bits,
+            )
+        )
+    return members
+
+
+def _apply_zip64_extra(
+    extra: bytes, size: int, compressed_size: int, header_offset: int
+) -> tuple[int, int, int]:
+    """Replace 0xFFFFFFFF sizes and offset with their values from the ZIP64 extra field."""
+    position = 0
+    while position + 4 <= len(extra):
+        field_id, field_length = struct.unpack_from("<2H", extra, position)
+        position += 4
+        if field_id == _ZIP64_EXTRA_ID:
+            values = iter(struct.unpack_from(f"<{field_length // 8}Q", extra, position))
+            if size == _ZIP64_LIMIT:
+                size = next(values)
+            if compressed_size == _ZIP64_LIMIT:
+                compressed_size = next(values)
+            if header_offset == _ZIP64_LIMIT:
+                header_offset = next(values)
+            break
+        position += field_length
+    return size, compressed_size, header_offset
@@ -0,0 +1,140 @@
+"""
+Startup-time database schema gate.
+
+Compares the Alembic head revision in migrations/versions with the revision
+recorded in the database's alembic_version table. The gate runs once per
+process (see DatabaseManager.ensure_schema) so request handlers and CLI
+commands never issue DDL or catalog queries on their hot path.
+
+Modes (Config.DATABASE_SCHEMA_MODE):
+    create  - Base.metadata.create_all (local development and SQLite tests)
+    verify  - fail fast with SchemaVersionError if the database is not at head
+    migrate - run "alembic upgrade head" if the database is behind, then verify
+"""
+
+import logging
+from enum import Enum
+from pathlib import Path
+
+from sqlalchemy.engine import Connection, Engine
+
+from epistemix_platform.exceptions import SchemaVersionError
+
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaMode(Enum):
+    """How the schema gate treats the database at process start."""
+
+    CREATE = "create"
+    VERIFY = "verify"
+    MIGRATE = "migrate"
+
+
+def _alembic_config(script_location: str | Path, connection: Connection | None = None):
+    """Build an in-memory Alembic config pointing at the migration scripts."""
+    from alembic.config import Config as AlembicConfig
+
+    alembic_config = AlembicConfig()
+    alembic_config.set_main_option("script_location", str(script_location))
+    if connection is not None:
+        # migrations/env.py reuses this connection instead of building its own engine
+        alembic_config.attributes["connection"] = connection
+    return alembic_config
+
+
+def get_migration_head(script_location: str | Path) -> str | None:
+    """
+    Get the head revision from the Alembic migration scripts.
+
+    Args:
+        script_location: Path to the Alembic migrations directory
+
+    Returns:
+        Head revision identifier, or None if there are no migrations
+
+    Raises:
+        SchemaVersionError: If the migrations directory is missing or has multiple heads
+    """
+    from alembic.script import ScriptDirectory
+    from alembic.util import CommandError
+
+    if not Path(script_location).is_dir():
+        raise SchemaVersionError(f"Alembic migrations directory not found: {script_location}")
+
+    script_directory = ScriptDirectory.from_config(_alembic_config(script_location))
+    try:
+        return script_directory.get_current_head()
+    except CommandError as e:
+        raise SchemaVersionError(f"Cannot determine migration head: {e}") from e
+
+
+def get_database_revision(engine: Engine) -> str | None:
+    """
+    Get the Alembic revision recorded in the database.
+
+    Args:
+        engine: Engine for the database to inspect
+
+    Returns:
+        Current revision identifier, or None if the database is unversioned
+    """
+    from alembic.runtime.migration import MigrationContext
+
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def verify_schema(engine: Engine, script_location: str | Path) -> str:
+    """
+    Verify that the database is at the Alembic head revision.
+
+    Args:
+        engine: Engine for the database to verify
+        script_location: Path to the Alembic migrations directory
+
+    Returns:
+        The verified revision identifier
+
+    Raises:
+        SchemaVersionError: If the database revision does not match the head
+    """
+    head = get_migration_head(script_location)
+    current = get_database_revision(engine)
+
+    if current != head:
+        raise SchemaVersionError(
+            f"Database schema is at revision {current or '<none>'} but migrations head is "
+            f"{head}. Run 'alembic upgrade head' or set DATABASE_SCHEMA_MODE=migrate."
+        )
+
+    logger.info("Database schema verified at revision %s", current)
+    return current
+
+
+def migrate_schema(engine: Engine, script_location: str | Path) -> str:
+    """
+    Upgrade the database to the Alembic head revision if it is behind.
+
+    Args:
+        engine: Engine for the database to migrate
+        script_location: Path to the Alembic migrations directory
+
+    Returns:
+        The revision the database is at after migrating
+
+    Raises:
+        SchemaVersionError: If the database is still not at head after upgrading
+    """
+    from alembic import command
+
+    head = get_migration_head(script_location)
+    current = get_database_revision(engine)
+
+    if current != head:
+        logger.warning("Migrating database schema from %s to %s", current or "<none>", head)
+        with engine.begin() as connection:
+            command.upgrade(_alembic_config(script_location, connection), "head")
+
+    return verify_schema(engine, script_location)
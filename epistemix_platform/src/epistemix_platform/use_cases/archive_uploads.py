@@ -7,12 +7,17 @@ import functools
 import logging
 from datetime import datetime, timedelta
 
+from epistemix_platform.models.archive_sweep import ArchiveSweep
+from epistemix_platform.models.job_s3_prefix import JobS3Prefix
 from epistemix_platform.models.upload_location import UploadLocation
-from epistemix_platform.repositories.interfaces import IUploadLocationRepository
+from epistemix_platform.repositories.interfaces import IJobRepository, IUploadLocationRepository
 
 
 logger = logging.getLogger(__name__)
 
+# Key prefix every job's artifacts are stored under (see JobS3Prefix.base_prefix)
+ALL_JOBS_PREFIX = "jobs/"
+
 
 def archive_uploads(
     upload_repository: IUploadLocationRepository,
@@ -49,15 +54,8 @@ def archive_uploads(
     #   and log noise from errors for locations that have already been archived
     upload_locations = list(dict.fromkeys(upload_locations))
 
-    # Calculate age threshold if specified
-    age_threshold = None
-    if hours_since_create is not None:
-        age_threshold = datetime.now() - timedelta(hours=hours_since_create)
-        age_desc = f"older than {hours_since_create} hours"
-    elif days_since_create is not None:
-        age_threshold = datetime.now() - timedelta(days=days_since_create)
-        age_desc = f"older than {days_since_create} days"
-    else:
+    age_threshold, age_desc = _age_threshold(days_since_create, hours_since_create)
+    if age_threshold is None:
         age_desc = "all provided uploads"
 
     logger.info(
@@ -98,6 +96,80 @@ def archive_uploads(
     return archived_locations
 
 
+def archive_job_prefixes(
+    job_repository: IJobRepository,
+    upload_repository: IUploadLocationRepository,
+    job_ids: list[int] | None = None,
+    days_since_create: int | None = None,
+    hours_since_create: int | None = None,
+    dry_run: bool = False,
+) -> ArchiveSweep:
+    """
+    Archive every stored object of the given jobs, or of all jobs, past an age.
+
+    This is the bulk counterpart of archive_uploads: instead of checking the
+    uploads recorded in the database one by one, the repository lists whole
+    job prefixes, so objects without an upload record (results, logs,
+    manifests) are archived too.
+
+    Args:
+        job_repository: Repository for job persistence (to get job.created_at)
+        upload_repository: Repository for managing upload locations
+        job_ids: Jobs to archive; None archives objects of all jobs
+        days_since_create: Optional - only archive objects older than specified days
+        hours_since_create: Optional - only archive objects older than specified hours
+        dry_run: If True, only report what would be archived without making changes
+
+    Returns:
+        ArchiveSweep describing what was (or would be) archived
+
+    Raises:
+        ValueError: If a job does not exist, or no age is given when archiving all jobs
+    """
+    age_threshold, age_desc = _age_threshold(days_since_create, hours_since_create)
+
+    if job_ids is None:
+        if age_threshold is None:
+            raise ValueError("An age threshold is required to archive uploads of all jobs")
+        prefixes = [ALL_JOBS_PREFIX]
+    else:
+        prefixes = []
+        for job_id in dict.fromkeys(job_ids):
+            job = job_repository.find_by_id(job_id)
+            if not job:
+                raise ValueError(f"Job {job_id} not found")
+            prefixes.append(f"{JobS3Prefix.from_job(job).base_prefix}/")
+
+    logger.info(
+        f"{'DRY RUN: ' if dry_run else ''}Archiving objects {age_desc or 'of any age'} "
+        f"under {', '.join(prefixes) or 'no prefixes'}"
+    )
+    if not prefixes:
+        return ArchiveSweep(prefixes=[], dry_run=dry_run)
+
+    return upload_repository.archive_prefixes(prefixes, age_threshold, dry_run=dry_run)
+
+
+def _age_threshold(
+    days_since_create: int | None, hours_since_create: int | None
+) -> tuple[datetime | None, str | None]:
+    """Age threshold and its description; hours take precedence over days."""
+    if hours_since_create is not None:
+        threshold = datetime.now() - timedelta(hours=hours_since_create)
+        return threshold, f"older than {hours_since_create} hours"
+    if days_since_create is not None:
+        threshold = datetime.now() - timedelta(days=days_since_create)
+        return threshold, f"older than {days_since_create} days"
+    return None, None
+
+
+def create_archive_job_prefixes(
+    job_repository: IJobRepository, upload_location_repository: IUploadLocationRepository
+):
+    """Factory to create archive_job_prefixes function with dependencies wired."""
+    return functools.partial(archive_job_prefixes, job_repository, upload_location_repository)
+
+
 def create_archive_uploads(upload_location_repository: IUploadLocationRepository):
     """Factory to create archive_uploads function with dependencies wired."""
     return functools.partial(archive_uploads, upload_location_repository)
@@ -0,0 +1,129 @@
+"""
+Download uploads use case for the Epistemix API.
+This module streams a job's uploads to a local directory concurrently, skipping
+files whose S3 object has not changed since the last download.
+"""
+
+import functools
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from epistemix_platform.models.job_upload import JobUpload
+from epistemix_platform.models.uploads_download import UploadsDownload
+from epistemix_platform.repositories.interfaces import IUploadLocationRepository
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
+# ETags of the files in a download directory, by filename
+ETAG_MANIFEST_NAME = ".epistemix-etags.json"
+
+
+def download_uploads(
+    upload_location_repository: IUploadLocationRepository,
+    uploads: list[JobUpload],
+    base_path: Path,
+    should_force: bool = False,
+    max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+) -> UploadsDownload:
+    """
+    Stream uploads straight to files in base_path on a bounded thread pool.
+
+    Objects are copied to disk in chunks as they arrive, without being read
+    into memory or parsed. The ETag of every downloaded file is recorded in
+    ETAG_MANIFEST_NAME inside base_path; when should_force re-downloads a
+    file with a recorded ETag, the GET is conditional and an unchanged object
+    is not transferred again.
+
+    Args:
+        upload_location_repository: Repository that downloads upload locations
+        uploads: Uploads to download
+        base_path: Directory to download into (created if missing)
+        should_force: If True, replace existing files (unless unchanged in S3);
+            if False, skip them
+        max_concurrency: Maximum downloads in flight
+
+    Returns:
+        UploadsDownload listing downloaded, unchanged, skipped and failed files
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    base_path.mkdir(parents=True, exist_ok=True)
+    etags = _load_etags(base_path)
+    outcome = UploadsDownload()
+
+    # One download per file name; like sequential downloads, the last upload
+    # wins when forcing and the first one when not
+    planned: dict[str, JobUpload] = {}
+    for upload in uploads:
+        filename = upload.location.extract_filename() or upload.get_default_filename()
+        file_path = base_path / filename
+        if filename in planned and not should_force:
+            outcome.skipped.append(str(file_path))
+        elif file_path.exists() and not should_force:
+            logger.warning(f"Skipping existing file: {file_path}")
+            outcome.skipped.append(str(file_path))
+        else:
+            planned[filename] = upload
+
+    def download(filename: str, upload: JobUpload) -> str | None:
+        file_path = base_path / filename
+        etag = etags.get(filename) if file_path.exists() else None
+        return upload_location_repository.download_to_file(upload.location, file_path, etag=etag)
+
+    if planned:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(planned))) as executor:
+            futures = {
+                filename: executor.submit(download, filename, upload)
+                for filename, upload in planned.items()
+            }
+            for filename, future in futures.items():
+                upload = planned[filename]
+                file_path = str(base_path / filename)
+                try:
+                    etag = future.result()
+                except Exception as e:
+                    error_msg = f"Failed to download {upload.context}_{upload.upload_type}: {e}"
+                    logger.error(error_msg)  # noqa: TRY400
+                    outcome.errors.append(error_msg)
+                    continue
+
+                if etag is None:
+                    outcome.unchanged.append(file_path)
+                else:
+                    etags[filename] = etag
+                    outcome.downloaded.append(file_path)
+                    logger.info(f"Downloaded {upload.context}_{upload.upload_type} to {file_path}")
+
+    _save_etags(base_path, etags)
+    logger.info(f"{outcome.summary()} to {base_path}")
+    return outcome
+
+
+def _load_etags(base_path: Path) -> dict[str, str]:
+    """Read the ETag manifest, treating a missing or unreadable one as empty."""
+    try:
+        etags = json.loads((base_path / ETAG_MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    return etags if isinstance(etags, dict) else {}
+
+
+def _save_etags(base_path: Path, etags: dict[str, str]) -> None:
+    manifest_path = base_path / ETAG_MANIFEST_NAME
+    part_path = manifest_path.with_name(f"{ETAG_MANIFEST_NAME}.part")
+    part_path.write_text(json.dumps(etags, indent=2, sort_keys=True))
+    os.replace(part_path, manifest_path)
+
+
+def create_download_uploads(upload_location_repository: IUploadLocationRepository):
+    """Factory to create download_uploads function with dependencies wired."""
+    return functools.partial(download_uploads, upload_location_repository)
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from epistemix_platform.models.job_s3_prefix import JobS3Prefix
 from epistemix_platform.models.run_results import RunResults
 from epistemix_platform.repositories.interfaces import (
@@ -7,20 +9,21 @@ from epistemix_platform.repositories.interfaces import (
 )
 
 
-def get_run_results(
+def iter_run_results(
     job_id: int,
     job_repository: IJobRepository,
     run_repository: IRunRepository,
     results_repository: IResultsRepository,
     bucket_name: str,
     expiration_seconds: int = 86400,  # 24 hours
-) -> list[RunResults]:
+) -> Iterator[RunResults]:
     """
-    Generate presigned download URLs for all runs in a job.
+    Generate presigned download URLs for all runs in a job, lazily.
 
-    This use case batch-generates presigned S3 URLs by reconstructing the S3 keys
-    from job metadata (job.created_at) and run IDs, eliminating the need for
-    persisted results_url fields.
+    The job and its runs are looked up when this is called, so a missing job
+    fails before any result is produced; the URLs themselves are signed in
+    bulk as the iterator is consumed, letting callers stream thousands of
+    them without building the whole list.
 
     Args:
         job_id: ID of the job
@@ -31,16 +34,10 @@ def get_run_results(
         expiration_seconds: URL expiration time (default 24 hours)
 
     Returns:
-        List of RunResults with presigned URLs for each run
+        Iterator of RunResults with a presigned URL for each run, in run order
 
     Raises:
         ValueError: If job not found
-
-    Business Rules:
-        - Generate URLs for ALL runs (results_url no longer required)
-        - Reconstruct S3 key from job.created_at + run_id
-        - Use 24-hour expiration for epx client compatibility
-        - Return empty list if no runs exist
     """
     # Step 1: Fetch job to get created_at for S3 prefix
     job = job_repository.find_by_id(job_id)
@@ -52,20 +49,59 @@ def get_run_results(
 
     # Step 3: Fetch all runs for this job
     runs = run_repository.find_by_job_id(job_id)
+    if not runs:
+        return iter(())
 
-    # Step 4: Generate presigned URL for each run
-    results = []
-    for run in runs:
-        # Reconstruct S3 URL from prefix + run_id
-        object_key = s3_prefix.run_results_key(run.id)
-        results_url = f"https://{bucket_name}.s3.amazonaws.com/{object_key}"
+    # Step 4: Sign the reconstructed keys in one batch (no URL building or parsing)
+    urls = results_repository.get_download_urls(
+        [(bucket_name, s3_prefix.run_results_key(run.id)) for run in runs],
+        expiration_seconds=expiration_seconds,
+    )
+    return (RunResults(run_id=run.id, url=url) for run, url in zip(runs, urls, strict=True))
 
-        # Generate presigned URL
-        upload_location = results_repository.get_download_url(
-            results_url=results_url,
-            expiration_seconds=expiration_seconds,
-        )
 
-        results.append(RunResults(run_id=run.id, url=upload_location.url))
+def get_run_results(
+    job_id: int,
+    job_repository: IJobRepository,
+    run_repository: IRunRepository,
+    results_repository: IResultsRepository,
+    bucket_name: str,
+    expiration_seconds: int = 86400,  # 24 hours
+) -> list[RunResults]:
+    """
+    Generate presigned download URLs for all runs in a job.
+
+    This use case batch-generates presigned S3 URLs by reconstructing the S3 keys
+    from job metadata (job.created_at) and run IDs, eliminating the need for
+    persisted results_url fields. See iter_run_results for the streaming form.
 
-    return results
+    Args:
+        job_id: ID of the job
+        job_repository: Repository for fetching job metadata
+        run_repository: Repository for fetching runs
+        results_repository: Repository for generating presigned URLs
+        bucket_name: S3 bucket name for results
+        expiration_seconds: URL expiration time (default 24 hours)
+
+    Returns:
+        List of RunResults with presigned URLs for each run
+
+    Raises:
+        ValueError: If job not found
+
+    Business Rules:
+        - Generate URLs for ALL runs (results_url no longer required)
+        - Reconstruct S3 key from job.created_at + run_id
+        - Use 24-hour expiration for epx client compatibility
+        - Return empty list if no runs exist
+    """
+    return list(
+        iter_run_results(
+            job_id=job_id,
+            job_repository=job_repository,
+            run_repository=run_repository,
+            results_repository=results_repository,
+            bucket_name=bucket_name,
+            expiration_seconds=expiration_seconds,
+        )
+    )
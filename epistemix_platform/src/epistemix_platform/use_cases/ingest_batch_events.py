@@ -0,0 +1,179 @@
+"""
+Ingest Batch events use case for the Epistemix API.
+This module applies AWS Batch job state-change events to runs, so run status is
+pushed from Batch as it changes instead of being polled with describe_jobs.
+"""
+
+import functools
+import logging
+
+from epistemix_platform.mappers.batch_status_mapper import BatchStatusMapper
+from epistemix_platform.models.batch_job_state_change import BatchJobStateChange
+from epistemix_platform.models.run import PodPhase, Run
+from epistemix_platform.repositories.interfaces import IRunRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Position of each AWS Batch status in the job lifecycle. EventBridge does not
+# guarantee delivery order, so events stamped with the same time are applied
+# in lifecycle order and never move a run backwards.
+_BATCH_STATUS_RANK = {
+    "SUBMITTED": 0,
+    "PENDING": 1,
+    "RUNNABLE": 2,
+    "STARTING": 3,
+    "RUNNING": 4,
+    "SUCCEEDED": 5,
+    "FAILED": 5,
+}
+_POD_PHASE_RANK = {
+    PodPhase.PENDING: 0,
+    PodPhase.RUNNING: 1,
+    PodPhase.SUCCEEDED: 2,
+    PodPhase.FAILED: 2,
+}
+
+
+def ingest_batch_events(
+    run_repository: IRunRepository,
+    events: list[dict],
+) -> dict[str, int]:
+    """
+    Apply a batch of AWS Batch job state-change events to their runs.
+
+    Runs are matched by the AWS Batch job ID recorded at submission, falling
+    back to the run ID in the job name for runs submitted before job IDs were
+    stored. Events are applied oldest first; an event older than the run's
+    last status sync, or one for a run that already reached a terminal status,
+    is ignored, so duplicate and out-of-order deliveries are harmless. All
+    updated runs are saved with a single save_all.
+
+    Args:
+        run_repository: Repository for run persistence
+        events: EventBridge "Batch Job State Change" events
+
+    Returns:
+        Counts of received, applied, ignored (stale, duplicate, unknown run)
+        and invalid (unparseable) events
+    """
+    state_changes: list[BatchJobStateChange] = []
+    invalid = 0
+    for event in events:
+        try:
+            state_change = BatchJobStateChange.from_event(event)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping Batch event: {e}")
+            invalid += 1
+            continue
+        if not state_change.is_array_parent:
+            state_changes.append(state_change)
+
+    runs_by_state_change = _find_runs(run_repository, state_changes)
+
+    updated_runs: dict[int, Run] = {}
+    applied = 0
+    for state_change in sorted(state_changes, key=_event_order):
+        run = runs_by_state_change.get(state_change)
+        if run is None or not _is_newer(state_change, run):
+            continue
+        _apply_state_change(run, state_change)
+        updated_runs[run.id] = run
+        applied += 1
+
+    if updated_runs:
+        run_repository.save_all(list(updated_runs.values()))
+
+    counts = {
+        "received": len(events),
+        "applied": applied,
+        "ignored": len(events) - applied - invalid,
+        "invalid": invalid,
+    }
+    logger.info(
+        f"Ingested {counts['received']} Batch events: {counts['applied']} applied, "
+        f"{counts['ignored']} ignored, {counts['invalid']} invalid"
+    )
+
+    return counts
+
+
+def _find_runs(
+    run_repository: IRunRepository, state_changes: list[BatchJobStateChange]
+) -> dict[BatchJobStateChange, Run]:
+    """Resolve the run each state change refers to with at most two bulk queries."""
+    runs_by_batch_job_id = {
+        run.batch_job_id: run
+        for run in run_repository.find_by_batch_job_ids(
+            list({state_change.batch_job_id for state_change in state_changes})
+        )
+    }
+
+    unmatched = [
+        state_change
+        for state_change in state_changes
+        if state_change.batch_job_id not in runs_by_batch_job_id
+        and state_change.run_id_from_job_name is not None
+    ]
+    runs_by_id = {
+        run.id: run
+        for run in run_repository.find_by_ids(
+            list({state_change.run_id_from_job_name for state_change in unmatched})
+        )
+    }
+
+    # Runs loaded by both lookups must be the same object so updates accumulate
+    for run in runs_by_batch_job_id.values():
+        runs_by_id.setdefault(run.id, run)
+
+    resolved = {}
+    for state_change in state_changes:
+        run = runs_by_batch_job_id.get(state_change.batch_job_id)
+        if run is None and state_change.run_id_from_job_name is not None:
+            run = runs_by_id.get(state_change.run_id_from_job_name)
+        if run is not None:
+            resolved[state_change] = runs_by_id[run.id]
+        else:
+            logger.debug(
+                f"No run for Batch job {state_change.job_name} ({state_change.batch_job_id})"
+            )
+
+    return resolved
+
+
+def _event_order(state_change: BatchJobStateChange) -> tuple:
+    return state_change.occurred_at, _BATCH_STATUS_RANK.get(state_change.batch_status, -1)
+
+
+def _is_newer(state_change: BatchJobStateChange, run: Run) -> bool:
+    """Check whether the state change supersedes the status currently on the run."""
+    if run.is_terminal:
+        return False
+    if run.status_synced_at is None or state_change.occurred_at > run.status_synced_at:
+        return True
+    if state_change.occurred_at < run.status_synced_at:
+        return False
+
+    # Same timestamp: only move forward through the lifecycle
+    pod_phase = BatchStatusMapper.batch_status_to_pod_phase(state_change.batch_status)
+    return _POD_PHASE_RANK.get(pod_phase, -1) > _POD_PHASE_RANK.get(run.pod_phase, -1)
+
+
+def _apply_state_change(run: Run, state_change: BatchJobStateChange) -> None:
+    status = BatchStatusMapper.batch_status_to_run_status(state_change.batch_status)
+    pod_phase = BatchStatusMapper.batch_status_to_pod_phase(state_change.batch_status)
+    if run.status != status or run.pod_phase != pod_phase:
+        logger.info(
+            f"Status change for run {run.id} from Batch event {state_change.event_id}: "
+            f"{run.status.name}/{run.pod_phase.name} → {status.name}/{pod_phase.name}"
+        )
+    run.status = status
+    run.pod_phase = pod_phase
+    if state_change.batch_job_id and run.batch_job_id is None:
+        run.batch_job_id = state_change.batch_job_id
+    run.status_synced_at = state_change.occurred_at
+
+
+def create_ingest_batch_events(run_repository: IRunRepository):
+    """Factory to create ingest_batch_events function with dependencies wired."""
+    return functools.partial(ingest_batch_events, run_repository)
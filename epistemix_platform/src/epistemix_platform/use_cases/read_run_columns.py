@@ -0,0 +1,143 @@
+"""
+Read columnar run results use cases for the Epistemix API.
+
+Runs converted by the simulation runner have Parquet copies of their per-day
+outputs stored next to the results ZIP. These use cases list those tables and
+read single columns or day ranges of them without downloading the ZIP.
+"""
+
+import functools
+import logging
+from typing import Any
+
+from epistemix_platform.models.job_s3_prefix import JobS3Prefix
+from epistemix_platform.repositories.interfaces import (
+    IJobRepository,
+    IResultsRepository,
+    IRunRepository,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def _find_run_prefix(
+    job_repository: IJobRepository, run_repository: IRunRepository, job_id: int, run_id: int
+) -> JobS3Prefix:
+    job = job_repository.find_by_id(job_id)
+    if not job:
+        raise ValueError(f"Job {job_id} not found")
+
+    run = run_repository.find_by_id(run_id)
+    if not run:
+        raise ValueError(f"Run {run_id} not found")
+    if run.job_id != job_id:
+        raise ValueError(f"Run {run_id} does not belong to job {job_id}")
+
+    return JobS3Prefix.from_job(job)
+
+
+def get_run_columnar_tables(
+    job_repository: IJobRepository,
+    run_repository: IRunRepository,
+    results_repository: IResultsRepository,
+    job_id: int,
+    run_id: int,
+) -> dict[str, dict[str, Any]]:
+    """
+    List the Parquet tables stored for a run.
+
+    Args:
+        job_repository: Repository for job persistence (to get job.created_at)
+        run_repository: Repository for run persistence
+        results_repository: Repository for S3 results storage
+        job_id: Job identifier
+        run_id: Run identifier
+
+    Returns:
+        Table name -> {"rows", "day_column", "columns"} summary
+
+    Raises:
+        ValueError: If the job, run or its columnar results do not exist
+    """
+    s3_prefix = _find_run_prefix(job_repository, run_repository, job_id, run_id)
+    manifest = results_repository.get_columnar_manifest(run_id, s3_prefix)
+
+    return {
+        name: {
+            "rows": table["rows"],
+            "day_column": table["day_column"],
+            "columns": [column["name"] for column in table["columns"]],
+        }
+        for name, table in manifest["tables"].items()
+    }
+
+
+def read_run_columns(
+    job_repository: IJobRepository,
+    run_repository: IRunRepository,
+    results_repository: IResultsRepository,
+    job_id: int,
+    run_id: int,
+    table: str,
+    columns: list[str] | None = None,
+    start_day: int | None = None,
+    end_day: int | None = None,
+) -> dict[str, list]:
+    """
+    Read columns and a day range of one of a run's Parquet tables.
+
+    Only the requested column chunks of the row groups covering the day range
+    are fetched from S3 (byte-range requests), so the cost is independent of
+    the size of the rest of the run's results.
+
+    Args:
+        job_repository: Repository for job persistence (to get job.created_at)
+        run_repository: Repository for run persistence
+        results_repository: Repository for S3 results storage
+        job_id: Job identifier
+        run_id: Run identifier
+        table: Table name, e.g. "RUN1/out"
+        columns: Columns to read (None reads every column)
+        start_day: First simulation day to include (inclusive)
+        end_day: Last simulation day to include (inclusive)
+
+    Returns:
+        Column name -> list of values
+
+    Raises:
+        ValueError: If the job, run, table or a column does not exist, or the
+            day range is invalid
+    """
+    if start_day is not None and end_day is not None and start_day > end_day:
+        raise ValueError(f"start_day ({start_day}) is after end_day ({end_day})")
+
+    s3_prefix = _find_run_prefix(job_repository, run_repository, job_id, run_id)
+    return results_repository.read_columnar_table(
+        run_id,
+        s3_prefix,
+        table,
+        columns=columns,
+        start_day=start_day,
+        end_day=end_day,
+    )
+
+
+def create_get_run_columnar_tables(
+    job_repository: IJobRepository,
+    run_repository: IRunRepository,
+    results_repository: IResultsRepository,
+):
+    """Factory to create get_run_columnar_tables function with dependencies wired."""
+    return functools.partial(
+        get_run_columnar_tables, job_repository, run_repository, results_repository
+    )
+
+
+def create_read_run_columns(
+    job_repository: IJobRepository,
+    run_repository: IRunRepository,
+    results_repository: IResultsRepository,
+):
+    """Factory to create read_run_columns function with dependencies wired."""
+    return functools.partial(read_run_columns, job_repository, run_repository, results_repository)
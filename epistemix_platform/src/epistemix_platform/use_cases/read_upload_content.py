@@ -40,6 +40,37 @@ def read_upload_content(
     return content
 
 
+def preview_upload_content(
+    upload_location_repository: IUploadLocationRepository, location: UploadLocation
+) -> UploadContent:
+    """
+    Read a preview of an uploaded file from storage.
+
+    ZIP archives are described from their central directory and the start of
+    each text entry, without downloading the archive; other files are read
+    in full.
+
+    Args:
+        upload_location_repository: Repository for handling upload locations
+        location: The upload location containing the URL
+
+    Returns:
+        UploadContent domain model
+
+    Raises:
+        ValueError: If the content cannot be read
+    """
+    content = upload_location_repository.preview_content(location)
+    sanitized_url = location.get_sanitized_url()
+    logger.info(f"Successfully previewed content from location: {sanitized_url}")
+    return content
+
+
 def create_read_upload_content(upload_location_repository: IUploadLocationRepository):
     """Factory to create read_upload_content function with dependencies wired."""
     return functools.partial(read_upload_content, upload_location_repository)
+
+
+def create_preview_upload_content(upload_location_repository: IUploadLocationRepository):
+    """Factory to create preview_upload_content function with dependencies wired."""
+    return functools.partial(preview_upload_content, upload_location_repository)
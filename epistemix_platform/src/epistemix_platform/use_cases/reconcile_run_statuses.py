@@ -0,0 +1,77 @@
+"""
+Reconcile run statuses use case for the Epistemix API.
+This module implements the background sweep that keeps run status in sync with AWS Batch,
+so GET /runs can read run status straight from the database.
+"""
+
+import functools
+import logging
+import time
+from datetime import datetime
+
+from epistemix_platform.gateways.interfaces import ISimulationRunner
+from epistemix_platform.models.run_reconciliation import RunReconciliation
+from epistemix_platform.repositories.interfaces import IRunRepository
+from epistemix_platform.use_cases.update_run_status import update_run_statuses
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECONCILE_BATCH_SIZE = 500
+
+
+def reconcile_run_statuses(
+    simulation_runner: ISimulationRunner,
+    run_repository: IRunRepository,
+    batch_size: int = DEFAULT_RECONCILE_BATCH_SIZE,
+    synced_before: datetime | None = None,
+) -> RunReconciliation:
+    """
+    Sync one batch of the stalest non-terminal runs with AWS Batch.
+
+    Runs are loaded least recently synced first and described in bulk with
+    describe_runs (array children by their "{array_job_id}:{index}" job IDs),
+    and every swept run is saved with a fresh status_synced_at, so calling this repeatedly
+    with the same synced_before walks through all unfinished runs once.
+
+    Args:
+        simulation_runner: Gateway for AWS Batch integration
+        run_repository: Repository for run persistence
+        batch_size: Maximum number of runs to sync
+        synced_before: Only sweep runs not synced since this time (defaults to now)
+
+    Returns:
+        RunReconciliation with the number of swept and changed runs and the
+        status lag (time since each run was last synced) observed before the sweep
+    """
+    started = time.monotonic()
+    now = datetime.utcnow()
+    runs = run_repository.find_unfinished(synced_before=synced_before or now, limit=batch_size)
+
+    lags = [(now - (run.status_synced_at or run.created_at)).total_seconds() for run in runs]
+    previous_states = {run.id: (run.status, run.pod_phase) for run in runs}
+
+    update_run_statuses(simulation_runner, run_repository, runs)
+
+    changed = sum(1 for run in runs if previous_states[run.id] != (run.status, run.pod_phase))
+    reconciliation = RunReconciliation(
+        swept=len(runs),
+        changed=changed,
+        max_lag_seconds=max(lags, default=0.0),
+        mean_lag_seconds=sum(lags) / len(lags) if lags else 0.0,
+        duration_seconds=time.monotonic() - started,
+    )
+    logger.info(
+        f"Reconciled {reconciliation.swept} runs ({reconciliation.changed} changed), "
+        f"max status lag {reconciliation.max_lag_seconds:.1f}s"
+    )
+
+    return reconciliation
+
+
+def create_reconcile_run_statuses(
+    simulation_runner: ISimulationRunner,
+    run_repository: IRunRepository,
+):
+    """Factory to create reconcile_run_statuses function with dependencies wired."""
+    return functools.partial(reconcile_run_statuses, simulation_runner, run_repository)
@@ -9,7 +9,13 @@ import functools
 import logging
 
 from epistemix_platform.gateways.interfaces import ISimulationRunner
-from epistemix_platform.models import Run
+from epistemix_platform.models import JobS3Prefix, PodPhase, Run, RunArrayManifest, RunStatus
+from epistemix_platform.models.run_array_manifest import MAX_ARRAY_SIZE, MIN_ARRAY_SIZE
+from epistemix_platform.repositories.interfaces import (
+    IJobRepository,
+    IRunRepository,
+    IUploadLocationRepository,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -26,17 +32,16 @@ def run_simulation(
     runner gateway. The Run object is passed directly from the caller (typically
     from submit_runs use case which already has the Run).
 
-    AWS Batch is the source of truth for job state. The run object is not
-    modified or saved after submission. Jobs are tracked by name (run.natural_key).
+    AWS Batch is the source of truth for job state. The gateway records the
+    Batch job ID on run.batch_job_id; persisting the run is left to the caller.
 
     Args:
         run: The Run object to execute
         simulation_runner: Gateway for AWS Batch integration
 
     Returns:
-        The Run (unmodified - AWS Batch is source of truth)
+        The Run with batch_job_id set
     """
-    # Submit run to AWS Batch via gateway (does not modify run object)
     simulation_runner.submit_run(run)
 
     logger.info(f"Submitted run {run.id} to AWS Batch with job name: {run.natural_key}")
@@ -49,3 +54,153 @@ def create_run_simulation(
 ):
     """Factory to create run_simulation function with simulation_runner wired."""
     return functools.partial(run_simulation, simulation_runner=simulation_runner)
+
+
+def run_simulations(
+    runs: list[Run],
+    simulation_runner: ISimulationRunner,
+    run_repository: IRunRepository,
+) -> dict[int, list[str]]:
+    """
+    Submit many runs for execution on AWS Batch concurrently.
+
+    Submitted runs are saved with the Batch job ID recorded by the gateway, so
+    status syncs and cancels can address the job without a name lookup. Runs
+    that could not be submitted are marked ERROR (pod phase FAILED), so later
+    status syncs do not look for a Batch job that never existed. Both are
+    persisted in one save_all call.
+
+    Args:
+        runs: The Run objects to execute
+        simulation_runner: Gateway for AWS Batch integration
+        run_repository: Repository used to persist the submitted and failed runs
+
+    Returns:
+        Error messages per failed run, keyed by run ID
+    """
+    failures = simulation_runner.submit_runs(runs)
+
+    failed_runs = [run for run in runs if run.id in failures]
+    _mark_failed(failed_runs, run_repository, save=False)
+    if runs:
+        run_repository.save_all(runs)
+
+    logger.info(f"Submitted {len(runs) - len(failed_runs)} of {len(runs)} runs to AWS Batch")
+
+    return {run_id: [error] for run_id, error in failures.items()}
+
+
+def _mark_failed(runs: list[Run], run_repository: IRunRepository, save: bool = True) -> None:
+    """Mark runs that never reached AWS Batch as ERROR and, by default, persist them."""
+    for run in runs:
+        run.status = RunStatus.ERROR
+        run.pod_phase = PodPhase.FAILED
+    if save and runs:
+        run_repository.save_all(runs)
+
+
+def create_run_simulations(
+    simulation_runner: ISimulationRunner,
+    run_repository: IRunRepository,
+):
+    """Factory to create run_simulations function with dependencies wired."""
+    return functools.partial(
+        run_simulations, simulation_runner=simulation_runner, run_repository=run_repository
+    )
+
+
+def run_simulation_arrays(
+    runs: list[Run],
+    simulation_runner: ISimulationRunner,
+    job_repository: IJobRepository,
+    run_repository: IRunRepository,
+    upload_location_repository: IUploadLocationRepository,
+) -> dict[int, list[str]]:
+    """
+    Submit runs as AWS Batch array jobs, one array per job (up to 10,000 runs each).
+
+    For each array a RunArrayManifest is written under the job's JobS3Prefix and
+    a single array job is submitted; each child maps AWS_BATCH_JOB_ARRAY_INDEX to
+    its run ID through the manifest. Each run is saved with its child job ID
+    ("{array_job_id}:{index}"), so status sync describes it in bulk like any
+    other run and it can be cancelled directly.
+
+    Groups too small for an array job (a single run) fall back to run_simulations.
+
+    Args:
+        runs: The Run objects to execute
+        simulation_runner: Gateway for AWS Batch integration
+        job_repository: Repository for the parent jobs (S3 prefix)
+        run_repository: Repository used to persist submitted and failed runs
+        upload_location_repository: Repository used to write the manifests
+
+    Returns:
+        Error messages per failed run, keyed by run ID
+
+    Raises:
+        ValueError: If a parent job does not exist
+    """
+    errors: dict[int, list[str]] = {}
+    single_runs: list[Run] = []
+
+    runs_by_job: dict[int, list[Run]] = {}
+    for run in runs:
+        runs_by_job.setdefault(run.job_id, []).append(run)
+
+    for job_id, job_runs in runs_by_job.items():
+        if len(job_runs) < MIN_ARRAY_SIZE:
+            single_runs.extend(job_runs)
+            continue
+
+        job = job_repository.find_by_id(job_id)
+        if not job:
+            raise ValueError(f"Job {job_id} not found")
+        s3_prefix = JobS3Prefix.from_job(job)
+
+        for start in range(0, len(job_runs), MAX_ARRAY_SIZE):
+            chunk = job_runs[start : start + MAX_ARRAY_SIZE]
+            if len(chunk) < MIN_ARRAY_SIZE:
+                single_runs.extend(chunk)
+                continue
+
+            manifest = RunArrayManifest(job_id=job_id, run_ids=tuple(run.id for run in chunk))
+            try:
+                upload_location_repository.write_run_array_manifest(manifest, s3_prefix)
+                array_job_id = simulation_runner.submit_run_array(
+                    manifest, s3_prefix.run_array_manifest_key(manifest.first_run_id)
+                )
+            except Exception as e:
+                logger.exception(f"Failed to submit array job {manifest.job_name}")
+                _mark_failed(chunk, run_repository)
+                message = f"AWS Batch array submission failed: {e}"
+                errors.update({run.id: [message] for run in chunk})
+                continue
+
+            logger.info(
+                f"Submitted array job {manifest.job_name} ({array_job_id}) "
+                f"with {manifest.size} runs"
+            )
+            for index, run in enumerate(chunk):
+                run.batch_job_id = f"{array_job_id}:{index}"
+            run_repository.save_all(chunk)
+
+    if single_runs:
+        errors.update(run_simulations(single_runs, simulation_runner, run_repository))
+
+    return errors
+
+
+def create_run_simulation_arrays(
+    simulation_runner: ISimulationRunner,
+    job_repository: IJobRepository,
+    run_repository: IRunRepository,
+    upload_location_repository: IUploadLocationRepository,
+):
+    """Factory to create run_simulation_arrays function with dependencies wired."""
+    return functools.partial(
+        run_simulation_arrays,
+        simulation_runner=simulation_runner,
+        job_repository=job_repository,
+        run_repository=run_repository,
+        upload_location_repository=upload_location_repository,
+    )
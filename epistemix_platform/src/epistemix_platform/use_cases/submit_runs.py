@@ -105,6 +105,10 @@ def submit_runs(
     as the timestamp, NOT run.created_at. This keeps all job artifacts in the
     same S3 directory.
 
+    Runs are processed as a batch so a large parameter sweep costs a handful of
+    database round trips: each parent job is fetched once, all runs are inserted
+    together, and all config URLs are written back in a single bulk update.
+
     Args:
         job_repository: Repository for job persistence (needed to get job.created_at)
         run_repository: Repository for run persistence
@@ -114,17 +118,30 @@ def submit_runs(
         epx_version: The epx client version used by the user
 
     Returns:
-        List of Run objects with persisted data
+        List of Run objects with persisted data, in request order
+
+    Raises:
+        ValueError: If a referenced job does not exist
     """
     user_token = UserToken.from_bearer_token(user_token_value)
-    run_responses = []
+    if not run_requests:
+        return []
+
+    # Extract and validate client version from user agent
+    epx_client_version = _parse_client_version(epx_version)
 
-    for run_request in run_requests:
-        # Extract and validate client version from user agent
-        epx_client_version = _parse_client_version(epx_version)
+    # Get each parent job once to create JobS3Prefix with job.created_at
+    # IMPORTANT: Use job.created_at, NOT run.created_at
+    s3_prefixes: dict[int, JobS3Prefix] = {}
+    for job_id in dict.fromkeys(run_request["jobId"] for run_request in run_requests):
+        job = job_repository.find_by_id(job_id)
+        if not job:
+            raise ValueError(f"Job {job_id} not found")
+        s3_prefixes[job_id] = JobS3Prefix.from_job(job)
 
-        # Create a new Run domain object (without URL initially)
-        run = Run.create_unpersisted(
+    # Create new Run domain objects (without URLs initially)
+    runs = [
+        Run.create_unpersisted(
             job_id=run_request["jobId"],
             user_id=user_token.user_id,
             request=run_request,
@@ -134,37 +151,27 @@ def submit_runs(
             user_deleted=False,
             epx_client_version=epx_client_version,
         )
+        for run_request in run_requests
+    ]
 
-        # Save the run to get an ID
-        persisted_run = run_repository.save(run)
-
-        # Get the parent job to create JobS3Prefix with job.created_at
-        job = job_repository.find_by_id(persisted_run.job_id)
-        if not job:
-            raise ValueError(f"Job {persisted_run.job_id} not found")
+    # Insert all runs at once to get their IDs
+    persisted_runs = run_repository.save_all(runs)
 
-        # Create JobS3Prefix from job to ensure consistent timestamp
-        # IMPORTANT: Use job.created_at, NOT run.created_at
-        s3_prefix = JobS3Prefix.from_job(job)
-
-        # Generate URL for this run using the persisted ID
+    # Generate a config URL for each run using the persisted ID
+    for persisted_run in persisted_runs:
         job_upload = JobUpload(
             context="run",
             upload_type="config",
             job_id=persisted_run.job_id,
             run_id=persisted_run.id,
         )
-        upload_location = upload_location_repository.get_upload_location(job_upload, s3_prefix)
-
-        # Update the run with the URL
+        upload_location = upload_location_repository.get_upload_location(
+            job_upload, s3_prefixes[persisted_run.job_id]
+        )
         persisted_run.config_url = upload_location.url
 
-        # Save the updated run with the URL
-        final_run = run_repository.save(persisted_run)
-
-        run_responses.append(final_run)
-
-    return run_responses
+    # Write all URLs back in one bulk update
+    return run_repository.save_all(persisted_runs)
 
 
 def create_submit_runs(
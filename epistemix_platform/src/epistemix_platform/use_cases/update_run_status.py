@@ -5,9 +5,10 @@ This module implements the core business logic for synchronizing run status with
 
 import functools
 import logging
+from datetime import datetime, timedelta
 
 from epistemix_platform.gateways.interfaces import ISimulationRunner
-from epistemix_platform.models.run import Run
+from epistemix_platform.models.run import Run, RunStatusDetail
 from epistemix_platform.repositories.interfaces import IRunRepository
 
 
@@ -32,6 +33,15 @@ def update_run_status(
     """
     status_detail = simulation_runner.describe_run(run)
 
+    if _apply_status_detail(run, status_detail):
+        run_repository.save(run)
+        return True
+
+    return False
+
+
+def _apply_status_detail(run: Run, status_detail: RunStatusDetail) -> bool:
+    """Copy status and pod phase onto the run, returning True if either changed."""
     status_changed = run.status != status_detail.status or run.pod_phase != status_detail.pod_phase
 
     if status_changed:
@@ -42,12 +52,99 @@ def update_run_status(
         )
         run.status = status_detail.status
         run.pod_phase = status_detail.pod_phase
-        run_repository.save(run)
-        return True
 
-    return False
+    return status_changed
+
+
+def _runs_due_for_sync(runs: list[Run], status_ttl_seconds: float, now: datetime) -> list[Run]:
+    """
+    Select the runs whose status must be read from AWS Batch.
+
+    Terminal runs are served from the database. With a positive TTL, runs
+    whose status was read within the last status_ttl_seconds are too.
+    """
+    due_runs = [run for run in runs if not run.is_terminal]
+    if status_ttl_seconds <= 0:
+        return due_runs
+
+    fresh_after = now - timedelta(seconds=status_ttl_seconds)
+    return [
+        run
+        for run in due_runs
+        if run.status_synced_at is None or run.status_synced_at <= fresh_after
+    ]
+
+
+def _save_synced_runs(
+    run_repository: IRunRepository, synced_runs: list[Run], now: datetime
+) -> None:
+    """
+    Stamp synced runs with status_synced_at and persist them in one bulk update.
+
+    The stamp lets other workers serve the run from the database until the
+    status TTL expires, and lets the reconciler report how stale statuses are.
+    """
+    for run in synced_runs:
+        run.status_synced_at = now
+    if synced_runs:
+        run_repository.save_all(synced_runs)
+
+
+def update_run_statuses(
+    simulation_runner: ISimulationRunner,
+    run_repository: IRunRepository,
+    runs: list[Run],
+    status_ttl_seconds: float = 0.0,
+) -> list[Run]:
+    """
+    Synchronize the status of many runs with AWS Batch and persist the result.
+
+    Runs in a terminal status are never sent to AWS Batch, and with a positive
+    status_ttl_seconds neither are runs synced within the TTL, so polling cost
+    is proportional to the runs that are still moving. The remaining statuses
+    are fetched in bulk with describe_runs, and every synced run is saved with
+    its new status_synced_at in one bulk update.
+
+    Args:
+        simulation_runner: Gateway for AWS Batch integration
+        run_repository: Repository for run persistence
+        runs: Run entities to update
+        status_ttl_seconds: How long a status read from AWS Batch is reused (0 disables)
+
+    Returns:
+        The runs whose status changed
+    """
+    now = datetime.utcnow()
+    due_runs = _runs_due_for_sync(runs, status_ttl_seconds, now)
+    if not due_runs:
+        return []
+
+    status_details = simulation_runner.describe_runs(due_runs)
+
+    changed_runs = [
+        run
+        for run in due_runs
+        if run.id in status_details and _apply_status_detail(run, status_details[run.id])
+    ]
+    _save_synced_runs(run_repository, due_runs, now)
+
+    return changed_runs
 
 
 def create_update_run_status(simulation_runner: ISimulationRunner, run_repository: IRunRepository):
     """Factory to create update_run_status function with dependencies wired."""
     return functools.partial(update_run_status, simulation_runner, run_repository)
+
+
+def create_update_run_statuses(
+    simulation_runner: ISimulationRunner,
+    run_repository: IRunRepository,
+    status_ttl_seconds: float = 0.0,
+):
+    """Factory to create update_run_statuses function with dependencies wired."""
+    return functools.partial(
+        update_run_statuses,
+        simulation_runner,
+        run_repository,
+        status_ttl_seconds=status_ttl_seconds,
+    )
@@ -7,30 +7,38 @@ services and repositories without implementing business logic directly.
 """
 
 import functools
-import io
+import hashlib
 import logging
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Protocol
 
 from epistemix_platform.exceptions import (
     InvalidResultsDirectoryError,
     ResultsMetadataError,
     ResultsPackagingError,
+    ResultsStorageError,
 )
 from epistemix_platform.models.job_s3_prefix import JobS3Prefix
+from epistemix_platform.models.results_manifest import ResultsManifest
 from epistemix_platform.models.run import RunStatus
 from epistemix_platform.repositories.interfaces import (
     IJobRepository,
     IResultsRepository,
     IRunRepository,
 )
+from epistemix_platform.utils.parallel_zip import write_parallel_zip
 
 
 logger = logging.getLogger(__name__)
 
+# ZIPs up to this size stay in memory; larger ones spill to a temporary file on disk
+RESULTS_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
 
 # ============================================================================
 # Results Packager - Internal to this use case
@@ -45,18 +53,33 @@ class PackagedResults:
     Immutable to ensure integrity - once created, content cannot change.
     This follows the value object pattern from Domain-Driven Design.
 
+    The packager returns the ZIP as a binary file object positioned at the
+    start (spooled to disk when large) so multi-GB results are never held in
+    memory. Use as a context manager to release the temporary file.
+
     Attributes:
-        zip_content: Binary ZIP file content
+        zip_content: ZIP file object positioned at offset 0, or the ZIP bytes
         file_count: Number of files included in ZIP
         total_size_bytes: Total size of ZIP file in bytes
         directory_name: Name of the results directory (e.g., "RUN4")
     """
 
-    zip_content: bytes
+    zip_content: BinaryIO | bytes
     file_count: int
     total_size_bytes: int
     directory_name: str
 
+    def close(self) -> None:
+        """Release the temporary file backing the ZIP content."""
+        if not isinstance(self.zip_content, bytes):
+            self.zip_content.close()
+
+    def __enter__(self) -> "PackagedResults":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 class _IResultsPackager(Protocol):
     """
@@ -87,6 +110,22 @@ class _IResultsPackager(Protocol):
         """
         ...
 
+    def build_manifest(self, results_dir: Path) -> ResultsManifest:
+        """
+        Hash the files package_directory would include, without zipping them.
+
+        Args:
+            results_dir: Path to results directory
+
+        Returns:
+            ResultsManifest with the SHA-256 of each file by archive name
+
+        Raises:
+            InvalidResultsDirectoryError: If directory validation fails
+            ResultsPackagingError: If a file cannot be read
+        """
+        ...
+
 
 class _FredResultsPackager:
     """
@@ -98,8 +137,22 @@ class _FredResultsPackager:
 
     The ZIP file preserves the directory structure for compatibility with
     FRED analysis tools.
+
+    With compression_workers > 1, entries are deflated concurrently by
+    write_parallel_zip and incompressible outputs are stored; the archive is
+    still a standard ZIP with the same layout. Files are hashed for the
+    results manifest on the same number of threads.
     """
 
+    def __init__(self, compression_workers: int = 1):
+        """
+        Initialize the packager.
+
+        Args:
+            compression_workers: Number of files compressed concurrently (1 uses zipfile)
+        """
+        self.compression_workers = compression_workers
+
     def package_directory(self, results_dir: Path) -> PackagedResults:
         """
         Package FRED results following current ZIP structure.
@@ -118,22 +171,8 @@ class _FredResultsPackager:
             InvalidResultsDirectoryError: If directory is invalid
             ResultsPackagingError: If ZIP creation fails
         """
-        # Step 1: Validate directory exists
-        self._validate_directory_exists(results_dir)
-
-        # Step 2: Find RUN* directories
-        run_dirs = self._find_run_directories(results_dir)
-        is_single_run_dir = self._is_run_directory(results_dir)
-
-        if not run_dirs and not is_single_run_dir:
-            logger.warning(
-                "No RUN* directories found: path=%s is_run_dir=%s run_dirs_count=%s. "
-                "Expected either a RUN* directory or a parent containing RUN*/ subdirectories.",
-                results_dir,
-                is_single_run_dir,
-                len(run_dirs),
-            )
-            raise InvalidResultsDirectoryError("No FRED output directories found")
+        # Steps 1-2: Validate directory and find RUN* directories
+        run_dirs = self._resolve_run_directories(results_dir)
 
         logger.info(
             "Found %s in %s",
@@ -143,7 +182,7 @@ class _FredResultsPackager:
             results_dir,
         )
 
-        # Step 3: Create ZIP in memory
+        # Step 3: Stream ZIP into a spooled temporary file
         try:
             zip_content, file_count = self._create_zip(results_dir, run_dirs)
         except Exception as e:
@@ -151,7 +190,8 @@ class _FredResultsPackager:
             raise ResultsPackagingError("Failed to create ZIP file") from e
 
         # Step 4: Get metadata
-        total_size = len(zip_content)
+        total_size = zip_content.seek(0, 2)
+        zip_content.seek(0)
         logger.info(f"Created ZIP file: {total_size} bytes ({total_size / 1024 / 1024:.2f} MB)")
 
         return PackagedResults(
@@ -161,6 +201,72 @@ class _FredResultsPackager:
             directory_name=results_dir.name,
         )
 
+    def build_manifest(self, results_dir: Path) -> ResultsManifest:
+        """
+        Hash the files package_directory would include, without zipping them.
+
+        Hashing is much cheaper than compressing and uploading, so comparing
+        the manifest with the previous upload's lets unchanged results skip both.
+
+        Args:
+            results_dir: Path to results directory
+
+        Returns:
+            ResultsManifest with the SHA-256 of each file by archive name
+
+        Raises:
+            InvalidResultsDirectoryError: If directory is invalid
+            ResultsPackagingError: If a file cannot be read
+        """
+        run_dirs = self._resolve_run_directories(results_dir)
+        entries = self._collect_entries(results_dir, run_dirs)
+        paths = [file_path for file_path, _ in entries]
+
+        try:
+            if self.compression_workers > 1:
+                # hashlib releases the GIL while hashing, so threads hash in parallel
+                with ThreadPoolExecutor(max_workers=self.compression_workers) as executor:
+                    digests = list(executor.map(_hash_file, paths))
+            else:
+                digests = [_hash_file(file_path) for file_path in paths]
+        except OSError as e:
+            logger.exception("Hashing results failed for %s", results_dir)
+            raise ResultsPackagingError("Failed to hash results files") from e
+
+        return ResultsManifest(
+            files={arcname: digest for (_, arcname), digest in zip(entries, digests, strict=True)}
+        )
+
+    def _resolve_run_directories(self, results_dir: Path) -> list[Path]:
+        """
+        Validate the results directory and find its RUN* subdirectories.
+
+        Args:
+            results_dir: Path to results directory
+
+        Returns:
+            List of RUN* subdirectories (empty if results_dir is itself a RUN* directory)
+
+        Raises:
+            InvalidResultsDirectoryError: If the directory is invalid or holds no FRED outputs
+        """
+        self._validate_directory_exists(results_dir)
+
+        run_dirs = self._find_run_directories(results_dir)
+        is_single_run_dir = self._is_run_directory(results_dir)
+
+        if not run_dirs and not is_single_run_dir:
+            logger.warning(
+                "No RUN* directories found: path=%s is_run_dir=%s run_dirs_count=%s. "
+                "Expected either a RUN* directory or a parent containing RUN*/ subdirectories.",
+                results_dir,
+                is_single_run_dir,
+                len(run_dirs),
+            )
+            raise InvalidResultsDirectoryError("No FRED output directories found")
+
+        return run_dirs
+
     def _validate_directory_exists(self, results_dir: Path) -> None:
         """
         Validate that directory exists and is actually a directory.
@@ -203,10 +309,14 @@ class _FredResultsPackager:
         """
         return path.name.upper().startswith("RUN") and path.is_dir()
 
-    def _create_zip(self, results_dir: Path, run_dirs: list[Path]) -> tuple[bytes, int]:
+    def _create_zip(self, results_dir: Path, run_dirs: list[Path]) -> tuple[BinaryIO, int]:
         """
         Create ZIP file from results directory.
 
+        Files are compressed in chunks straight into a SpooledTemporaryFile, so
+        peak memory stays around RESULTS_SPOOL_MAX_BYTES whatever the results size.
+        With compression_workers > 1 the files are compressed in parallel.
+
         SECURITY: Only includes files from RUN* directories and prevents symlink escape attacks.
         - Restricts iteration to RUN* subdirectories only
         - Skips symlinks to prevent directory traversal attacks
@@ -217,41 +327,67 @@ class _FredResultsPackager:
             run_dirs: List of RUN* subdirectories (if parent directory)
 
         Returns:
-            Tuple of (zip_content_bytes, file_count)
+            Tuple of (zip_file, file_count); the caller owns and must close zip_file
 
         Raises:
             Exception: If ZIP creation fails (I/O error, permissions, etc.)
         """
-        zip_buffer = io.BytesIO()
-        file_count = 0
+        zip_buffer = tempfile.SpooledTemporaryFile(  # noqa: SIM115 - returned to the caller
+            max_size=RESULTS_SPOOL_MAX_BYTES, mode="w+b", suffix=".zip"
+        )
 
+        try:
+            entries = self._collect_entries(results_dir, run_dirs)
+            if self.compression_workers > 1:
+                write_parallel_zip(entries, zip_buffer, workers=self.compression_workers)
+            else:
+                with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                    for file_path, arcname in entries:
+                        # ZipFile.write compresses the file in chunks, never whole
+                        zip_file.write(file_path, arcname=arcname)
+                        logger.debug("Added to ZIP: %s", arcname)
+        except BaseException:
+            zip_buffer.close()
+            raise
+
+        return zip_buffer, len(entries)
+
+    def _collect_entries(self, results_dir: Path, run_dirs: list[Path]) -> list[tuple[Path, str]]:
+        """
+        List the files to archive with their archive names.
+
+        Args:
+            results_dir: Root directory to zip
+            run_dirs: List of RUN* subdirectories (if parent directory)
+
+        Returns:
+            (file path, archive name) pairs, skipping files outside results_dir
+        """
         # Resolve root path once for security checks
         root_path = results_dir.resolve()
 
         # Determine which directories to iterate (only RUN* dirs)
         targets = run_dirs if run_dirs else [results_dir]
 
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for base in targets:
-                for file_path in base.rglob("*"):
-                    if not file_path.is_file():
-                        continue
+        entries = []
+        for base in targets:
+            for file_path in base.rglob("*"):
+                if not file_path.is_file():
+                    continue
 
-                    # SECURITY: Prevent packaging files outside root via symlinks
-                    try:
-                        resolved = file_path.resolve()
-                        resolved.relative_to(root_path)
-                    except (ValueError, RuntimeError):
-                        # File is outside root or symlink escape attempt
-                        logger.warning("Skipping file outside root via symlink: %s", file_path)
-                        continue
+                # SECURITY: Prevent packaging files outside root via symlinks
+                try:
+                    resolved = file_path.resolve()
+                    resolved.relative_to(root_path)
+                except (ValueError, RuntimeError):
+                    # File is outside root or symlink escape attempt
+                    logger.warning("Skipping file outside root via symlink: %s", file_path)
+                    continue
 
-                    arcname = self._calculate_archive_name(file_path, results_dir, run_dirs)
-                    zip_file.write(file_path, arcname=arcname.as_posix())
-                    file_count += 1
-                    logger.debug("Added to ZIP: %s", arcname)
+                arcname = self._calculate_archive_name(file_path, results_dir, run_dirs)
+                entries.append((file_path, arcname.as_posix()))
 
-        return zip_buffer.getvalue(), file_count
+        return entries
 
     def _calculate_archive_name(
         self, file_path: Path, results_dir: Path, run_dirs: list[Path]
@@ -280,6 +416,12 @@ class _FredResultsPackager:
         return Path(results_dir.name) / file_path.relative_to(results_dir)
 
 
+def _hash_file(file_path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file, reading it in chunks."""
+    with file_path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 # ============================================================================
 # Upload Results Use Case
 # ============================================================================
@@ -293,6 +435,7 @@ def upload_results(
     job_id: int,
     run_id: int,
     results_dir: Path,
+    columnar_dir: Path | None = None,
 ) -> str:
     """
     Upload FRED simulation results to S3.
@@ -304,10 +447,16 @@ def upload_results(
     1. Fetch job to get created_at timestamp
     2. Validate run exists and belongs to job
     3. Create JobS3Prefix from job.created_at for consistent paths
-    4. Package results directory into ZIP (delegated to results_packager)
-    5. Upload ZIP to S3 with consistent prefix (delegated to results_repository)
-    6. Update run metadata with results URL and timestamp
-    7. Handle failures with proper error types
+    4. Hash the results files and compare with the last upload's manifest
+    5. Unless every file is unchanged, package results directory into ZIP
+       (delegated to results_packager), upload it with consistent prefix
+       (delegated to results_repository) and save the new manifest
+    6. Upload Parquet results and manifest next to the ZIP, if given
+    7. Update run metadata with results URL and timestamp
+    8. Handle failures with proper error types
+
+    Retries and re-runs that produce byte-identical outputs therefore skip
+    compression and upload entirely and reuse the ZIP already in S3.
 
     Args:
         run_repository: Repository for run persistence
@@ -317,6 +466,8 @@ def upload_results(
         job_id: Job identifier
         run_id: Run identifier
         results_dir: Path to results directory
+        columnar_dir: Optional directory of Parquet results with a manifest.json,
+            as written by the simulation runner
 
     Returns:
         S3 URL where results were uploaded
@@ -343,32 +494,70 @@ def upload_results(
     # Step 3: Create S3 prefix from job.created_at for consistent timestamps
     s3_prefix = JobS3Prefix.from_job(job)
 
-    # Step 4: Package results directory into ZIP (delegates to service)
+    # Step 4: Hash results and compare with the last upload (delegates to service)
     # Raises: InvalidResultsDirectoryError, ResultsPackagingError
-    packaged = results_packager.package_directory(results_dir)
-    logger.info(
-        f"Packaged {packaged.file_count} files from {packaged.directory_name} "
-        f"({packaged.total_size_bytes / 1024 / 1024:.2f} MB)"
-    )
+    manifest = results_packager.build_manifest(results_dir)
+    previous_manifest = _find_previous_manifest(results_repository, run_id, s3_prefix)
 
-    # Step 5: Upload ZIP to S3 with consistent prefix (delegates to repository)
-    # Raises: ResultsStorageError (with sanitized credentials)
-    upload_location = results_repository.upload_results(
-        job_id=job_id,
-        run_id=run_id,
-        zip_content=packaged.zip_content,
-        s3_prefix=s3_prefix,
-    )
+    if previous_manifest is not None and manifest.matches(previous_manifest):
+        logger.info(
+            f"Results for run {run_id} are unchanged since the last upload "
+            f"({len(manifest.files)} files); reusing {previous_manifest.results_url}"
+        )
+        results_url = previous_manifest.results_url
+    else:
+        if previous_manifest is not None:
+            logger.info(
+                f"Results for run {run_id} changed since the last upload: "
+                f"{len(manifest.changed_files(previous_manifest))} files added or modified, "
+                f"{len(manifest.removed_files(previous_manifest))} removed"
+            )
+
+        # Step 5: Package results directory into ZIP (delegates to service)
+        # Raises: InvalidResultsDirectoryError, ResultsPackagingError
+        with results_packager.package_directory(results_dir) as packaged:
+            logger.info(
+                f"Packaged {packaged.file_count} files from {packaged.directory_name} "
+                f"({packaged.total_size_bytes / 1024 / 1024:.2f} MB)"
+            )
 
-    # Step 6: Update run metadata
-    run.results_url = upload_location.url
+            # Stream ZIP to S3 with consistent prefix (delegates to repository)
+            # Raises: ResultsStorageError (with sanitized credentials)
+            upload_location = results_repository.upload_results(
+                job_id=job_id,
+                run_id=run_id,
+                zip_content=packaged.zip_content,
+                s3_prefix=s3_prefix,
+            )
+        results_url = upload_location.url
+
+        # The manifest only saves work on the next upload, so failing to store it is not fatal
+        try:
+            results_repository.save_results_manifest(
+                job_id=job_id, run_id=run_id, manifest=manifest, s3_prefix=s3_prefix
+            )
+        except ResultsStorageError as e:
+            logger.warning(f"Could not save results manifest for run {run_id}: {e}")
+
+    # Step 6: Upload columnar results next to the ZIP (the ZIP stays the source of truth)
+    if columnar_dir is not None:
+        columnar_location = results_repository.upload_columnar_results(
+            job_id=job_id,
+            run_id=run_id,
+            columnar_dir=columnar_dir,
+            s3_prefix=s3_prefix,
+        )
+        logger.info(f"Uploaded columnar results for run {run_id}: {columnar_location.url}")
+
+    # Step 7: Update run metadata
+    run.results_url = results_url
     run.results_uploaded_at = datetime.utcnow()
     run.status = RunStatus.DONE
 
     try:
         run_repository.save(run)
         logger.info(
-            f"Updated run {run_id}: results_url={upload_location.url}, "
+            f"Updated run {run_id}: results_url={results_url}, "
             f"status={run.status.value}, uploaded_at={run.results_uploaded_at.isoformat()}"
         )
     except Exception as e:
@@ -376,25 +565,38 @@ def upload_results(
         logger.exception("CRITICAL: Results uploaded to S3 but database update failed")
         raise ResultsMetadataError(
             f"Results uploaded to S3 but database update failed: {e}",
-            orphaned_s3_url=upload_location.url,
+            orphaned_s3_url=results_url,
         ) from e
 
     return run.results_url
 
 
+def _find_previous_manifest(
+    results_repository: IResultsRepository, run_id: int, s3_prefix: JobS3Prefix
+) -> ResultsManifest | None:
+    """Fetch the last upload's manifest; an unreadable one just means a full upload."""
+    try:
+        return results_repository.get_results_manifest(run_id, s3_prefix)
+    except ResultsStorageError as e:
+        logger.warning(f"Could not read results manifest for run {run_id}: {e}")
+        return None
+
+
 def create_upload_results(
     run_repository: IRunRepository,
     job_repository: IJobRepository,
     results_repository: IResultsRepository,
+    compression_workers: int = 1,
 ):
     """
     Factory to create upload_results function with dependencies wired.
 
     Creates internal instance of results_packager that is only used by this use case.
     Time is obtained directly via datetime.utcnow() (can be mocked with freezegun in tests).
+    compression_workers sets how many files the packager compresses in parallel.
     """
     # Create internal dependencies
-    results_packager = _FredResultsPackager()
+    results_packager = _FredResultsPackager(compression_workers=compression_workers)
 
     return functools.partial(
         upload_results,
@@ -38,6 +38,9 @@ def write_to_local(file_path: Path, content: UploadContent, force: bool = False)
     if not isinstance(content, UploadContent):
         raise ValueError(f"content must be an UploadContent object, got {type(content)}")
 
+    if content.is_zip_preview():
+        raise ValueError(f"Cannot write ZIP preview to {file_path}: it has no archive bytes")
+
     # Check if file exists and handle based on force flag
     if file_path.exists() and not force:
         raise FileExistsError(f"File already exists: {file_path}. Use force=True to overwrite.")
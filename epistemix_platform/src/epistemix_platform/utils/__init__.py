@@ -5,10 +5,11 @@ This package contains application utilities that encapsulate business logic
 and coordinate between domain models and infrastructure.
 """
 
-from epistemix_platform.utils.s3_client import create_s3_client
+from epistemix_platform.utils.s3_client import create_s3_client, get_aws_session
 
 
 __all__ = [
     # S3 Client
     "create_s3_client",
+    "get_aws_session",
 ]
@@ -0,0 +1,90 @@
+"""
+Synthetic AWS Batch job state-change events.
+
+Generates the EventBridge events AWS Batch would publish for a set of runs, for
+replaying through `epistemix-cli runs events replay` or POST /events/batch when
+load testing event ingestion without submitting real Batch jobs.
+"""
+
+import random
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from epistemix_platform.models.batch_job_state_change import (
+    BATCH_EVENT_DETAIL_TYPE,
+    BATCH_EVENT_SOURCE,
+)
+
+
+_LIFECYCLE = ("SUBMITTED", "PENDING", "RUNNABLE", "STARTING", "RUNNING")
+
+
+def generate_batch_job_events(
+    job_id: int,
+    run_ids: list[int],
+    start: datetime | None = None,
+    step_seconds: float = 5.0,
+    failure_rate: float = 0.0,
+    shuffle: bool = False,
+    seed: int | None = None,
+    region: str = "us-east-1",
+    account_id: str = "123456789012",
+) -> list[dict[str, Any]]:
+    """
+    Generate the full Batch lifecycle of state-change events for each run.
+
+    Each run goes SUBMITTED → PENDING → RUNNABLE → STARTING → RUNNING and ends
+    SUCCEEDED, or FAILED with probability failure_rate. Job names follow the
+    per-run submission convention ("job-{job_id}-run-{run_id}").
+
+    Args:
+        job_id: ID of the job the runs belong to
+        run_ids: IDs of the runs to generate events for
+        start: Time of each run's SUBMITTED event (defaults to now, UTC)
+        step_seconds: Time between consecutive events of a run
+        failure_rate: Fraction of runs that end FAILED instead of SUCCEEDED
+        shuffle: Shuffle the events to mimic out-of-order delivery
+        seed: Seed for reproducible failures and shuffling
+        region: AWS region reported in the events
+        account_id: AWS account ID reported in the events
+
+    Returns:
+        EventBridge "Batch Job State Change" events, in time order unless shuffled
+    """
+    rng = random.Random(seed)
+    start = start or datetime.now(UTC).replace(tzinfo=None)
+
+    events = []
+    for run_id in run_ids:
+        batch_job_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        final_status = "FAILED" if rng.random() < failure_rate else "SUCCEEDED"
+        for step, status in enumerate((*_LIFECYCLE, final_status)):
+            occurred_at = start + timedelta(seconds=step * step_seconds)
+            events.append(
+                {
+                    "version": "0",
+                    "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                    "detail-type": BATCH_EVENT_DETAIL_TYPE,
+                    "source": BATCH_EVENT_SOURCE,
+                    "account": account_id,
+                    "time": occurred_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "region": region,
+                    "resources": [f"arn:aws:batch:{region}:{account_id}:job/{batch_job_id}"],
+                    "detail": {
+                        "jobName": f"job-{job_id}-run-{run_id}",
+                        "jobId": batch_job_id,
+                        "status": status,
+                        "statusReason": (
+                            "Essential container in task exited" if status == "FAILED" else ""
+                        ),
+                    },
+                }
+            )
+
+    if shuffle:
+        rng.shuffle(events)
+    else:
+        events.sort(key=lambda event: event["time"])
+
+    return events
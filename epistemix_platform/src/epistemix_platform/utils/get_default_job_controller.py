@@ -6,16 +6,32 @@ used by both app.py (Flask) and cli.py to avoid code duplication.
 """
 
 from collections.abc import Callable
+from pathlib import Path
 
 from epistemix_platform.controllers.job_controller import JobController
-from epistemix_platform.gateways.simulation_runner import AWSBatchSimulationRunner
+from epistemix_platform.gateways.simulation_runner import (
+    DEFAULT_SUBMIT_CONCURRENCY,
+    AWSBatchSimulationRunner,
+)
 from epistemix_platform.mappers.job_mapper import JobMapper
 from epistemix_platform.mappers.run_mapper import RunMapper
 from epistemix_platform.repositories import SQLAlchemyJobRepository, SQLAlchemyRunRepository
+from epistemix_platform.repositories.presigned_url_cache import (
+    DEFAULT_HEADROOM,
+    get_presigned_url_cache,
+)
+from epistemix_platform.repositories.s3_multipart_upload import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    S3MultipartUploader,
+)
 from epistemix_platform.repositories.s3_results_repository import S3ResultsRepository
 from epistemix_platform.repositories.s3_upload_location_repository import (
+    DEFAULT_ARCHIVE_CONCURRENCY,
+    DEFAULT_BATCH_OPERATIONS_THRESHOLD,
     create_upload_location_repository,
 )
+from epistemix_platform.utils.s3_client import create_s3_client, get_aws_session
 
 
 def create_job_controller(
@@ -23,6 +39,18 @@ def create_job_controller(
     environment: str,
     bucket_name: str,
     region_name: str,
+    batch_submit_concurrency: int = DEFAULT_SUBMIT_CONCURRENCY,
+    batch_submission_mode: str = "per-run",
+    run_status_ttl_seconds: float = 0.0,
+    sync_run_status_on_read: bool = True,
+    results_upload_part_size: int = DEFAULT_PART_SIZE,
+    results_upload_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    results_upload_checkpoint_dir: str | None = None,
+    results_compression_workers: int = 1,
+    presigned_url_cache_size: int = 0,
+    presigned_url_cache_headroom: float = DEFAULT_HEADROOM,
+    archive_concurrency: int = DEFAULT_ARCHIVE_CONCURRENCY,
+    archive_batch_operations_threshold: int = DEFAULT_BATCH_OPERATIONS_THRESHOLD,
 ) -> JobController:
     """
     Create a JobController instance with default dependencies.
@@ -32,10 +60,26 @@ def create_job_controller(
     Flask app (app.py) and CLI (cli.py).
 
     Args:
-        session_factory: Callable that returns a database session
+        session_factory: Callable that returns a database session, typically the
+            scoped DatabaseManager.get_session from the process-wide registry
         environment: Environment name (e.g., "dev", "staging", "prod")
         bucket_name: S3 bucket name for uploads
         region_name: AWS region name
+        batch_submit_concurrency: Maximum concurrent AWS Batch submissions per request
+        batch_submission_mode: "per-run" or "array" (one Batch array job per job)
+        run_status_ttl_seconds: Seconds a run status read from AWS Batch is reused (0 disables)
+        sync_run_status_on_read: Whether GET /runs syncs statuses with AWS Batch
+        results_upload_part_size: Bytes per part of multipart results uploads
+        results_upload_concurrency: Maximum parts of a results upload in flight
+        results_upload_checkpoint_dir: Directory for resumable upload checkpoints;
+            None or empty aborts failed uploads instead
+        results_compression_workers: Files compressed in parallel when packaging results
+        presigned_url_cache_size: Presigned URLs kept in the process-wide cache (0 disables)
+        presigned_url_cache_headroom: Fraction of a URL's requested validity that must
+            remain for a cached URL to be reused
+        archive_concurrency: Objects transitioned to Glacier at once when archiving prefixes
+        archive_batch_operations_threshold: Number of objects from which archiving prefixes
+            writes an S3 Batch Operations manifest instead (0 never does)
 
     Returns:
         Configured JobController instance
@@ -44,7 +88,7 @@ def create_job_controller(
         # In app.py (Flask)
         def get_job_controller():
             return create_job_controller(
-                session_factory=lambda: g.db_session,
+                session_factory=g.db_manager.get_session,
                 environment=app.config["ENVIRONMENT"],
                 bucket_name=app.config["S3_UPLOAD_BUCKET"],
                 region_name=app.config["AWS_REGION"],
@@ -53,9 +97,9 @@ def create_job_controller(
         # In cli.py
         def get_job_controller():
             config = get_config()
-            session = get_database_session()
+            db_manager = get_database_manager(config.get_database_url())
             return create_job_controller(
-                session_factory=lambda: session,
+                session_factory=db_manager.get_session,
                 environment=config.ENVIRONMENT,
                 bucket_name=config.S3_UPLOAD_BUCKET,
                 region_name=config.AWS_REGION,
@@ -69,16 +113,47 @@ def create_job_controller(
     job_repository = SQLAlchemyJobRepository(job_mapper, session_factory)
     run_repository = SQLAlchemyRunRepository(run_mapper, session_factory)
 
+    # Shared across requests: repositories are rebuilt for every request
+    url_cache = get_presigned_url_cache(presigned_url_cache_size, presigned_url_cache_headroom)
+
+    # Shared across requests, so presigned URLs are signed with the credentials the clients use
+    aws_session = get_aws_session(region_name)
+
     # Create upload location repository
     upload_location_repository = create_upload_location_repository(
-        env=environment, bucket_name=bucket_name, region_name=region_name
+        env=environment,
+        bucket_name=bucket_name,
+        region_name=region_name,
+        url_cache=url_cache,
+        archive_concurrency=archive_concurrency,
+        batch_operations_threshold=archive_batch_operations_threshold,
+        session=aws_session,
     )
 
-    # Create S3 results repository
-    results_repository = S3ResultsRepository(bucket_name=bucket_name, region_name=region_name)
+    # Create S3 results repository with its multipart upload engine
+    s3_client = create_s3_client(region_name=region_name, session=aws_session)
+    results_repository = S3ResultsRepository(
+        bucket_name=bucket_name,
+        region_name=region_name,
+        s3_client=s3_client,
+        url_cache=url_cache,
+        session=aws_session,
+        multipart_uploader=S3MultipartUploader(
+            s3_client,
+            part_size=results_upload_part_size,
+            max_concurrency=results_upload_concurrency,
+            checkpoint_dir=(
+                Path(results_upload_checkpoint_dir) if results_upload_checkpoint_dir else None
+            ),
+        ),
+    )
 
     # Create simulation runner gateway
-    simulation_runner = AWSBatchSimulationRunner.create(environment=environment, region=region_name)
+    simulation_runner = AWSBatchSimulationRunner.create(
+        environment=environment,
+        region=region_name,
+        max_concurrency=batch_submit_concurrency,
+    )
 
     # Create and return JobController
     return JobController.create_with_repositories(
@@ -87,4 +162,44 @@ def create_job_controller(
         upload_location_repository=upload_location_repository,
         results_repository=results_repository,
         simulation_runner=simulation_runner,
+        batch_submission_mode=batch_submission_mode,
+        run_status_ttl_seconds=run_status_ttl_seconds,
+        sync_run_status_on_read=sync_run_status_on_read,
+        results_compression_workers=results_compression_workers,
+    )
+
+
+def create_job_controller_from_config(
+    config_class: type, session_factory: Callable
+) -> JobController:
+    """
+    Create a JobController from a Config class (DevelopmentConfig, ProductionConfig, ...).
+
+    Used by the CLI and by processes that drive the platform in-process (such
+    as the simulation runner) so the Config-to-factory mapping lives in one place.
+
+    Args:
+        config_class: Config class whose attributes configure the controller
+        session_factory: Callable that returns a database session
+
+    Returns:
+        Configured JobController instance
+    """
+    return create_job_controller(
+        session_factory=session_factory,
+        environment=config_class.ENVIRONMENT,
+        bucket_name=config_class.S3_UPLOAD_BUCKET,
+        region_name=config_class.AWS_REGION,
+        batch_submit_concurrency=config_class.BATCH_SUBMIT_CONCURRENCY,
+        batch_submission_mode=config_class.BATCH_SUBMISSION_MODE,
+        run_status_ttl_seconds=config_class.RUN_STATUS_CACHE_TTL,
+        sync_run_status_on_read=config_class.RUN_STATUS_SYNC_ON_READ,
+        results_upload_part_size=config_class.RESULTS_UPLOAD_PART_SIZE_MB * 1024 * 1024,
+        results_upload_concurrency=config_class.RESULTS_UPLOAD_CONCURRENCY,
+        results_upload_checkpoint_dir=config_class.RESULTS_UPLOAD_CHECKPOINT_DIR,
+        results_compression_workers=config_class.RESULTS_COMPRESSION_WORKERS,
+        presigned_url_cache_size=config_class.PRESIGNED_URL_CACHE_SIZE,
+        presigned_url_cache_headroom=config_class.PRESIGNED_URL_CACHE_HEADROOM,
+        archive_concurrency=config_class.ARCHIVE_CONCURRENCY,
+        archive_batch_operations_threshold=config_class.ARCHIVE_BATCH_OPERATIONS_THRESHOLD,
     )
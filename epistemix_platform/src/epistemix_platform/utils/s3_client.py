@@ -6,6 +6,7 @@ with proper error handling and credential chain support.
 """
 
 import logging
+import threading
 from typing import Any
 
 import boto3
@@ -14,8 +15,38 @@ from botocore.exceptions import BotoCoreError, NoCredentialsError
 
 logger = logging.getLogger(__name__)
 
+# Process-wide sessions keyed by region: controllers and their repositories are
+# built per request, and a new Session reloads service models and re-resolves
+# credentials (a metadata call in ECS), so sessions must outlive them
+_sessions: dict[str | None, Any] = {}
+_sessions_lock = threading.Lock()
 
-def create_s3_client(region_name: str | None = None, s3_client: Any | None = None) -> Any:
+
+def get_aws_session(region_name: str | None = None) -> Any:
+    """
+    Get or create the process-wide boto3 Session for a region.
+
+    Clients created from one session share its resolved (and refreshed)
+    credentials, so URLs presigned from the session's credentials match the
+    credentials the clients sign requests with.
+
+    Args:
+        region_name: AWS region name (None uses the default region from config/environment)
+
+    Returns:
+        The shared boto3 Session
+    """
+    with _sessions_lock:
+        session = _sessions.get(region_name)
+        if session is None:
+            session = boto3.Session(region_name=region_name)
+            _sessions[region_name] = session
+    return session
+
+
+def create_s3_client(
+    region_name: str | None = None, s3_client: Any | None = None, session: Any | None = None
+) -> Any:
     """
     Create or validate an S3 client with proper error handling.
 
@@ -34,6 +65,8 @@ def create_s3_client(region_name: str | None = None, s3_client: Any | None = Non
     Args:
         region_name: AWS region name (optional, will use default region from config/environment)
         s3_client: Optional pre-configured S3 client (for testing)
+        session: Optional boto3 Session to create the client from, so callers can
+            read the credentials it signs with (defaults to boto3's default session)
 
     Returns:
         Configured boto3 S3 client
@@ -58,7 +91,7 @@ def create_s3_client(region_name: str | None = None, s3_client: Any | None = Non
     if region_name:
         session_kwargs["region_name"] = region_name
     try:
-        client = boto3.client("s3", **session_kwargs)
+        client = (session or boto3).client("s3", **session_kwargs)
     except (NoCredentialsError, BotoCoreError) as e:
         logger.exception("Failed to initialize S3 client")
         raise ValueError("S3 client initialization failed") from e
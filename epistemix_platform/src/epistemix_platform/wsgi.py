@@ -10,7 +10,7 @@ import sys
 
 from werkzeug.middleware.proxy_fix import ProxyFix
 
-from epistemix_platform.app import app
+from epistemix_platform.app import app, init_database
 
 
 # Configure logging for production with level-based stream separation
@@ -54,6 +54,9 @@ logger = logging.getLogger(__name__)
 app.logger.handlers = root.handlers
 app.logger.setLevel(logging.INFO)
 
+# Run the schema gate once at startup so a mismatched schema fails the boot, not a request
+init_database()
+
 # Log startup information
 logger.info(
     f"Epistemix API WSGI application initialized for {app.config['ENVIRONMENT']} environment"
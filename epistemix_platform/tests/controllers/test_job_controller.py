@@ -10,7 +10,7 @@ import shutil
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import boto3
 import pytest
@@ -21,10 +21,12 @@ from returns.pipeline import is_successful
 from epistemix_platform.controllers.job_controller import JobController
 from epistemix_platform.mappers.job_mapper import JobMapper
 from epistemix_platform.mappers.run_mapper import RunMapper
+from epistemix_platform.models.archive_sweep import ArchiveSweep
 from epistemix_platform.models.job import Job, JobStatus
 from epistemix_platform.models.job_upload import JobUpload
 from epistemix_platform.models.requests import RunRequest
 from epistemix_platform.models.run import PodPhase, Run, RunStatus
+from epistemix_platform.models.run_reconciliation import RunReconciliation
 from epistemix_platform.models.upload_content import UploadContent
 from epistemix_platform.models.upload_location import UploadLocation
 from epistemix_platform.repositories import (
@@ -73,11 +75,19 @@ def service():
     service._get_runs_by_job_id = Mock(return_value=[run])
     service._get_job_uploads = Mock(return_value=[mock_upload1, mock_upload2])
     service._read_upload_content = Mock(return_value=UploadContent.create_text("test content"))
+    service._preview_upload_content = Mock(return_value=UploadContent.create_text("test content"))
     service._write_to_local = Mock(return_value=None)
     service._archive_uploads = Mock(return_value=[mock_location1, mock_location2])
-    service._run_simulation = Mock(return_value=run)
-    service._update_run_status = Mock(return_value=True)
+    service._archive_job_prefixes = Mock(return_value=ArchiveSweep(prefixes=["jobs/"]))
+    service._run_simulations = Mock(return_value={})
+    service._update_run_statuses = Mock(return_value=[])
+    service._reconcile_run_statuses = Mock(
+        return_value=RunReconciliation(
+            swept=2, changed=1, max_lag_seconds=30.0, mean_lag_seconds=20.0, duration_seconds=0.5
+        )
+    )
     service._get_run_results = Mock(return_value=[])
+    service._iter_run_results = Mock(return_value=iter([]))
     service._upload_results = Mock(return_value="https://s3.amazonaws.com/bucket/results.zip")
     service.job_repository = Mock()
     service.run_repository = Mock()
@@ -292,6 +302,79 @@ class TestJobController:
         assert not is_successful(result)
         assert result.failure() == "An unexpected error occurred while retrieving the runs"
 
+    def test_get_runs__sync_on_read_disabled__reads_database_only(self, service):
+        service._sync_run_status_on_read = False
+
+        result = service.get_runs(job_id=1)
+
+        assert is_successful(result)
+        service._update_run_statuses.assert_not_called()
+
+    def test_reconcile_run_statuses__when_no_exceptions__returns_success_result_with_metrics(
+        self, service
+    ):
+        synced_before = datetime(2025, 1, 1, 12, 0, 0)
+
+        result = service.reconcile_run_statuses(batch_size=100, synced_before=synced_before)
+
+        assert is_successful(result)
+        assert result.unwrap()["swept"] == 2
+        service._reconcile_run_statuses.assert_called_once_with(
+            batch_size=100, synced_before=synced_before
+        )
+
+    def test_reconcile_run_statuses__when_exception_raised__returns_failure_result(self, service):
+        service._reconcile_run_statuses.side_effect = Exception("Batch unavailable")
+
+        result = service.reconcile_run_statuses(batch_size=100)
+
+        assert not is_successful(result)
+        assert result.failure() == "An unexpected error occurred while reconciling run statuses"
+
+    def test_ingest_batch_events__when_no_exceptions__returns_success_result_with_counts(
+        self, service
+    ):
+        counts = {"received": 1, "applied": 1, "ignored": 0, "invalid": 0}
+        service._ingest_batch_events = Mock(return_value=counts)
+        events = [{"source": "aws.batch"}]
+
+        result = service.ingest_batch_events(events)
+
+        assert is_successful(result)
+        assert result.unwrap() == counts
+        service._ingest_batch_events.assert_called_once_with(events)
+
+    def test_ingest_batch_events__when_exception_raised__returns_failure_result(self, service):
+        service._ingest_batch_events = Mock(side_effect=Exception("Database unavailable"))
+
+        result = service.ingest_batch_events([])
+
+        assert not is_successful(result)
+        assert result.failure() == "An unexpected error occurred while ingesting Batch events"
+
+    def test_read_run_columns__when_no_exceptions__returns_success_result_with_columns(
+        self, service
+    ):
+        service._read_run_columns = Mock(return_value={"N": [1000, 1001]})
+
+        result = service.read_run_columns(
+            job_id=1, run_id=1, table="RUN1/out", columns=["N"], start_day=0, end_day=1
+        )
+
+        assert is_successful(result)
+        assert result.unwrap() == {"N": [1000, 1001]}
+        service._read_run_columns.assert_called_once_with(
+            job_id=1, run_id=1, table="RUN1/out", columns=["N"], start_day=0, end_day=1
+        )
+
+    def test_read_run_columns__when_value_error_raised__returns_failure_result(self, service):
+        service._read_run_columns = Mock(side_effect=ValueError("No columnar results for run 1"))
+
+        result = service.read_run_columns(job_id=1, run_id=1, table="RUN1/out")
+
+        assert not is_successful(result)
+        assert result.failure() == "No columnar results for run 1"
+
     def test_get_job_uploads__given_job_id__calls_internal_get_job_uploads_use_case(self, service):
         upload = JobUpload(
             context="job",
@@ -305,7 +388,8 @@ class TestJobController:
         service.get_job_uploads(job_id=1)
 
         service._get_job_uploads.assert_called_once_with(job_id=1)
-        service._read_upload_content.assert_called_once_with(upload.location)
+        service._preview_upload_content.assert_called_once_with(upload.location)
+        service._read_upload_content.assert_not_called()
 
     def test_get_job_uploads__when_no_exceptions__returns_success_result_with_content(
         self, service
@@ -319,7 +403,7 @@ class TestJobController:
         )
         content = UploadContent.create_text("test file content")
         service._get_job_uploads.return_value = [upload]
-        service._read_upload_content.return_value = content
+        service._preview_upload_content.return_value = content
 
         result = service.get_job_uploads(job_id=1)
 
@@ -350,7 +434,7 @@ class TestJobController:
             run_id=None,
         )
         service._get_job_uploads.return_value = [upload]
-        service._read_upload_content.side_effect = ValueError("S3 error")
+        service._preview_upload_content.side_effect = ValueError("S3 error")
 
         result = service.get_job_uploads(job_id=1)
 
@@ -404,6 +488,30 @@ class TestJobController:
         assert not is_successful(result)
         assert "Failed to generate download URLs" in result.failure()
 
+    def test_stream_run_results_download__when_no_exceptions__returns_success_result_with_iterator(
+        self, service
+    ):
+        from epistemix_platform.models.run_results import RunResults
+
+        service._iter_run_results.return_value = iter(
+            [RunResults(run_id=1, url="https://s3/presigned-1")]
+        )
+
+        result = service.stream_run_results_download(job_id=1, bucket_name="test-bucket")
+
+        assert is_successful(result)
+        assert list(result.unwrap()) == [{"run_id": 1, "url": "https://s3/presigned-1"}]
+
+    def test_stream_run_results_download__when_value_error_raised__returns_failure_result(
+        self, service
+    ):
+        service._iter_run_results.side_effect = ValueError("Job 999 not found")
+
+        result = service.stream_run_results_download(job_id=999, bucket_name="test-bucket")
+
+        assert not is_successful(result)
+        assert result.failure() == "Job 999 not found"
+
     def test_archive_job_uploads__given_job_id_and_days_since_create_with_dry_run_true__calls_internal_archive_uploads_use_case(
         self, service
     ):
@@ -472,6 +580,37 @@ class TestJobController:
         assert not is_successful(result)
         assert result.failure() == "An unexpected error occurred while archiving uploads"
 
+    def test_archive_old_uploads__when_no_exceptions__returns_success_result_with_sweep(
+        self, service
+    ):
+        service._archive_job_prefixes.return_value = ArchiveSweep(
+            prefixes=["jobs/"], archived=["jobs/12/2025/10/23/211500/job_input.zip"]
+        )
+
+        result = service.archive_old_uploads(days_since_create=90, dry_run=True)
+
+        assert is_successful(result)
+        assert result.unwrap()["archived"] == ["jobs/12/2025/10/23/211500/job_input.zip"]
+        service._archive_job_prefixes.assert_called_once_with(
+            job_ids=None, days_since_create=90, hours_since_create=None, dry_run=True
+        )
+
+    def test_archive_old_uploads__when_value_error_raised__returns_failure_result(self, service):
+        service._archive_job_prefixes.side_effect = ValueError("Job 404 not found")
+
+        result = service.archive_old_uploads(job_ids=[404])
+
+        assert not is_successful(result)
+        assert result.failure() == "Job 404 not found"
+
+    def test_archive_old_uploads__when_exception_raised__returns_failure_result(self, service):
+        service._archive_job_prefixes.side_effect = Exception("S3 error")
+
+        result = service.archive_old_uploads(days_since_create=90)
+
+        assert not is_successful(result)
+        assert result.failure() == "An unexpected error occurred while archiving uploads"
+
     def test_upload_results_from_directory__when_no_exceptions__returns_success_result_with_url(
         self, service
     ):
@@ -484,7 +623,7 @@ class TestJobController:
         assert is_successful(result)
         assert result.unwrap() == "https://s3.amazonaws.com/bucket/results.zip"
         service._upload_results.assert_called_once_with(
-            job_id=1, run_id=1, results_dir=Path("/tmp/results")
+            job_id=1, run_id=1, results_dir=Path("/tmp/results"), columnar_dir=None
         )
 
     def test_upload_results_from_directory__when_value_error_raised__returns_failure_result(
@@ -511,7 +650,7 @@ class TestJobController:
         assert not is_successful(result)
         assert result.failure() == "An unexpected error occurred while uploading results"
 
-    def test_submit_runs__given_user_token_and_run_requests__calls_internal_run_simulation_use_case_for_each_run(
+    def test_submit_runs__given_user_token_and_run_requests__calls_internal_run_simulations_use_case_with_all_runs(
         self, service, run_requests
     ):
         bearer_token = "Bearer valid_token"
@@ -536,13 +675,43 @@ class TestJobController:
             updated_at=datetime(2025, 1, 1, 12, 0, 0),
         )
         service._submit_runs.return_value = [run1, run2]
-        service._run_simulation = Mock(return_value=run1)
 
         service.submit_runs(user_token_value=bearer_token, run_requests=run_requests)
 
-        # Verify _run_simulation was called with the correct runs
-        expected_calls = [
-            call(run=run1),
-            call(run=run2),
-        ]
-        service._run_simulation.assert_has_calls(expected_calls)
+        service._run_simulations.assert_called_once_with(runs=[run1, run2])
+
+    def test_submit_runs__when_some_runs_fail_to_submit__reports_errors_per_run(
+        self, service, run_requests
+    ):
+        run1 = Run.create_persisted(
+            run_id=1,
+            job_id=1,
+            user_id=456,
+            status=RunStatus.SUBMITTED,
+            pod_phase=PodPhase.PENDING,
+            request={},
+            created_at=datetime(2025, 1, 1, 12, 0, 0),
+            updated_at=datetime(2025, 1, 1, 12, 0, 0),
+        )
+        run2 = Run.create_persisted(
+            run_id=2,
+            job_id=1,
+            user_id=456,
+            status=RunStatus.ERROR,
+            pod_phase=PodPhase.FAILED,
+            request={},
+            created_at=datetime(2025, 1, 1, 12, 0, 0),
+            updated_at=datetime(2025, 1, 1, 12, 0, 0),
+        )
+        service._submit_runs.return_value = [run1, run2]
+        service._run_simulations.return_value = {2: ["AWS Batch submission failed: throttled"]}
+
+        result = service.submit_runs(
+            user_token_value="Bearer valid_token", run_requests=run_requests
+        )
+
+        assert is_successful(result)
+        first, second = result.unwrap()
+        assert first["errors"] is None
+        assert second["status"] == "ERROR"
+        assert second["errors"] == ["AWS Batch submission failed: throttled"]
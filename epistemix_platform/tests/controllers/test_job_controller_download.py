@@ -18,6 +18,7 @@ from epistemix_platform.models.job_upload import JobUpload
 from epistemix_platform.models.run import PodPhase, Run, RunStatus
 from epistemix_platform.models.upload_content import UploadContent
 from epistemix_platform.models.upload_location import UploadLocation
+from epistemix_platform.models.uploads_download import UploadsDownload
 
 
 @pytest.fixture
@@ -360,3 +361,54 @@ class TestJobControllerDownloadForceFlag:
 
         assert not is_successful(result)
         assert result.failure() == "An unexpected error occurred while downloading uploads"
+
+
+class TestJobControllerStreamUploads:
+    def test_stream_job_uploads__passes_uploads_and_options_to_use_case(self, service):
+        service._download_uploads = Mock(
+            return_value=UploadsDownload(downloaded=["/tmp/d/file1.txt"], unchanged=["/tmp/d/f2"])
+        )
+
+        result = service.stream_job_uploads(
+            job_id=1, base_path=Path("/tmp/d"), should_force=True, max_concurrency=4
+        )
+
+        assert is_successful(result)
+        assert result.unwrap() == {
+            "downloaded": ["/tmp/d/file1.txt"],
+            "unchanged": ["/tmp/d/f2"],
+            "skipped": [],
+            "errors": [],
+        }
+        service._download_uploads.assert_called_once_with(
+            service._get_job_uploads.return_value,
+            Path("/tmp/d"),
+            should_force=True,
+            max_concurrency=4,
+        )
+        service._read_upload_content.assert_not_called()
+
+    def test_stream_job_uploads__when_no_uploads_found__returns_failure_result(self, service):
+        service._get_job_uploads.return_value = []
+        service._download_uploads = Mock()
+
+        result = service.stream_job_uploads(job_id=999, base_path=Path("/tmp/d"))
+
+        assert result.failure() == "No uploads found for job 999"
+        service._download_uploads.assert_not_called()
+
+    def test_stream_job_uploads__when_all_files_fail__returns_failure_result(self, service):
+        service._download_uploads = Mock(
+            return_value=UploadsDownload(errors=["Failed to download job_input: boom"])
+        )
+
+        result = service.stream_job_uploads(job_id=1, base_path=Path("/tmp/d"))
+
+        assert "Failed to download any files" in result.failure()
+
+    def test_stream_job_uploads__when_value_error_raised__returns_failure_result(self, service):
+        service._get_job_uploads.side_effect = ValueError("Job 999 not found")
+
+        result = service.stream_job_uploads(job_id=999, base_path=Path("/tmp/d"))
+
+        assert result.failure() == "Job 999 not found"
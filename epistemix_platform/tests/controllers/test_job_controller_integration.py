@@ -82,6 +82,8 @@ def simulation_runner_mock():
     from epistemix_platform.models import RunStatusDetail
 
     mock_runner = Mock()
+    # Every run submits successfully unless a test overrides this
+    mock_runner.submit_runs.return_value = {}
     # Mock describe_run to return current DB status (no change scenario)
     # Tests that need different behavior can override this
     mock_runner.describe_run.side_effect = lambda run: RunStatusDetail(
@@ -89,6 +91,14 @@ def simulation_runner_mock():
         pod_phase=run.pod_phase,
         message="Job status unchanged",
     )
+    mock_runner.describe_runs.side_effect = lambda runs: {
+        run.id: RunStatusDetail(
+            status=run.status,
+            pod_phase=run.pod_phase,
+            message="Job status unchanged",
+        )
+        for run in runs
+    }
     return mock_runner
 
 
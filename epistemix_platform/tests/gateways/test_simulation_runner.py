@@ -11,7 +11,7 @@ import pytest
 from botocore.exceptions import ClientError
 
 from epistemix_platform.gateways.simulation_runner import AWSBatchSimulationRunner
-from epistemix_platform.models import PodPhase, Run, RunStatus, RunStatusDetail
+from epistemix_platform.models import PodPhase, Run, RunArrayManifest, RunStatus, RunStatusDetail
 
 
 class TestAWSBatchSimulationRunnerSubmit:
@@ -44,8 +44,8 @@ class TestAWSBatchSimulationRunnerSubmit:
         assert "jobDefinition" in call_kwargs
         assert "jobQueue" in call_kwargs
 
-    def test_submit_run_does_not_modify_run_object(self):
-        """Test that submit_run does not modify the run object (AWS Batch is source of truth)."""
+    def test_submit_run_records_batch_job_id_on_run(self):
+        """Test that submit_run returns the Batch job ID and records it on the run."""
         # ARRANGE
         mock_batch_client = Mock()
         mock_batch_client.submit_job.return_value = {"jobId": "abc-123-job-id"}
@@ -61,14 +61,12 @@ class TestAWSBatchSimulationRunnerSubmit:
             request={"simulation": "test"},
         )
 
-        # Store original attributes
-        original_dict = run.to_dict()
-
         # ACT
-        runner.submit_run(run)
+        batch_job_id = runner.submit_run(run)
 
-        # ASSERT - Run object should be unchanged (AWS Batch is source of truth)
-        assert run.to_dict() == original_dict
+        # ASSERT
+        assert batch_job_id == "abc-123-job-id"
+        assert run.batch_job_id == "abc-123-job-id"
 
     def test_submit_run_passes_job_and_run_ids_as_command_arguments(self):
         """Test that submit_run passes job_id and run_id as command args to simulation-runner CLI."""
@@ -99,6 +97,126 @@ class TestAWSBatchSimulationRunnerSubmit:
         assert command == ["run", "--job-id", "123", "--run-id", "42"]
 
 
+class TestAWSBatchSimulationRunnerSubmitRuns:
+    """Tests for concurrent submit_runs method."""
+
+    @staticmethod
+    def _make_runs(count):
+        return [
+            Run.create_persisted(
+                run_id=run_id,
+                job_id=123,
+                user_id=456,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+                request={"simulation": "test"},
+            )
+            for run_id in range(1, count + 1)
+        ]
+
+    def test_submit_runs_submits_every_run(self):
+        mock_batch_client = Mock()
+        mock_batch_client.submit_job.return_value = {"jobId": "abc-123-job-id"}
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client, max_concurrency=4)
+
+        failures = runner.submit_runs(self._make_runs(10))
+
+        assert failures == {}
+        job_names = {call.kwargs["jobName"] for call in mock_batch_client.submit_job.call_args_list}
+        assert job_names == {f"job-123-run-{run_id}" for run_id in range(1, 11)}
+
+    def test_submit_runs_leaves_retries_to_the_client(self):
+        mock_batch_client = Mock()
+        mock_batch_client.submit_job.side_effect = ClientError(
+            {"Error": {"Code": "TooManyRequestsException"}}, "submit_job"
+        )
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+
+        with patch("time.sleep") as mock_sleep:
+            failures = runner.submit_runs(self._make_runs(1))
+
+        assert list(failures) == [1]
+        assert "AWS Batch submission failed" in failures[1]
+        assert mock_batch_client.submit_job.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_client_config_uses_standard_mode_retries(self):
+        config = AWSBatchSimulationRunner._client_config(max_concurrency=32)
+
+        assert config.retries == {"max_attempts": 3, "mode": "standard"}
+        assert config.max_pool_connections == 32
+
+    def test_submit_runs_reports_unexpected_error_and_keeps_other_job_ids(self):
+        mock_batch_client = Mock()
+
+        def submit_job(**kwargs):
+            if kwargs["jobName"] == "job-123-run-2":
+                return {}  # no jobId
+            return {"jobId": f"batch-{kwargs['jobName']}"}
+
+        mock_batch_client.submit_job.side_effect = submit_job
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+        runs = self._make_runs(3)
+
+        failures = runner.submit_runs(runs)
+
+        assert list(failures) == [2]
+        assert "Unexpected error submitting run" in failures[2]
+        assert [run.batch_job_id for run in runs] == [
+            "batch-job-123-run-1",
+            None,
+            "batch-job-123-run-3",
+        ]
+
+    def test_submit_runs_reports_partial_failures_per_run(self):
+        mock_batch_client = Mock()
+
+        def submit_job(**kwargs):
+            if kwargs["jobName"] == "job-123-run-2":
+                raise ClientError({"Error": {"Code": "ClientException"}}, "submit_job")
+            return {"jobId": "abc-123-job-id"}
+
+        mock_batch_client.submit_job.side_effect = submit_job
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+
+        failures = runner.submit_runs(self._make_runs(3))
+
+        assert list(failures) == [2]
+        assert mock_batch_client.submit_job.call_count == 3
+
+    def test_submit_runs_with_no_runs_returns_empty_dict(self):
+        mock_batch_client = Mock()
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+
+        assert runner.submit_runs([]) == {}
+        mock_batch_client.submit_job.assert_not_called()
+
+
+class TestAWSBatchSimulationRunnerArrayJobs:
+    """Tests for array-job submission and bulk child status."""
+
+    def test_submit_run_array_submits_one_array_job(self):
+        mock_batch_client = Mock()
+        mock_batch_client.submit_job.return_value = {"jobId": "array-parent-id"}
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+        manifest = RunArrayManifest(job_id=123, run_ids=(4, 5, 6))
+
+        array_job_id = runner.submit_run_array(manifest, "jobs/123/run_array_4_manifest.json")
+
+        assert array_job_id == "array-parent-id"
+        mock_batch_client.submit_job.assert_called_once()
+        call_kwargs = mock_batch_client.submit_job.call_args[1]
+        assert call_kwargs["jobName"] == "job-123-array-4"
+        assert call_kwargs["arrayProperties"] == {"size": 3}
+        assert call_kwargs["containerOverrides"]["command"] == [
+            "run",
+            "--job-id",
+            "123",
+            "--array-manifest",
+            "jobs/123/run_array_4_manifest.json",
+        ]
+
+
 class TestAWSBatchSimulationRunnerDescribe:
     """Tests for describe_run method."""
 
@@ -146,6 +264,28 @@ class TestAWSBatchSimulationRunnerDescribe:
         assert call_kwargs["filters"] == [{"name": "JOB_NAME", "values": ["job-123-run-42"]}]
         mock_batch_client.describe_jobs.assert_called_once_with(jobs=["abc-123-job-id"])
 
+    def test_describe_run_with_stored_batch_job_id_skips_name_lookup(self):
+        mock_batch_client = Mock()
+        mock_batch_client.describe_jobs.return_value = {
+            "jobs": [{"jobId": "abc-123-job-id", "status": "SUCCEEDED"}]
+        }
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+        run = Run.create_persisted(
+            run_id=42,
+            job_id=123,
+            user_id=456,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            request={"simulation": "test"},
+            batch_job_id="abc-123-job-id",
+        )
+
+        status_detail = runner.describe_run(run)
+
+        mock_batch_client.list_jobs.assert_not_called()
+        mock_batch_client.describe_jobs.assert_called_once_with(jobs=["abc-123-job-id"])
+        assert status_detail.status == RunStatus.DONE
+
     def test_describe_run_returns_status_detail_with_running(self):
         """Test that describe_run returns RunStatusDetail for RUNNING."""
         # ARRANGE
@@ -386,6 +526,165 @@ class TestAWSBatchSimulationRunnerDescribe:
         assert hasattr(result, "pod_phase")  # FRED-46 requirement
 
 
+class TestAWSBatchSimulationRunnerDescribeRuns:
+    """Tests for bulk describe_runs method."""
+
+    @staticmethod
+    def _make_runs(count, job_id=123):
+        return [
+            Run.create_persisted(
+                run_id=run_id,
+                job_id=job_id,
+                user_id=456,
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+                request={"simulation": "test"},
+            )
+            for run_id in range(1, count + 1)
+        ]
+
+    @staticmethod
+    def _describe_jobs(jobs):
+        return {"jobs": [{"jobId": job_id, "status": "RUNNING"} for job_id in jobs]}
+
+    def test_describe_runs_lists_once_per_job_and_describes_in_chunks(self):
+        mock_batch_client = Mock()
+        summaries = [
+            {"jobId": f"batch-{run_id}", "jobName": f"job-123-run-{run_id}", "createdAt": 1}
+            for run_id in range(1, 251)
+        ]
+        mock_batch_client.get_paginator.return_value.paginate.return_value = [
+            {"jobSummaryList": summaries[:100]},
+            {"jobSummaryList": summaries[100:]},
+        ]
+        mock_batch_client.describe_jobs.side_effect = self._describe_jobs
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+
+        statuses = runner.describe_runs(self._make_runs(250))
+
+        mock_batch_client.get_paginator.return_value.paginate.assert_called_once()
+        filters = mock_batch_client.get_paginator.return_value.paginate.call_args.kwargs["filters"]
+        assert filters == [{"name": "JOB_NAME", "values": ["job-123-run-*"]}]
+        assert mock_batch_client.describe_jobs.call_count == 3
+        mock_batch_client.list_jobs.assert_not_called()
+        assert len(statuses) == 250
+        assert statuses[250].status == RunStatus.RUNNING
+
+    def test_describe_runs_uses_latest_submission_and_omits_unknown_runs(self):
+        mock_batch_client = Mock()
+        mock_batch_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "jobSummaryList": [
+                    {"jobId": "old", "jobName": "job-123-run-1", "createdAt": 1},
+                    {"jobId": "new", "jobName": "job-123-run-1", "createdAt": 2},
+                    {"jobId": "other", "jobName": "job-123-run-99", "createdAt": 1},
+                ]
+            }
+        ]
+        mock_batch_client.describe_jobs.side_effect = self._describe_jobs
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+
+        statuses = runner.describe_runs(self._make_runs(2))
+
+        mock_batch_client.describe_jobs.assert_called_once_with(jobs=["new"])
+        assert list(statuses) == [1]
+
+    def test_describe_runs_uses_stored_batch_job_ids_and_lists_only_legacy_runs(self):
+        mock_batch_client = Mock()
+        mock_batch_client.get_paginator.return_value.paginate.return_value = [
+            {"jobSummaryList": [{"jobId": "legacy", "jobName": "job-7-run-3", "createdAt": 1}]}
+        ]
+        mock_batch_client.describe_jobs.side_effect = self._describe_jobs
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+        stored = self._make_runs(2)
+        for run in stored:
+            run.batch_job_id = f"stored-{run.id}"
+        legacy = Run.create_persisted(
+            run_id=3,
+            job_id=7,
+            user_id=456,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            request={"simulation": "test"},
+        )
+
+        statuses = runner.describe_runs([*stored, legacy])
+
+        filters = mock_batch_client.get_paginator.return_value.paginate.call_args.kwargs["filters"]
+        assert filters == [{"name": "JOB_NAME", "values": ["job-7-run-*"]}]
+        mock_batch_client.describe_jobs.assert_called_once_with(
+            jobs=["stored-1", "stored-2", "legacy"]
+        )
+        assert set(statuses) == {1, 2, 3}
+
+    def test_describe_runs_with_only_stored_batch_job_ids_skips_list_jobs(self):
+        mock_batch_client = Mock()
+        mock_batch_client.describe_jobs.side_effect = self._describe_jobs
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+        runs = self._make_runs(2)
+        for run in runs:
+            run.batch_job_id = f"stored-{run.id}"
+
+        statuses = runner.describe_runs(runs)
+
+        mock_batch_client.get_paginator.assert_not_called()
+        assert set(statuses) == {1, 2}
+
+    def test_describe_runs_describes_array_children_in_chunks_of_100(self):
+        mock_batch_client = Mock()
+
+        def describe_jobs(jobs):
+            return {
+                "jobs": [
+                    {
+                        "jobId": job_id,
+                        "status": "SUCCEEDED",
+                        "arrayProperties": {"index": int(job_id.split(":")[1])},
+                    }
+                    for job_id in jobs
+                ]
+            }
+
+        mock_batch_client.describe_jobs.side_effect = describe_jobs
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+        runs = self._make_runs(250)
+        for index, run in enumerate(runs):
+            run.batch_job_id = f"array-parent-id:{index}"
+
+        statuses = runner.describe_runs(runs)
+
+        mock_batch_client.get_paginator.assert_not_called()
+        assert [len(c.kwargs["jobs"]) for c in mock_batch_client.describe_jobs.call_args_list] == [
+            100,
+            100,
+            50,
+        ]
+        assert len(statuses) == 250
+        assert statuses[250].status == RunStatus.DONE
+        assert statuses[250].pod_phase == PodPhase.SUCCEEDED
+
+    def test_describe_runs_returns_error_status_after_max_retries(self):
+        mock_batch_client = Mock()
+        mock_batch_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "ServerException"}}, "list_jobs"
+        )
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+
+        with patch("time.sleep"):
+            statuses = runner.describe_runs(self._make_runs(2))
+
+        assert mock_batch_client.get_paginator.return_value.paginate.call_count == 3
+        assert {detail.status for detail in statuses.values()} == {RunStatus.ERROR}
+        assert {detail.pod_phase for detail in statuses.values()} == {PodPhase.UNKNOWN}
+
+    def test_describe_runs_with_no_runs_makes_no_calls(self):
+        mock_batch_client = Mock()
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+
+        assert runner.describe_runs([]) == {}
+        mock_batch_client.get_paginator.assert_not_called()
+
+
 class TestAWSBatchSimulationRunnerCancel:
     """Tests for cancel_run method."""
 
@@ -426,6 +725,26 @@ class TestAWSBatchSimulationRunnerCancel:
             jobId="abc-123-job-id", reason="User requested cancellation"
         )
 
+    def test_cancel_run_with_stored_batch_job_id_terminates_directly(self):
+        mock_batch_client = Mock()
+        runner = AWSBatchSimulationRunner(batch_client=mock_batch_client)
+        run = Run.create_persisted(
+            run_id=42,
+            job_id=123,
+            user_id=456,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            request={"simulation": "test"},
+            batch_job_id="array-parent-id:3",
+        )
+
+        runner.cancel_run(run)
+
+        mock_batch_client.list_jobs.assert_not_called()
+        mock_batch_client.terminate_job.assert_called_once_with(
+            jobId="array-parent-id:3", reason="User requested cancellation"
+        )
+
     def test_cancel_run_raises_if_job_not_found(self):
         """Test that cancel_run raises ValueError if job not found in AWS Batch."""
         # ARRANGE
@@ -41,6 +41,7 @@ class TestRunMapper:
         assert run.status == RunStatus.RUNNING
         assert run.user_deleted is False
         assert run.epx_client_version == "1.5.0"
+        assert run.batch_job_id is None  # runs submitted before job IDs were stored
         assert run.is_persisted() is True
 
     def test_record_to_domain__with_user_deleted_true(self):
@@ -286,6 +287,7 @@ class TestRunMapper:
             status=RunStatus.RUNNING,  # New status
             user_deleted=True,  # New user_deleted
             epx_client_version="2.1.0",  # New epx_client_version
+            batch_job_id="batch-555",  # New batch_job_id
         )
 
         RunMapper.update_record_from_domain(original_record, updated_run)
@@ -301,6 +303,7 @@ class TestRunMapper:
         assert original_record.status == RunStatusEnum.RUNNING
         assert original_record.user_deleted == 1
         assert original_record.epx_client_version == "2.1.0"
+        assert original_record.batch_job_id == "batch-555"
 
     def test_round_trip_conversion__preserves_all_data(self):
         """Test that converting record -> domain -> record preserves all data."""
@@ -316,6 +319,7 @@ class TestRunMapper:
             status=RunStatusEnum.DONE,
             user_deleted=1,
             epx_client_version="1.8.3",
+            batch_job_id="array-parent-id:7",
         )
 
         run = RunMapper.record_to_domain(original_record)
@@ -332,6 +336,7 @@ class TestRunMapper:
         assert final_record.status == original_record.status
         assert final_record.user_deleted == original_record.user_deleted
         assert final_record.epx_client_version == original_record.epx_client_version
+        assert final_record.batch_job_id == original_record.batch_job_id
 
     def test_reverse_round_trip_conversion__preserves_all_data(self):
         """Test that converting domain -> record -> domain preserves all data."""
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+import pytest
+
+from epistemix_platform.models.batch_job_state_change import BatchJobStateChange
+
+
+def _event(**detail):
+    return {
+        "id": "evt-1",
+        "detail-type": "Batch Job State Change",
+        "source": "aws.batch",
+        "time": "2025-01-01T12:00:05Z",
+        "detail": {"jobName": "job-12-run-34", "jobId": "abc", "status": "RUNNING", **detail},
+    }
+
+
+class TestBatchJobStateChange:
+    def test_from_event__per_run_job__parses_run_id_and_naive_utc_time(self):
+        state_change = BatchJobStateChange.from_event(_event())
+
+        assert state_change.batch_job_id == "abc"
+        assert state_change.batch_status == "RUNNING"
+        assert state_change.occurred_at == datetime(2025, 1, 1, 12, 0, 5)
+        assert state_change.run_id_from_job_name == 34
+        assert not state_change.is_array_parent
+
+    def test_from_event__array_job__flags_parent_and_child(self):
+        parent = BatchJobStateChange.from_event(
+            _event(jobName="job-12-array-0", arrayProperties={"size": 3})
+        )
+        child = BatchJobStateChange.from_event(
+            _event(jobName="job-12-array-0", jobId="abc:2", arrayProperties={"index": 2})
+        )
+
+        assert parent.is_array_parent
+        assert child.array_index == 2
+        assert child.run_id_from_job_name is None
+
+    @pytest.mark.parametrize(
+        "event",
+        [
+            {**_event(), "source": "aws.ecs"},
+            {**_event(), "detail-type": "ECS Task State Change"},
+            {**_event(), "detail": {"jobName": "job-12-run-34"}},
+            {k: v for k, v in _event().items() if k != "time"},
+        ],
+    )
+    def test_from_event__not_a_batch_state_change__raises_value_error(self, event):
+        with pytest.raises(ValueError):
+            BatchJobStateChange.from_event(event)
+
+    def test_from_event__not_an_object__raises_type_error(self):
+        with pytest.raises(TypeError):
+            BatchJobStateChange.from_event(["not", "an", "event"])
@@ -325,6 +325,33 @@ class TestJobS3Prefix:
         assert "run_4_results" in run_4_results
         assert "run_5_config" in run_5_config
 
+    def test_run_array_manifest_key(self, sample_prefix):
+        """
+        Verify the array-job manifest is stored alongside the other job artifacts.
+        """
+        assert (
+            sample_prefix.run_array_manifest_key(first_run_id=4)
+            == "jobs/12/2025/10/23/211500/run_array_4_manifest.json"
+        )
+
+    def test_generate_run_columnar_prefix(self, sample_prefix):
+        """
+        Verify Parquet results sit next to the run's results ZIP.
+        """
+        assert (
+            sample_prefix.run_columnar_prefix(run_id=4)
+            == "jobs/12/2025/10/23/211500/run_4_columnar"
+        )
+
+    def test_generate_run_results_manifest_key(self, sample_prefix):
+        """
+        Verify the content-hash manifest sits next to the run's results ZIP.
+        """
+        assert (
+            sample_prefix.run_results_manifest_key(run_id=4)
+            == "jobs/12/2025/10/23/211500/run_4_results_manifest.json"
+        )
+
     def test_value_object_equality(self):
         """
         Verify that two JobS3Prefix instances with same values are equal.
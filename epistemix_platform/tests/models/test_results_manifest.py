@@ -0,0 +1,51 @@
+"""
+Unit tests for ResultsManifest value object.
+"""
+
+import pytest
+
+from epistemix_platform.models.results_manifest import ResultsManifest
+
+
+class TestResultsManifest:
+    def test_matches__same_files_and_digests__is_true(self):
+        current = ResultsManifest(files={"RUN1/out.csv": "aa", "RUN1/log.txt": "bb"})
+        previous = ResultsManifest(
+            files={"RUN1/log.txt": "bb", "RUN1/out.csv": "aa"},
+            results_url="https://bucket.s3.amazonaws.com/run_4_results.zip",
+        )
+
+        assert current.matches(previous)
+
+    def test_matches__changed_digest__is_false(self):
+        current = ResultsManifest(files={"RUN1/out.csv": "aa"})
+        previous = ResultsManifest(files={"RUN1/out.csv": "cc"})
+
+        assert not current.matches(previous)
+
+    def test_changed_and_removed_files__compare_with_previous_manifest(self):
+        current = ResultsManifest(files={"RUN1/out.csv": "aa", "RUN1/new.csv": "dd"})
+        previous = ResultsManifest(files={"RUN1/out.csv": "cc", "RUN1/old.csv": "ee"})
+
+        assert current.changed_files(previous) == ["RUN1/new.csv", "RUN1/out.csv"]
+        assert current.removed_files(previous) == ["RUN1/old.csv"]
+
+    def test_to_dict__round_trips_through_from_dict(self):
+        manifest = ResultsManifest(
+            files={"RUN1/out.csv": "aa"},
+            results_url="https://bucket.s3.amazonaws.com/run_4_results.zip",
+            results_etag='"etag"',
+        )
+
+        assert manifest.to_dict() == {
+            "formatVersion": 1,
+            "algorithm": "sha256",
+            "resultsUrl": "https://bucket.s3.amazonaws.com/run_4_results.zip",
+            "resultsEtag": '"etag"',
+            "files": {"RUN1/out.csv": "aa"},
+        }
+        assert ResultsManifest.from_dict(manifest.to_dict()) == manifest
+
+    def test_from_dict__unsupported_version__raises_value_error(self):
+        with pytest.raises(ValueError, match="Unsupported results manifest version"):
+            ResultsManifest.from_dict({"formatVersion": 2, "algorithm": "sha256", "files": {}})
@@ -8,7 +8,7 @@ from datetime import UTC, datetime
 
 import pytest
 
-from epistemix_platform.models.run import Run
+from epistemix_platform.models.run import PodPhase, Run, RunStatus
 
 
 class TestRunModelApplicationFields:
@@ -126,3 +126,33 @@ class TestRunNaturalKey:
         # ACT & ASSERT
         with pytest.raises(ValueError, match="Cannot generate natural_key for unpersisted run"):
             _ = run.natural_key
+
+
+class TestRunIsTerminal:
+    """Tests for the is_terminal property used to skip status syncs."""
+
+    @pytest.mark.parametrize(
+        ("status", "pod_phase", "expected"),
+        [
+            (RunStatus.DONE, PodPhase.SUCCEEDED, True),
+            (RunStatus.ERROR, PodPhase.FAILED, True),
+            (RunStatus.CANCELLED, PodPhase.FAILED, True),
+            (RunStatus.ERROR, PodPhase.UNKNOWN, False),
+            (RunStatus.RUNNING, PodPhase.RUNNING, False),
+            (RunStatus.SUBMITTED, PodPhase.PENDING, False),
+        ],
+    )
+    def test_is_terminal_reflects_status_and_pod_phase(self, status, pod_phase, expected):
+        """Test that only statuses AWS Batch will not change are terminal."""
+        run = Run.create_persisted(
+            run_id=1,
+            job_id=1,
+            user_id=456,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            request={"simulation": "test"},
+            status=status,
+            pod_phase=pod_phase,
+        )
+
+        assert run.is_terminal is expected
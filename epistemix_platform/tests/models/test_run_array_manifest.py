@@ -0,0 +1,36 @@
+"""
+Unit tests for RunArrayManifest value object.
+"""
+
+import pytest
+
+from epistemix_platform.models.run_array_manifest import RunArrayManifest
+
+
+class TestRunArrayManifest:
+    def test_job_name__uses_job_and_first_run_id(self):
+        manifest = RunArrayManifest(job_id=12, run_ids=(4, 5, 6))
+
+        assert manifest.job_name == "job-12-array-4"
+        assert manifest.size == 3
+
+    def test_run_id_for_index__maps_index_to_run(self):
+        manifest = RunArrayManifest(job_id=12, run_ids=(4, 5, 6))
+
+        assert manifest.run_id_for_index(2) == 6
+
+    def test_run_id_for_index__out_of_range__raises_value_error(self):
+        manifest = RunArrayManifest(job_id=12, run_ids=(4, 5))
+
+        with pytest.raises(ValueError, match="out of range"):
+            manifest.run_id_for_index(2)
+
+    def test_init__single_run__raises_value_error(self):
+        with pytest.raises(ValueError, match="between 2 and 10000"):
+            RunArrayManifest(job_id=12, run_ids=(4,))
+
+    def test_to_dict__round_trips_through_from_dict(self):
+        manifest = RunArrayManifest(job_id=12, run_ids=(4, 5))
+
+        assert manifest.to_dict() == {"jobId": 12, "runIds": [4, 5]}
+        assert RunArrayManifest.from_dict(manifest.to_dict()) == manifest
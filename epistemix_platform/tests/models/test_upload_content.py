@@ -206,6 +206,30 @@ class TestUploadContentCreateZipArchive:
         assert content.zip_entries[0].preview == "First 100 chars..."
 
 
+class TestUploadContentCreateZipPreview:
+    """Test UploadContent.create_zip_preview() factory method."""
+
+    def test_create_zip_preview_has_entries_and_summary_but_no_archive_bytes(self):
+        entries = [ZipFileEntry(name="main.fred", size=4096, compressed_size=900, preview="x")]
+
+        content = UploadContent.create_zip_preview(entries=entries, summary="1 file")
+
+        assert content.is_archive()
+        assert content.is_zip_preview()
+        assert content.raw_content == "1 file"
+        assert content.to_dict()["zipEntries"] == [
+            {"name": "main.fred", "size": 4096, "compressedSize": 900, "preview": "x"}
+        ]
+
+    def test_create_zip_archive_is_not_a_preview(self):
+        entries = [ZipFileEntry(name="single.txt", size=50, compressed_size=25)]
+        content = UploadContent.create_zip_archive(
+            binary_content=b"data", entries=entries, summary="1 file"
+        )
+
+        assert not content.is_zip_preview()
+
+
 class TestUploadContentRepr:
     """Test UploadContent string representation."""
 
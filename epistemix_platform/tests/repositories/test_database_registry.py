@@ -0,0 +1,106 @@
+"""
+Tests for the process-wide database manager registry.
+"""
+
+import pytest
+from sqlalchemy import inspect
+
+from epistemix_platform.repositories.database import (
+    dispose_database_managers,
+    get_database_manager,
+    get_pool_metrics,
+)
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'registry.sqlite'}"
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    dispose_database_managers()
+    yield
+    dispose_database_managers()
+
+
+class TestDatabaseManagerRegistry:
+    def test_get_database_manager__same_url__returns_same_manager(self, database_url):
+        first = get_database_manager(database_url)
+        second = get_database_manager(database_url)
+
+        assert first is second
+        assert first.engine is second.engine
+
+    def test_get_database_manager__different_urls__returns_distinct_managers(self, tmp_path):
+        first = get_database_manager(f"sqlite:///{tmp_path / 'a.sqlite'}")
+        second = get_database_manager(f"sqlite:///{tmp_path / 'b.sqlite'}")
+
+        assert first is not second
+
+    def test_get_session__same_thread__returns_scoped_session(self, database_url):
+        manager = get_database_manager(database_url)
+
+        assert manager.get_session() is manager.get_session()
+
+    def test_remove_session__next_call__returns_new_session(self, database_url):
+        manager = get_database_manager(database_url)
+        session = manager.get_session()
+
+        manager.remove_session()
+
+        assert manager.get_session() is not session
+
+    def test_ensure_schema__called_twice__creates_tables_once(self, database_url, monkeypatch):
+        manager = get_database_manager(database_url)
+        calls = []
+        original_create_tables = manager.create_tables
+
+        def counting_create_tables():
+            calls.append(1)
+            original_create_tables()
+
+        monkeypatch.setattr(manager, "create_tables", counting_create_tables)
+
+        manager.ensure_schema()
+        manager.ensure_schema()
+
+        assert len(calls) == 1
+        assert {"jobs", "runs"} <= set(inspect(manager.engine).get_table_names())
+
+    def test_drop_tables__then_ensure_schema__recreates_tables(self, database_url):
+        manager = get_database_manager(database_url)
+        manager.ensure_schema()
+
+        manager.drop_tables()
+        manager.ensure_schema()
+
+        assert {"jobs", "runs"} <= set(inspect(manager.engine).get_table_names())
+
+    def test_dispose_database_managers__clears_registry(self, database_url):
+        first = get_database_manager(database_url)
+
+        dispose_database_managers()
+
+        assert get_database_manager(database_url) is not first
+
+    def test_get_pool_metrics__registered_manager__reports_pool(self, database_url):
+        get_database_manager(database_url)
+
+        metrics = get_pool_metrics()
+
+        assert len(metrics) == 1
+        (pool_metrics,) = metrics.values()
+        assert "pool" in pool_metrics
+
+    def test_get_pool_metrics__registered_manager__keys_pool_without_database_url(
+        self, database_url
+    ):
+        get_database_manager(database_url)
+
+        metrics = get_pool_metrics()
+
+        (label,) = metrics
+        assert label.startswith("db-")
+        assert "registry" not in label
+        assert "sqlite" not in label
@@ -0,0 +1,184 @@
+"""
+Tests for the presigned URL cache and its use by the S3 repositories.
+"""
+
+import logging
+from datetime import datetime
+from unittest.mock import MagicMock, Mock
+
+import boto3
+import pytest
+from botocore.credentials import Credentials
+
+from epistemix_platform.models.job_s3_prefix import JobS3Prefix
+from epistemix_platform.models.job_upload import JobUpload
+from epistemix_platform.repositories.presigned_url_cache import (
+    PresignedUrlCache,
+    get_presigned_url_cache,
+    signing_credential_scope,
+)
+from epistemix_platform.repositories.s3_results_repository import S3ResultsRepository
+from epistemix_platform.repositories.s3_upload_location_repository import (
+    S3UploadLocationRepository,
+)
+from epistemix_platform.utils.s3_client import get_aws_session
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return PresignedUrlCache(max_entries=3, headroom=0.9, clock=clock)
+
+
+def _signer(prefix="url"):
+    calls = []
+
+    def sign():
+        calls.append(1)
+        return f"https://bucket.s3.amazonaws.com/key?{prefix}={len(calls)}"
+
+    return sign, calls
+
+
+class TestPresignedUrlCache:
+    def test_get_or_sign__same_object__reuses_url(self, cache):
+        sign, calls = _signer()
+
+        first = cache.get_or_sign("GET", "bucket", "key", 3600, sign)
+        second = cache.get_or_sign("GET", "bucket", "key", 3600, sign)
+
+        assert first == second
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_get_or_sign__less_than_headroom_left__signs_again(self, cache, clock):
+        sign, calls = _signer()
+        cache.get_or_sign("GET", "bucket", "key", 3600, sign)
+
+        clock.now += 360  # exactly 90% of the validity left
+        cache.get_or_sign("GET", "bucket", "key", 3600, sign)
+        clock.now += 1
+        renewed = cache.get_or_sign("GET", "bucket", "key", 3600, sign)
+
+        assert len(calls) == 2
+        assert renewed.endswith("url=2")
+
+    def test_get_or_sign__longer_validity_requested__signs_again(self, cache):
+        sign, calls = _signer()
+        cache.get_or_sign("GET", "bucket", "key", 3600, sign)
+
+        cache.get_or_sign("GET", "bucket", "key", 86400, sign)
+
+        assert len(calls) == 2
+
+    def test_get_or_sign__method_or_credentials_differ__cached_separately(self, cache):
+        sign, calls = _signer()
+
+        cache.get_or_sign("GET", "bucket", "key", 3600, sign, credential_scope="AKIA1")
+        cache.get_or_sign("PUT", "bucket", "key", 3600, sign, credential_scope="AKIA1")
+        cache.get_or_sign("GET", "bucket", "key", 3600, sign, credential_scope="AKIA2")
+
+        assert len(calls) == 3
+
+    def test_get_or_sign__over_max_entries__evicts_least_recently_used(self, cache):
+        sign, calls = _signer()
+        for key in ("a", "b", "c"):
+            cache.get_or_sign("GET", "bucket", key, 3600, sign)
+        cache.get_or_sign("GET", "bucket", "a", 3600, sign)  # "b" is now least recent
+
+        cache.get_or_sign("GET", "bucket", "d", 3600, sign)
+        cache.get_or_sign("GET", "bucket", "a", 3600, sign)
+        cache.get_or_sign("GET", "bucket", "b", 3600, sign)
+
+        assert len(cache) == 3
+        assert len(calls) == 5
+
+    def test_get_or_sign__never_logs_signed_query_string(self, cache, caplog):
+        caplog.set_level(logging.DEBUG)
+
+        url = cache.get_or_sign("GET", "bucket", "key", 3600, lambda: "https://h/key?X-Sig=secret")
+        cache.get_or_sign("GET", "bucket", "key", 3600, lambda: "unused")
+
+        assert url == "https://h/key?X-Sig=secret"
+        assert "secret" not in caplog.text
+
+    @pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"headroom": 0}, {"headroom": 1.5}])
+    def test_init__invalid_settings__raises_value_error(self, kwargs):
+        with pytest.raises(ValueError):
+            PresignedUrlCache(**kwargs)
+
+    def test_get_presigned_url_cache__shared_per_configuration(self):
+        assert get_presigned_url_cache(100, 0.5) is get_presigned_url_cache(100, 0.5)
+        assert get_presigned_url_cache(100, 0.5) is not get_presigned_url_cache(100, 0.8)
+        assert get_presigned_url_cache(0) is None
+
+    def test_signing_credential_scope__reads_session_credentials(self):
+        session = boto3.Session(aws_access_key_id="AKIAEXAMPLE", aws_secret_access_key="secret")
+
+        assert signing_credential_scope(session) == "AKIAEXAMPLE"
+
+
+class TestRepositoriesWithPresignedUrlCache:
+    @pytest.fixture
+    def s3_prefix(self):
+        return JobS3Prefix(job_id=123, timestamp=datetime(2025, 1, 1, 12, 0, 0))
+
+    def test_get_upload_location__repeated_request__reuses_presigned_put(self, cache, s3_prefix):
+        session = boto3.Session(
+            region_name="us-east-1",
+            aws_access_key_id="test-access-key",
+            aws_secret_access_key="test-secret-key",
+        )
+        s3_client = session.client("s3")
+        s3_client.generate_presigned_url = Mock(wraps=s3_client.generate_presigned_url)
+        repository = S3UploadLocationRepository(
+            bucket_name="test-bucket", s3_client=s3_client, url_cache=cache, session=session
+        )
+        job_upload = JobUpload(context="run", upload_type="config", job_id=123, run_id=4)
+
+        first = repository.get_upload_location(job_upload, s3_prefix)
+        second = repository.get_upload_location(job_upload, s3_prefix)
+
+        assert first.url == second.url
+        s3_client.generate_presigned_url.assert_called_once()
+
+    def test_repositories__no_session__share_process_wide_session_per_region(self):
+        upload_repository = S3UploadLocationRepository(
+            bucket_name="test-bucket", region_name="us-east-1", s3_client=MagicMock()
+        )
+        results_repository = S3ResultsRepository(
+            bucket_name="test-bucket", region_name="us-east-1", s3_client=MagicMock()
+        )
+
+        assert upload_repository.session is results_repository.session
+        assert get_aws_session("us-east-1") is upload_repository.session
+        assert get_aws_session("us-west-2") is not upload_repository.session
+
+    def test_get_download_urls__cached_objects__skip_signing(self, cache):
+        session = MagicMock()
+        session.get_credentials.return_value = Credentials("AKIAEXAMPLE", "secret")
+        s3_client = MagicMock()
+        s3_client.meta.region_name = "us-east-1"
+        s3_client.meta.endpoint_url = "https://s3.amazonaws.com"
+        repository = S3ResultsRepository(
+            bucket_name="test-bucket", s3_client=s3_client, url_cache=cache, session=session
+        )
+        objects = [("test-bucket", f"jobs/123/run_{i}_results.zip") for i in (4, 5)]
+
+        first = list(repository.get_download_urls(objects, expiration_seconds=86400))
+        second = list(repository.get_download_urls(objects, expiration_seconds=86400))
+
+        assert first == second
+        assert (cache.hits, cache.misses) == (2, 2)
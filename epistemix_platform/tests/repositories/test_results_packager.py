@@ -62,10 +62,30 @@ Scenario 8: Verify correct archive paths in ZIP structure
   Then the ZIP contains "RUN4/data.txt" and "RUN4/subdir/results.csv"
   And for a parent directory with RUN1/ and RUN2/
   Then the ZIP contains "RUN1/data.txt" and "RUN2/data.txt" (no extra prefix)
+
+Scenario 9: Stream large results to disk instead of memory
+  Given a RUN4 directory whose ZIP exceeds the in-memory spool size
+  When I package the directory
+  Then the ZIP is spooled to a temporary file positioned at offset 0
+  And closing the PackagedResults releases the temporary file
+
+Scenario 10: Compress entries in parallel
+  Given a parent directory with RUN1/, RUN2/ and RUN3/
+  When I package it with several compression workers
+  Then the ZIP has the same entries, in the same order, as a serial packager produces
+  And every entry's content is intact
+
+Scenario 11: Build a content-hash manifest without zipping
+  Given a parent directory with RUN1/, RUN2/ and RUN3/
+  When I call build_manifest, serially and with several workers
+  Then the manifest maps every ZIP archive name to the SHA-256 of its file
+  And changing one file changes only that file's digest
 """
 
+import hashlib
 import zipfile
-from io import BytesIO
+import os
+import sys
 
 import pytest
 
@@ -159,11 +179,11 @@ class TestFredResultsPackager:
         # Assert
         assert isinstance(result, PackagedResults)
         assert result.file_count == 3  # data.txt, results.csv, subdir/nested.txt
-        assert result.total_size_bytes == len(result.zip_content)
+        assert result.total_size_bytes == len(result.zip_content.read())
         assert result.directory_name == "RUN4"
 
         # Verify ZIP structure
-        with zipfile.ZipFile(BytesIO(result.zip_content)) as zf:
+        with zipfile.ZipFile(result.zip_content) as zf:
             names = zf.namelist()
             assert "RUN4/data.txt" in names
             assert "RUN4/results.csv" in names
@@ -195,7 +215,7 @@ class TestFredResultsPackager:
         assert result.directory_name == "output"
 
         # Verify ZIP structure
-        with zipfile.ZipFile(BytesIO(result.zip_content)) as zf:
+        with zipfile.ZipFile(result.zip_content) as zf:
             names = zf.namelist()
             # Files should preserve RUN*/file structure (no extra "output/" prefix)
             assert "RUN1/data1.txt" in names
@@ -286,7 +306,7 @@ class TestFredResultsPackager:
         assert result.directory_name == "RUN5"
 
         # Verify ZIP is valid but empty
-        with zipfile.ZipFile(BytesIO(result.zip_content)) as zf:
+        with zipfile.ZipFile(result.zip_content) as zf:
             assert len(zf.namelist()) == 0
 
     # ==========================================================================
@@ -327,7 +347,7 @@ class TestFredResultsPackager:
         result = packager.package_directory(single_run_dir)
 
         # Assert - verify archive paths include RUN4 prefix
-        with zipfile.ZipFile(BytesIO(result.zip_content)) as zf:
+        with zipfile.ZipFile(result.zip_content) as zf:
             names = zf.namelist()
             assert "RUN4/data.txt" in names
             assert "RUN4/subdir/nested.txt" in names
@@ -343,7 +363,7 @@ class TestFredResultsPackager:
         result = packager.package_directory(parent_with_multiple_runs)
 
         # Assert - verify archive paths have no extra parent prefix
-        with zipfile.ZipFile(BytesIO(result.zip_content)) as zf:
+        with zipfile.ZipFile(result.zip_content) as zf:
             names = zf.namelist()
             # Should be RUN1/file, not output/RUN1/file
             assert "RUN1/data1.txt" in names
@@ -381,7 +401,7 @@ class TestFredResultsPackager:
         result = packager.package_directory(run_dir)
 
         # Assert: ZIP should NOT contain the symlink target content
-        with zipfile.ZipFile(BytesIO(result.zip_content)) as zf:
+        with zipfile.ZipFile(result.zip_content) as zf:
             names = zf.namelist()
 
             # Should contain legitimate file
@@ -427,7 +447,7 @@ class TestFredResultsPackager:
         result = packager.package_directory(parent_dir)
 
         # Assert: Only RUN1 files should be in ZIP
-        with zipfile.ZipFile(BytesIO(result.zip_content)) as zf:
+        with zipfile.ZipFile(result.zip_content) as zf:
             names = zf.namelist()
 
             # Should contain RUN1 files
@@ -442,3 +462,90 @@ class TestFredResultsPackager:
                 content = zf.read(name).decode()
                 assert "DB_PASSWORD" not in content
                 assert "secret token" not in content
+
+    # ==========================================================================
+    # Scenario 9: Stream large results to disk instead of memory
+    # ==========================================================================
+
+    def test_package_large_results_spools_to_disk(self, packager, tmp_path, monkeypatch):
+        """
+        Given a RUN4 directory whose ZIP exceeds the in-memory spool size
+        When I package the directory
+        Then the ZIP is spooled to a temporary file positioned at offset 0
+        And closing the PackagedResults releases the temporary file
+        """
+        # Arrange: incompressible output larger than the spool threshold
+        monkeypatch.setattr(
+            sys.modules[_FredResultsPackager.__module__], "RESULTS_SPOOL_MAX_BYTES", 1024
+        )
+        run_dir = tmp_path / "RUN4"
+        run_dir.mkdir()
+        (run_dir / "population.bin").write_bytes(os.urandom(64 * 1024))
+
+        # Act
+        with packager.package_directory(run_dir) as result:
+            # Assert
+            assert result.zip_content._rolled  # backed by a temporary file on disk
+            assert result.zip_content.tell() == 0
+            assert result.total_size_bytes > 64 * 1024
+            with zipfile.ZipFile(result.zip_content) as zf:
+                assert zf.namelist() == ["RUN4/population.bin"]
+
+        assert result.zip_content.closed
+
+    # ==========================================================================
+    # Scenario 10: Compress entries in parallel
+    # ==========================================================================
+
+    def test_package_with_compression_workers_matches_serial_layout(
+        self, packager, parent_with_multiple_runs
+    ):
+        """
+        Given a parent directory with RUN1/, RUN2/ and RUN3/
+        When I package it with several compression workers
+        Then the ZIP has the same entries, in the same order, as a serial packager produces
+        And every entry's content is intact
+        """
+        # Act
+        with packager.package_directory(parent_with_multiple_runs) as serial:
+            with zipfile.ZipFile(serial.zip_content) as zf:
+                serial_entries = [(name, zf.read(name)) for name in zf.namelist()]
+
+        with _FredResultsPackager(compression_workers=4).package_directory(
+            parent_with_multiple_runs
+        ) as parallel:
+            # Assert
+            assert parallel.file_count == serial.file_count
+            with zipfile.ZipFile(parallel.zip_content) as zf:
+                assert zf.testzip() is None
+                assert [(name, zf.read(name)) for name in zf.namelist()] == serial_entries
+
+    # ==========================================================================
+    # Scenario 11: Build a content-hash manifest without zipping
+    # ==========================================================================
+
+    def test_build_manifest_hashes_every_archived_file(self, packager, parent_with_multiple_runs):
+        """
+        Given a parent directory with RUN1/, RUN2/ and RUN3/
+        When I call build_manifest, serially and with several workers
+        Then the manifest maps every ZIP archive name to the SHA-256 of its file
+        And changing one file changes only that file's digest
+        """
+        # Act
+        manifest = packager.build_manifest(parent_with_multiple_runs)
+        parallel_manifest = _FredResultsPackager(compression_workers=4).build_manifest(
+            parent_with_multiple_runs
+        )
+
+        # Assert
+        with packager.package_directory(parent_with_multiple_runs) as packaged:
+            with zipfile.ZipFile(packaged.zip_content) as zf:
+                expected = {
+                    name: hashlib.sha256(zf.read(name)).hexdigest() for name in zf.namelist()
+                }
+        assert dict(manifest.files) == expected
+        assert parallel_manifest == manifest
+
+        (parent_with_multiple_runs / "RUN2" / "data2.txt").write_text("run 2 data, rerun")
+        changed = packager.build_manifest(parent_with_multiple_runs)
+        assert changed.changed_files(manifest) == ["RUN2/data2.txt"]
@@ -0,0 +1,215 @@
+"""
+Tests for columnar (Parquet) results in S3ResultsRepository, against a moto S3 stand-in.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from moto import mock_aws
+
+from epistemix_platform.models.job_s3_prefix import JobS3Prefix
+from epistemix_platform.repositories.s3_range_reader import S3RangeReader
+from epistemix_platform.repositories.s3_results_repository import S3ResultsRepository
+
+
+BUCKET = "test-results-bucket"
+DAYS = 1000
+ROW_GROUP_DAYS = 100
+
+
+def _describe_table(path, columnar_dir):
+    """Manifest entry in the format written by the simulation runner."""
+    metadata = pq.ParquetFile(path).metadata
+    row_groups = []
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        columns = {}
+        for column_index in range(row_group.num_columns):
+            chunk = row_group.column(column_index)
+            columns[chunk.path_in_schema] = {
+                "offset": chunk.data_page_offset,
+                "length": chunk.total_compressed_size,
+            }
+        day_stats = row_group.column(0).statistics
+        row_groups.append(
+            {
+                "rows": row_group.num_rows,
+                "day_min": day_stats.min,
+                "day_max": day_stats.max,
+                "columns": columns,
+            }
+        )
+    schema = metadata.schema.to_arrow_schema()
+    size = path.stat().st_size
+    footer_offset = size - 8 - int.from_bytes(path.read_bytes()[-8:-4], "little")
+    return {
+        "path": path.relative_to(columnar_dir).as_posix(),
+        "size": size,
+        "rows": metadata.num_rows,
+        "day_column": "Day",
+        "columns": [{"name": field.name, "type": str(field.type)} for field in schema],
+        "footer": {"offset": footer_offset, "length": size - footer_offset},
+        "row_groups": row_groups,
+    }
+
+
+@pytest.fixture
+def columnar_dir(tmp_path):
+    """Parquet results for one RUN directory plus its manifest."""
+    columnar_dir = tmp_path / "COLUMNAR" / "run_4"
+    parquet_path = columnar_dir / "RUN1" / "out.parquet"
+    parquet_path.parent.mkdir(parents=True)
+    table = pa.table(
+        {
+            "Day": list(range(DAYS)),
+            "N": [1000 + day for day in range(DAYS)],
+            "Influenza.newExposed": [day % 7 for day in range(DAYS)],
+        }
+    )
+    pq.write_table(table, parquet_path, row_group_size=ROW_GROUP_DAYS)
+
+    manifest = {
+        "format_version": 1,
+        "tables": {"RUN1/out": _describe_table(parquet_path, columnar_dir)},
+    }
+    (columnar_dir / "manifest.json").write_text(json.dumps(manifest))
+    return columnar_dir
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+def repository(s3_client):
+    return S3ResultsRepository(bucket_name=BUCKET, s3_client=s3_client)
+
+
+@pytest.fixture
+def s3_prefix():
+    return JobS3Prefix(job_id=12, timestamp=datetime(2025, 10, 23, 21, 15, 0))
+
+
+@pytest.fixture
+def uploaded(repository, columnar_dir, s3_prefix):
+    repository.upload_columnar_results(
+        job_id=12, run_id=4, columnar_dir=columnar_dir, s3_prefix=s3_prefix
+    )
+
+
+class TestUploadColumnarResults:
+    def test_uploads_files_and_manifest_under_run_columnar_prefix(
+        self, repository, s3_client, columnar_dir, s3_prefix
+    ):
+        location = repository.upload_columnar_results(
+            job_id=12, run_id=4, columnar_dir=columnar_dir, s3_prefix=s3_prefix
+        )
+
+        prefix = "jobs/12/2025/10/23/211500/run_4_columnar"
+        assert location.url == f"https://{BUCKET}.s3.amazonaws.com/{prefix}/manifest.json"
+        keys = [obj["Key"] for obj in s3_client.list_objects_v2(Bucket=BUCKET)["Contents"]]
+        assert sorted(keys) == [f"{prefix}/RUN1/out.parquet", f"{prefix}/manifest.json"]
+
+    def test_rejects_directory_without_manifest(self, repository, tmp_path, s3_prefix):
+        with pytest.raises(ValueError, match="manifest.json"):
+            repository.upload_columnar_results(
+                job_id=12, run_id=4, columnar_dir=tmp_path, s3_prefix=s3_prefix
+            )
+
+
+@pytest.mark.usefixtures("uploaded")
+class TestReadColumnarTable:
+    def test_reads_single_column_for_day_range(self, repository, s3_prefix):
+        data = repository.read_columnar_table(
+            4, s3_prefix, "RUN1/out", columns=["N"], start_day=150, end_day=249
+        )
+
+        assert data == {"N": [1000 + day for day in range(150, 250)]}
+
+    def test_reads_only_footer_and_needed_column_chunks(
+        self, repository, columnar_dir, s3_prefix, monkeypatch
+    ):
+        readers = []
+        original_init = S3RangeReader.__init__
+
+        def tracking_init(self, *args, **kwargs):
+            original_init(self, *args, **kwargs)
+            readers.append(self)
+
+        monkeypatch.setattr(S3RangeReader, "__init__", tracking_init)
+
+        repository.read_columnar_table(
+            4, s3_prefix, "RUN1/out", columns=["N"], start_day=0, end_day=99
+        )
+
+        table = json.loads((columnar_dir / "manifest.json").read_text())["tables"]["RUN1/out"]
+        chunks = table["row_groups"][0]["columns"]
+        (reader,) = readers
+        # Footer, then the N chunk and the Day chunk used to trim the day range
+        assert reader.request_count <= 3
+        assert reader.bytes_fetched == (
+            table["footer"]["length"] + chunks["N"]["length"] + chunks["Day"]["length"]
+        )
+
+    def test_without_filters_reads_whole_table(self, repository, s3_prefix):
+        data = repository.read_columnar_table(4, s3_prefix, "RUN1/out")
+
+        assert list(data) == ["Day", "N", "Influenza.newExposed"]
+        assert data["Day"] == list(range(DAYS))
+
+    def test_day_range_outside_table_returns_no_rows(self, repository, s3_prefix):
+        data = repository.read_columnar_table(
+            4, s3_prefix, "RUN1/out", columns=["N"], start_day=5000
+        )
+
+        assert data == {"N": []}
+
+    def test_unknown_table_or_column_raises_value_error(self, repository, s3_prefix):
+        with pytest.raises(ValueError, match="Unknown table"):
+            repository.read_columnar_table(4, s3_prefix, "RUN9/out")
+        with pytest.raises(ValueError, match="Unknown columns"):
+            repository.read_columnar_table(4, s3_prefix, "RUN1/out", columns=["Missing"])
+
+    def test_run_without_columnar_results_raises_value_error(self, repository, s3_prefix):
+        with pytest.raises(ValueError, match="No columnar results for run 5"):
+            repository.get_columnar_manifest(5, s3_prefix)
+
+
+def test_importing_repository_does_not_load_pyarrow():
+    """The API imports the repository on every cold start; pyarrow loads only on reads."""
+    check = (
+        "import sys, epistemix_platform.repositories.s3_results_repository; "
+        "sys.exit('pyarrow' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, env=env, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+class TestS3RangeReader:
+    def test_reads_and_seeks_with_ranged_gets(self, s3_client):
+        s3_client.put_object(Bucket=BUCKET, Key="blob", Body=b"0123456789")
+        reader = S3RangeReader(s3_client, BUCKET, "blob", size=10)
+
+        reader.seek(-4, 2)
+        assert reader.read(2) == b"67"
+        assert reader.read() == b"89"
+        assert reader.read(1) == b""
+        reader.seek(1)
+        assert reader.read(3) == b"123"
+        assert reader.request_count <= 3
+        assert reader.bytes_fetched == 7
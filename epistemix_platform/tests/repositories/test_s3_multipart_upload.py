@@ -0,0 +1,141 @@
+"""
+Tests for S3MultipartUploader against a moto S3 stand-in.
+"""
+
+import os
+from io import BytesIO
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from epistemix_platform.repositories.s3_multipart_upload import MIN_PART_SIZE, S3MultipartUploader
+
+
+BUCKET = "test-results-bucket"
+KEY = "jobs/12/2025/10/23/211500/run_4_results.zip"
+
+
+class _FlakyS3Client:
+    """Delegates to a real client, failing upload_part for the given part numbers."""
+
+    def __init__(self, s3_client, fail_parts=()):
+        self._s3_client = s3_client
+        self.fail_parts = set(fail_parts)
+        self.uploaded_parts = []
+
+    def upload_part(self, **kwargs):
+        if kwargs["PartNumber"] in self.fail_parts:
+            raise ClientError(
+                {"Error": {"Code": "RequestTimeout", "Message": "Connection reset"}}, "UploadPart"
+            )
+        self.uploaded_parts.append(kwargs["PartNumber"])
+        return self._s3_client.upload_part(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._s3_client, name)
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+def content():
+    # Three parts: two full 5 MiB parts and a short last part
+    return os.urandom(2 * MIN_PART_SIZE + 1024)
+
+
+def _uploaded_content(s3_client):
+    return s3_client.get_object(Bucket=BUCKET, Key=KEY)["Body"].read()
+
+
+def _open_uploads(s3_client):
+    return s3_client.list_multipart_uploads(Bucket=BUCKET).get("Uploads", [])
+
+
+class TestS3MultipartUploader:
+    def test_upload__object_smaller_than_a_part__uses_single_put(self, s3_client):
+        flaky_client = _FlakyS3Client(s3_client)
+        uploader = S3MultipartUploader(flaky_client, part_size=MIN_PART_SIZE)
+
+        uploader.upload(BytesIO(b"small zip"), BUCKET, KEY, content_type="application/zip")
+
+        assert _uploaded_content(s3_client) == b"small zip"
+        assert flaky_client.uploaded_parts == []
+
+    def test_upload__large_object__uploads_parts_concurrently_and_completes(
+        self, s3_client, content
+    ):
+        flaky_client = _FlakyS3Client(s3_client)
+        uploader = S3MultipartUploader(flaky_client, part_size=MIN_PART_SIZE, max_concurrency=3)
+
+        uploader.upload(BytesIO(content), BUCKET, KEY, content_type="application/zip")
+
+        assert _uploaded_content(s3_client) == content
+        assert sorted(flaky_client.uploaded_parts) == [1, 2, 3]
+        head = s3_client.head_object(Bucket=BUCKET, Key=KEY)
+        assert head["ContentType"] == "application/zip"
+        assert _open_uploads(s3_client) == []
+
+    def test_upload__part_fails_without_checkpoint__aborts_upload(self, s3_client, content):
+        uploader = S3MultipartUploader(
+            _FlakyS3Client(s3_client, fail_parts={2}), part_size=MIN_PART_SIZE
+        )
+
+        with pytest.raises(ClientError):
+            uploader.upload(BytesIO(content), BUCKET, KEY)
+
+        assert _open_uploads(s3_client) == []
+
+    def test_upload__part_fails_with_checkpoint__resumes_missing_parts_on_retry(
+        self, s3_client, content, tmp_path
+    ):
+        flaky_client = _FlakyS3Client(s3_client, fail_parts={2})
+        uploader = S3MultipartUploader(
+            flaky_client, part_size=MIN_PART_SIZE, max_concurrency=1, checkpoint_dir=tmp_path
+        )
+
+        with pytest.raises(ClientError):
+            uploader.upload(BytesIO(content), BUCKET, KEY)
+
+        assert len(_open_uploads(s3_client)) == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        flaky_client.fail_parts.clear()
+        flaky_client.uploaded_parts.clear()
+        uploader.upload(BytesIO(content), BUCKET, KEY)
+
+        assert _uploaded_content(s3_client) == content
+        assert 1 not in flaky_client.uploaded_parts
+        assert 2 in flaky_client.uploaded_parts
+        assert _open_uploads(s3_client) == []
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_upload__checkpoint_for_different_content__aborts_stale_upload_and_restarts(
+        self, s3_client, content, tmp_path
+    ):
+        uploader = S3MultipartUploader(
+            _FlakyS3Client(s3_client, fail_parts={3}),
+            part_size=MIN_PART_SIZE,
+            checkpoint_dir=tmp_path,
+        )
+        with pytest.raises(ClientError):
+            uploader.upload(BytesIO(content), BUCKET, KEY)
+
+        retry_content = content + b"more output"
+        S3MultipartUploader(s3_client, part_size=MIN_PART_SIZE, checkpoint_dir=tmp_path).upload(
+            BytesIO(retry_content), BUCKET, KEY
+        )
+
+        assert _uploaded_content(s3_client) == retry_content
+        assert _open_uploads(s3_client) == []
+
+    def test_init__part_size_below_s3_minimum__raises_value_error(self, s3_client):
+        with pytest.raises(ValueError):
+            S3MultipartUploader(s3_client, part_size=1024)
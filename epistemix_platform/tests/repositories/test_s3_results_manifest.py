@@ -0,0 +1,80 @@
+"""
+Tests for results manifests in S3ResultsRepository, against a moto S3 stand-in.
+"""
+
+from datetime import datetime
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from epistemix_platform.models.job_s3_prefix import JobS3Prefix
+from epistemix_platform.models.results_manifest import ResultsManifest
+from epistemix_platform.repositories.s3_results_repository import S3ResultsRepository
+
+
+BUCKET = "test-results-bucket"
+MANIFEST = ResultsManifest(files={"RUN4/out.csv": "aa", "RUN4/log.txt": "bb"})
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+def repository(s3_client):
+    return S3ResultsRepository(bucket_name=BUCKET, s3_client=s3_client)
+
+
+@pytest.fixture
+def s3_prefix():
+    return JobS3Prefix(job_id=12, timestamp=datetime(2025, 10, 23, 21, 15, 0))
+
+
+@pytest.fixture
+def uploaded_zip(repository, s3_prefix):
+    repository.upload_results(job_id=12, run_id=4, zip_content=b"zip v1", s3_prefix=s3_prefix)
+
+
+@pytest.mark.usefixtures("uploaded_zip")
+class TestResultsManifest:
+    def test_save_then_get__returns_manifest_stamped_with_zip_url_and_etag(
+        self, repository, s3_client, s3_prefix
+    ):
+        stored = repository.save_results_manifest(
+            job_id=12, run_id=4, manifest=MANIFEST, s3_prefix=s3_prefix
+        )
+
+        zip_key = "jobs/12/2025/10/23/211500/run_4_results.zip"
+        assert stored.results_url == f"https://{BUCKET}.s3.amazonaws.com/{zip_key}"
+        assert stored.results_etag == s3_client.head_object(Bucket=BUCKET, Key=zip_key)["ETag"]
+        assert repository.get_results_manifest(4, s3_prefix) == stored
+
+    def test_get__without_manifest__returns_none(self, repository, s3_prefix):
+        assert repository.get_results_manifest(4, s3_prefix) is None
+
+    def test_get__after_zip_replaced__returns_none(self, repository, s3_prefix):
+        repository.save_results_manifest(
+            job_id=12, run_id=4, manifest=MANIFEST, s3_prefix=s3_prefix
+        )
+        repository.upload_results(job_id=12, run_id=4, zip_content=b"zip v2", s3_prefix=s3_prefix)
+
+        assert repository.get_results_manifest(4, s3_prefix) is None
+
+    def test_get__after_zip_deleted__returns_none(self, repository, s3_client, s3_prefix):
+        repository.save_results_manifest(
+            job_id=12, run_id=4, manifest=MANIFEST, s3_prefix=s3_prefix
+        )
+        s3_client.delete_object(Bucket=BUCKET, Key=s3_prefix.run_results_key(4))
+
+        assert repository.get_results_manifest(4, s3_prefix) is None
+
+    def test_save__job_id_mismatch__raises_value_error(self, repository, s3_prefix):
+        with pytest.raises(ValueError, match="does not match job_id"):
+            repository.save_results_manifest(
+                job_id=99, run_id=4, manifest=MANIFEST, s3_prefix=s3_prefix
+            )
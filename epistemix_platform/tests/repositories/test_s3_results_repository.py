@@ -54,8 +54,15 @@ Scenario 7: Reject invalid S3 URL formats
   When I call get_download_url
   Then a ValueError is raised
   And the error message indicates invalid URL format
+
+Scenario 8: Sign many download URLs in one batch
+  Given (bucket, key) pairs for several runs
+  When I call get_download_urls
+  Then one presigned URL is produced per pair, in order
+  And the credentials are looked up once for the whole batch
 """
 
+from io import BytesIO
 from unittest.mock import MagicMock
 
 import pytest
@@ -140,6 +147,30 @@ class TestS3ResultsRepository:
         expected_url = f"https://{bucket_name}.s3.amazonaws.com/{expected_key}"
         assert result.url == expected_url
 
+    def test_upload_results_streams_file_object(self, mock_s3_client, bucket_name, sample_prefix):
+        """
+        Given simulation results as a ZIP file object (spooled by the packager)
+        When I call upload_results
+        Then the object is streamed by the multipart uploader
+        And put_object is not used
+        """
+        mock_uploader = MagicMock()
+        repository = S3ResultsRepository(
+            s3_client=mock_s3_client, bucket_name=bucket_name, multipart_uploader=mock_uploader
+        )
+        zip_file = BytesIO(b"fake zip content")
+
+        result = repository.upload_results(
+            job_id=12, run_id=4, zip_content=zip_file, s3_prefix=sample_prefix
+        )
+
+        expected_key = "jobs/12/2025/10/23/211500/run_4_results.zip"
+        mock_s3_client.put_object.assert_not_called()
+        mock_uploader.upload.assert_called_once_with(
+            zip_file, bucket_name, expected_key, content_type="application/zip"
+        )
+        assert result.url == f"https://{bucket_name}.s3.amazonaws.com/{expected_key}"
+
     # ==========================================================================
     # Scenario 2: Sanitize AWS credentials in ClientError exceptions
     # ==========================================================================
@@ -407,6 +438,45 @@ class TestS3ResultsRepository:
         assert "thisisafakelongsecretvaluefortest1234567890" not in sanitized
         assert '"SecretAccessKey": "[REDACTED]"' in sanitized
 
+    # ==========================================================================
+    # Scenario 8: Sign many download URLs in one batch
+    # ==========================================================================
+
+    def test_get_download_urls_signs_pairs_with_one_credential_lookup(
+        self, mock_s3_client, bucket_name
+    ):
+        """
+        Given (bucket, key) pairs for several runs
+        When I call get_download_urls
+        Then one presigned URL is produced per pair, in order
+        And the credentials are looked up once for the whole batch
+        """
+        # Arrange
+        from botocore.credentials import Credentials
+
+        mock_session = MagicMock()
+        mock_session.get_credentials.return_value = Credentials("AKIAEXAMPLE", "secret")
+        repository = S3ResultsRepository(
+            s3_client=mock_s3_client, bucket_name=bucket_name, session=mock_session
+        )
+        mock_s3_client.meta.region_name = "us-east-1"
+        mock_s3_client.meta.endpoint_url = "https://s3.amazonaws.com"
+        objects = [
+            ("test-bucket", f"jobs/12/2025/10/23/211500/run_{i}_results.zip") for i in (4, 5)
+        ]
+
+        # Act
+        urls = list(repository.get_download_urls(objects, expiration_seconds=86400))
+
+        # Assert
+        assert [url.split("?")[0] for url in urls] == [
+            "https://test-bucket.s3.amazonaws.com/jobs/12/2025/10/23/211500/run_4_results.zip",
+            "https://test-bucket.s3.amazonaws.com/jobs/12/2025/10/23/211500/run_5_results.zip",
+        ]
+        assert all("X-Amz-Expires=86400" in url for url in urls)
+        mock_session.get_credentials.assert_called_once()
+        mock_s3_client.generate_presigned_url.assert_not_called()
+
 
 # ==========================================================================
 # JobS3Prefix Integration Tests
@@ -2,8 +2,10 @@
 Tests for S3UploadLocationRepository.
 """
 
+import io
 import os
-from datetime import datetime
+import zipfile
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import boto3
@@ -11,10 +13,12 @@ import pytest
 from botocore.exceptions import ClientError, NoCredentialsError
 from botocore.stub import Stubber
 from freezegun import freeze_time
+from moto import mock_aws
 
 from epistemix_platform.models.job import Job
 from epistemix_platform.models.job_s3_prefix import JobS3Prefix
 from epistemix_platform.models.job_upload import JobUpload
+from epistemix_platform.models.run_array_manifest import RunArrayManifest
 from epistemix_platform.models.upload_content import UploadContent
 from epistemix_platform.models.upload_location import UploadLocation
 from epistemix_platform.repositories.s3_upload_location_repository import (
@@ -555,6 +559,278 @@ class TestS3UploadLocationRepository:
 
         assert result == []
 
+    def test_write_run_array_manifest__puts_json_under_job_prefix(
+        self, repository, s3_stubber, s3_prefix
+    ):
+        _, s3_stub = s3_stubber
+        manifest = RunArrayManifest(job_id=123, run_ids=(4, 5, 6))
+        s3_stub.add_response(
+            "put_object",
+            {},
+            {
+                "Bucket": "test-bucket",
+                "Key": "jobs/123/2025/01/01/120000/run_array_4_manifest.json",
+                "Body": b'{"jobId": 123, "runIds": [4, 5, 6]}',
+                "ContentType": "application/json",
+                "ServerSideEncryption": "AES256",
+            },
+        )
+
+        location = repository.write_run_array_manifest(manifest, s3_prefix)
+
+        assert location.url == (
+            "https://test-bucket.s3.amazonaws.com/"
+            "jobs/123/2025/01/01/120000/run_array_4_manifest.json"
+        )
+        s3_stub.assert_no_pending_responses()
+
+    def test_write_run_array_manifest__s3_error__raises_value_error(
+        self, repository, s3_stubber, s3_prefix
+    ):
+        _, s3_stub = s3_stubber
+        s3_stub.add_client_error("put_object", service_error_code="AccessDenied")
+
+        with pytest.raises(ValueError, match="Failed to write run array manifest"):
+            repository.write_run_array_manifest(
+                RunArrayManifest(job_id=123, run_ids=(4, 5)), s3_prefix
+            )
+
+
+class TestS3UploadLocationRepositoryDownloadToFile:
+    """download_to_file against a moto S3 stand-in."""
+
+    @pytest.fixture
+    def s3_client(self):
+        with mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket="test-bucket")
+            yield client
+
+    @pytest.fixture
+    def repository(self, s3_client):
+        return S3UploadLocationRepository(bucket_name="test-bucket", s3_client=s3_client)
+
+    @pytest.fixture
+    def location(self, s3_client):
+        key = "jobs/123/2025/01/01/120000/job_input.zip"
+        s3_client.put_object(Bucket="test-bucket", Key=key, Body=b"PK" + b"\x00" * 4096)
+        return UploadLocation(url=f"https://test-bucket.s3.amazonaws.com/{key}?X-Amz-Signature=x")
+
+    def test_download_to_file__streams_object_and_returns_etag(
+        self, repository, s3_client, location, tmp_path
+    ):
+        file_path = tmp_path / "job_input.zip"
+
+        etag = repository.download_to_file(location, file_path)
+
+        assert file_path.read_bytes() == b"PK" + b"\x00" * 4096
+        head = s3_client.head_object(
+            Bucket="test-bucket", Key="jobs/123/2025/01/01/120000/job_input.zip"
+        )
+        assert etag == head["ETag"]
+        assert list(tmp_path.iterdir()) == [file_path]
+
+    def test_download_to_file__matching_etag__returns_none_and_keeps_file(
+        self, repository, location, tmp_path
+    ):
+        file_path = tmp_path / "job_input.zip"
+        etag = repository.download_to_file(location, file_path)
+        file_path.write_bytes(b"local copy")
+
+        assert repository.download_to_file(location, file_path, etag=etag) is None
+        assert file_path.read_bytes() == b"local copy"
+
+    def test_download_to_file__stale_etag__downloads_again(self, repository, location, tmp_path):
+        file_path = tmp_path / "job_input.zip"
+        file_path.write_bytes(b"old")
+
+        etag = repository.download_to_file(location, file_path, etag='"stale"')
+
+        assert etag is not None
+        assert file_path.read_bytes().startswith(b"PK")
+
+    def test_download_to_file__missing_object__raises_and_keeps_existing_file(
+        self, repository, tmp_path
+    ):
+        file_path = tmp_path / "job_config.json"
+        file_path.write_text("{}")
+        location = UploadLocation(url="https://test-bucket.s3.amazonaws.com/jobs/123/missing.json")
+
+        with pytest.raises(ValueError, match="NoSuchKey"):
+            repository.download_to_file(location, file_path)
+        assert file_path.read_text() == "{}"
+        assert list(tmp_path.iterdir()) == [file_path]
+
+
+class TestS3UploadLocationRepositoryPreviewContent:
+    """preview_content against a moto S3 stand-in."""
+
+    @pytest.fixture
+    def s3_client(self):
+        with mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket="test-bucket")
+            yield client
+
+    @pytest.fixture
+    def repository(self, s3_client):
+        return S3UploadLocationRepository(bucket_name="test-bucket", s3_client=s3_client)
+
+    @pytest.fixture
+    def job_input_key(self, s3_client):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("main.fred", "Days = 100\n" * 10_000)
+            archive.writestr("population.bin", os.urandom(1_000_000))
+        key = "jobs/123/2025/01/01/120000/job_input.zip"
+        s3_client.put_object(Bucket="test-bucket", Key=key, Body=buffer.getvalue())
+        return key
+
+    def test_preview_content__zip__reads_entries_with_range_requests(
+        self, repository, s3_client, job_input_key
+    ):
+        s3_client.get_object = Mock(wraps=s3_client.get_object)
+        location = UploadLocation(url=f"https://test-bucket.s3.amazonaws.com/{job_input_key}")
+
+        content = repository.preview_content(location)
+
+        assert content.is_zip_preview()
+        entries = {entry.name: entry for entry in content.zip_entries}
+        assert entries["main.fred"].size == 110_000
+        assert entries["main.fred"].preview.startswith("Days = 100\n")
+        assert entries["main.fred"].preview.endswith("(truncated, 110000 total bytes)")
+        assert entries["population.bin"].preview is None
+        assert "[ZIP Archive Contents - 2 files]" in content.summary
+        assert all("Range" in call.kwargs for call in s3_client.get_object.call_args_list)
+
+    def test_preview_content__json__reads_full_object(self, repository, s3_client):
+        key = "jobs/123/2025/01/01/120000/job_config.json"
+        s3_client.put_object(Bucket="test-bucket", Key=key, Body=b'{"a": 1}')
+
+        content = repository.preview_content(
+            UploadLocation(url=f"https://test-bucket.s3.amazonaws.com/{key}")
+        )
+
+        assert content.raw_content == '{"a": 1}'
+
+    def test_preview_content__job_input_not_a_zip__falls_back_to_read_content(
+        self, repository, s3_client
+    ):
+        key = "jobs/123/2025/01/01/120000/job_input.zip"
+        s3_client.put_object(Bucket="test-bucket", Key=key, Body=b"plain text input")
+
+        content = repository.preview_content(
+            UploadLocation(url=f"https://test-bucket.s3.amazonaws.com/{key}")
+        )
+
+        assert content.raw_content == "plain text input"
+
+    def test_preview_content__missing_object__raises_value_error(self, repository):
+        location = UploadLocation(url="https://test-bucket.s3.amazonaws.com/jobs/1/job_input.zip")
+
+        with pytest.raises(ValueError, match="NoSuchKey"):
+            repository.preview_content(location)
+
+
+class TestS3UploadLocationRepositoryArchivePrefixes:
+    """archive_prefixes against a moto S3 stand-in."""
+
+    PREFIX = "jobs/12/2025/10/23/211500/"
+
+    @pytest.fixture
+    def s3_client(self):
+        with mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket="test-bucket")
+            for name in ("job_config.json", "job_input.zip", "run_4_results.zip"):
+                client.put_object(Bucket="test-bucket", Key=f"{self.PREFIX}{name}", Body=b"x")
+            client.put_object(
+                Bucket="test-bucket",
+                Key=f"{self.PREFIX}run_5_results.zip",
+                Body=b"x",
+                StorageClass="GLACIER",
+            )
+            client.put_object(Bucket="test-bucket", Key="jobs/13/job_config.json", Body=b"x")
+            yield client
+
+    @pytest.fixture
+    def repository(self, s3_client):
+        return S3UploadLocationRepository(bucket_name="test-bucket", s3_client=s3_client)
+
+    def _storage_class(self, s3_client, key):
+        return s3_client.head_object(Bucket="test-bucket", Key=key).get("StorageClass", "STANDARD")
+
+    def test_archive_prefixes__transitions_old_objects_without_head_requests(
+        self, repository, s3_client
+    ):
+        s3_client.head_object = Mock(wraps=s3_client.head_object)
+        age_threshold = datetime.now() + timedelta(days=1)
+
+        sweep = repository.archive_prefixes([self.PREFIX], age_threshold)
+
+        s3_client.head_object.assert_not_called()
+        assert sorted(sweep.archived) == [
+            f"{self.PREFIX}job_config.json",
+            f"{self.PREFIX}job_input.zip",
+            f"{self.PREFIX}run_4_results.zip",
+        ]
+        assert sweep.already_archived == 1
+        assert sweep.errors == []
+        for key in sweep.archived:
+            assert self._storage_class(s3_client, key) == "GLACIER"
+        assert self._storage_class(s3_client, "jobs/13/job_config.json") == "STANDARD"
+
+    def test_archive_prefixes__recent_objects__are_left_alone(self, repository):
+        sweep = repository.archive_prefixes(["jobs/"], datetime.now() - timedelta(days=1))
+
+        assert sweep.archived == []
+        assert sweep.too_recent == 4
+        assert sweep.already_archived == 1
+
+    def test_archive_prefixes__dry_run__reports_without_transitioning(self, repository, s3_client):
+        sweep = repository.archive_prefixes(["jobs/"], None, dry_run=True)
+
+        assert len(sweep.archived) == 4
+        assert sweep.summary() == "Would archive 4 objects, 1 already archived"
+        assert self._storage_class(s3_client, "jobs/13/job_config.json") == "STANDARD"
+
+    def test_archive_prefixes__at_batch_operations_threshold__writes_manifest_instead(
+        self, s3_client
+    ):
+        repository = S3UploadLocationRepository(
+            bucket_name="test-bucket", s3_client=s3_client, batch_operations_threshold=4
+        )
+
+        sweep = repository.archive_prefixes(["jobs/"], None)
+
+        assert sweep.archived == []
+        assert len(sweep.manifested) == 4
+        manifest_key = sweep.manifest_url.removeprefix("s3://test-bucket/")
+        assert manifest_key.startswith("batch-operations/archive/")
+        manifest = s3_client.get_object(Bucket="test-bucket", Key=manifest_key)
+        assert manifest["ETag"] == sweep.manifest_etag
+        rows = manifest["Body"].read().decode().splitlines()
+        assert "test-bucket,jobs/13/job_config.json" in rows
+        assert self._storage_class(s3_client, "jobs/13/job_config.json") == "STANDARD"
+
+    def test_archive_prefixes__copy_errors__are_reported_per_object(self, repository, s3_client):
+        def copy_object(**kwargs):
+            if kwargs["Key"].endswith("job_input.zip"):
+                raise ClientError({"Error": {"Code": "AccessDenied"}}, "CopyObject")
+
+        s3_client.copy_object = Mock(side_effect=copy_object)
+
+        sweep = repository.archive_prefixes([self.PREFIX], None)
+
+        assert sweep.errors == [f"Failed to archive {self.PREFIX}job_input.zip: AccessDenied"]
+        assert len(sweep.archived) == 2
+
+    def test_archive_prefixes__missing_bucket__raises_value_error(self, s3_client):
+        repository = S3UploadLocationRepository(bucket_name="missing-bucket", s3_client=s3_client)
+
+        with pytest.raises(ValueError, match="NoSuchBucket"):
+            repository.archive_prefixes(["jobs/"], None)
+
 
 class TestDummyS3UploadLocationRepository:
     """Test cases for the DummyS3UploadLocationRepository."""
@@ -633,10 +909,10 @@ class TestCreateUploadLocationRepository:
         assert isinstance(repository, DummyS3UploadLocationRepository)
         assert repository.test_url == custom_url
 
-    @patch("epistemix_platform.utils.s3_client.boto3.client")
-    def test_create_upload_location_repository__production_env__returns_s3(self, mock_boto3_client):
+    @patch("epistemix_platform.repositories.s3_upload_location_repository.get_aws_session")
+    def test_create_upload_location_repository__production_env__returns_s3(self, mock_session):
         """Test that PRODUCTION environment returns S3UploadLocationRepository."""
-        mock_boto3_client.return_value.meta.region_name = "us-east-1"
+        mock_session.return_value.client.return_value.meta.region_name = "us-east-1"
 
         repository = create_upload_location_repository(
             env="PRODUCTION", bucket_name="test-bucket", region_name="us-east-1"
@@ -644,19 +920,18 @@ class TestCreateUploadLocationRepository:
 
         assert isinstance(repository, S3UploadLocationRepository)
         assert repository.bucket_name == "test-bucket"
-        mock_boto3_client.assert_called_once()
+        mock_session.assert_called_once_with("us-east-1")
+        mock_session.return_value.client.assert_called_once_with("s3", region_name="us-east-1")
 
     def test_create_upload_location_repository__production_without_bucket__raises_error(self):
         """Test that production environment without bucket name raises error."""
         with pytest.raises(ValueError, match="bucket_name is required for PRODUCTION environment"):
             create_upload_location_repository(env="PRODUCTION")
 
-    @patch("epistemix_platform.utils.s3_client.boto3.client")
-    def test_create_upload_location_repository__development_env__returns_s3(
-        self, mock_boto3_client
-    ):
+    @patch("epistemix_platform.repositories.s3_upload_location_repository.get_aws_session")
+    def test_create_upload_location_repository__development_env__returns_s3(self, mock_session):
         """Test that DEVELOPMENT environment returns S3UploadLocationRepository."""
-        mock_boto3_client.return_value.meta.region_name = "us-west-2"
+        mock_session.return_value.client.return_value.meta.region_name = "us-west-2"
 
         repository = create_upload_location_repository(
             env="DEVELOPMENT", bucket_name="dev-bucket", region_name="us-west-2"
@@ -665,10 +940,10 @@ class TestCreateUploadLocationRepository:
         assert isinstance(repository, S3UploadLocationRepository)
         assert repository.bucket_name == "dev-bucket"
 
-    @patch("epistemix_platform.utils.s3_client.boto3.client")
-    def test_create_upload_location_repository__unknown_env__returns_s3(self, mock_boto3_client):
+    @patch("epistemix_platform.repositories.s3_upload_location_repository.get_aws_session")
+    def test_create_upload_location_repository__unknown_env__returns_s3(self, mock_session):
         """Test that unknown environment defaults to S3UploadLocationRepository."""
-        mock_boto3_client.return_value.meta.region_name = "eu-west-1"
+        mock_session.return_value.client.return_value.meta.region_name = "eu-west-1"
 
         repository = create_upload_location_repository(env="STAGING", bucket_name="staging-bucket")
 
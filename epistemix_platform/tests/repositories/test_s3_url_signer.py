@@ -0,0 +1,96 @@
+"""
+Unit tests for S3UrlSigner, checked against botocore's own SigV4 query signer.
+"""
+
+from datetime import UTC, datetime
+from urllib.parse import parse_qsl, quote, urlsplit
+
+import pytest
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+from freezegun import freeze_time
+
+from epistemix_platform.repositories.s3_url_signer import S3UrlSigner
+
+
+SIGNING_TIME = "2025-10-23 21:15:00"
+
+
+def _botocore_url(credentials, region_name, url, expiration_seconds):
+    with freeze_time(SIGNING_TIME):
+        auth = S3SigV4QueryAuth(
+            credentials.get_frozen_credentials(), "s3", region_name, expires=expiration_seconds
+        )
+        request = AWSRequest(method="GET", url=url)
+        auth.add_auth(request)
+    return request.url
+
+
+def _parts(url):
+    split = urlsplit(url)
+    return split.netloc, split.path, dict(parse_qsl(split.query))
+
+
+class TestS3UrlSigner:
+    @pytest.mark.parametrize(
+        ("credentials", "region_name", "bucket", "expected_base"),
+        [
+            (
+                Credentials("AKIAEXAMPLE", "secret"),
+                "us-east-1",
+                "results",
+                "results.s3.amazonaws.com",
+            ),
+            (
+                Credentials("ASIAEXAMPLE", "se/cret", "session+token="),
+                "us-east-2",
+                "results",
+                "results.s3.us-east-2.amazonaws.com",
+            ),
+            (Credentials("AKIAEXAMPLE", "secret"), "us-east-1", "my.results", "s3.amazonaws.com"),
+        ],
+    )
+    def test_sign__matches_botocore_signature(
+        self, credentials, region_name, bucket, expected_base
+    ):
+        key = "jobs/12/2025/10/23/211500/run 4_results+v1.zip"
+        signer = S3UrlSigner(
+            credentials,
+            region_name=region_name,
+            expiration_seconds=86400,
+            now=datetime(2025, 10, 23, 21, 15, 0, tzinfo=UTC),
+        )
+
+        url = signer.sign(bucket, key)
+
+        path = f"/{quote(key, safe='/~')}"
+        if expected_base == "s3.amazonaws.com":
+            path = f"/{bucket}{path}"
+        expected = _botocore_url(credentials, region_name, f"https://{expected_base}{path}", 86400)
+        assert _parts(url) == _parts(expected)
+
+    def test_sign__custom_endpoint__uses_path_style(self):
+        credentials = Credentials("AKIAEXAMPLE", "secret")
+        signer = S3UrlSigner(
+            credentials,
+            region_name="us-east-1",
+            expiration_seconds=3600,
+            endpoint_url="http://localhost:4566/",
+            now=datetime(2025, 10, 23, 21, 15, 0, tzinfo=UTC),
+        )
+
+        url = signer.sign("results", "jobs/12/run_4_results.zip")
+
+        expected = _botocore_url(
+            credentials,
+            "us-east-1",
+            "http://localhost:4566/results/jobs/12/run_4_results.zip",
+            3600,
+        )
+        assert url.startswith("http://localhost:4566/results/jobs/12/run_4_results.zip?")
+        assert _parts(url) == _parts(expected)
+
+    def test_init__expiration_over_seven_days__raises_value_error(self):
+        with pytest.raises(ValueError, match="expiration_seconds must be between"):
+            S3UrlSigner(Credentials("AKIAEXAMPLE", "secret"), "us-east-1", 8 * 24 * 3600)
@@ -0,0 +1,121 @@
+"""
+Tests for S3ZipInspector, against a moto S3 stand-in.
+"""
+
+import io
+import os
+import zipfile
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from epistemix_platform.repositories.s3_zip_inspector import S3ZipInspector
+
+
+BUCKET = "test-upload-bucket"
+
+
+def _zip_bytes(entries, comment=b"", allow_zip64=True):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, allowZip64=allow_zip64) as archive:
+        for name, content, compress_type in entries:
+            archive.writestr(name, content, compress_type=compress_type)
+        archive.comment = comment
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+def archive():
+    return _zip_bytes(
+        [
+            ("main.fred", "Days = 100\n" * 10_000, zipfile.ZIP_DEFLATED),
+            ("data/population.bin", os.urandom(2_000_000), zipfile.ZIP_DEFLATED),
+            ("notes.txt", "héllo wörld\n" * 1000, zipfile.ZIP_DEFLATED),
+            ("stored.csv", "day,count\n" * 500, zipfile.ZIP_STORED),
+            ("empty.txt", "", zipfile.ZIP_DEFLATED),
+        ]
+    )
+
+
+@pytest.fixture
+def inspector(s3_client, archive):
+    s3_client.put_object(Bucket=BUCKET, Key="job_input.zip", Body=archive)
+    return S3ZipInspector(s3_client, BUCKET, "job_input.zip")
+
+
+class TestS3ZipInspector:
+    def test_members__lists_entries_from_central_directory(self, inspector, archive):
+        members = inspector.members()
+
+        infos = zipfile.ZipFile(io.BytesIO(archive)).infolist()
+        assert [(m.name, m.size, m.compressed_size) for m in members] == [
+            (info.filename, info.file_size, info.compress_size) for info in infos
+        ]
+        # One suffix-range GET covers the end record and the directory
+        assert inspector.request_count == 1
+        assert inspector.bytes_fetched <= 16 * 1024
+
+    @pytest.mark.parametrize("max_bytes", [1, 2000, 50_000])
+    def test_read_prefix__matches_zipfile_for_every_member(self, inspector, archive, max_bytes):
+        expected = zipfile.ZipFile(io.BytesIO(archive))
+
+        for member in inspector.members():
+            prefix = inspector.read_prefix(member, max_bytes)
+
+            assert prefix == expected.read(member.name)[:max_bytes]
+
+    def test_read_prefix__transfers_kilobytes_not_archive(self, inspector, archive):
+        members = inspector.members()
+        before = inspector.bytes_fetched
+
+        for member in members:
+            inspector.read_prefix(member, 2000)
+
+        assert len(archive) > 2_000_000
+        assert inspector.bytes_fetched - before < 20 * 1024
+
+    def test_members__long_archive_comment__finds_end_record(self, s3_client):
+        archive = _zip_bytes([("a.txt", "abc", zipfile.ZIP_DEFLATED)], comment=b"c" * 65_000)
+        s3_client.put_object(Bucket=BUCKET, Key="commented.zip", Body=archive)
+        inspector = S3ZipInspector(s3_client, BUCKET, "commented.zip", tail_bytes=1024)
+
+        (member,) = inspector.members()
+
+        assert inspector.read_prefix(member, 10) == b"abc"
+
+    def test_members__zip64_archive__reads_all_entries(self, s3_client):
+        entries = [(f"f{n}.txt", "", zipfile.ZIP_STORED) for n in range(70_000)]
+        archive = _zip_bytes([*entries, ("last.txt", "hello" * 100, zipfile.ZIP_DEFLATED)])
+        s3_client.put_object(Bucket=BUCKET, Key="many.zip", Body=archive)
+        inspector = S3ZipInspector(s3_client, BUCKET, "many.zip")
+
+        members = inspector.members()
+
+        assert len(members) == 70_001
+        assert inspector.read_prefix(members[-1], 10) == b"hellohello"
+
+    def test_members__not_a_zip__raises_value_error(self, s3_client):
+        s3_client.put_object(Bucket=BUCKET, Key="job_input.zip", Body=b"not a zip archive")
+        inspector = S3ZipInspector(s3_client, BUCKET, "job_input.zip")
+
+        with pytest.raises(ValueError, match="not a ZIP archive"):
+            inspector.members()
+
+    def test_read_prefix__unsupported_compression__raises_value_error(self, s3_client):
+        archive = _zip_bytes([("a.txt", "abc" * 100, zipfile.ZIP_BZIP2)])
+        s3_client.put_object(Bucket=BUCKET, Key="bzip2.zip", Body=archive)
+        inspector = S3ZipInspector(s3_client, BUCKET, "bzip2.zip")
+
+        (member,) = inspector.members()
+
+        with pytest.raises(ValueError, match="unsupported compression method 12"):
+            inspector.read_prefix(member, 10)
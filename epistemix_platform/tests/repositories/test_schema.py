@@ -0,0 +1,113 @@
+"""
+Tests for the startup-time database schema gate.
+"""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect
+
+from epistemix_platform import config as config_module
+from epistemix_platform.exceptions import SchemaVersionError
+from epistemix_platform.repositories.database import (
+    dispose_database_managers,
+    get_database_manager,
+)
+from epistemix_platform.repositories.schema import (
+    get_database_revision,
+    get_migration_head,
+    verify_schema,
+)
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'schema.sqlite'}"
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    dispose_database_managers()
+    yield
+    dispose_database_managers()
+
+
+class TestSchemaGate:
+    def test_ensure_schema__verify_unversioned_database__raises_schema_version_error(
+        self, database_url
+    ):
+        manager = get_database_manager(database_url)
+
+        with pytest.raises(SchemaVersionError, match="DATABASE_SCHEMA_MODE=migrate"):
+            manager.ensure_schema(mode="verify", script_location=MIGRATIONS_DIR)
+
+    def test_ensure_schema__migrate__upgrades_database_to_head(self, database_url):
+        manager = get_database_manager(database_url)
+
+        manager.ensure_schema(mode="migrate", script_location=MIGRATIONS_DIR)
+
+        assert get_database_revision(manager.engine) == get_migration_head(MIGRATIONS_DIR)
+        assert {"jobs", "runs"} <= set(inspect(manager.engine).get_table_names())
+
+    def test_ensure_schema__migrate__adds_batch_job_id_to_runs(self, database_url):
+        manager = get_database_manager(database_url)
+
+        manager.ensure_schema(mode="migrate", script_location=MIGRATIONS_DIR)
+
+        columns = {column["name"] for column in inspect(manager.engine).get_columns("runs")}
+        assert "batch_job_id" in columns
+
+    def test_verify_schema__migrated_database__returns_head(self, database_url):
+        manager = get_database_manager(database_url)
+        manager.ensure_schema(mode="migrate", script_location=MIGRATIONS_DIR)
+
+        assert verify_schema(manager.engine, MIGRATIONS_DIR) == get_migration_head(MIGRATIONS_DIR)
+
+    def test_ensure_schema__verify_failed__retries_on_next_call(self, database_url):
+        manager = get_database_manager(database_url)
+        with pytest.raises(SchemaVersionError):
+            manager.ensure_schema(mode="verify", script_location=MIGRATIONS_DIR)
+
+        manager.ensure_schema(mode="migrate", script_location=MIGRATIONS_DIR)
+        manager.ensure_schema(mode="verify", script_location=MIGRATIONS_DIR)
+
+    def test_ensure_schema__migrate_without_script_location__raises_value_error(self, database_url):
+        manager = get_database_manager(database_url)
+
+        with pytest.raises(ValueError, match="script_location"):
+            manager.ensure_schema(mode="migrate")
+
+    def test_ensure_schema__verify_in_pex_layout__skips_with_warning(
+        self, database_url, tmp_path, monkeypatch, caplog
+    ):
+        # Inside a PEX the package has no migrations directory beside it
+        pex_module = tmp_path / ".deps" / "epistemix_platform" / "config.py"
+        monkeypatch.setattr(config_module, "__file__", str(pex_module))
+        script_location = config_module._source_tree_migrations()
+        manager = get_database_manager(database_url)
+
+        manager.ensure_schema(mode="verify", script_location=script_location)
+
+        assert script_location is None
+        assert "skipping schema verification" in caplog.text
+
+    def test_ensure_schema__verify_missing_configured_directory__raises(
+        self, database_url, tmp_path
+    ):
+        manager = get_database_manager(database_url)
+
+        with pytest.raises(SchemaVersionError, match="not found"):
+            manager.ensure_schema(mode="verify", script_location=str(tmp_path / "missing"))
+
+    def test_ensure_schema__unknown_mode__raises_value_error(self, database_url):
+        manager = get_database_manager(database_url)
+
+        with pytest.raises(ValueError):
+            manager.ensure_schema(mode="drop-everything")
+
+    def test_get_migration_head__missing_directory__raises_schema_version_error(self, tmp_path):
+        with pytest.raises(SchemaVersionError, match="not found"):
+            get_migration_head(tmp_path / "missing")
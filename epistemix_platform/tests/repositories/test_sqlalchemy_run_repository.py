@@ -140,6 +140,71 @@ class TestSQLAlchemyJobRepository:
         persisted_run = RunMapper.record_to_domain(run_record)
         assert persisted_run == expected_run
 
+    def test_save_all__given_new_runs__assigns_ids_in_order(self, repository: IRunRepository):
+        runs = [
+            Run.create_unpersisted(
+                job_id=1,
+                user_id=1,
+                status=RunStatus.SUBMITTED,
+                pod_phase=PodPhase.PENDING,
+                request={"index": index},
+            )
+            for index in range(3)
+        ]
+
+        saved_runs = repository.save_all(runs)
+
+        assert [run.id for run in saved_runs] == [1, 2, 3]
+        assert [run.request for run in saved_runs] == [{"index": 0}, {"index": 1}, {"index": 2}]
+
+    def test_save_all__given_new_and_existing_runs__updates_on_commit(
+        self, repository: IRunRepository, db_session
+    ):
+        existing_run = repository.save(
+            Run.create_unpersisted(
+                job_id=1,
+                user_id=1,
+                status=RunStatus.SUBMITTED,
+                pod_phase=PodPhase.PENDING,
+                request={},
+            )
+        )
+        db_session.commit()
+
+        existing_run.config_url = "http://example.com/config.json"
+        new_run = Run.create_unpersisted(
+            job_id=1,
+            user_id=1,
+            status=RunStatus.SUBMITTED,
+            pod_phase=PodPhase.PENDING,
+            request={},
+        )
+        repository.save_all([existing_run, new_run])
+        db_session.commit()
+
+        assert repository.find_by_id(1).config_url == "http://example.com/config.json"
+        assert repository.find_by_id(2).id == new_run.id
+
+    def test_save_all__given_unknown_persisted_run__raises_value_error(
+        self, repository: IRunRepository
+    ):
+        run = Run.create_persisted(
+            run_id=42,
+            user_id=1,
+            job_id=1,
+            status=RunStatus.SUBMITTED,
+            pod_phase=PodPhase.PENDING,
+            request={},
+            created_at=datetime(2025, 1, 1, 12, 0, 0),
+            updated_at=datetime(2025, 1, 1, 12, 0, 0),
+        )
+
+        with pytest.raises(ValueError, match=r"\[42\] not found"):
+            repository.save_all([run])
+
+    def test_save_all__given_empty_list__returns_empty_list(self, repository: IRunRepository):
+        assert repository.save_all([]) == []
+
     def test_delete__given_existing_run__deletes_run_on_commit(
         self, repository: IRunRepository, db_session
     ):
@@ -293,3 +358,62 @@ class TestSQLAlchemyJobRepository:
     ):
         runs = repository.find_by_status(RunStatus.DONE)
         assert runs == []
+
+    def test_find_unfinished__mixed_statuses__returns_non_terminal_runs_stalest_first(
+        self, repository: IRunRepository, db_session
+    ):
+        def make_run(status, pod_phase, synced_at=None):
+            return Run.create_unpersisted(
+                job_id=1,
+                user_id=1,
+                status=status,
+                pod_phase=pod_phase,
+                request={},
+                config_url="http://example.com/config.json",
+                status_synced_at=synced_at,
+            )
+
+        recently_synced = make_run(
+            RunStatus.RUNNING, PodPhase.RUNNING, datetime(2025, 1, 1, 11, 59)
+        )
+        never_synced = make_run(RunStatus.SUBMITTED, PodPhase.PENDING)
+        stale = make_run(RunStatus.RUNNING, PodPhase.RUNNING, datetime(2025, 1, 1, 11, 0))
+        batch_unreachable = make_run(RunStatus.ERROR, PodPhase.UNKNOWN)
+        done = make_run(RunStatus.DONE, PodPhase.SUCCEEDED)
+        failed = make_run(RunStatus.ERROR, PodPhase.FAILED)
+        repository.save_all([recently_synced, never_synced, stale, batch_unreachable, done, failed])
+        db_session.commit()
+
+        unfinished = repository.find_unfinished()
+        due = repository.find_unfinished(synced_before=datetime(2025, 1, 1, 11, 30), limit=2)
+
+        assert [run.id for run in unfinished] == [
+            never_synced.id,
+            batch_unreachable.id,
+            stale.id,
+            recently_synced.id,
+        ]
+        assert [run.id for run in due] == [never_synced.id, batch_unreachable.id]
+
+    def test_find_by_batch_job_ids__stored_ids__returns_matching_runs_only(
+        self, repository: IRunRepository, db_session
+    ):
+        def make_run(batch_job_id):
+            return Run.create_unpersisted(
+                job_id=1,
+                user_id=1,
+                request={},
+                config_url="http://example.com/config.json",
+                batch_job_id=batch_job_id,
+            )
+
+        per_run, array_child, legacy = make_run("abc"), make_run("parent:0"), make_run(None)
+        repository.save_all([per_run, array_child, legacy])
+        db_session.commit()
+
+        found = repository.find_by_batch_job_ids(["parent:0", "abc", "unknown"])
+        found_by_id = repository.find_by_ids([legacy.id, per_run.id, 999])
+
+        assert sorted(run.id for run in found) == [per_run.id, array_child.id]
+        assert sorted(run.id for run in found_by_id) == [per_run.id, legacy.id]
+        assert repository.find_by_batch_job_ids([]) == []
@@ -26,6 +26,10 @@ def mock_batch_client():
     mock_client.describe_jobs.return_value = {
         "jobs": [{"jobId": "batch-job-123", "status": "RUNNING", "statusReason": ""}]
     }
+    # Mock for describe_runs() bulk status synchronization
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {"jobSummaryList": [{"jobId": "batch-job-123", "jobName": "job-1-run-1"}]}
+    ]
     return mock_client
 
 
@@ -429,7 +433,7 @@ class TestAppRoutes:
         self, client, bearer_token, setup_runs_with_urls
     ):
         """Test that the endpoint generates presigned URLs for all runs (batch operation)."""
-        # Mock the controller's get_run_results_download to return presigned URLs
+        # Mock the controller's stream_run_results_download to return presigned URLs
         with patch("epistemix_platform.app.get_job_controller") as mock_get_controller:
             from unittest.mock import Mock
 
@@ -438,9 +442,9 @@ class TestAppRoutes:
             # Create a mock controller
             mock_controller = Mock()
 
-            # Set up the get_run_results_download method as a batch operation
+            # Set up the stream_run_results_download method as a batch operation
             # It now takes job_id and bucket_name, returns all URLs for the job
-            mock_controller.get_run_results_download.return_value = Success(
+            mock_controller.stream_run_results_download.return_value = Success(
                 [
                     {
                         "run_id": 1,
@@ -488,8 +492,8 @@ class TestAppRoutes:
 
             # Verify controller was called once as a batch operation
             # Note: bucket_name comes from app.config["S3_UPLOAD_BUCKET"]
-            mock_controller.get_run_results_download.assert_called_once()
-            call_args = mock_controller.get_run_results_download.call_args
+            mock_controller.stream_run_results_download.assert_called_once()
+            call_args = mock_controller.stream_run_results_download.call_args
             assert call_args[1]["job_id"] == 100
             assert "bucket_name" in call_args[1]
 
@@ -609,7 +613,7 @@ class TestAppRoutes:
 
             mock_controller = Mock()
             # Batch operation returns URL reconstructed on-the-fly
-            mock_controller.get_run_results_download.return_value = Success(
+            mock_controller.stream_run_results_download.return_value = Success(
                 [
                     {
                         "run_id": 1,
@@ -631,3 +635,186 @@ class TestAppRoutes:
             assert len(data["urls"]) == 1  # Run gets URL even without persisted results_url
             assert data["urls"][0]["run_id"] == 1
             assert "X-Amz-Expires" in data["urls"][0]["url"]
+
+    def test_get_job_results__streams_large_url_lists_as_one_json_document(
+        self, client, bearer_token
+    ):
+        """Test that URLs are streamed in chunks that together form valid JSON."""
+        with patch("epistemix_platform.app.get_job_controller") as mock_get_controller:
+            from returns.result import Success
+
+            urls = [{"run_id": i, "url": f"https://s3/presigned-{i}"} for i in range(1201)]
+            mock_controller = Mock()
+            mock_controller.stream_run_results_download.return_value = Success(iter(urls))
+            mock_get_controller.return_value = mock_controller
+
+            response = client.get(
+                "/jobs/results?job_id=100",
+                headers={"Offline-Token": bearer_token, "Fredcli-Version": "1.0.0"},
+            )
+
+            assert response.status_code == 200
+            assert response.is_streamed
+            assert response.mimetype == "application/json"
+            assert response.get_json() == {"urls": urls}
+
+    def test_get_job_results__job_not_found__returns_error(self, client, bearer_token):
+        """Test that a failure is reported before anything is streamed."""
+        with patch("epistemix_platform.app.get_job_controller") as mock_get_controller:
+            from returns.result import Failure
+
+            mock_controller = Mock()
+            mock_controller.stream_run_results_download.return_value = Failure("Job 999 not found")
+            mock_get_controller.return_value = mock_controller
+
+            response = client.get(
+                "/jobs/results?job_id=999",
+                headers={"Offline-Token": bearer_token, "Fredcli-Version": "1.0.0"},
+            )
+
+            assert response.status_code == 400
+            assert response.get_json() == {"error": "Job 999 not found"}
+
+    def test_get_job_result_columns__reads_columns_for_day_range(self, client, bearer_token):
+        """Test that the endpoint passes the table, columns and day range to the controller."""
+        with patch("epistemix_platform.app.get_job_controller") as mock_get_controller:
+            from returns.result import Success
+
+            mock_controller = Mock()
+            mock_controller.read_run_columns.return_value = Success(
+                {"Day": [10, 11], "N": [1010, 1011]}
+            )
+            mock_get_controller.return_value = mock_controller
+
+            response = client.get(
+                "/jobs/results/columns?job_id=12&run_id=4&table=RUN1/out"
+                "&columns=Day,N&start_day=10&end_day=11",
+                headers={"Offline-Token": bearer_token, "Fredcli-Version": "1.0.0"},
+            )
+
+            assert response.status_code == 200
+            assert response.get_json() == {"columns": {"Day": [10, 11], "N": [1010, 1011]}}
+            mock_controller.read_run_columns.assert_called_once_with(
+                job_id=12,
+                run_id=4,
+                table="RUN1/out",
+                columns=["Day", "N"],
+                start_day=10,
+                end_day=11,
+            )
+
+    def test_get_job_result_columns__without_table__lists_tables(self, client, bearer_token):
+        """Test that the endpoint lists the run's tables when no table is given."""
+        with patch("epistemix_platform.app.get_job_controller") as mock_get_controller:
+            from returns.result import Success
+
+            tables = {"RUN1/out": {"rows": 100, "day_column": "Day", "columns": ["Day", "N"]}}
+            mock_controller = Mock()
+            mock_controller.get_run_columnar_tables.return_value = Success(tables)
+            mock_get_controller.return_value = mock_controller
+
+            response = client.get(
+                "/jobs/results/columns?job_id=12&run_id=4",
+                headers={"Offline-Token": bearer_token, "Fredcli-Version": "1.0.0"},
+            )
+
+            assert response.status_code == 200
+            assert response.get_json() == {"tables": tables}
+
+    def test_get_job_result_columns__invalid_day__returns_error(self, client, bearer_token):
+        """Test that the endpoint rejects non-integer day parameters."""
+        response = client.get(
+            "/jobs/results/columns?job_id=12&run_id=4&table=RUN1/out&start_day=first",
+            headers={"Offline-Token": bearer_token, "Fredcli-Version": "1.0.0"},
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "Invalid start_day parameter"}
+
+    @freeze_time("2025-01-01 12:00:00")
+    def test_ingest_batch_events__valid_token__applies_event_to_run(
+        self, client, bearer_token, monkeypatch
+    ):
+        monkeypatch.setitem(app.config, "BATCH_EVENTS_TOKEN", "events-secret")
+        headers = {
+            "Offline-Token": bearer_token,
+            "content-type": "application/json",
+            "fredcli-version": "0.4.0",
+            "user-agent": "epx_client_1.2.2",
+        }
+        client.post("/jobs/register", headers=headers, json={"tags": ["info_job"]})
+        client.post(
+            "/runs",
+            headers=headers,
+            json={
+                "runRequests": [
+                    {
+                        "jobId": 1,
+                        "workingDir": "/workspaces/fred_simulations",
+                        "size": "hot",
+                        "fredVersion": "latest",
+                        "population": {"version": "US_2010.v5", "locations": ["Loving_County_TX"]},
+                        "fredArgs": [{"flag": "-p", "value": "main.fred"}],
+                        "fredFiles": ["/workspaces/fred_simulations/main.fred"],
+                    }
+                ]
+            },
+        )
+        event = {
+            "id": "evt-1",
+            "detail-type": "Batch Job State Change",
+            "source": "aws.batch",
+            "time": "2025-01-01T12:05:00Z",
+            "detail": {"jobName": "job-1-run-1", "jobId": "batch-job-123", "status": "SUCCEEDED"},
+        }
+
+        response = client.post(
+            "/events/batch",
+            headers={"X-Events-Token": "events-secret", "content-type": "application/json"},
+            json=[event, event],
+        )
+        runs = client.get("/runs", headers=headers, query_string={"job_id": 1}).get_json()["runs"]
+
+        assert response.status_code == 200
+        assert response.get_json() == {"received": 2, "applied": 1, "ignored": 1, "invalid": 0}
+        assert runs[0]["status"] == "DONE"
+        assert runs[0]["podPhase"] == "Succeeded"
+
+    def test_ingest_batch_events__json_with_charset__is_accepted(self, client, monkeypatch):
+        monkeypatch.setitem(app.config, "BATCH_EVENTS_TOKEN", "events-secret")
+
+        response = client.post(
+            "/events/batch",
+            headers={
+                "X-Events-Token": "events-secret",
+                "content-type": "application/json; charset=utf-8",
+            },
+            data=json.dumps({"source": "aws.batch", "detail": {}}),
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["received"] == 1
+
+    def test_ingest_batch_events__wrong_token__returns_forbidden(self, client, monkeypatch):
+        monkeypatch.setitem(app.config, "BATCH_EVENTS_TOKEN", "events-secret")
+
+        response = client.post(
+            "/events/batch",
+            headers={"X-Events-Token": "guess", "content-type": "application/json"},
+            json={"source": "aws.batch"},
+        )
+
+        assert response.status_code == 403
+
+    def test_ingest_batch_events__token_not_configured__returns_not_found(
+        self, client, monkeypatch
+    ):
+        monkeypatch.setitem(app.config, "BATCH_EVENTS_TOKEN", "")
+
+        response = client.post(
+            "/events/batch",
+            headers={"X-Events-Token": "", "content-type": "application/json"},
+            json={"source": "aws.batch"},
+        )
+
+        assert response.status_code == 404
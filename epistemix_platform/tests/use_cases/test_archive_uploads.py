@@ -4,8 +4,10 @@ from unittest.mock import Mock, call, patch
 import pytest
 from freezegun import freeze_time
 
+from epistemix_platform.models.archive_sweep import ArchiveSweep
+from epistemix_platform.models.job import Job
 from epistemix_platform.models.upload_location import UploadLocation
-from epistemix_platform.use_cases.archive_uploads import archive_uploads
+from epistemix_platform.use_cases.archive_uploads import archive_job_prefixes, archive_uploads
 
 
 class TestArchiveUploadsUseCase:
@@ -388,3 +390,78 @@ class TestArchiveUploadsUseCase:
         actual_delta = now - threshold
 
         assert abs((actual_delta - expected_delta).total_seconds()) < 2
+
+
+class TestArchiveJobPrefixesUseCase:
+    @pytest.fixture
+    def job_repository(self):
+        repo = Mock()
+        repo.find_by_id.side_effect = lambda job_id: (
+            Job(id=job_id, user_id=1, tags=[], created_at=datetime(2025, 10, 23, 21, 15, 0))
+            if job_id != 404
+            else None
+        )
+        return repo
+
+    @pytest.fixture
+    def upload_repository(self):
+        repo = Mock()
+        repo.archive_prefixes.side_effect = lambda prefixes, _threshold, dry_run: ArchiveSweep(
+            prefixes=prefixes, dry_run=dry_run
+        )
+        return repo
+
+    @freeze_time("2025-01-15 14:30:00")
+    def test_archive_job_prefixes__without_job_ids__sweeps_all_jobs_prefix(
+        self, job_repository, upload_repository
+    ):
+        sweep = archive_job_prefixes(job_repository, upload_repository, days_since_create=30)
+
+        assert sweep.prefixes == ["jobs/"]
+        upload_repository.archive_prefixes.assert_called_once_with(
+            ["jobs/"], datetime(2024, 12, 16, 14, 30, 0), dry_run=False
+        )
+        job_repository.find_by_id.assert_not_called()
+
+    def test_archive_job_prefixes__without_job_ids_or_age__raises_value_error(
+        self, job_repository, upload_repository
+    ):
+        with pytest.raises(ValueError, match="age threshold is required"):
+            archive_job_prefixes(job_repository, upload_repository)
+
+        upload_repository.archive_prefixes.assert_not_called()
+
+    @freeze_time("2025-01-15 14:30:00")
+    def test_archive_job_prefixes__with_job_ids__sweeps_each_job_prefix_once(
+        self, job_repository, upload_repository
+    ):
+        archive_job_prefixes(
+            job_repository,
+            upload_repository,
+            job_ids=[12, 13, 12],
+            hours_since_create=2,
+            dry_run=True,
+        )
+
+        upload_repository.archive_prefixes.assert_called_once_with(
+            ["jobs/12/2025/10/23/211500/", "jobs/13/2025/10/23/211500/"],
+            datetime(2025, 1, 15, 12, 30, 0),
+            dry_run=True,
+        )
+
+    def test_archive_job_prefixes__with_job_ids_and_no_age__archives_regardless_of_age(
+        self, job_repository, upload_repository
+    ):
+        archive_job_prefixes(job_repository, upload_repository, job_ids=[12])
+
+        upload_repository.archive_prefixes.assert_called_once_with(
+            ["jobs/12/2025/10/23/211500/"], None, dry_run=False
+        )
+
+    def test_archive_job_prefixes__unknown_job__raises_value_error(
+        self, job_repository, upload_repository
+    ):
+        with pytest.raises(ValueError, match="Job 404 not found"):
+            archive_job_prefixes(job_repository, upload_repository, job_ids=[12, 404])
+
+        upload_repository.archive_prefixes.assert_not_called()
@@ -0,0 +1,166 @@
+"""
+Tests for the download_uploads use case.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from epistemix_platform.models.job_upload import JobUpload
+from epistemix_platform.models.upload_location import UploadLocation
+from epistemix_platform.use_cases.download_uploads import (
+    ETAG_MANIFEST_NAME,
+    create_download_uploads,
+    download_uploads,
+)
+
+
+def _upload(name, upload_type="config", context="job", run_id=None):
+    return JobUpload(
+        context=context,
+        upload_type=upload_type,
+        job_id=1,
+        run_id=run_id,
+        location=UploadLocation(url=f"https://bucket.s3.amazonaws.com/jobs/1/{name}?sig=x"),
+    )
+
+
+class FakeRepository:
+    """Writes the URL path as file content; ETags come from the etags dict."""
+
+    def __init__(self, etags=None):
+        self.etags = etags or {}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def download_to_file(self, location, file_path, etag=None):
+        with self.lock:
+            self.requests.append((file_path.name, etag))
+        current = self.etags.get(file_path.name, '"v1"')
+        if etag == current:
+            return None
+        file_path.write_text(location.url.split("?")[0])
+        return current
+
+
+class TestDownloadUploads:
+    def test_downloads_each_upload_and_records_etags(self, tmp_path):
+        repository = FakeRepository()
+        uploads = [_upload("job_config.json"), _upload("job_input.zip", "input")]
+
+        outcome = download_uploads(repository, uploads, tmp_path)
+
+        assert outcome.downloaded == [
+            str(tmp_path / "job_config.json"),
+            str(tmp_path / "job_input.zip"),
+        ]
+        assert (tmp_path / "job_input.zip").read_text().endswith("/jobs/1/job_input.zip")
+        etags = json.loads((tmp_path / ETAG_MANIFEST_NAME).read_text())
+        assert etags == {"job_config.json": '"v1"', "job_input.zip": '"v1"'}
+
+    def test_existing_file_without_force_is_skipped(self, tmp_path):
+        (tmp_path / "job_config.json").write_text("local")
+        repository = FakeRepository()
+
+        outcome = download_uploads(repository, [_upload("job_config.json")], tmp_path)
+
+        assert outcome.skipped == [str(tmp_path / "job_config.json")]
+        assert repository.requests == []
+        assert (tmp_path / "job_config.json").read_text() == "local"
+
+    def test_force_with_recorded_etag__unchanged_object_is_not_downloaded(self, tmp_path):
+        repository = FakeRepository()
+        uploads = [_upload("job_config.json"), _upload("job_input.zip", "input")]
+        download_uploads(repository, uploads, tmp_path)
+        repository.etags["job_input.zip"] = '"v2"'
+
+        outcome = download_uploads(repository, uploads, tmp_path, should_force=True)
+
+        assert outcome.unchanged == [str(tmp_path / "job_config.json")]
+        assert outcome.downloaded == [str(tmp_path / "job_input.zip")]
+        assert repository.requests[-2:] == [
+            ("job_config.json", '"v1"'),
+            ("job_input.zip", '"v1"'),
+        ]
+        etags = json.loads((tmp_path / ETAG_MANIFEST_NAME).read_text())
+        assert etags["job_input.zip"] == '"v2"'
+
+    def test_force_with_deleted_file__downloads_without_etag(self, tmp_path):
+        repository = FakeRepository()
+        download_uploads(repository, [_upload("job_config.json")], tmp_path)
+        (tmp_path / "job_config.json").unlink()
+
+        outcome = download_uploads(
+            repository, [_upload("job_config.json")], tmp_path, should_force=True
+        )
+
+        assert outcome.downloaded == [str(tmp_path / "job_config.json")]
+        assert repository.requests[-1] == ("job_config.json", None)
+
+    def test_failed_download_is_reported_and_others_continue(self, tmp_path):
+        repository = FakeRepository()
+        original = repository.download_to_file
+
+        def flaky(location, file_path, etag=None):
+            if file_path.name == "job_input.zip":
+                raise ValueError("S3 error (AccessDenied)")
+            return original(location, file_path, etag=etag)
+
+        repository.download_to_file = flaky
+        uploads = [_upload("job_config.json"), _upload("job_input.zip", "input")]
+
+        outcome = download_uploads(repository, uploads, tmp_path)
+
+        assert outcome.downloaded == [str(tmp_path / "job_config.json")]
+        assert outcome.errors == ["Failed to download job_input: S3 error (AccessDenied)"]
+
+    def test_downloads_run_concurrently_up_to_max_concurrency(self, tmp_path):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_download(_location, file_path, **_):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            file_path.write_text("x")
+            return '"v1"'
+
+        repository = Mock()
+        repository.download_to_file.side_effect = slow_download
+        uploads = [_upload(f"run_{i}_config.json", context="run", run_id=i) for i in range(1, 9)]
+
+        outcome = download_uploads(repository, uploads, tmp_path, max_concurrency=3)
+
+        assert len(outcome.downloaded) == 8
+        assert 1 < peak <= 3
+
+    def test_unreadable_etag_manifest_is_ignored(self, tmp_path):
+        (tmp_path / "job_config.json").write_text("local")
+        (tmp_path / ETAG_MANIFEST_NAME).write_text("not json")
+        repository = FakeRepository()
+
+        outcome = download_uploads(
+            repository, [_upload("job_config.json")], tmp_path, should_force=True
+        )
+
+        assert outcome.downloaded == [str(tmp_path / "job_config.json")]
+        assert repository.requests == [("job_config.json", None)]
+
+    def test_invalid_max_concurrency_raises_value_error(self, tmp_path):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            download_uploads(FakeRepository(), [], tmp_path, max_concurrency=0)
+
+    def test_factory_wires_repository(self, tmp_path):
+        download = create_download_uploads(FakeRepository())
+
+        outcome = download([_upload("job_config.json")], tmp_path)
+
+        assert outcome.downloaded == [str(tmp_path / "job_config.json")]
@@ -6,8 +6,12 @@ import pytest
 from epistemix_platform.models.job import Job
 from epistemix_platform.models.run import Run, RunStatus
 from epistemix_platform.models.run_results import RunResults
-from epistemix_platform.models.upload_location import UploadLocation
-from epistemix_platform.use_cases.get_run_results import get_run_results
+from epistemix_platform.use_cases.get_run_results import get_run_results, iter_run_results
+
+
+def _sign_each(url):
+    """get_download_urls stand-in returning the same URL for every object."""
+    return lambda objects, **_: (url for _ in objects)
 
 
 class TestGetRunResults:
@@ -47,8 +51,8 @@ class TestGetRunResults:
         mock_run_repo.find_by_job_id.return_value = runs
 
         mock_results_repo = Mock()
-        mock_results_repo.get_download_url.return_value = UploadLocation(
-            url="https://presigned-url.s3.amazonaws.com?X-Amz-Expires=86400"
+        mock_results_repo.get_download_urls.side_effect = _sign_each(
+            "https://presigned-url.s3.amazonaws.com?X-Amz-Expires=86400"
         )
 
         # Act
@@ -67,7 +71,7 @@ class TestGetRunResults:
         assert results[1].run_id == 2
         assert results[0].url == "https://presigned-url.s3.amazonaws.com?X-Amz-Expires=86400"
 
-    def test_get_run_results__when_fetching_results__calls_repository_with_reconstructed_s3_urls(
+    def test_get_run_results__when_fetching_results__signs_reconstructed_s3_keys_in_one_batch(
         self,
     ):
         # Arrange
@@ -96,9 +100,7 @@ class TestGetRunResults:
         mock_run_repo.find_by_job_id.return_value = runs
 
         mock_results_repo = Mock()
-        mock_results_repo.get_download_url.return_value = UploadLocation(
-            url="https://presigned-url.com"
-        )
+        mock_results_repo.get_download_urls.side_effect = _sign_each("https://presigned-url.com")
 
         # Act
         get_run_results(
@@ -110,13 +112,11 @@ class TestGetRunResults:
         )
 
         # Assert
-        expected_url = (
-            "https://test-bucket.s3.amazonaws.com/jobs/100/2025/11/08/205647/run_1_results.zip"
-        )
-        mock_results_repo.get_download_url.assert_called_once_with(
-            results_url=expected_url,
+        mock_results_repo.get_download_urls.assert_called_once_with(
+            [("test-bucket", "jobs/100/2025/11/08/205647/run_1_results.zip")],
             expiration_seconds=86400,
         )
+        mock_results_repo.get_download_url.assert_not_called()
 
     def test_get_run_results__when_job_has_no_runs__returns_empty_list(self):
         # Arrange
@@ -146,7 +146,7 @@ class TestGetRunResults:
 
         # Assert
         assert results == []
-        mock_results_repo.get_download_url.assert_not_called()
+        mock_results_repo.get_download_urls.assert_not_called()
 
     def test_get_run_results__when_no_expiration_specified__uses_24_hour_expiration(self):
         # Arrange
@@ -175,9 +175,7 @@ class TestGetRunResults:
         mock_run_repo.find_by_job_id.return_value = runs
 
         mock_results_repo = Mock()
-        mock_results_repo.get_download_url.return_value = UploadLocation(
-            url="https://presigned-url.com"
-        )
+        mock_results_repo.get_download_urls.side_effect = _sign_each("https://presigned-url.com")
 
         # Act
         get_run_results(
@@ -189,7 +187,7 @@ class TestGetRunResults:
         )
 
         # Assert
-        call_args = mock_results_repo.get_download_url.call_args
+        call_args = mock_results_repo.get_download_urls.call_args
         assert call_args[1]["expiration_seconds"] == 86400
 
     def test_get_run_results__when_custom_expiration_provided__uses_custom_expiration_seconds(self):
@@ -219,9 +217,7 @@ class TestGetRunResults:
         mock_run_repo.find_by_job_id.return_value = runs
 
         mock_results_repo = Mock()
-        mock_results_repo.get_download_url.return_value = UploadLocation(
-            url="https://presigned-url.com"
-        )
+        mock_results_repo.get_download_urls.side_effect = _sign_each("https://presigned-url.com")
 
         # Act
         get_run_results(
@@ -234,7 +230,7 @@ class TestGetRunResults:
         )
 
         # Assert
-        call_args = mock_results_repo.get_download_url.call_args
+        call_args = mock_results_repo.get_download_urls.call_args
         assert call_args[1]["expiration_seconds"] == 3600
 
     def test_get_run_results__when_job_not_found__raises_value_error(self):
@@ -254,3 +250,71 @@ class TestGetRunResults:
                 results_repository=mock_results_repo,
                 bucket_name="test-bucket",
             )
+
+    def test_iter_run_results__when_job_not_found__raises_before_iterating(self):
+        # Arrange
+        mock_job_repo = Mock()
+        mock_job_repo.find_by_id.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Job 999 not found"):
+            iter_run_results(
+                job_id=999,
+                job_repository=mock_job_repo,
+                run_repository=Mock(),
+                results_repository=Mock(),
+                bucket_name="test-bucket",
+            )
+
+    def test_iter_run_results__signs_urls_lazily_as_results_are_consumed(self):
+        # Arrange
+        job = Job(
+            id=100,
+            user_id=123,
+            tags=["test"],
+            created_at=datetime(2025, 11, 8, 20, 56, 47),
+        )
+        runs = [
+            Run(
+                id=run_id,
+                job_id=100,
+                user_id=123,
+                status=RunStatus.DONE,
+                created_at=datetime(2025, 11, 8, 20, 56, 48),
+                updated_at=datetime(2025, 11, 8, 20, 56, 48),
+                request={"test": "data"},
+            )
+            for run_id in (1, 2)
+        ]
+        mock_job_repo = Mock()
+        mock_job_repo.find_by_id.return_value = job
+        mock_run_repo = Mock()
+        mock_run_repo.find_by_job_id.return_value = runs
+        signed = []
+
+        def sign(objects, expiration_seconds):
+            assert expiration_seconds == 86400
+            for _, key in objects:
+                signed.append(key)
+                yield f"https://presigned/{key}"
+
+        mock_results_repo = Mock()
+        mock_results_repo.get_download_urls.side_effect = sign
+
+        # Act
+        results = iter_run_results(
+            job_id=100,
+            job_repository=mock_job_repo,
+            run_repository=mock_run_repo,
+            results_repository=mock_results_repo,
+            bucket_name="test-bucket",
+        )
+
+        # Assert
+        assert signed == []
+        first = next(results)
+        assert first == RunResults(
+            run_id=1, url="https://presigned/jobs/100/2025/11/08/205647/run_1_results.zip"
+        )
+        assert len(signed) == 1
+        assert [result.run_id for result in results] == [2]
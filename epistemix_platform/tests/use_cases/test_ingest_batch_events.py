@@ -0,0 +1,86 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+from epistemix_platform.models import PodPhase, Run, RunStatus
+from epistemix_platform.use_cases.ingest_batch_events import ingest_batch_events
+from epistemix_platform.utils.batch_event_fixtures import generate_batch_job_events
+
+
+def _make_run(run_id, batch_job_id=None, status=RunStatus.SUBMITTED, pod_phase=PodPhase.PENDING):
+    return Run.create_persisted(
+        run_id=run_id,
+        job_id=12,
+        user_id=456,
+        created_at=datetime(2025, 1, 1, 11, 0, 0),
+        updated_at=datetime(2025, 1, 1, 11, 0, 0),
+        status=status,
+        pod_phase=pod_phase,
+        request={},
+        batch_job_id=batch_job_id,
+    )
+
+
+def _repository(runs):
+    mock_run_repository = Mock()
+    mock_run_repository.find_by_batch_job_ids.side_effect = lambda ids: [
+        run for run in runs if run.batch_job_id in ids
+    ]
+    mock_run_repository.find_by_ids.side_effect = lambda ids: [run for run in runs if run.id in ids]
+    return mock_run_repository
+
+
+class TestIngestBatchEventsUseCase:
+    def test_ingest_batch_events__shuffled_lifecycle__ends_at_final_status(self):
+        events = generate_batch_job_events(
+            12, [1, 2], start=datetime(2025, 1, 1, 12, 0, 0), shuffle=True, seed=7
+        )
+        batch_job_id = next(
+            event["detail"]["jobId"]
+            for event in events
+            if event["detail"]["jobName"] == "job-12-run-1"
+        )
+        first = _make_run(1, batch_job_id=batch_job_id)
+        second = _make_run(2)  # Submitted before job IDs were stored
+        mock_run_repository = _repository([first, second])
+
+        counts = ingest_batch_events(mock_run_repository, events)
+
+        for run in (first, second):
+            assert (run.status, run.pod_phase) == (RunStatus.DONE, PodPhase.SUCCEEDED)
+            assert run.status_synced_at == datetime(2025, 1, 1, 12, 0, 25)
+        assert second.batch_job_id is not None
+        assert counts == {"received": 12, "applied": 12, "ignored": 0, "invalid": 0}
+        mock_run_repository.save_all.assert_called_once()
+
+    def test_ingest_batch_events__stale_or_duplicate_event__is_ignored(self):
+        run = _make_run(1, batch_job_id="abc", status=RunStatus.RUNNING, pod_phase=PodPhase.RUNNING)
+        run.status_synced_at = datetime(2025, 1, 1, 12, 0, 20)
+        events = generate_batch_job_events(12, [1], start=datetime(2025, 1, 1, 12, 0, 0))
+        for event in events:
+            event["detail"]["jobId"] = "abc"
+        mock_run_repository = _repository([run])
+
+        counts = ingest_batch_events(mock_run_repository, events[:5] + events[4:5])
+
+        assert (run.status, run.pod_phase) == (RunStatus.RUNNING, PodPhase.RUNNING)
+        assert counts == {"received": 6, "applied": 0, "ignored": 6, "invalid": 0}
+        mock_run_repository.save_all.assert_not_called()
+
+    def test_ingest_batch_events__terminal_run__is_not_moved_backwards(self):
+        run = _make_run(1, batch_job_id="abc", status=RunStatus.DONE, pod_phase=PodPhase.SUCCEEDED)
+        events = generate_batch_job_events(12, [1], start=datetime(2025, 1, 1, 12, 0, 0))
+        running = events[4]
+        running["detail"]["jobId"] = "abc"
+
+        counts = ingest_batch_events(_repository([run]), [running])
+
+        assert run.status == RunStatus.DONE
+        assert counts["ignored"] == 1
+
+    def test_ingest_batch_events__unknown_runs_and_malformed_events__are_counted(self):
+        mock_run_repository = _repository([])
+        events = generate_batch_job_events(12, [99], start=datetime(2025, 1, 1, 12, 0, 0))[:1]
+
+        counts = ingest_batch_events(mock_run_repository, [*events, {"source": "aws.ecs"}])
+
+        assert counts == {"received": 2, "applied": 0, "ignored": 1, "invalid": 1}
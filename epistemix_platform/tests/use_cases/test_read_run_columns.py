@@ -0,0 +1,134 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from epistemix_platform.models.job import Job
+from epistemix_platform.models.job_s3_prefix import JobS3Prefix
+from epistemix_platform.models.run import Run, RunStatus
+from epistemix_platform.use_cases.read_run_columns import (
+    get_run_columnar_tables,
+    read_run_columns,
+)
+
+
+@pytest.fixture
+def job():
+    return Job(id=12, user_id=100, tags=[], created_at=datetime(2025, 10, 23, 21, 15, 0))
+
+
+@pytest.fixture
+def run():
+    return Run(
+        id=4,
+        job_id=12,
+        user_id=100,
+        created_at=datetime(2025, 10, 23, 21, 16, 0),
+        updated_at=datetime(2025, 10, 23, 22, 0, 0),
+        request={},
+        status=RunStatus.DONE,
+    )
+
+
+@pytest.fixture
+def job_repository(job):
+    repository = Mock()
+    repository.find_by_id.return_value = job
+    return repository
+
+
+@pytest.fixture
+def run_repository(run):
+    repository = Mock()
+    repository.find_by_id.return_value = run
+    return repository
+
+
+@pytest.fixture
+def results_repository():
+    return Mock()
+
+
+class TestReadRunColumns:
+    def test_read_run_columns__reads_table_under_job_prefix(
+        self, job, job_repository, run_repository, results_repository
+    ):
+        results_repository.read_columnar_table.return_value = {"N": [1000, 1001]}
+
+        data = read_run_columns(
+            job_repository,
+            run_repository,
+            results_repository,
+            job_id=12,
+            run_id=4,
+            table="RUN1/out",
+            columns=["N"],
+            start_day=0,
+            end_day=1,
+        )
+
+        assert data == {"N": [1000, 1001]}
+        results_repository.read_columnar_table.assert_called_once_with(
+            4, JobS3Prefix.from_job(job), "RUN1/out", columns=["N"], start_day=0, end_day=1
+        )
+
+    def test_read_run_columns__when_run_belongs_to_other_job__raises_value_error(
+        self, job_repository, run_repository, results_repository, run
+    ):
+        run.job_id = 99
+
+        with pytest.raises(ValueError, match="does not belong to job 12"):
+            read_run_columns(
+                job_repository, run_repository, results_repository, job_id=12, run_id=4, table="t"
+            )
+
+        results_repository.read_columnar_table.assert_not_called()
+
+    def test_read_run_columns__when_start_after_end__raises_value_error(
+        self, job_repository, run_repository, results_repository
+    ):
+        with pytest.raises(ValueError, match="after end_day"):
+            read_run_columns(
+                job_repository,
+                run_repository,
+                results_repository,
+                job_id=12,
+                run_id=4,
+                table="RUN1/out",
+                start_day=10,
+                end_day=5,
+            )
+
+
+class TestGetRunColumnarTables:
+    def test_get_run_columnar_tables__summarizes_manifest_tables(
+        self, job_repository, run_repository, results_repository
+    ):
+        results_repository.get_columnar_manifest.return_value = {
+            "format_version": 1,
+            "tables": {
+                "RUN1/out": {
+                    "path": "RUN1/out.parquet",
+                    "rows": 100,
+                    "day_column": "Day",
+                    "columns": [{"name": "Day", "type": "int64"}, {"name": "N", "type": "int64"}],
+                    "row_groups": [],
+                }
+            },
+        }
+
+        tables = get_run_columnar_tables(
+            job_repository, run_repository, results_repository, job_id=12, run_id=4
+        )
+
+        assert tables == {"RUN1/out": {"rows": 100, "day_column": "Day", "columns": ["Day", "N"]}}
+
+    def test_get_run_columnar_tables__when_job_not_found__raises_value_error(
+        self, job_repository, run_repository, results_repository
+    ):
+        job_repository.find_by_id.return_value = None
+
+        with pytest.raises(ValueError, match="Job 12 not found"):
+            get_run_columnar_tables(
+                job_repository, run_repository, results_repository, job_id=12, run_id=4
+            )
@@ -4,7 +4,10 @@ import pytest
 
 from epistemix_platform.models.upload_content import UploadContent
 from epistemix_platform.models.upload_location import UploadLocation
-from epistemix_platform.use_cases.read_upload_content import read_upload_content
+from epistemix_platform.use_cases.read_upload_content import (
+    preview_upload_content,
+    read_upload_content,
+)
 
 
 class TestReadUploadContent:
@@ -107,3 +110,19 @@ class TestReadUploadContent:
         assert upload_location_repository.read_content.call_count == 2
         upload_location_repository.read_content.assert_any_call(location1)
         upload_location_repository.read_content.assert_any_call(location2)
+
+    def test_preview_upload_content__delegates_to_repository_preview(
+        self, upload_location_repository
+    ):
+        # Arrange
+        location = UploadLocation(url="https://s3.amazonaws.com/bucket/job_input.zip")
+        expected_content = UploadContent.create_text("summary")
+        upload_location_repository.preview_content.return_value = expected_content
+
+        # Act
+        content = preview_upload_content(upload_location_repository, location)
+
+        # Assert
+        assert content == expected_content
+        upload_location_repository.preview_content.assert_called_once_with(location)
+        upload_location_repository.read_content.assert_not_called()
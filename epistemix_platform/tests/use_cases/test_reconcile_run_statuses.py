@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from epistemix_platform.models import PodPhase, Run, RunStatus, RunStatusDetail
+from epistemix_platform.use_cases.reconcile_run_statuses import reconcile_run_statuses
+
+
+def _make_run(run_id, job_id=123, synced_at=None):
+    return Run.create_persisted(
+        run_id=run_id,
+        job_id=job_id,
+        user_id=456,
+        created_at=datetime.utcnow() - timedelta(minutes=10),
+        updated_at=datetime.utcnow(),
+        status=RunStatus.SUBMITTED,
+        pod_phase=PodPhase.PENDING,
+        request={},
+        status_synced_at=synced_at,
+    )
+
+
+class TestReconcileRunStatusesUseCase:
+    def test_reconcile_run_statuses__unfinished_runs__syncs_in_bulk_and_reports_lag(self):
+        stale = _make_run(1, synced_at=datetime.utcnow() - timedelta(seconds=120))
+        never_synced = _make_run(2)
+        mock_run_repository = Mock()
+        mock_run_repository.find_unfinished.return_value = [stale, never_synced]
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.describe_runs.return_value = {
+            1: RunStatusDetail(status=RunStatus.RUNNING, message="", pod_phase=PodPhase.RUNNING),
+        }
+        synced_before = datetime.utcnow()
+
+        reconciliation = reconcile_run_statuses(
+            mock_simulation_runner,
+            mock_run_repository,
+            batch_size=50,
+            synced_before=synced_before,
+        )
+
+        mock_run_repository.find_unfinished.assert_called_once_with(
+            synced_before=synced_before, limit=50
+        )
+        mock_simulation_runner.describe_runs.assert_called_once_with([stale, never_synced])
+        mock_run_repository.save_all.assert_called_once_with([stale, never_synced])
+        assert reconciliation.swept == 2
+        assert reconciliation.changed == 1
+        assert reconciliation.max_lag_seconds >= 600  # never synced: lag since creation
+        assert 120 <= reconciliation.mean_lag_seconds < reconciliation.max_lag_seconds
+
+    def test_reconcile_run_statuses__array_children__describes_them_with_other_runs(self):
+        first, second = _make_run(1), _make_run(2)
+        first.batch_job_id = "array-parent-id:0"
+        second.batch_job_id = "array-parent-id:1"
+        mock_run_repository = Mock()
+        mock_run_repository.find_unfinished.return_value = [first, second]
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.describe_runs.return_value = {
+            2: RunStatusDetail(status=RunStatus.DONE, message="", pod_phase=PodPhase.SUCCEEDED),
+        }
+
+        reconciliation = reconcile_run_statuses(mock_simulation_runner, mock_run_repository)
+
+        mock_simulation_runner.describe_runs.assert_called_once_with([first, second])
+        assert second.status == RunStatus.DONE
+        assert reconciliation.changed == 1
+
+    def test_reconcile_run_statuses__nothing_unfinished__makes_no_batch_calls(self):
+        mock_run_repository = Mock()
+        mock_run_repository.find_unfinished.return_value = []
+        mock_simulation_runner = Mock()
+
+        reconciliation = reconcile_run_statuses(mock_simulation_runner, mock_run_repository)
+
+        assert reconciliation.swept == 0
+        assert reconciliation.max_lag_seconds == 0.0
+        mock_simulation_runner.describe_runs.assert_not_called()
+        mock_run_repository.save_all.assert_not_called()
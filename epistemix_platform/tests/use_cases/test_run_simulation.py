@@ -1,8 +1,12 @@
 from datetime import UTC, datetime
 from unittest.mock import Mock
 
-from epistemix_platform.models import Run
-from epistemix_platform.use_cases.run_simulation import run_simulation
+from epistemix_platform.models import Job, PodPhase, Run, RunStatus
+from epistemix_platform.use_cases.run_simulation import (
+    run_simulation,
+    run_simulation_arrays,
+    run_simulations,
+)
 
 
 class TestRunSimulationUseCase:
@@ -117,3 +121,152 @@ class TestRunSimulationUseCase:
         # ASSERT
         assert result is run
         mock_simulation_runner.submit_run.assert_called_once_with(run)
+
+
+class TestRunSimulationsUseCase:
+    def _make_run(self, run_id):
+        return Run.create_persisted(
+            run_id=run_id,
+            job_id=123,
+            user_id=456,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            status=RunStatus.SUBMITTED,
+            pod_phase=PodPhase.PENDING,
+            request={"simulation": "test"},
+        )
+
+    def test_run_simulations__all_submitted__returns_no_errors_and_saves_batch_job_ids(self):
+        runs = [self._make_run(1), self._make_run(2)]
+
+        def submit_runs(runs_to_submit):
+            for run in runs_to_submit:
+                run.batch_job_id = f"batch-{run.id}"
+            return {}
+
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.submit_runs.side_effect = submit_runs
+        mock_run_repository = Mock()
+
+        errors = run_simulations(
+            runs=runs,
+            simulation_runner=mock_simulation_runner,
+            run_repository=mock_run_repository,
+        )
+
+        assert errors == {}
+        mock_simulation_runner.submit_runs.assert_called_once_with(runs)
+        mock_run_repository.save_all.assert_called_once_with(runs)
+        assert [run.batch_job_id for run in runs] == ["batch-1", "batch-2"]
+
+    def test_run_simulations__some_failed__marks_failed_runs_as_error_and_saves_all(self):
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.submit_runs.return_value = {2: "AWS Batch submission failed"}
+        mock_run_repository = Mock()
+        first, second = self._make_run(1), self._make_run(2)
+
+        errors = run_simulations(
+            runs=[first, second],
+            simulation_runner=mock_simulation_runner,
+            run_repository=mock_run_repository,
+        )
+
+        assert errors == {2: ["AWS Batch submission failed"]}
+        assert first.status == RunStatus.SUBMITTED
+        assert second.status == RunStatus.ERROR
+        assert second.pod_phase == PodPhase.FAILED
+        mock_run_repository.save_all.assert_called_once_with([first, second])
+
+
+class TestRunSimulationArraysUseCase:
+    @staticmethod
+    def _make_run(run_id, job_id=123):
+        return Run.create_persisted(
+            run_id=run_id,
+            job_id=job_id,
+            user_id=456,
+            created_at=datetime.now(UTC),
+            updated_at=datetime.now(UTC),
+            status=RunStatus.SUBMITTED,
+            pod_phase=PodPhase.PENDING,
+            request={"simulation": "test"},
+        )
+
+    @staticmethod
+    def _make_job(job_id=123):
+        return Job.create_persisted(
+            job_id=job_id,
+            user_id=456,
+            tags=[],
+            created_at=datetime(2025, 10, 23, 21, 15, 0),
+            updated_at=datetime(2025, 10, 23, 21, 15, 0),
+        )
+
+    def test_run_simulation_arrays__multi_run_job__submits_one_array_and_saves_child_ids(self):
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.submit_run_array.return_value = "array-parent-id"
+        mock_simulation_runner.submit_runs.return_value = {}
+        mock_job_repository = Mock()
+        mock_job_repository.find_by_id.return_value = self._make_job()
+        mock_run_repository = Mock()
+        mock_upload_location_repository = Mock()
+        runs = [self._make_run(4), self._make_run(5), self._make_run(6)]
+
+        errors = run_simulation_arrays(
+            runs=runs,
+            simulation_runner=mock_simulation_runner,
+            job_repository=mock_job_repository,
+            run_repository=mock_run_repository,
+            upload_location_repository=mock_upload_location_repository,
+        )
+
+        assert errors == {}
+        assert [run.batch_job_id for run in runs] == [
+            "array-parent-id:0",
+            "array-parent-id:1",
+            "array-parent-id:2",
+        ]
+        mock_run_repository.save_all.assert_called_once_with(runs)
+        manifest, manifest_key = mock_simulation_runner.submit_run_array.call_args[0]
+        assert manifest.run_ids == (4, 5, 6)
+        assert manifest_key == "jobs/123/2025/10/23/211500/run_array_4_manifest.json"
+        mock_upload_location_repository.write_run_array_manifest.assert_called_once()
+        mock_simulation_runner.submit_runs.assert_not_called()
+        mock_job_repository.save.assert_not_called()
+
+    def test_run_simulation_arrays__single_run_job__falls_back_to_per_run_submission(self):
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.submit_runs.return_value = {}
+        runs = [self._make_run(4)]
+
+        run_simulation_arrays(
+            runs=runs,
+            simulation_runner=mock_simulation_runner,
+            job_repository=Mock(),
+            run_repository=Mock(),
+            upload_location_repository=Mock(),
+        )
+
+        mock_simulation_runner.submit_run_array.assert_not_called()
+        mock_simulation_runner.submit_runs.assert_called_once_with(runs)
+
+    def test_run_simulation_arrays__array_submission_fails__marks_all_runs_failed(self):
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.submit_run_array.side_effect = RuntimeError("Batch unavailable")
+        mock_job_repository = Mock()
+        mock_job_repository.find_by_id.return_value = self._make_job()
+        mock_run_repository = Mock()
+        runs = [self._make_run(4), self._make_run(5)]
+
+        errors = run_simulation_arrays(
+            runs=runs,
+            simulation_runner=mock_simulation_runner,
+            job_repository=mock_job_repository,
+            run_repository=mock_run_repository,
+            upload_location_repository=Mock(),
+        )
+
+        assert set(errors) == {4, 5}
+        assert all(run.status == RunStatus.ERROR for run in runs)
+        mock_run_repository.save_all.assert_called_once_with(runs)
+        mock_job_repository.save.assert_not_called()
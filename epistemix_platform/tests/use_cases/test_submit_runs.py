@@ -40,6 +40,12 @@ def bearer_token():
     return f"Bearer {token_b64}"
 
 
+def _assign_ids(runs):
+    for run_id, run in enumerate(runs, start=1):
+        run.id = run_id
+    return runs
+
+
 @freeze_time("2025-01-01 12:00:00")
 class TestSubmitRunsUseCase:
     @pytest.fixture
@@ -76,17 +82,7 @@ class TestSubmitRunsUseCase:
         run_request,
         bearer_token,
     ):
-        mock_repository.save.return_value = Run.create_persisted(
-            run_id=1,
-            user_id=123,
-            job_id=1,
-            status=RunStatus.SUBMITTED,
-            pod_phase=PodPhase.PENDING,
-            request=run_request,
-            created_at=datetime(2025, 1, 1, 12, 0, 0),
-            updated_at=datetime(2025, 1, 1, 12, 0, 0),
-            config_url="https://example.com/presigned-url",
-        )
+        mock_repository.save_all.side_effect = _assign_ids
 
         expected_runs = [
             Run.create_persisted(
@@ -111,6 +107,51 @@ class TestSubmitRunsUseCase:
 
         assert result == expected_runs
 
+    def test_submit_runs__many_runs_for_one_job__fetches_job_once_and_saves_in_bulk(
+        self,
+        mock_job_repository,
+        mock_repository,
+        mock_upload_location_repository,
+        run_request,
+        bearer_token,
+    ):
+        mock_repository.save_all.side_effect = _assign_ids
+
+        result = submit_runs(
+            mock_job_repository,
+            mock_repository,
+            mock_upload_location_repository,
+            [dict(run_request) for _ in range(5)],
+            bearer_token,
+        )
+
+        assert [run.id for run in result] == [1, 2, 3, 4, 5]
+        assert all(run.config_url == "https://example.com/presigned-url" for run in result)
+        mock_job_repository.find_by_id.assert_called_once_with(1)
+        assert mock_repository.save_all.call_count == 2
+        mock_repository.save.assert_not_called()
+
+    def test_submit_runs__job_not_found__raises_value_error_before_saving(
+        self,
+        mock_job_repository,
+        mock_repository,
+        mock_upload_location_repository,
+        run_request,
+        bearer_token,
+    ):
+        mock_job_repository.find_by_id.return_value = None
+
+        with pytest.raises(ValueError, match="Job 1 not found"):
+            submit_runs(
+                mock_job_repository,
+                mock_repository,
+                mock_upload_location_repository,
+                [run_request],
+                bearer_token,
+            )
+
+        mock_repository.save_all.assert_not_called()
+
     def test_submit_runs__raises_value_error_when_invalid_token(
         self, mock_job_repository, mock_repository, mock_upload_location_repository, run_request
     ):
@@ -238,3 +279,30 @@ class TestSubmitRunsSQLAlchemyRunRepositoryIntegration:
                 [run_request],
                 invalid_token,
             )
+
+    @freeze_time("2025-01-01 12:00:00")
+    def test_submit_runs__runs_across_jobs__persists_config_urls_for_each_run(
+        self,
+        job_repository,
+        run_repository,
+        upload_location_repository,
+        run_request,
+        bearer_token,
+        db_session,
+    ):
+        first_job = job_repository.save(Job.create_new(user_id=123, tags=["test"]))
+        second_job = job_repository.save(Job.create_new(user_id=123, tags=["test"]))
+        db_session.commit()
+
+        run_requests = [
+            {**run_request, "jobId": job_id}
+            for job_id in (first_job.id, second_job.id, first_job.id)
+        ]
+        submit_runs(
+            job_repository, run_repository, upload_location_repository, run_requests, bearer_token
+        )
+        db_session.commit()
+
+        saved_runs = [run_repository.find_by_id(run_id) for run_id in (1, 2, 3)]
+        assert [run.job_id for run in saved_runs] == [first_job.id, second_job.id, first_job.id]
+        assert all(run.config_url == "https://example.com/presigned-url" for run in saved_runs)
@@ -0,0 +1,96 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+from epistemix_platform.models import PodPhase, Run, RunStatus, RunStatusDetail
+from epistemix_platform.use_cases.update_run_status import update_run_statuses
+
+
+def _make_run(run_id, status=RunStatus.SUBMITTED, pod_phase=PodPhase.PENDING, synced_at=None):
+    return Run.create_persisted(
+        run_id=run_id,
+        job_id=123,
+        user_id=456,
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+        status=status,
+        pod_phase=pod_phase,
+        request={},
+        status_synced_at=synced_at,
+    )
+
+
+class TestUpdateRunStatusesUseCase:
+    def test_update_run_statuses__some_changed__returns_changed_and_saves_synced_runs_in_bulk(self):
+        unchanged, changed, missing = _make_run(1), _make_run(2), _make_run(3)
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.describe_runs.return_value = {
+            1: RunStatusDetail(status=RunStatus.SUBMITTED, message="", pod_phase=PodPhase.PENDING),
+            2: RunStatusDetail(status=RunStatus.RUNNING, message="", pod_phase=PodPhase.RUNNING),
+        }
+        mock_run_repository = Mock()
+
+        changed_runs = update_run_statuses(
+            mock_simulation_runner, mock_run_repository, [unchanged, changed, missing]
+        )
+
+        assert changed_runs == [changed]
+        assert changed.status == RunStatus.RUNNING
+        assert missing.status == RunStatus.SUBMITTED
+        mock_simulation_runner.describe_runs.assert_called_once()
+        mock_run_repository.save_all.assert_called_once_with([unchanged, changed, missing])
+        mock_run_repository.save.assert_not_called()
+        assert unchanged.status_synced_at is not None
+
+    def test_update_run_statuses__nothing_changed__records_sync_time(self):
+        run = _make_run(1)
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.describe_runs.return_value = {}
+        mock_run_repository = Mock()
+
+        assert update_run_statuses(mock_simulation_runner, mock_run_repository, [run]) == []
+        mock_run_repository.save_all.assert_called_once_with([run])
+        assert run.status_synced_at is not None
+
+    def test_update_run_statuses__terminal_runs__are_not_sent_to_batch(self):
+        done = _make_run(1, status=RunStatus.DONE, pod_phase=PodPhase.SUCCEEDED)
+        failed = _make_run(2, status=RunStatus.ERROR, pod_phase=PodPhase.FAILED)
+        mock_simulation_runner = Mock()
+        mock_run_repository = Mock()
+
+        assert (
+            update_run_statuses(mock_simulation_runner, mock_run_repository, [done, failed]) == []
+        )
+        mock_simulation_runner.describe_runs.assert_not_called()
+        mock_run_repository.save_all.assert_not_called()
+
+    def test_update_run_statuses__batch_unavailable_error__is_synced_again(self):
+        degraded = _make_run(1, status=RunStatus.ERROR, pod_phase=PodPhase.UNKNOWN)
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.describe_runs.return_value = {}
+
+        update_run_statuses(mock_simulation_runner, Mock(), [degraded])
+
+        mock_simulation_runner.describe_runs.assert_called_once_with([degraded])
+
+    def test_update_run_statuses__within_ttl__served_from_database(self):
+        fresh = _make_run(1, synced_at=datetime.utcnow() - timedelta(seconds=5))
+        stale = _make_run(2, synced_at=datetime.utcnow() - timedelta(seconds=60))
+        never_synced = _make_run(3)
+        mock_simulation_runner = Mock()
+        mock_simulation_runner.describe_runs.return_value = {
+            2: RunStatusDetail(status=RunStatus.RUNNING, message="", pod_phase=PodPhase.RUNNING),
+        }
+        mock_run_repository = Mock()
+
+        changed_runs = update_run_statuses(
+            mock_simulation_runner,
+            mock_run_repository,
+            [fresh, stale, never_synced],
+            status_ttl_seconds=30,
+        )
+
+        assert changed_runs == [stale]
+        mock_simulation_runner.describe_runs.assert_called_once_with([stale, never_synced])
+        mock_run_repository.save_all.assert_called_once_with([stale, never_synced])
+        assert stale.status_synced_at == never_synced.status_synced_at
+        assert stale.status_synced_at > fresh.status_synced_at
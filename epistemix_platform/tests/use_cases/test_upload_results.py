@@ -4,10 +4,15 @@ from unittest.mock import MagicMock, Mock
 import pytest
 from freezegun import freeze_time
 
+from epistemix_platform.exceptions import ResultsStorageError
+from epistemix_platform.models.results_manifest import ResultsManifest
 from epistemix_platform.models.run import Run, RunStatus
 from epistemix_platform.use_cases.upload_results import PackagedResults, upload_results
 
 
+RESULTS_MANIFEST = ResultsManifest(files={"RUN4/out1.txt": "aa", "RUN4/out2.txt": "bb"})
+
+
 @pytest.fixture
 def mock_run_repository():
     return Mock()
@@ -15,12 +20,17 @@ def mock_run_repository():
 
 @pytest.fixture
 def mock_results_packager():
-    return Mock()
+    packager = Mock()
+    packager.build_manifest.return_value = RESULTS_MANIFEST
+    return packager
 
 
 @pytest.fixture
 def mock_results_repository():
-    return Mock()
+    repository = Mock()
+    # No previous upload, so every test uploads unless it sets a manifest
+    repository.get_results_manifest.return_value = None
+    return repository
 
 
 @pytest.fixture
@@ -126,6 +136,213 @@ class TestUploadResults:
             == "https://epistemix-uploads-staging.s3.amazonaws.com/results/job_123/run_1.zip"
         )
 
+    def test_upload_results__with_columnar_dir__uploads_parquet_results_next_to_zip(
+        self,
+        mock_run_repository,
+        mock_job_repository,
+        mock_results_packager,
+        mock_results_repository,
+        sample_job,
+        completed_run,
+        results_dir,
+        tmp_path,
+    ):
+        # Arrange
+        mock_job_repository.find_by_id.return_value = sample_job
+        mock_run_repository.find_by_id.return_value = completed_run
+        mock_results_packager.package_directory.return_value = PackagedResults(
+            zip_content=b"fake zip content",
+            file_count=3,
+            total_size_bytes=100,
+            directory_name="RUN4",
+        )
+        mock_results_repository.upload_results.return_value = Mock(url="https://s3/run_1.zip")
+        columnar_dir = tmp_path / "COLUMNAR" / "run_1"
+
+        # Act
+        upload_results(
+            run_repository=mock_run_repository,
+            job_repository=mock_job_repository,
+            results_packager=mock_results_packager,
+            results_repository=mock_results_repository,
+            job_id=123,
+            run_id=1,
+            results_dir=results_dir,
+            columnar_dir=columnar_dir,
+        )
+
+        # Assert
+        call_args = mock_results_repository.upload_columnar_results.call_args
+        assert call_args.kwargs["columnar_dir"] == columnar_dir
+        assert (
+            call_args.kwargs["s3_prefix"]
+            == mock_results_repository.upload_results.call_args.kwargs["s3_prefix"]
+        )
+        assert completed_run.results_url == "https://s3/run_1.zip"
+
+    def test_upload_results__without_columnar_dir__uploads_only_zip(
+        self,
+        mock_run_repository,
+        mock_job_repository,
+        mock_results_packager,
+        mock_results_repository,
+        sample_job,
+        completed_run,
+        results_dir,
+    ):
+        # Arrange
+        mock_job_repository.find_by_id.return_value = sample_job
+        mock_run_repository.find_by_id.return_value = completed_run
+        mock_results_packager.package_directory.return_value = PackagedResults(
+            zip_content=b"fake zip content",
+            file_count=3,
+            total_size_bytes=100,
+            directory_name="RUN4",
+        )
+        mock_results_repository.upload_results.return_value = Mock(url="https://s3/run_1.zip")
+
+        # Act
+        upload_results(
+            run_repository=mock_run_repository,
+            job_repository=mock_job_repository,
+            results_packager=mock_results_packager,
+            results_repository=mock_results_repository,
+            job_id=123,
+            run_id=1,
+            results_dir=results_dir,
+        )
+
+        # Assert
+        mock_results_repository.upload_columnar_results.assert_not_called()
+
+    def test_upload_results__when_files_unchanged__skips_packaging_and_upload(
+        self,
+        mock_run_repository,
+        mock_job_repository,
+        mock_results_packager,
+        mock_results_repository,
+        sample_job,
+        completed_run,
+        results_dir,
+    ):
+        # Arrange
+        mock_job_repository.find_by_id.return_value = sample_job
+        mock_run_repository.find_by_id.return_value = completed_run
+        mock_results_repository.get_results_manifest.return_value = ResultsManifest(
+            files=dict(RESULTS_MANIFEST.files),
+            results_url="https://s3/run_1.zip",
+            results_etag='"etag"',
+        )
+
+        # Act
+        results_url = upload_results(
+            run_repository=mock_run_repository,
+            job_repository=mock_job_repository,
+            results_packager=mock_results_packager,
+            results_repository=mock_results_repository,
+            job_id=123,
+            run_id=1,
+            results_dir=results_dir,
+        )
+
+        # Assert
+        assert results_url == "https://s3/run_1.zip"
+        mock_results_packager.build_manifest.assert_called_once_with(results_dir)
+        mock_results_packager.package_directory.assert_not_called()
+        mock_results_repository.upload_results.assert_not_called()
+        mock_results_repository.save_results_manifest.assert_not_called()
+        assert completed_run.status == RunStatus.DONE
+        mock_run_repository.save.assert_called_once_with(completed_run)
+
+    def test_upload_results__when_files_changed__uploads_zip_and_saves_manifest(
+        self,
+        mock_run_repository,
+        mock_job_repository,
+        mock_results_packager,
+        mock_results_repository,
+        sample_job,
+        completed_run,
+        results_dir,
+    ):
+        # Arrange
+        mock_job_repository.find_by_id.return_value = sample_job
+        mock_run_repository.find_by_id.return_value = completed_run
+        mock_results_repository.get_results_manifest.return_value = ResultsManifest(
+            files={"RUN4/out1.txt": "aa", "RUN4/out2.txt": "old"},
+            results_url="https://s3/run_1.zip",
+            results_etag='"etag"',
+        )
+        mock_results_packager.package_directory.return_value = PackagedResults(
+            zip_content=b"fake zip content",
+            file_count=2,
+            total_size_bytes=100,
+            directory_name="RUN4",
+        )
+        mock_results_repository.upload_results.return_value = Mock(url="https://s3/run_1.zip")
+
+        # Act
+        upload_results(
+            run_repository=mock_run_repository,
+            job_repository=mock_job_repository,
+            results_packager=mock_results_packager,
+            results_repository=mock_results_repository,
+            job_id=123,
+            run_id=1,
+            results_dir=results_dir,
+        )
+
+        # Assert
+        mock_results_repository.upload_results.assert_called_once()
+        save_call = mock_results_repository.save_results_manifest.call_args
+        assert save_call.kwargs["manifest"] == RESULTS_MANIFEST
+        assert (
+            save_call.kwargs["s3_prefix"]
+            == mock_results_repository.upload_results.call_args.kwargs["s3_prefix"]
+        )
+
+    def test_upload_results__when_manifest_storage_fails__still_uploads_results(
+        self,
+        mock_run_repository,
+        mock_job_repository,
+        mock_results_packager,
+        mock_results_repository,
+        sample_job,
+        completed_run,
+        results_dir,
+    ):
+        # Arrange
+        mock_job_repository.find_by_id.return_value = sample_job
+        mock_run_repository.find_by_id.return_value = completed_run
+        mock_results_repository.get_results_manifest.side_effect = ResultsStorageError(
+            "Failed to read results manifest", sanitized=True
+        )
+        mock_results_repository.save_results_manifest.side_effect = ResultsStorageError(
+            "Failed to upload results manifest", sanitized=True
+        )
+        mock_results_packager.package_directory.return_value = PackagedResults(
+            zip_content=b"fake zip content",
+            file_count=2,
+            total_size_bytes=100,
+            directory_name="RUN4",
+        )
+        mock_results_repository.upload_results.return_value = Mock(url="https://s3/run_1.zip")
+
+        # Act
+        results_url = upload_results(
+            run_repository=mock_run_repository,
+            job_repository=mock_job_repository,
+            results_packager=mock_results_packager,
+            results_repository=mock_results_repository,
+            job_id=123,
+            run_id=1,
+            results_dir=results_dir,
+        )
+
+        # Assert
+        assert results_url == "https://s3/run_1.zip"
+        mock_results_repository.upload_results.assert_called_once()
+        mock_run_repository.save.assert_called_once_with(completed_run)
+
     def test_upload_results__when_run_not_found__raises_value_error(
         self,
         mock_run_repository,
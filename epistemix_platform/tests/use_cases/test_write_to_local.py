@@ -1,6 +1,6 @@
 import pytest
 
-from epistemix_platform.models.upload_content import UploadContent
+from epistemix_platform.models.upload_content import UploadContent, ZipFileEntry
 from epistemix_platform.use_cases.write_to_local import write_to_local
 
 
@@ -99,3 +99,12 @@ class TestWriteToLocal:
             write_to_local(file_path, "not an UploadContent object")
 
         assert "content must be an UploadContent object" in str(exc_info.value)
+
+    def test_write_to_local__with_zip_preview__raises_value_error(self, tmp_path):
+        content = UploadContent.create_zip_preview(
+            [ZipFileEntry(name="main.fred", size=10, compressed_size=8)], "1 file"
+        )
+
+        with pytest.raises(ValueError, match="no archive bytes"):
+            write_to_local(tmp_path / "job_input.zip", content)
+        assert not (tmp_path / "job_input.zip").exists()
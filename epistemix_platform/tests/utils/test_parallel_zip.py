@@ -0,0 +1,84 @@
+import os
+import sys
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from epistemix_platform.utils.parallel_zip import write_parallel_zip
+
+
+@pytest.fixture
+def results_files(tmp_path):
+    run_dir = tmp_path / "RUN1"
+    (run_dir / "DAILY").mkdir(parents=True)
+    files = {
+        "RUN1/out.csv": b"day,infected\n" + b"".join(b"%d,%d\n" % (d, d * 3) for d in range(5000)),
+        "RUN1/DAILY/Cases.txt": b"0 1 2 3 4 5\n" * 20000,
+        "RUN1/population.bin": os.urandom(256 * 1024),
+        "RUN1/plot.png": b"\x89PNG" + b"\x00" * 4096,
+        "RUN1/empty.txt": b"",
+    }
+    for arcname, content in files.items():
+        (tmp_path / arcname).write_bytes(content)
+    return tmp_path, files
+
+
+def _entries(root, files):
+    return [(root / arcname, arcname) for arcname in files]
+
+
+class TestWriteParallelZip:
+    def test_write_parallel_zip__mixed_outputs__readable_by_zipfile_in_order(self, results_files):
+        root, files = results_files
+        output = BytesIO()
+
+        count = write_parallel_zip(_entries(root, files), output, workers=4)
+
+        output.seek(0)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == list(files)
+            for arcname, content in files.items():
+                assert zf.read(arcname) == content
+        assert count == len(files)
+
+    def test_write_parallel_zip__incompressible_or_compressed_outputs__are_stored(
+        self, results_files
+    ):
+        root, files = results_files
+        output = BytesIO()
+
+        write_parallel_zip(_entries(root, files), output, workers=2)
+
+        output.seek(0)
+        with zipfile.ZipFile(output) as zf:
+            methods = {info.filename: info.compress_type for info in zf.infolist()}
+        assert methods["RUN1/population.bin"] == zipfile.ZIP_STORED
+        assert methods["RUN1/plot.png"] == zipfile.ZIP_STORED
+        assert methods["RUN1/out.csv"] == zipfile.ZIP_DEFLATED
+        assert methods["RUN1/DAILY/Cases.txt"] == zipfile.ZIP_DEFLATED
+
+    def test_write_parallel_zip__beyond_zip64_limits__writes_zip64_records(
+        self, results_files, monkeypatch
+    ):
+        root, files = results_files
+        module = sys.modules[write_parallel_zip.__module__]
+        monkeypatch.setattr(module, "_ZIP64_LIMIT", 1024)
+        monkeypatch.setattr(module, "_ZIP64_COUNT_LIMIT", 2)
+        output = BytesIO()
+
+        write_parallel_zip(_entries(root, files), output, workers=3)
+
+        output.seek(0)
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.read("RUN1/population.bin") == files["RUN1/population.bin"]
+            assert len(zf.infolist()) == len(files)
+
+    def test_write_parallel_zip__unreadable_file__raises_os_error(self, results_files):
+        root, files = results_files
+        entries = [*_entries(root, files), (root / "RUN1" / "missing.txt", "RUN1/missing.txt")]
+
+        with pytest.raises(OSError):
+            write_parallel_zip(entries, BytesIO(), workers=2)
@@ -0,0 +1,143 @@
+"""
+AWS Batch array-job manifest resolution.
+
+When the platform submits a multi-run job as a Batch array job, every child
+container runs the same command and only differs by the
+AWS_BATCH_JOB_ARRAY_INDEX environment variable. The platform uploads a
+manifest mapping each index to a run ID under the job's S3 prefix::
+
+    {"jobId": 12, "runIds": [4, 5, 6]}
+
+This module resolves the run ID a child container should execute.
+"""
+
+import json
+import logging
+import os
+from typing import Any
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from simulation_runner.exceptions import ConfigurationError
+
+
+logger = logging.getLogger(__name__)
+
+ARRAY_INDEX_ENV_VAR = "AWS_BATCH_JOB_ARRAY_INDEX"
+
+
+def get_array_index() -> int:
+    """
+    Read the array child index that AWS Batch assigns to this container.
+
+    Returns
+    -------
+    int
+        Zero-based array index
+
+    Raises
+    ------
+    ConfigurationError
+        If AWS_BATCH_JOB_ARRAY_INDEX is missing or not an integer
+    """
+    value = os.getenv(ARRAY_INDEX_ENV_VAR)
+    if value is None:
+        raise ConfigurationError(
+            f"{ARRAY_INDEX_ENV_VAR} is not set; --array-manifest requires an AWS Batch array job"
+        )
+    try:
+        return int(value)
+    except ValueError as e:
+        raise ConfigurationError(f"Invalid {ARRAY_INDEX_ENV_VAR}: {value!r}") from e
+
+
+def load_manifest(
+    manifest_key: str, s3_bucket: str, aws_region: str, s3_client: Any | None = None
+) -> dict:
+    """
+    Download an array-job manifest from S3.
+
+    Parameters
+    ----------
+    manifest_key : str
+        S3 key of the manifest JSON
+    s3_bucket : str
+        Bucket holding job uploads (EPISTEMIX_S3_BUCKET)
+    aws_region : str
+        AWS region of the bucket
+    s3_client : Any, optional
+        boto3 S3 client (created if not provided)
+
+    Returns
+    -------
+    dict
+        Parsed manifest with "jobId" and "runIds"
+
+    Raises
+    ------
+    ConfigurationError
+        If the bucket is not configured or the manifest cannot be read
+    """
+    if not s3_bucket:
+        raise ConfigurationError("EPISTEMIX_S3_BUCKET is required to read the array manifest")
+
+    client = s3_client or boto3.client("s3", region_name=aws_region)
+    try:
+        response = client.get_object(Bucket=s3_bucket, Key=manifest_key)
+        return json.loads(response["Body"].read())
+    except (ClientError, BotoCoreError, json.JSONDecodeError) as e:
+        raise ConfigurationError(
+            f"Failed to read array manifest s3://{s3_bucket}/{manifest_key}: {e}"
+        ) from e
+
+
+def resolve_array_run_id(
+    job_id: int,
+    manifest: dict,
+    array_index: int,
+) -> int:
+    """
+    Map an array child index to its run ID.
+
+    Parameters
+    ----------
+    job_id : int
+        Job ID the container was started for (checked against the manifest)
+    manifest : dict
+        Parsed manifest with "jobId" and "runIds"
+    array_index : int
+        Zero-based array index from AWS_BATCH_JOB_ARRAY_INDEX
+
+    Returns
+    -------
+    int
+        Run ID this child should execute
+
+    Raises
+    ------
+    ConfigurationError
+        If the manifest belongs to another job or the index is out of range
+
+    Examples
+    --------
+    >>> resolve_array_run_id(12, {"jobId": 12, "runIds": [4, 5, 6]}, 1)
+    5
+    """
+    if int(manifest.get("jobId", -1)) != job_id:
+        raise ConfigurationError(
+            f"Array manifest is for job {manifest.get('jobId')}, not job {job_id}"
+        )
+
+    run_ids = manifest.get("runIds", [])
+    if not 0 <= array_index < len(run_ids):
+        raise ConfigurationError(
+            f"Array index {array_index} out of range for manifest with {len(run_ids)} runs"
+        )
+
+    run_id = int(run_ids[array_index])
+    logger.info(
+        "Resolved array child to run",
+        extra={"job_id": job_id, "array_index": array_index, "run_id": run_id},
+    )
+    return run_id
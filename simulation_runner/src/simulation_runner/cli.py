@@ -9,6 +9,7 @@ Usage:
     simulation-runner run --job-id 12 --run-id 4
     simulation-runner validate --job-id 12
     simulation-runner prepare --job-id 12 --run-id 4
+    simulation-runner warm-cache --population-version US_2010.v5 --location Allegheny_County_PA
 """
 
 # Bootstrap configuration MUST happen before other imports
@@ -20,11 +21,13 @@ bootstrap_config()
 
 # Standard imports after bootstrap
 import logging
+import os
 from pathlib import Path
 
 import click
 
 from simulation_runner import __version__
+from simulation_runner.array_manifest import get_array_index, load_manifest, resolve_array_run_id
 from simulation_runner.config import SimulationConfig
 from simulation_runner.exceptions import (
     ConfigurationError,
@@ -34,6 +37,13 @@ from simulation_runner.exceptions import (
     WorkflowError,
 )
 from simulation_runner.fred_config_builder import FREDConfigBuilder
+from simulation_runner.platform_client import TRANSFER_MODES
+from simulation_runner.population_cache import (
+    DEFAULT_CACHE_PREFIX,
+    DEFAULT_MAX_CACHE_GB,
+    PopulationCache,
+)
+from simulation_runner.scheduler import FAILURE_POLICIES
 from simulation_runner.workflow import SimulationWorkflow
 
 
@@ -62,24 +72,73 @@ def cli(log_level: str):
 @cli.command()
 @click.option("--job-id", required=True, type=int, help="Job ID to process")
 @click.option("--run-id", type=int, help="Specific run ID to process (optional)")
-def run(job_id: int, run_id: int | None):
+@click.option(
+    "--array-manifest",
+    help="S3 key of an AWS Batch array-job manifest; the run ID is taken from "
+    "AWS_BATCH_JOB_ARRAY_INDEX",
+)
+@click.option(
+    "--parallel-runs",
+    type=click.IntRange(min=1),
+    help="Most FRED runs executed at once (defaults to MAX_PARALLEL_RUNS, "
+    "else sized from CPUs and memory)",
+)
+@click.option(
+    "--failure-policy",
+    type=click.Choice(FAILURE_POLICIES),
+    help="Stop the other runs when one fails, or let them finish "
+    "(defaults to RUN_FAILURE_POLICY, else fail-fast)",
+)
+@click.option(
+    "--transfer-mode",
+    type=click.Choice(TRANSFER_MODES),
+    help="Download and upload in-process or with epistemix-cli "
+    "(defaults to TRANSFER_MODE, else auto)",
+)
+def run(
+    job_id: int,
+    run_id: int | None,
+    array_manifest: str | None,
+    parallel_runs: int | None,
+    failure_policy: str | None,
+    transfer_mode: str | None,
+):
     """
     Run complete simulation workflow.
 
     Downloads job uploads, prepares FRED configurations, validates them,
-    and executes simulations.
+    and executes simulations. Without --run-id, several runs execute at
+    once and each run's results are uploaded as soon as it finishes.
 
     Examples:
         simulation-runner run --job-id 12
+        simulation-runner run --job-id 12 --parallel-runs 4 --failure-policy continue
         simulation-runner run --job-id 12 --run-id 4
+        simulation-runner run --job-id 12 --array-manifest jobs/12/.../run_array_4_manifest.json
     """
+    if array_manifest and run_id:
+        raise click.UsageError("--run-id and --array-manifest are mutually exclusive")
+
     try:
+        if array_manifest:
+            manifest_config = SimulationConfig.from_env(job_id)
+            manifest = load_manifest(
+                array_manifest, manifest_config.s3_bucket, manifest_config.aws_region
+            )
+            run_id = resolve_array_run_id(job_id, manifest, get_array_index())
+
         click.echo(f"Starting simulation workflow for job {job_id}")
         if run_id:
             click.echo(f"Processing run {run_id}")
 
         # Load configuration
         config = SimulationConfig.from_env(job_id, run_id)
+        if parallel_runs is not None:
+            config.max_parallel_runs = parallel_runs
+        if failure_policy is not None:
+            config.failure_policy = failure_policy
+        if transfer_mode is not None:
+            config.transfer_mode = transfer_mode
 
         # Validate configuration
         errors = config.validate()
@@ -271,6 +330,89 @@ def download(job_id: int, output_dir: Path | None):
         raise click.ClickException(f"Unexpected error: {e}") from e
 
 
+@cli.command("warm-cache")
+@click.option("--population-version", required=True, help="Synthetic population version")
+@click.option(
+    "--location", "locations", required=True, multiple=True, help="Location to cache (repeatable)"
+)
+@click.option(
+    "--cache-dir",
+    required=True,
+    envvar="POPULATION_CACHE_DIR",
+    type=click.Path(path_type=Path),
+    help="Population cache directory (default: POPULATION_CACHE_DIR)",
+)
+@click.option(
+    "--data-dir",
+    type=click.Path(path_type=Path),
+    help="FRED data directory to place the files in (default: only fill the cache)",
+)
+@click.option(
+    "--bucket",
+    required=True,
+    envvar=["POPULATION_CACHE_BUCKET", "EPISTEMIX_S3_BUCKET"],
+    help="S3 bucket holding the population data (default: POPULATION_CACHE_BUCKET)",
+)
+@click.option(
+    "--prefix",
+    envvar="POPULATION_CACHE_PREFIX",
+    default=DEFAULT_CACHE_PREFIX,
+    show_default=True,
+    help="S3 key prefix of the population data",
+)
+@click.option(
+    "--max-gb",
+    envvar="POPULATION_CACHE_MAX_GB",
+    type=float,
+    default=DEFAULT_MAX_CACHE_GB,
+    show_default=True,
+    help="Size cap of the cache directory (0 = unlimited)",
+)
+def warm_cache(
+    population_version: str,
+    locations: tuple[str, ...],
+    cache_dir: Path,
+    data_dir: Path | None,
+    bucket: str,
+    prefix: str,
+    max_gb: float,
+):
+    """
+    Fetch locations' population data into the population cache.
+
+    Run on an instance (e.g. from its launch template) to pre-warm the
+    host cache before jobs for the expected locations arrive.
+
+    Examples:
+        simulation-runner warm-cache --population-version US_2010.v5 \\
+            --location Allegheny_County_PA --location Philadelphia_County_PA
+    """
+    try:
+        cache = PopulationCache(
+            cache_dir=cache_dir,
+            data_dir=data_dir,
+            s3_bucket=bucket,
+            prefix=prefix,
+            max_bytes=int(max_gb * 1024**3),
+            aws_region=os.getenv("AWS_REGION", "us-east-1"),
+        )
+        result = cache.warm((population_version, location) for location in locations)
+
+        click.echo(f"✓ Cached {len(result.locations)} locations in {cache_dir}")
+        click.echo(f"  Already present: {result.present}")
+        click.echo(f"  From cache:      {result.cached}")
+        click.echo(f"  Fetched:         {result.fetched} ({result.bytes_fetched / 1024**2:.1f} MB)")
+        click.echo(f"  Evicted:         {result.evicted}")
+        for location in result.unpublished:
+            click.echo(f"  ⚠ No manifest published for {location}")
+
+    except SimulationRunnerError as e:
+        raise click.ClickException(f"Cache warm failed: {e}") from e
+    except Exception as e:
+        logger.exception("Unexpected error")
+        raise click.ClickException(f"Unexpected error: {e}") from e
+
+
 @cli.command()
 def version():
     """Show simulation runner version."""
@@ -293,6 +435,12 @@ def config():
         click.echo(f"EPISTEMIX_S3_BUCKET: {test_config.s3_bucket or '(not set)'}")
         click.echo(f"AWS_REGION:         {test_config.aws_region}")
         click.echo(f"DATABASE_URL:       {test_config.database_url}")
+        click.echo(f"MAX_PARALLEL_RUNS:  {test_config.max_parallel_runs or '(auto)'}")
+        click.echo(f"FRED_RUN_MEMORY_MB: {test_config.run_memory_mb}")
+        click.echo(f"RUN_FAILURE_POLICY: {test_config.failure_policy}")
+        click.echo(f"UPLOAD_CONCURRENCY: {test_config.upload_concurrency}")
+        click.echo(f"TRANSFER_MODE:      {test_config.transfer_mode}")
+        click.echo(f"POPULATION_CACHE_DIR: {test_config.population_cache_dir or '(disabled)'}")
         click.echo("=" * 60)
 
         # Validate
@@ -0,0 +1,175 @@
+"""
+Columnar (Parquet) conversion of FRED outputs.
+
+FRED writes its per-day statistics as CSV files inside each RUN* directory
+(``RUN1/out.csv``, ``RUN1/Influenza.csv``, ...). Answering a question about a
+run from the results ZIP means downloading and parsing all of them. This
+module converts those CSVs to Parquet files, split into row groups of
+consecutive days, and writes a manifest describing them::
+
+    columnar/
+      manifest.json
+      RUN1/out.parquet
+      RUN1/Influenza.parquet
+
+The manifest records, for every table, the day range and the byte offset and
+length of each column chunk in each row group, plus the Parquet footer
+location. A reader can then fetch a single column or a range of days from S3
+with HTTP range requests instead of downloading whole files.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from simulation_runner.exceptions import ConversionError
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# Rows per Parquet row group; FRED writes one row per simulated day, so a
+# date-range read fetches at most one partial row group at each end
+DEFAULT_ROW_GROUP_DAYS = 64
+
+# Column FRED uses for the simulation day, matched case-insensitively
+DAY_COLUMN_NAMES = ("day", "sim_day")
+
+
+def convert_results_to_parquet(
+    output_dir: Path,
+    columnar_dir: Path,
+    row_group_days: int = DEFAULT_ROW_GROUP_DAYS,
+) -> dict[str, Any]:
+    """
+    Convert the CSV outputs of every RUN* directory to Parquet.
+
+    Parameters
+    ----------
+    output_dir : Path
+        FRED output directory: either a parent of RUN* directories or a
+        single RUN* directory
+    columnar_dir : Path
+        Directory to write the Parquet files and manifest.json to
+    row_group_days : int
+        Rows (days) per Parquet row group
+
+    Returns
+    -------
+    dict
+        The manifest written to columnar_dir/manifest.json
+
+    Raises
+    ------
+    ConversionError
+        If no CSV outputs are found or a CSV cannot be parsed or written
+
+    Examples
+    --------
+    >>> manifest = convert_results_to_parquet(Path("OUT/run_4"), Path("COLUMNAR/run_4"))
+    >>> sorted(manifest["tables"])
+    ['RUN1/Influenza', 'RUN1/out']
+    """
+    if output_dir.name.startswith("RUN"):
+        run_dirs = [output_dir]
+    else:
+        run_dirs = sorted(p for p in output_dir.glob("RUN*") if p.is_dir())
+
+    csv_files = [
+        (run_dir, csv_file) for run_dir in run_dirs for csv_file in sorted(run_dir.rglob("*.csv"))
+    ]
+    if not csv_files:
+        raise ConversionError(f"No CSV outputs found in {output_dir}")
+
+    tables = {}
+    for run_dir, csv_file in csv_files:
+        table_name = (Path(run_dir.name) / csv_file.relative_to(run_dir)).with_suffix("")
+        parquet_path = columnar_dir / table_name.with_suffix(".parquet")
+        tables[table_name.as_posix()] = _convert_table(
+            csv_file, parquet_path, columnar_dir, row_group_days
+        )
+
+    manifest = {"format_version": MANIFEST_FORMAT_VERSION, "tables": tables}
+    (columnar_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+
+    logger.info(
+        "Converted outputs to Parquet",
+        extra={"output_dir": str(output_dir), "table_count": len(tables)},
+    )
+    return manifest
+
+
+def _convert_table(
+    csv_file: Path, parquet_path: Path, columnar_dir: Path, row_group_days: int
+) -> dict[str, Any]:
+    """Write one CSV as Parquet and describe its layout for the manifest."""
+    try:
+        table = pa_csv.read_csv(csv_file)
+        day_column = _find_day_column(table.schema)
+        if day_column is not None:
+            table = table.sort_by(day_column)
+
+        parquet_path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(table, parquet_path, row_group_size=row_group_days, write_statistics=True)
+        metadata = pq.ParquetFile(parquet_path).metadata
+    except (OSError, pa.ArrowException) as e:
+        raise ConversionError(f"Failed to convert {csv_file} to Parquet: {e}") from e
+
+    file_size = parquet_path.stat().st_size
+    return {
+        "path": parquet_path.relative_to(columnar_dir).as_posix(),
+        "size": file_size,
+        "rows": metadata.num_rows,
+        "day_column": day_column,
+        "columns": [{"name": field.name, "type": str(field.type)} for field in table.schema],
+        "footer": _footer_range(parquet_path, file_size),
+        "row_groups": [
+            _describe_row_group(metadata.row_group(index), day_column)
+            for index in range(metadata.num_row_groups)
+        ],
+    }
+
+
+def _find_day_column(schema: pa.Schema) -> str | None:
+    for name in schema.names:
+        if name.lower() in DAY_COLUMN_NAMES and pa.types.is_integer(schema.field(name).type):
+            return name
+    return None
+
+
+def _footer_range(parquet_path: Path, file_size: int) -> dict[str, int]:
+    """Locate the footer: metadata, its 4-byte length and the 4-byte magic."""
+    with parquet_path.open("rb") as f:
+        f.seek(file_size - 8)
+        metadata_length = int.from_bytes(f.read(4), "little")
+    offset = file_size - 8 - metadata_length
+    return {"offset": offset, "length": file_size - offset}
+
+
+def _describe_row_group(row_group: pq.RowGroupMetaData, day_column: str | None) -> dict[str, Any]:
+    columns = {}
+    day_min = day_max = None
+    for index in range(row_group.num_columns):
+        chunk = row_group.column(index)
+        # The dictionary page, when present, precedes the data pages
+        offset = chunk.data_page_offset
+        if chunk.has_dictionary_page and chunk.dictionary_page_offset is not None:
+            offset = min(offset, chunk.dictionary_page_offset)
+        columns[chunk.path_in_schema] = {"offset": offset, "length": chunk.total_compressed_size}
+
+        if chunk.path_in_schema == day_column and chunk.is_stats_set:
+            day_min, day_max = chunk.statistics.min, chunk.statistics.max
+
+    return {
+        "rows": row_group.num_rows,
+        "day_min": day_min,
+        "day_max": day_max,
+        "columns": columns,
+    }
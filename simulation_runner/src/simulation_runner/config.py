@@ -10,6 +10,9 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from simulation_runner.exceptions import ConfigurationError
+from simulation_runner.platform_client import AUTO, TRANSFER_MODES
+from simulation_runner.population_cache import DEFAULT_CACHE_PREFIX, DEFAULT_MAX_CACHE_GB
+from simulation_runner.scheduler import FAIL_FAST, FAILURE_POLICIES
 
 
 @dataclass
@@ -36,6 +39,28 @@ class SimulationConfig:
         AWS region for S3 access
     database_url : str
         Database connection string
+    columnar_results : bool
+        Whether to convert CSV outputs to Parquet and upload them with the results ZIP
+    max_parallel_runs : Optional[int]
+        Most FRED runs executed at once (None = as many as CPUs and memory allow)
+    run_memory_mb : int
+        Estimated peak memory of one FRED run, used to size parallelism
+    failure_policy : str
+        "fail-fast" stops the other runs after a run fails; "continue" lets them finish
+    upload_concurrency : int
+        Most finished runs uploaded at once while other runs are still executing
+    transfer_mode : str
+        "auto" downloads and uploads in-process when epistemix_platform is importable
+        and with epistemix-cli otherwise; "in-process" or "subprocess" force one
+    population_cache_dir : Optional[Path]
+        Host-mounted directory caching population data fetched from S3
+        (None = use only the data in the image)
+    population_cache_bucket : str
+        S3 bucket holding the population data (defaults to s3_bucket)
+    population_cache_prefix : str
+        S3 key prefix of the population data
+    population_cache_max_gb : float
+        Size cap of the population cache directory (0 = unlimited)
     """
 
     job_id: int
@@ -45,6 +70,16 @@ class SimulationConfig:
     s3_bucket: str
     aws_region: str
     database_url: str
+    columnar_results: bool = False
+    max_parallel_runs: int | None = None
+    run_memory_mb: int = 2048
+    failure_policy: str = FAIL_FAST
+    upload_concurrency: int = 2
+    transfer_mode: str = AUTO
+    population_cache_dir: Path | None = None
+    population_cache_bucket: str = ""
+    population_cache_prefix: str = DEFAULT_CACHE_PREFIX
+    population_cache_max_gb: float = DEFAULT_MAX_CACHE_GB
 
     @classmethod
     def from_env(cls, job_id: int, run_id: int | None = None) -> "SimulationConfig":
@@ -97,6 +132,34 @@ class SimulationConfig:
         if database_url.startswith("postgres://"):
             database_url = database_url.replace("postgres://", "postgresql://", 1)
 
+        # Parquet conversion of outputs (optional, off by default)
+        columnar_results = os.getenv("COLUMNAR_RESULTS", "false").lower() in ("1", "true", "yes")
+
+        # Concurrent runs (optional, sized from CPUs and memory by default)
+        try:
+            max_parallel_str = os.getenv("MAX_PARALLEL_RUNS", "")
+            max_parallel_runs = int(max_parallel_str) if max_parallel_str else None
+            run_memory_mb = int(os.getenv("FRED_RUN_MEMORY_MB", "2048"))
+            upload_concurrency = int(os.getenv("UPLOAD_CONCURRENCY", "2"))
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid parallel run setting: {e}") from e
+        failure_policy = os.getenv("RUN_FAILURE_POLICY", FAIL_FAST)
+
+        # Download/upload path (optional, in-process when available by default)
+        transfer_mode = os.getenv("TRANSFER_MODE", AUTO)
+
+        # Population data cache (optional, off unless a cache directory is set)
+        cache_dir_str = os.getenv("POPULATION_CACHE_DIR", "")
+        population_cache_dir = Path(cache_dir_str) if cache_dir_str else None
+        population_cache_bucket = os.getenv("POPULATION_CACHE_BUCKET", s3_bucket)
+        population_cache_prefix = os.getenv("POPULATION_CACHE_PREFIX", DEFAULT_CACHE_PREFIX)
+        try:
+            population_cache_max_gb = float(
+                os.getenv("POPULATION_CACHE_MAX_GB", str(DEFAULT_MAX_CACHE_GB))
+            )
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid population cache setting: {e}") from e
+
         return cls(
             job_id=job_id,
             run_id=run_id,
@@ -105,6 +168,16 @@ class SimulationConfig:
             s3_bucket=s3_bucket,
             aws_region=aws_region,
             database_url=database_url,
+            columnar_results=columnar_results,
+            max_parallel_runs=max_parallel_runs,
+            run_memory_mb=run_memory_mb,
+            failure_policy=failure_policy,
+            upload_concurrency=upload_concurrency,
+            transfer_mode=transfer_mode,
+            population_cache_dir=population_cache_dir,
+            population_cache_bucket=population_cache_bucket,
+            population_cache_prefix=population_cache_prefix,
+            population_cache_max_gb=population_cache_max_gb,
         )
 
     def validate(self) -> list[str]:
@@ -148,6 +221,34 @@ class SimulationConfig:
         if self.run_id is not None and self.run_id <= 0:
             errors.append(f"run_id must be positive, got: {self.run_id}")
 
+        # Validate parallel run settings
+        if self.max_parallel_runs is not None and self.max_parallel_runs < 1:
+            errors.append(f"max_parallel_runs must be at least 1, got: {self.max_parallel_runs}")
+        if self.failure_policy not in FAILURE_POLICIES:
+            errors.append(
+                f"failure_policy must be one of {', '.join(FAILURE_POLICIES)}, "
+                f"got: {self.failure_policy}"
+            )
+        if self.upload_concurrency < 1:
+            errors.append(f"upload_concurrency must be at least 1, got: {self.upload_concurrency}")
+        if self.transfer_mode not in TRANSFER_MODES:
+            errors.append(
+                f"transfer_mode must be one of {', '.join(TRANSFER_MODES)}, "
+                f"got: {self.transfer_mode}"
+            )
+
+        # Validate population cache settings
+        if self.population_cache_dir is not None:
+            if not self.population_cache_bucket:
+                errors.append(
+                    "population_cache_bucket is required when population_cache_dir is set"
+                )
+            if self.population_cache_max_gb < 0:
+                errors.append(
+                    "population_cache_max_gb must not be negative, "
+                    f"got: {self.population_cache_max_gb}"
+                )
+
         return errors
 
     def get_fred_binary(self) -> Path:
@@ -183,5 +284,11 @@ class SimulationConfig:
             f"fred_home={self.fred_home}, "
             f"workspace_dir={self.workspace_dir}, "
             f"s3_bucket={self.s3_bucket}, "
-            f"aws_region={self.aws_region})"
+            f"aws_region={self.aws_region}, "
+            f"columnar_results={self.columnar_results}, "
+            f"max_parallel_runs={self.max_parallel_runs}, "
+            f"failure_policy={self.failure_policy}, "
+            f"upload_concurrency={self.upload_concurrency}, "
+            f"transfer_mode={self.transfer_mode}, "
+            f"population_cache_dir={self.population_cache_dir})"
         )
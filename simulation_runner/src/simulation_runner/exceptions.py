@@ -42,12 +42,30 @@ class ValidationError(SimulationRunnerError):
     pass
 
 
+class PopulationCacheError(SimulationRunnerError):
+    """Failed to make synthetic population data available."""
+
+    pass
+
+
 class SimulationError(SimulationRunnerError):
     """FRED simulation execution failed."""
 
     pass
 
 
+class RunCancelledError(SimulationError):
+    """FRED run stopped because another run of the job failed."""
+
+    pass
+
+
+class ConversionError(SimulationRunnerError):
+    """Failed to convert simulation outputs to a columnar format."""
+
+    pass
+
+
 class UploadError(SimulationRunnerError):
     """Failed to upload simulation results to S3."""
 
@@ -8,10 +8,14 @@ FRED 11+ format (CLI arguments) to FRED 10 format (in-file parameters).
 
 import json
 import logging
+from datetime import date
 from pathlib import Path
 
 from simulation_runner.exceptions import FREDConfigError
-from simulation_runner.utils.date_converter import convert_date_to_fred10_format
+from simulation_runner.utils.date_converter import (
+    convert_date_from_fred10_format,
+    convert_date_to_fred10_format,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -55,6 +59,7 @@ class FREDConfigBuilder:
         self._start_date: str | None = None
         self._end_date: str | None = None
         self._locations: list[str] = []
+        self._population_version: str | None = None
         self._seed: int | None = None
 
     def with_dates(self, start_date: str, end_date: str | None = None) -> "FREDConfigBuilder":
@@ -107,6 +112,26 @@ class FREDConfigBuilder:
         self._locations = locations
         return self
 
+    def with_population_version(self, version: str) -> "FREDConfigBuilder":
+        """
+        Record the synthetic population version of the locations.
+
+        The version (e.g., "US_2010.v5") selects which population data the
+        run needs; it is not written to the .fred file.
+
+        Parameters
+        ----------
+        version : str
+            Synthetic population version
+
+        Returns
+        -------
+        FREDConfigBuilder
+            Self for method chaining
+        """
+        self._population_version = version
+        return self
+
     def with_seed(self, seed: int) -> "FREDConfigBuilder":
         """
         Add random seed for simulation.
@@ -169,6 +194,7 @@ class FREDConfigBuilder:
         end_date = params.get("end_date")
         synth_pop = params.get("synth_pop", {})
         locations = synth_pop.get("locations", [])
+        population_version = synth_pop.get("version")
         seed = params.get("seed")
 
         # Initialize builder
@@ -181,6 +207,9 @@ class FREDConfigBuilder:
         if locations:
             builder.with_locations(locations)
 
+        if population_version:
+            builder.with_population_version(population_version)
+
         if seed is not None:
             builder.with_seed(seed)
 
@@ -323,3 +352,37 @@ class FREDConfigBuilder:
         # FRED 10 uses 16-bit run numbers
         max_run_number = 2**16
         return (self._seed % max_run_number) + 1
+
+    def get_population(self) -> tuple[str | None, list[str]]:
+        """
+        Get the synthetic population the run needs.
+
+        Returns
+        -------
+        tuple[str | None, list[str]]
+            Population version (None if not given) and location names
+        """
+        return self._population_version, list(self._locations)
+
+    def get_sim_days(self) -> int | None:
+        """
+        Calculate the number of days the simulation covers.
+
+        Returns
+        -------
+        int | None
+            Days from start_date to end_date inclusive, or None unless both are set
+
+        Examples
+        --------
+        >>> builder = FREDConfigBuilder(Path("main.fred"))
+        >>> builder.with_dates("2020-01-01", "2020-03-31")
+        >>> builder.get_sim_days()
+        91
+        """
+        if not (self._start_date and self._end_date):
+            return None
+
+        start = date.fromisoformat(convert_date_from_fred10_format(self._start_date))
+        end = date.fromisoformat(convert_date_from_fred10_format(self._end_date))
+        return (end - start).days + 1
@@ -0,0 +1,244 @@
+"""
+Line-by-line streaming of FRED output.
+
+FRED can write hundreds of MB to stdout over an hour-long run. OutputStream
+reads the process's output as it is produced and copies each line to the
+run's log file. It keeps only the last few lines in memory, for error
+messages. It also follows FRED's day counter, so the run's progress and
+throughput can be reported while it executes.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import BinaryIO, TextIO
+
+
+logger = logging.getLogger(__name__)
+
+# Lines of output kept in memory for error messages
+DEFAULT_TAIL_LINES = 20
+# Seconds between progress reports, and between flushes of the log file
+PROGRESS_INTERVAL = 10.0
+LOG_FLUSH_INTERVAL = 1.0
+
+# FRED's day counter, e.g. "day 12 finished", "Day = 12" or "day: 12"
+_DAY_PATTERN = re.compile(r"^\s*day\s*[=:]?\s*(\d+)\b", re.IGNORECASE)
+
+
+def parse_day(line: str) -> int | None:
+    """
+    Read the simulated day from a line of FRED output.
+
+    Parameters
+    ----------
+    line : str
+        One line of FRED output
+
+    Returns
+    -------
+    int | None
+        The day number, or None if the line is not a day counter line
+
+    Examples
+    --------
+    >>> parse_day("day 12 finished")
+    12
+    >>> parse_day("Reading population")
+    """
+    match = _DAY_PATTERN.match(line)
+    return int(match.group(1)) if match else None
+
+
+class DayProgress:
+    """
+    Simulated-day progress and throughput of one FRED run.
+
+    Examples
+    --------
+    >>> progress = DayProgress(total_days=100)
+    >>> progress.update(49)
+    >>> progress.snapshot()["percent"]
+    50.0
+    """
+
+    def __init__(self, total_days: int | None = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize progress tracking.
+
+        Parameters
+        ----------
+        total_days : int | None
+            Days the run simulates, if known
+        clock : Callable[[], float]
+            Monotonic clock in seconds
+        """
+        self.total_days = total_days
+        self.day: int | None = None
+        self._clock = clock
+        self._started = clock()
+        self._first_day: int | None = None
+        self._first_day_at: float | None = None
+
+    def update(self, day: int) -> None:
+        """Record that FRED reached day (counted from 0)."""
+        if self._first_day is None:
+            self._first_day = day
+            self._first_day_at = self._clock()
+        self.day = day
+
+    @property
+    def days_per_second(self) -> float | None:
+        """Simulated days per wall-clock second since the first day counter line."""
+        if self.day is None or self.day == self._first_day:
+            return None
+        elapsed = self._clock() - self._first_day_at
+        return (self.day - self._first_day) / elapsed if elapsed > 0 else None
+
+    def snapshot(self) -> dict:
+        """
+        Current progress as a dict for structured logs.
+
+        Returns
+        -------
+        dict
+            day, total_days, percent, days_per_second, eta_seconds and elapsed_seconds
+            (None where unknown)
+        """
+        rate = self.days_per_second
+        percent = None
+        eta_seconds = None
+        if self.day is not None and self.total_days:
+            done = min(self.day + 1, self.total_days)
+            percent = round(100 * done / self.total_days, 1)
+            if rate:
+                eta_seconds = round((self.total_days - done) / rate, 1)
+        return {
+            "day": self.day,
+            "total_days": self.total_days,
+            "percent": percent,
+            "days_per_second": round(rate, 2) if rate else None,
+            "eta_seconds": eta_seconds,
+            "elapsed_seconds": round(self._clock() - self._started, 1),
+        }
+
+
+class OutputStream:
+    """
+    Copies a process's output to a log file line by line on a background thread.
+
+    Examples
+    --------
+    >>> process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    >>> with open("run_4_simulation.log", "w") as log_file:
+    ...     output = OutputStream(log_file, on_progress=report)
+    ...     output.start(process.stdout)
+    ...     process.wait()
+    ...     output.join()
+    >>> output.tail()
+    'FRED finished'
+    """
+
+    def __init__(
+        self,
+        log_file: TextIO,
+        total_days: int | None = None,
+        tail_lines: int = DEFAULT_TAIL_LINES,
+        on_progress: Callable[[dict], None] | None = None,
+        progress_interval: float = PROGRESS_INTERVAL,
+    ):
+        """
+        Initialize the stream.
+
+        Parameters
+        ----------
+        log_file : TextIO
+            File every line is written to
+        total_days : int | None
+            Days the run simulates, if known, for percent complete and ETA
+        tail_lines : int
+            Last lines kept in memory
+        on_progress : Callable[[dict], None] | None
+            Called with DayProgress.snapshot() at most every progress_interval
+            seconds while the day counter advances, and once at the end
+        progress_interval : float
+            Seconds between progress reports
+        """
+        self.log_file = log_file
+        self.progress = DayProgress(total_days)
+        self.line_count = 0
+        self._tail: deque[str] = deque(maxlen=tail_lines)
+        self._on_progress = on_progress
+        self._progress_interval = progress_interval
+        self._thread: threading.Thread | None = None
+
+    def start(self, stream: BinaryIO) -> None:
+        """Start copying stream (the process's stdout pipe) until it closes."""
+        self._thread = threading.Thread(target=self.pump, args=(stream,), daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the stream to close and everything to be written."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def pump(self, stream: BinaryIO) -> None:
+        """
+        Copy stream to the log file until it closes.
+
+        Parameters
+        ----------
+        stream : BinaryIO
+            The process's output, read as bytes and decoded as UTF-8 (invalid
+            bytes are replaced, so a stray byte never stops the copy)
+        """
+        last_flush = last_report = time.monotonic()
+        reported_day = None
+
+        for raw_line in iter(stream.readline, b""):
+            line = raw_line.decode("utf-8", errors="replace")
+            self.log_file.write(line)
+            self.line_count += 1
+            self._tail.append(line.rstrip("\r\n"))
+
+            day = parse_day(line)
+            if day is not None:
+                self.progress.update(day)
+
+            now = time.monotonic()
+            if now - last_flush >= LOG_FLUSH_INTERVAL:
+                self.log_file.flush()
+                last_flush = now
+            if (
+                self._on_progress is not None
+                and self.progress.day != reported_day
+                and now - last_report >= self._progress_interval
+            ):
+                self._on_progress(self.progress.snapshot())
+                reported_day = self.progress.day
+                last_report = now
+
+        self.log_file.flush()
+        stream.close()
+        if self._on_progress is not None and self.progress.day not in (None, reported_day):
+            self._on_progress(self.progress.snapshot())
+
+    def tail(self, lines: int | None = None) -> str:
+        """
+        The last lines of output.
+
+        Parameters
+        ----------
+        lines : int | None
+            Number of lines (None = all lines kept)
+
+        Returns
+        -------
+        str
+            The lines, joined with newlines
+        """
+        kept = list(self._tail)
+        return "\n".join(kept[-lines:] if lines else kept)
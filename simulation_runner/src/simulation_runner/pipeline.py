@@ -0,0 +1,186 @@
+"""
+Streaming per-run pipeline for a job's simulations.
+
+Instead of finishing a stage for every run before the next stage starts,
+each run moves through the stages (validate -> simulate -> package ->
+upload) on its own. Stages have their own worker threads and are connected
+by bounded queues, so uploads of finished runs overlap with FRED runs still
+executing, and a stage that falls behind holds back the stages before it
+rather than letting finished runs pile up on disk.
+"""
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from simulation_runner.exceptions import RunCancelledError
+from simulation_runner.scheduler import FAIL_FAST, FAILURE_POLICIES, ScheduleOutcome
+
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the runs on a stage queue
+_END = object()
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step every run goes through.
+
+    Attributes
+    ----------
+    name : str
+        Stage name, for logs
+    task : Callable[[dict, threading.Event], dict]
+        Called as task(run_info, stop_event) on one of the stage's workers;
+        returns the run dict to hand to the next stage
+    workers : int
+        Runs this stage works on at once
+    queue_size : int
+        Runs that may wait for this stage (0 = same as workers)
+    """
+
+    name: str
+    task: Callable[[dict, threading.Event], dict]
+    workers: int = 1
+    queue_size: int = 0
+
+
+class RunPipeline:
+    """
+    Moves every run through a sequence of stages, each with its own workers.
+
+    Under the fail-fast policy, the first failure sets the stop event passed
+    to every task and runs still waiting for a stage are cancelled; under
+    continue, only the failed run leaves the pipeline.
+
+    Examples
+    --------
+    >>> pipeline = RunPipeline([Stage("simulate", simulate, workers=4), Stage("upload", upload)])
+    >>> outcome = pipeline.run(runs)
+    >>> [run["run_id"] for run in outcome.completed]
+    [4, 5, 6]
+    """
+
+    def __init__(self, stages: list[Stage], failure_policy: str = FAIL_FAST):
+        """
+        Initialize the pipeline.
+
+        Parameters
+        ----------
+        stages : list[Stage]
+            Stages in the order runs go through them
+        failure_policy : str
+            "fail-fast" or "continue"
+
+        Raises
+        ------
+        ValueError
+            If there are no stages, a stage has no workers, or the policy is unknown
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        for stage in stages:
+            if stage.workers < 1:
+                raise ValueError(f"Stage {stage.name} needs at least 1 worker")
+        if failure_policy not in FAILURE_POLICIES:
+            raise ValueError(
+                f"failure_policy must be one of {', '.join(FAILURE_POLICIES)}, "
+                f"got {failure_policy!r}"
+            )
+        self.stages = stages
+        self.failure_policy = failure_policy
+
+    def run(self, runs: list[dict]) -> ScheduleOutcome:
+        """
+        Push every run through the stages and wait until all have left.
+
+        Parameters
+        ----------
+        runs : list[dict]
+            Run dicts, fed in order
+
+        Returns
+        -------
+        ScheduleOutcome
+            Runs that went through every stage (in completion order), failed,
+            or were cancelled
+        """
+        outcome = ScheduleOutcome()
+        outcome_lock = threading.Lock()
+        stop_event = threading.Event()
+        queues = [queue.Queue(maxsize=stage.queue_size or stage.workers) for stage in self.stages]
+
+        def fail(stage: Stage, run_info: dict, error: Exception) -> None:
+            with outcome_lock:
+                outcome.failed.append((run_info, error))
+            logger.warning(
+                "Run failed",
+                extra={"stage": stage.name, "run_id": run_info.get("run_id"), "error": str(error)},
+            )
+            if self.failure_policy == FAIL_FAST:
+                stop_event.set()
+
+        def work(index: int, remaining: list[int], remaining_lock: threading.Lock) -> None:
+            stage = self.stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+
+            while True:
+                run_info = inbox.get()
+                if run_info is _END:
+                    # Let sibling workers see the end too; the last one passes it on
+                    inbox.put(_END)
+                    with remaining_lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last and outbox is not None:
+                        outbox.put(_END)
+                    return
+
+                if stop_event.is_set():
+                    with outcome_lock:
+                        outcome.cancelled.append(run_info)
+                    continue
+
+                try:
+                    result = stage.task(run_info, stop_event)
+                except RunCancelledError:
+                    with outcome_lock:
+                        outcome.cancelled.append(run_info)
+                    continue
+                except Exception as e:
+                    fail(stage, run_info, e)
+                    continue
+
+                if outbox is None:
+                    with outcome_lock:
+                        outcome.completed.append(result)
+                else:
+                    # Blocks while the next stage is backed up
+                    outbox.put(result)
+
+        threads = []
+        for index, stage in enumerate(self.stages):
+            remaining, remaining_lock = [stage.workers], threading.Lock()
+            for number in range(stage.workers):
+                thread = threading.Thread(
+                    target=work,
+                    args=(index, remaining, remaining_lock),
+                    name=f"pipeline-{stage.name}-{number}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        for run_info in runs:
+            queues[0].put(run_info)
+        queues[0].put(_END)
+
+        for thread in threads:
+            thread.join()
+
+        return outcome
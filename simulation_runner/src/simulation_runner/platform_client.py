@@ -0,0 +1,208 @@
+"""
+In-process client for the Epistemix platform.
+
+Downloading uploads and uploading results through epistemix-cli starts a
+new Python process for every call, and each one loads its configuration,
+builds a database engine and S3 clients, and runs the schema check before
+doing any work. Results are uploaded once per run, so this startup cost
+adds up on jobs with many runs. When epistemix_platform is importable,
+PlatformClient calls the same JobController methods in this process. It
+builds one controller, and so one S3 client and one database engine, for
+the whole workflow.
+"""
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from simulation_runner.exceptions import ConfigurationError, DownloadError, UploadError
+
+
+logger = logging.getLogger(__name__)
+
+# How the workflow talks to the platform: in-process when epistemix_platform
+# is importable (falling back to epistemix-cli otherwise), always in-process,
+# or always through epistemix-cli subprocesses
+AUTO = "auto"
+IN_PROCESS = "in-process"
+SUBPROCESS = "subprocess"
+TRANSFER_MODES = (AUTO, IN_PROCESS, SUBPROCESS)
+
+
+class PlatformClient:
+    """
+    Downloads job uploads and uploads run results with a JobController.
+
+    The controller's repositories take their session from a scoped (per
+    thread) registry, so each pipeline worker gets its own session for the
+    run it uploads. The session is committed after each upload, rolled back
+    if the upload fails, and then returned to the registry.
+
+    Examples
+    --------
+    >>> client = PlatformClient.from_environment()
+    >>> client.download_uploads(job_id=12, output_dir=Path("/workspace/job_12"))
+    {'downloaded': [...], 'unchanged': [], 'skipped': [], 'errors': []}
+    >>> client.upload_results(job_id=12, run_id=4, results_dir=Path("/workspace/job_12/OUT/run_4"))
+    'https://bucket.s3.amazonaws.com/jobs/12/runs/4/results.zip'
+    """
+
+    def __init__(
+        self,
+        job_controller: Any,
+        session_factory: Callable,
+        remove_session: Callable[[], None] | None = None,
+    ):
+        """
+        Initialize the client.
+
+        Parameters
+        ----------
+        job_controller : JobController
+            Controller whose methods do the downloads and uploads
+        session_factory : Callable
+            Returns the database session the controller's repositories use
+        remove_session : Callable[[], None] | None
+            Releases the calling thread's session after each upload and when
+            the client is closed
+        """
+        self.job_controller = job_controller
+        self.session_factory = session_factory
+        self._remove_session = remove_session
+
+    @classmethod
+    def from_environment(cls) -> "PlatformClient":
+        """
+        Build a client from the platform configuration in the environment.
+
+        Uses the same Config class selection (epistemix_platform.config.get_config)
+        and schema check as epistemix-cli.
+
+        Returns
+        -------
+        PlatformClient
+            Client with a JobController built once for this process
+
+        Raises
+        ------
+        ConfigurationError
+            If epistemix_platform is not importable or its database cannot be set up
+        """
+        try:
+            from epistemix_platform.config import get_config
+            from epistemix_platform.repositories.database import get_database_manager
+            from epistemix_platform.utils.get_default_job_controller import (
+                create_job_controller_from_config,
+            )
+        except ImportError as e:
+            raise ConfigurationError(
+                f"In-process transfers need epistemix_platform to be importable: {e}"
+            ) from e
+
+        config_class = get_config()
+
+        try:
+            db_manager = get_database_manager(config_class.get_database_url())
+            db_manager.ensure_schema(
+                mode=config_class.DATABASE_SCHEMA_MODE,
+                script_location=config_class.ALEMBIC_SCRIPT_LOCATION,
+            )
+            job_controller = create_job_controller_from_config(config_class, db_manager.get_session)
+        except Exception as e:
+            raise ConfigurationError(f"Failed to set up the platform client: {e}") from e
+
+        logger.info(
+            "Using in-process platform client", extra={"environment": config_class.ENVIRONMENT}
+        )
+        return cls(job_controller, db_manager.get_session, db_manager.remove_session)
+
+    def download_uploads(self, job_id: int, output_dir: Path) -> dict[str, list[str]]:
+        """
+        Stream a job's uploads into output_dir, keeping files unchanged in S3.
+
+        Parameters
+        ----------
+        job_id : int
+            Job whose uploads to download
+        output_dir : Path
+            Directory to write the files to
+
+        Returns
+        -------
+        dict[str, list[str]]
+            Downloaded, unchanged and skipped file paths, and per-file errors
+
+        Raises
+        ------
+        DownloadError
+            If the job has no uploads or none could be downloaded
+        """
+        from returns.pipeline import is_successful
+
+        result = self.job_controller.stream_job_uploads(
+            job_id=job_id, base_path=output_dir, should_force=True
+        )
+        if not is_successful(result):
+            raise DownloadError(f"Failed to download uploads for job {job_id}: {result.failure()}")
+        return result.unwrap()
+
+    def upload_results(
+        self, job_id: int, run_id: int, results_dir: Path, columnar_dir: Path | None = None
+    ) -> str:
+        """
+        Upload a run's results and mark the run as done.
+
+        Parameters
+        ----------
+        job_id : int
+            Job the run belongs to
+        run_id : int
+            Run whose results to upload
+        results_dir : Path
+            Directory of FRED output for the run
+        columnar_dir : Path | None
+            Directory of Parquet results to upload next to the ZIP
+
+        Returns
+        -------
+        str
+            URL of the uploaded results
+
+        Raises
+        ------
+        UploadError
+            If the upload or the run update fails
+        """
+        from returns.pipeline import is_successful
+
+        session = self.session_factory()
+        try:
+            result = self.job_controller.upload_results_from_directory(
+                job_id=job_id, run_id=run_id, results_dir=results_dir, columnar_dir=columnar_dir
+            )
+            if not is_successful(result):
+                session.rollback()
+                raise UploadError(
+                    f"Failed to upload results for run {run_id} (job {job_id}): {result.failure()}"
+                )
+
+            # Persist results_url, results_uploaded_at and the DONE status
+            try:
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise UploadError(
+                    f"Failed to record results upload for run {run_id} (job {job_id}): {e}"
+                ) from e
+        finally:
+            # Pipeline workers are separate threads; return this thread's session
+            if self._remove_session is not None:
+                self._remove_session()
+
+        return result.unwrap()
+
+    def close(self) -> None:
+        """Release the calling thread's database session."""
+        if self._remove_session is not None:
+            self._remove_session()
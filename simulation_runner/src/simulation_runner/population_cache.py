@@ -0,0 +1,375 @@
+"""
+Shared cache of FRED synthetic population data.
+
+Each Batch job starts in a fresh container, and the image may not contain
+every location's population data under FRED_HOME/data. PopulationCache
+fetches the files a location needs from a content-addressed S3 prefix. It
+keeps them in a cache directory mounted from the host, so later jobs on
+the same instance reuse them::
+
+    {prefix}/locations/{version}/{location}.json
+        {"files": [{"path": ..., "sha256": ..., "size": ...}, ...]}
+    {prefix}/objects/{sha256}
+        file contents
+
+A location manifest lists its files by path relative to FRED_HOME/data.
+Each file is stored once under its SHA-256 digest, so files shared by
+several locations or versions are fetched and cached only once.
+Downloaded files are checked against their digest before use. Files are
+placed into FRED_HOME/data by hard link, or by copy across file systems.
+Evicting a cache entry therefore never breaks a running job. The cache
+is kept under a size cap by evicting the least recently used files.
+Locations without a manifest are left to the data in the image.
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from simulation_runner.exceptions import PopulationCacheError
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PREFIX = "populations"
+DEFAULT_MAX_CACHE_GB = 50
+# Bytes read from S3 (and hashed) at a time
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+_LOCK_FILE = "cache.lock"
+_OBJECTS_DIR = "objects"
+_SHA256 = re.compile(r"[0-9a-f]{64}")
+
+
+@dataclass(frozen=True)
+class PopulationFile:
+    """
+    One file of a location's population data.
+
+    Attributes
+    ----------
+    path : str
+        Path relative to FRED_HOME/data
+    sha256 : str
+        Hex SHA-256 digest of the contents (also its S3 object name)
+    size : int
+        Size in bytes
+    """
+
+    path: str
+    sha256: str
+    size: int
+
+
+@dataclass
+class WarmResult:
+    """
+    What PopulationCache.warm did.
+
+    Attributes
+    ----------
+    locations : list[str]
+        "version/location" entries made available
+    unpublished : list[str]
+        "version/location" entries with no manifest in S3, left to the image's data
+    present : int
+        Files already in FRED_HOME/data (from the image or an earlier warm)
+    cached : int
+        Files placed from the shared cache
+    fetched : int
+        Files downloaded from S3
+    bytes_fetched : int
+        Bytes downloaded from S3
+    evicted : int
+        Cache files evicted to stay under the size cap
+    """
+
+    locations: list[str] = field(default_factory=list)
+    unpublished: list[str] = field(default_factory=list)
+    present: int = 0
+    cached: int = 0
+    fetched: int = 0
+    bytes_fetched: int = 0
+    evicted: int = 0
+
+
+class PopulationCache:
+    """
+    Makes locations' population data available under FRED_HOME/data.
+
+    Examples
+    --------
+    >>> cache = PopulationCache(
+    ...     cache_dir=Path("/var/cache/fred-populations"),
+    ...     data_dir=Path("/fred-framework/data"),
+    ...     s3_bucket="epistemix-uploads",
+    ... )
+    >>> cache.warm([("US_2010.v5", "Allegheny_County_PA")])
+    WarmResult(locations=['US_2010.v5/Allegheny_County_PA'], present=0, cached=12, ...)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        data_dir: Path | None,
+        s3_bucket: str,
+        prefix: str = DEFAULT_CACHE_PREFIX,
+        max_bytes: int = DEFAULT_MAX_CACHE_GB * 1024**3,
+        aws_region: str | None = None,
+        s3_client: Any | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        cache_dir : Path
+            Shared cache directory (mounted from the host)
+        data_dir : Path | None
+            FRED data directory (FRED_HOME/data) the files are placed in
+            (None = only fill the cache, e.g. to pre-warm a host)
+        s3_bucket : str
+            Bucket holding the content-addressed population prefix
+        prefix : str
+            S3 key prefix of the population data
+        max_bytes : int
+            Size cap of the cache directory (0 = unlimited)
+        aws_region : str | None
+            AWS region of the bucket
+        s3_client : Any, optional
+            boto3 S3 client (created on first use if not provided)
+        """
+        self.cache_dir = cache_dir
+        self.data_dir = data_dir
+        self.s3_bucket = s3_bucket
+        self.prefix = prefix.strip("/")
+        self.max_bytes = max_bytes
+        self.aws_region = aws_region
+        self._s3_client = s3_client
+
+    @property
+    def s3_client(self) -> Any:
+        if self._s3_client is None:
+            self._s3_client = boto3.client("s3", region_name=self.aws_region)
+        return self._s3_client
+
+    def warm(self, populations: Iterable[tuple[str, str]]) -> WarmResult:
+        """
+        Make every (version, location) pair's files available under data_dir.
+
+        Files already under data_dir are left as they are; the others are
+        placed from the cache, fetching the ones it does not hold yet. A
+        location with no manifest in S3 is logged and left to the data in
+        the image.
+
+        Holds an exclusive lock on the cache directory, so containers
+        sharing the host cache do not fetch or evict at the same time.
+
+        Parameters
+        ----------
+        populations : Iterable[tuple[str, str]]
+            (population version, location) pairs, e.g. ("US_2010.v5", "Allegheny_County_PA")
+
+        Returns
+        -------
+        WarmResult
+            Counts of files found, placed, fetched and evicted
+
+        Raises
+        ------
+        PopulationCacheError
+            If a manifest or file cannot be fetched, or a file fails its checksum
+        """
+        result = WarmResult()
+        in_use: set[str] = set()
+
+        with self._locked():
+            for version, location in dict.fromkeys(populations):
+                files = self.manifest(version, location)
+                if files is None:
+                    logger.warning(
+                        "No population manifest, using image data",
+                        extra={"population_version": version, "location": location},
+                    )
+                    result.unpublished.append(f"{version}/{location}")
+                    continue
+
+                for entry in files:
+                    target = self.data_dir / entry.path if self.data_dir else None
+                    if target is not None and target.exists():
+                        result.present += 1
+                        continue
+
+                    cached = self._object_path(entry.sha256)
+                    if cached.exists() and cached.stat().st_size == entry.size:
+                        result.cached += 1
+                    else:
+                        self._fetch(entry, cached)
+                        result.fetched += 1
+                        result.bytes_fetched += entry.size
+
+                    # Mark as recently used for eviction
+                    os.utime(cached)
+                    in_use.add(entry.sha256)
+                    if target is not None:
+                        self._place(cached, target)
+
+                result.locations.append(f"{version}/{location}")
+
+            result.evicted = self._evict(keep=in_use)
+
+        logger.info(
+            "Population cache warmed",
+            extra={
+                "locations": result.locations,
+                "unpublished": result.unpublished,
+                "present": result.present,
+                "cached": result.cached,
+                "fetched": result.fetched,
+                "bytes_fetched": result.bytes_fetched,
+                "evicted": result.evicted,
+            },
+        )
+        return result
+
+    def manifest(self, version: str, location: str) -> list[PopulationFile] | None:
+        """
+        Fetch the list of files a location needs.
+
+        Parameters
+        ----------
+        version : str
+            Synthetic population version
+        location : str
+            Location name
+
+        Returns
+        -------
+        list[PopulationFile] | None
+            The location's files, or None if no manifest is published for it
+
+        Raises
+        ------
+        PopulationCacheError
+            If the manifest cannot be read or is malformed
+        """
+        key = f"{self.prefix}/locations/{version}/{location}.json"
+        try:
+            response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=key)
+            document = json.loads(response["Body"].read())
+            files = [
+                PopulationFile(path=item["path"], sha256=item["sha256"], size=int(item["size"]))
+                for item in document["files"]
+            ]
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise PopulationCacheError(
+                f"Failed to read population manifest s3://{self.s3_bucket}/{key}: {e}"
+            ) from e
+        except BotoCoreError as e:
+            raise PopulationCacheError(
+                f"Failed to read population manifest s3://{self.s3_bucket}/{key}: {e}"
+            ) from e
+        except (ValueError, KeyError, TypeError) as e:
+            raise PopulationCacheError(f"Invalid population manifest {key}: {e}") from e
+
+        for entry in files:
+            path = Path(entry.path)
+            if path.is_absolute() or ".." in path.parts or not _SHA256.fullmatch(entry.sha256):
+                raise PopulationCacheError(f"Invalid entry in population manifest {key}: {entry}")
+        return files
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.cache_dir / _OBJECTS_DIR / sha256
+
+    def _fetch(self, entry: PopulationFile, destination: Path) -> None:
+        """Download entry into destination, verifying its SHA-256 before it becomes visible."""
+        key = f"{self.prefix}/objects/{entry.sha256}"
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+
+        fd, tmp_name = tempfile.mkstemp(dir=destination.parent, prefix=".fetch-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                body = self.s3_client.get_object(Bucket=self.s3_bucket, Key=key)["Body"]
+                for chunk in iter(lambda: body.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    tmp.write(chunk)
+
+            if digest.hexdigest() != entry.sha256:
+                raise PopulationCacheError(
+                    f"Checksum mismatch for {entry.path} (s3://{self.s3_bucket}/{key}): "
+                    f"got {digest.hexdigest()}"
+                )
+            os.replace(tmp_name, destination)
+        except (ClientError, BotoCoreError) as e:
+            raise PopulationCacheError(
+                f"Failed to download s3://{self.s3_bucket}/{key} for {entry.path}: {e}"
+            ) from e
+        finally:
+            # Left behind only if the download or checksum failed
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    def _place(self, cached: Path, target: Path) -> None:
+        """Hard link cached to target, copying instead across file systems."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_target = target.with_name(f".{target.name}.placing")
+        try:
+            os.link(cached, tmp_target)
+        except OSError:
+            shutil.copyfile(cached, tmp_target)
+        os.replace(tmp_target, target)
+
+    def _evict(self, keep: set[str]) -> int:
+        """Delete least recently used cache files until the cache fits max_bytes."""
+        if not self.max_bytes:
+            return 0
+
+        objects_dir = self.cache_dir / _OBJECTS_DIR
+        if not objects_dir.exists():
+            return 0
+
+        entries = [(path, path.stat()) for path in objects_dir.iterdir() if path.is_file()]
+        total = sum(stat.st_size for _, stat in entries)
+        evicted = 0
+
+        for path, stat in sorted(entries, key=lambda item: item[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if path.name in keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            evicted += 1
+
+        if total > self.max_bytes:
+            logger.warning(
+                "Population cache over its size cap with files in use",
+                extra={"cache_bytes": total, "max_bytes": self.max_bytes},
+            )
+        return evicted
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_dir / _LOCK_FILE, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,333 @@
+"""
+Local scheduling of concurrent FRED runs.
+
+A job's runs are independent FRED processes, so a container with several
+vCPUs can run several of them at once. This module sizes that parallelism
+from the CPUs and memory available to the container and runs per-run tasks
+on a thread pool under a failure policy.
+"""
+
+import logging
+import math
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from simulation_runner.exceptions import RunCancelledError
+
+
+logger = logging.getLogger(__name__)
+
+# Stop every run after the first failure, or let the other runs finish
+FAIL_FAST = "fail-fast"
+CONTINUE = "continue"
+FAILURE_POLICIES = (FAIL_FAST, CONTINUE)
+
+# How often a waiting run checks whether it has been cancelled
+PROCESS_POLL_INTERVAL = 0.5
+# How long a terminated process gets to exit before it is killed
+PROCESS_TERMINATE_GRACE = 10.0
+
+# cgroup files holding the container's CPU quota and memory limit (v2, then v1)
+_CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+_CGROUP_V1_CPU_QUOTA = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+_CGROUP_V1_CPU_PERIOD = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+_CGROUP_MEMORY_LIMITS = (
+    Path("/sys/fs/cgroup/memory.max"),
+    Path("/sys/fs/cgroup/memory/memory.limit_in_bytes"),
+)
+# cgroup v1 reports "no limit" as a huge page-aligned number
+_UNLIMITED_MEMORY = 1 << 60
+
+
+def detect_cpu_count() -> int:
+    """
+    Count the CPUs this process may use.
+
+    Takes the smallest of the CPU affinity mask and the cgroup CPU quota, so
+    a 4-vCPU Batch container on a larger host counts 4.
+
+    Returns
+    -------
+    int
+        Number of usable CPUs (at least 1)
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+    quota = _read_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, quota)
+    return max(1, cpus)
+
+
+def _read_cpu_quota() -> int | None:
+    try:
+        quota, period = _CGROUP_CPU_MAX.read_text().split()[:2]
+    except (OSError, ValueError):
+        try:
+            quota = _CGROUP_V1_CPU_QUOTA.read_text().strip()
+            period = _CGROUP_V1_CPU_PERIOD.read_text().strip()
+        except OSError:
+            return None
+
+    if quota == "max" or quota.startswith("-"):
+        return None
+    try:
+        return max(1, math.ceil(int(quota) / int(period)))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def detect_memory_bytes() -> int | None:
+    """
+    Find the memory available to this process.
+
+    Returns
+    -------
+    int | None
+        The cgroup memory limit, else physical memory; None if unknown
+    """
+    for path in _CGROUP_MEMORY_LIMITS:
+        try:
+            value = path.read_text().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < _UNLIMITED_MEMORY:
+            return int(value)
+
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def plan_parallelism(
+    run_count: int,
+    max_parallel_runs: int | None = None,
+    run_memory_mb: int | None = None,
+    cpu_count: int | None = None,
+    memory_bytes: int | None = None,
+) -> int:
+    """
+    Decide how many FRED runs to execute at once.
+
+    Each FRED process is single-threaded, so at most one run per CPU; and at
+    most as many runs as fit in memory at run_memory_mb each.
+
+    Parameters
+    ----------
+    run_count : int
+        Number of runs to execute
+    max_parallel_runs : int | None
+        Explicit upper bound (None = as many as CPUs and memory allow)
+    run_memory_mb : int | None
+        Estimated peak memory of one FRED run (None = not limited by memory)
+    cpu_count : int | None
+        Usable CPUs (None = detect)
+    memory_bytes : int | None
+        Usable memory (None = detect)
+
+    Returns
+    -------
+    int
+        Number of runs to execute concurrently (at least 1)
+
+    Examples
+    --------
+    >>> plan_parallelism(10, cpu_count=4, memory_bytes=6 * 1024**3, run_memory_mb=2048)
+    3
+    """
+    limits = [run_count, cpu_count if cpu_count is not None else detect_cpu_count()]
+    if max_parallel_runs is not None:
+        limits.append(max_parallel_runs)
+    if run_memory_mb:
+        memory = memory_bytes if memory_bytes is not None else detect_memory_bytes()
+        if memory is not None:
+            limits.append(memory // (run_memory_mb * 1024 * 1024))
+    return max(1, min(limits))
+
+
+def wait_for_process(
+    process: subprocess.Popen,
+    stop_event: threading.Event,
+    timeout: float,
+    poll_interval: float = PROCESS_POLL_INTERVAL,
+) -> int | None:
+    """
+    Wait for a process, terminating it if stop_event is set or it times out.
+
+    Parameters
+    ----------
+    process : subprocess.Popen
+        The running process
+    stop_event : threading.Event
+        Set to stop the process early
+    timeout : float
+        Seconds the process may run
+    poll_interval : float
+        Seconds between checks of stop_event
+
+    Returns
+    -------
+    int | None
+        The process exit code, or None if it was stopped
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        If the process ran for longer than timeout (it is terminated first)
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return process.wait(timeout=min(poll_interval, max(0, deadline - time.monotonic())))
+        except subprocess.TimeoutExpired:
+            pass
+
+        if stop_event.is_set():
+            _terminate(process)
+            return None
+        if time.monotonic() >= deadline:
+            _terminate(process)
+            raise subprocess.TimeoutExpired(process.args, timeout)
+
+
+def _terminate(process: subprocess.Popen) -> None:
+    _signal(process, signal.SIGTERM)
+    try:
+        process.wait(timeout=PROCESS_TERMINATE_GRACE)
+    except subprocess.TimeoutExpired:
+        _signal(process, signal.SIGKILL)
+        process.wait()
+
+
+def _signal(process: subprocess.Popen, sig: int) -> None:
+    # A process started with start_new_session=True leads its own process
+    # group; signal the whole group so children holding its output pipe exit too
+    if process.poll() is not None:
+        return
+    try:
+        if os.getpgid(process.pid) == process.pid:
+            os.killpg(process.pid, sig)
+            return
+    except ProcessLookupError:
+        return
+    process.send_signal(sig)
+
+
+@dataclass
+class ScheduleOutcome:
+    """
+    What happened to each run handed to RunScheduler.run.
+
+    Attributes
+    ----------
+    completed : list[dict]
+        Runs whose task returned, in completion order
+    failed : list[tuple[dict, Exception]]
+        Runs whose task raised, with the error, in completion order
+    cancelled : list[dict]
+        Runs stopped or never started because another run failed (fail-fast)
+    """
+
+    completed: list[dict] = field(default_factory=list)
+    failed: list[tuple[dict, Exception]] = field(default_factory=list)
+    cancelled: list[dict] = field(default_factory=list)
+
+
+class RunScheduler:
+    """
+    Executes a task for each run on a bounded thread pool.
+
+    Tasks receive the run's dict and a stop event; a task that starts a
+    process should pass the event to wait_for_process and raise
+    RunCancelledError when it was stopped. With the fail-fast policy, the
+    first failure sets the event and runs not yet started are skipped.
+
+    Examples
+    --------
+    >>> scheduler = RunScheduler(max_workers=4, failure_policy=CONTINUE)
+    >>> outcome = scheduler.run(runs, lambda run_info, stop_event: run_info)
+    >>> len(outcome.completed) == len(runs)
+    True
+    """
+
+    def __init__(self, max_workers: int, failure_policy: str = FAIL_FAST):
+        """
+        Initialize the scheduler.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum runs executing at once
+        failure_policy : str
+            "fail-fast" or "continue"
+
+        Raises
+        ------
+        ValueError
+            If max_workers is less than 1 or failure_policy is unknown
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if failure_policy not in FAILURE_POLICIES:
+            raise ValueError(
+                f"failure_policy must be one of {', '.join(FAILURE_POLICIES)}, "
+                f"got {failure_policy!r}"
+            )
+        self.max_workers = max_workers
+        self.failure_policy = failure_policy
+
+    def run(
+        self, runs: list[dict], task: Callable[[dict, threading.Event], dict]
+    ) -> ScheduleOutcome:
+        """
+        Execute task for every run and wait for all of them.
+
+        Parameters
+        ----------
+        runs : list[dict]
+            Run dicts, started in order
+        task : Callable[[dict, threading.Event], dict]
+            Called as task(run_info, stop_event) on a worker thread
+
+        Returns
+        -------
+        ScheduleOutcome
+            Completed, failed and cancelled runs
+        """
+        outcome = ScheduleOutcome()
+        stop_event = threading.Event()
+
+        def guarded(run_info: dict) -> dict:
+            # Runs queued behind a failure are skipped without starting
+            if stop_event.is_set():
+                raise RunCancelledError(f"Run {run_info.get('run_id')} was not started")
+            return task(run_info, stop_event)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(guarded, run_info): run_info for run_info in runs}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    run_info = pending.pop(future)
+                    try:
+                        outcome.completed.append(future.result())
+                    except RunCancelledError:
+                        outcome.cancelled.append(run_info)
+                    except Exception as e:
+                        outcome.failed.append((run_info, e))
+                        if self.failure_policy == FAIL_FAST and not stop_event.is_set():
+                            logger.warning(
+                                "Stopping remaining runs after failure",
+                                extra={"run_id": run_info.get("run_id"), "error": str(e)},
+                            )
+                            stop_event.set()
+
+        return outcome
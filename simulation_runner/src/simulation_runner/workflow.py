@@ -7,24 +7,46 @@ the entire simulation pipeline from download to execution.
 
 import logging
 import subprocess
+import threading
 import zipfile
+from collections.abc import Callable
 from pathlib import Path
+from typing import TextIO
 
+from simulation_runner.columnar import convert_results_to_parquet
 from simulation_runner.config import SimulationConfig
 from simulation_runner.exceptions import (
+    ConfigurationError,
+    ConversionError,
     DownloadError,
     ExtractionError,
     FREDConfigError,
+    PopulationCacheError,
+    RunCancelledError,
     SimulationError,
     UploadError,
     ValidationError,
     WorkflowError,
 )
 from simulation_runner.fred_config_builder import FREDConfigBuilder
+from simulation_runner.output_stream import OutputStream
+from simulation_runner.pipeline import RunPipeline, Stage
+from simulation_runner.platform_client import IN_PROCESS, SUBPROCESS, PlatformClient
+from simulation_runner.population_cache import PopulationCache, WarmResult
+from simulation_runner.scheduler import (
+    RunScheduler,
+    ScheduleOutcome,
+    plan_parallelism,
+    wait_for_process,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Longest a single FRED run, and a FRED config check, may take
+SIMULATION_TIMEOUT_SECONDS = 3600
+VALIDATION_TIMEOUT_SECONDS = 60
+
 
 class SimulationWorkflow:
     """
@@ -34,9 +56,14 @@ class SimulationWorkflow:
     1. Download job uploads from S3
     2. Extract archives
     3. Prepare FRED configurations
-    4. Validate configurations
-    5. Run simulations
-    6. Collect outputs
+    4. Warm the population data cache (optional)
+    5. Validate configurations
+    6. Run simulations (several at once)
+    7. Convert outputs to Parquet (optional)
+    8. Upload results
+
+    Steps 5-8 run per run as a pipeline, so one run can be uploading
+    while others are still validating or executing.
 
     Examples
     --------
@@ -59,10 +86,43 @@ class SimulationWorkflow:
         self.workspace_dir = config.workspace_dir
         self.job_id = config.job_id
         self.run_id = config.run_id
+        self._platform_client: PlatformClient | None = None
+        self._platform_client_resolved = False
+        self._platform_client_lock = threading.Lock()
+
+    def _get_platform_client(self) -> PlatformClient | None:
+        """
+        Get the in-process platform client, built once per workflow.
+
+        Returns
+        -------
+        PlatformClient | None
+            The client, or None to use epistemix-cli subprocesses (transfer_mode
+            "subprocess", or "auto" when epistemix_platform is not importable)
+
+        Raises
+        ------
+        ConfigurationError
+            If transfer_mode is "in-process" and the client cannot be built
+        """
+        with self._platform_client_lock:
+            if not self._platform_client_resolved:
+                self._platform_client_resolved = True
+                if self.config.transfer_mode != SUBPROCESS:
+                    try:
+                        self._platform_client = PlatformClient.from_environment()
+                    except ConfigurationError as e:
+                        if self.config.transfer_mode == IN_PROCESS:
+                            raise
+                        logger.info(
+                            "Using epistemix-cli for transfers",
+                            extra={"job_id": self.job_id, "reason": str(e)},
+                        )
+            return self._platform_client
 
     def download_uploads(self) -> Path:
         """
-        Download job uploads using epistemix-cli.
+        Download job uploads, in-process or using epistemix-cli (see transfer_mode).
 
         Returns
         -------
@@ -82,6 +142,10 @@ class SimulationWorkflow:
         # Create workspace directory
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
 
+        platform_client = self._get_platform_client()
+        if platform_client is not None:
+            return self._download_in_process(platform_client)
+
         # Build epistemix-cli command
         cmd = [
             "epistemix-cli",
@@ -131,11 +195,35 @@ class SimulationWorkflow:
             raise DownloadError(f"Download timed out after 5 minutes for job {self.job_id}") from e
         except subprocess.CalledProcessError as e:
             raise DownloadError(
-                f"Failed to download uploads for job {self.job_id}: " f"{e.stderr}"
+                f"Failed to download uploads for job {self.job_id}: {e.stderr}"
             ) from e
         except Exception as e:
             raise DownloadError(f"Unexpected error downloading job {self.job_id}: {e}") from e
 
+    def _download_in_process(self, platform_client: PlatformClient) -> Path:
+        """Download job uploads with the in-process platform client."""
+        try:
+            outcome = platform_client.download_uploads(self.job_id, self.workspace_dir)
+        except DownloadError:
+            raise
+        except Exception as e:
+            raise DownloadError(f"Unexpected error downloading job {self.job_id}: {e}") from e
+
+        logger.info(
+            "Download completed",
+            extra={
+                "job_id": self.job_id,
+                "downloaded": len(outcome["downloaded"]),
+                "unchanged": len(outcome["unchanged"]),
+                "errors": outcome["errors"],
+            },
+        )
+
+        if not any(self.workspace_dir.iterdir()):
+            raise DownloadError(f"No files downloaded for job {self.job_id}")
+
+        return self.workspace_dir
+
     def extract_archives(self) -> Path:
         """
         Extract job_input.zip if present.
@@ -190,7 +278,9 @@ class SimulationWorkflow:
         Returns
         -------
         list[dict]
-            List of dicts with 'run_id', 'config_path', 'run_number' for each run
+            List of dicts with 'run_id', 'config_path', 'run_number', 'sim_days'
+            (None if the run has no end date), 'population_version' and
+            'locations' for each run
 
         Raises
         ------
@@ -238,12 +328,16 @@ class SimulationWorkflow:
                 builder.build(prepared_fred)
 
                 run_number = builder.get_run_number()
+                population_version, locations = builder.get_population()
 
                 prepared_runs.append(
                     {
                         "run_id": run_id,
                         "config_path": prepared_fred,
                         "run_number": run_number,
+                        "sim_days": builder.get_sim_days(),
+                        "population_version": population_version,
+                        "locations": locations,
                     }
                 )
 
@@ -261,6 +355,56 @@ class SimulationWorkflow:
 
         return prepared_runs
 
+    def warm_population_cache(self, prepared_runs: list[dict]) -> WarmResult | None:
+        """
+        Make the population data of every run's locations available to FRED.
+
+        Files missing from FRED_HOME/data are placed from the host's
+        population cache, which fetches them from S3 the first time any
+        job on the instance needs them.
+
+        Parameters
+        ----------
+        prepared_runs : list[dict]
+            List of prepared run configurations with population_version and locations
+
+        Returns
+        -------
+        WarmResult | None
+            What the cache did, or None if it is disabled or no run names a
+            population version
+
+        Raises
+        ------
+        PopulationCacheError
+            If population data cannot be fetched or verified
+        """
+        if self.config.population_cache_dir is None:
+            return None
+
+        populations = [
+            (run_info["population_version"], location)
+            for run_info in prepared_runs
+            if run_info.get("population_version")
+            for location in run_info.get("locations", [])
+        ]
+        if not populations:
+            logger.info(
+                "No population version in run configs, using image data",
+                extra={"job_id": self.job_id},
+            )
+            return None
+
+        cache = PopulationCache(
+            cache_dir=self.config.population_cache_dir,
+            data_dir=self.config.fred_home / "data",
+            s3_bucket=self.config.population_cache_bucket,
+            prefix=self.config.population_cache_prefix,
+            max_bytes=int(self.config.population_cache_max_gb * 1024**3),
+            aws_region=self.config.aws_region,
+        )
+        return cache.warm(populations)
+
     def validate_configs(self, prepared_runs: list[dict]) -> list[dict]:
         """
         Validate FRED configurations.
@@ -280,8 +424,6 @@ class SimulationWorkflow:
         ValidationError
             If any validation fails
         """
-        fred_binary = self.config.get_fred_binary()
-
         logger.info(
             "Validating configs",
             extra={
@@ -291,67 +433,86 @@ class SimulationWorkflow:
         )
 
         for run_info in prepared_runs:
-            run_id = run_info["run_id"]
-            config_path = run_info["config_path"]
+            self._validate_config(run_info)
 
-            validation_log = self.workspace_dir / f"run_{run_id}_validation.log"
+        return prepared_runs
 
-            cmd = [
-                str(fred_binary),
-                "-p",
-                str(config_path),
-                "-c",  # Check/validate flag
-            ]
+    def _validate_config(self, run_info: dict, stop_event: threading.Event | None = None) -> dict:
+        """
+        Validate one run's FRED configuration, streaming FRED's output to its log.
 
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=60,
-                    env={"FRED_HOME": str(self.config.fred_home)},
-                )
+        Parameters
+        ----------
+        run_info : dict
+            Prepared run configuration; 'validation_log' is added
+        stop_event : threading.Event | None
+            Set to stop the validation early
 
-                # Write validation log
-                with open(validation_log, "w") as f:
-                    f.write(result.stdout)
-                    if result.stderr:
-                        f.write("\n\n=== STDERR ===\n")
-                        f.write(result.stderr)
+        Returns
+        -------
+        dict
+            run_info
 
-                run_info["validation_log"] = validation_log
+        Raises
+        ------
+        RunCancelledError
+            If stop_event was set before FRED exited
+        ValidationError
+            If FRED rejects the configuration, cannot be started or times out
+        """
+        fred_binary = self.config.get_fred_binary()
+        run_id = run_info["run_id"]
+        config_path = run_info["config_path"]
 
-                logger.info(
-                    "Validation passed",
-                    extra={
-                        "job_id": self.job_id,
-                        "run_id": run_id,
-                        "log": str(validation_log),
-                    },
-                )
+        validation_log = self.workspace_dir / f"run_{run_id}_validation.log"
 
-            except subprocess.CalledProcessError as e:
-                # Write error log
-                with open(validation_log, "w") as f:
-                    f.write("VALIDATION FAILED\n\n")
-                    f.write(e.stdout)
-                    if e.stderr:
-                        f.write("\n\n=== STDERR ===\n")
-                        f.write(e.stderr)
+        cmd = [
+            str(fred_binary),
+            "-p",
+            str(config_path),
+            "-c",  # Check/validate flag
+        ]
 
+        with open(validation_log, "w") as log_file:
+            try:
+                returncode, output = self._stream_fred(
+                    cmd, log_file, stop_event or threading.Event(), VALIDATION_TIMEOUT_SECONDS
+                )
+            except OSError as e:
                 raise ValidationError(
-                    f"FRED validation failed for run {run_id}. "
-                    f"See {validation_log} for details."
+                    f"Failed to start FRED validation for run {run_id}: {e}"
                 ) from e
             except subprocess.TimeoutExpired as e:
                 raise ValidationError(f"FRED validation timed out for run {run_id}") from e
 
-        return prepared_runs
+            if returncode is None:
+                raise RunCancelledError(f"FRED validation for run {run_id} was stopped")
+            if returncode != 0:
+                log_file.write(f"\n\nVALIDATION FAILED (exit code {returncode})\n")
+                raise ValidationError(
+                    f"FRED validation failed for run {run_id}. See {validation_log} for details. "
+                    f"Last output:\n{output.tail()}"
+                )
+
+        run_info["validation_log"] = validation_log
+
+        logger.info(
+            "Validation passed",
+            extra={
+                "job_id": self.job_id,
+                "run_id": run_id,
+                "log": str(validation_log),
+            },
+        )
+
+        return run_info
 
     def run_simulations(self, prepared_runs: list[dict]) -> list[dict]:
         """
-        Execute FRED simulations.
+        Execute FRED simulations, several at once.
+
+        Parallelism is sized from the CPUs and memory available (see
+        plan_parallelism) and the configured failure policy applies.
 
         Parameters
         ----------
@@ -368,8 +529,6 @@ class SimulationWorkflow:
         SimulationError
             If any simulation fails
         """
-        fred_binary = self.config.get_fred_binary()
-
         logger.info(
             "Running simulations",
             extra={
@@ -377,93 +536,322 @@ class SimulationWorkflow:
                 "run_count": len(prepared_runs),
             },
         )
+        return self._schedule(prepared_runs, self._run_simulation)
 
-        for run_info in prepared_runs:
-            run_id = run_info["run_id"]
-            config_path = run_info["config_path"]
-            run_number = run_info["run_number"]
+    def run_pipeline(self, prepared_runs: list[dict]) -> list[dict]:
+        """
+        Validate, simulate, package and upload each run on its own.
 
-            output_dir = self.workspace_dir / "OUT" / f"run_{run_id}"
-            output_dir.mkdir(parents=True, exist_ok=True)
+        Runs move through the stages independently, connected by bounded
+        queues: while some runs are executing FRED, finished ones are
+        converted to Parquet (when columnar_results is enabled) and uploaded,
+        and the next ones are validated. Simulation parallelism is sized
+        from the CPUs and memory available (see plan_parallelism), uploads
+        use upload_concurrency workers, and the configured failure policy
+        applies to every stage.
 
-            simulation_log = self.workspace_dir / f"run_{run_id}_simulation.log"
+        Parameters
+        ----------
+        prepared_runs : list[dict]
+            List of prepared run configurations
 
-            cmd = [
-                str(fred_binary),
-                "-p",
-                str(config_path),
-                "-r",
-                str(run_number),
-                "-d",
-                str(output_dir),
-            ]
+        Returns
+        -------
+        list[dict]
+            Input list with 'validation_log', 'output_dir', 'simulation_log'
+            and 'results_uploaded' added
 
-            logger.info(
-                "Starting simulation",
+        Raises
+        ------
+        ValidationError
+            If the validation of a run fails
+        SimulationError
+            If a simulation fails (or several runs fail)
+        UploadError
+            If the upload of a run fails
+        """
+        parallel_runs = plan_parallelism(
+            len(prepared_runs),
+            max_parallel_runs=self.config.max_parallel_runs,
+            run_memory_mb=self.config.run_memory_mb,
+        )
+
+        def validate(run_info: dict, stop_event: threading.Event) -> dict:
+            return self._validate_config(run_info, stop_event)
+
+        def package(run_info: dict, _stop_event: threading.Event) -> dict:
+            self.convert_results([run_info])
+            return run_info
+
+        def upload(run_info: dict, _stop_event: threading.Event) -> dict:
+            self.upload_results([run_info])
+            return run_info
+
+        stages = [
+            Stage("validate", validate),
+            Stage("simulate", self._run_simulation, workers=parallel_runs),
+        ]
+        if self.config.columnar_results:
+            stages.append(Stage("package", package))
+        stages.append(Stage("upload", upload, workers=self.config.upload_concurrency))
+
+        logger.info(
+            "Starting run pipeline",
+            extra={
+                "job_id": self.job_id,
+                "run_count": len(prepared_runs),
+                "stages": [stage.name for stage in stages],
+                "parallel_runs": parallel_runs,
+                "upload_concurrency": self.config.upload_concurrency,
+                "failure_policy": self.config.failure_policy,
+            },
+        )
+
+        outcome = RunPipeline(stages, self.config.failure_policy).run(prepared_runs)
+        return self._check_outcome(prepared_runs, outcome)
+
+    def _schedule(
+        self, runs: list[dict], task: Callable[[dict, threading.Event], dict]
+    ) -> list[dict]:
+        """Run task for every run on a RunScheduler and raise if any run failed."""
+        parallel_runs = plan_parallelism(
+            len(runs),
+            max_parallel_runs=self.config.max_parallel_runs,
+            run_memory_mb=self.config.run_memory_mb,
+        )
+        logger.info(
+            "Scheduling runs",
+            extra={
+                "job_id": self.job_id,
+                "run_count": len(runs),
+                "parallel_runs": parallel_runs,
+                "failure_policy": self.config.failure_policy,
+            },
+        )
+
+        outcome = RunScheduler(parallel_runs, self.config.failure_policy).run(runs, task)
+        return self._check_outcome(runs, outcome)
+
+    def _check_outcome(self, runs: list[dict], outcome: ScheduleOutcome) -> list[dict]:
+        """Return runs if every run completed, else raise the failure(s)."""
+        if outcome.cancelled:
+            logger.warning(
+                "Runs cancelled after failure",
                 extra={
                     "job_id": self.job_id,
-                    "run_id": run_id,
-                    "run_number": run_number,
+                    "run_ids": [run_info["run_id"] for run_info in outcome.cancelled],
                 },
             )
+        if len(outcome.failed) == 1:
+            raise outcome.failed[0][1]
+        if outcome.failed:
+            details = "; ".join(f"run {run['run_id']}: {error}" for run, error in outcome.failed)
+            raise SimulationError(
+                f"{len(outcome.failed)} of {len(runs)} runs failed: {details}"
+            ) from outcome.failed[0][1]
+
+        return runs
+
+    def _run_simulation(self, run_info: dict, stop_event: threading.Event) -> dict:
+        """
+        Execute one FRED simulation, streaming its output to the run's log file.
+
+        Progress (simulated day, percent complete, days per second) is logged
+        as "Simulation progress" events while FRED runs.
 
+        Parameters
+        ----------
+        run_info : dict
+            Validated run configuration; 'output_dir', 'simulation_log' and
+            'simulated_days' are added
+        stop_event : threading.Event
+            Set to stop the simulation early
+
+        Returns
+        -------
+        dict
+            run_info
+
+        Raises
+        ------
+        RunCancelledError
+            If stop_event was set before FRED exited
+        SimulationError
+            If FRED fails, cannot be started or times out
+        """
+        fred_binary = self.config.get_fred_binary()
+        run_id = run_info["run_id"]
+        config_path = run_info["config_path"]
+        run_number = run_info["run_number"]
+
+        output_dir = self.workspace_dir / "OUT" / f"run_{run_id}"
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        simulation_log = self.workspace_dir / f"run_{run_id}_simulation.log"
+
+        cmd = [
+            str(fred_binary),
+            "-p",
+            str(config_path),
+            "-r",
+            str(run_number),
+            "-d",
+            str(output_dir),
+        ]
+
+        logger.info(
+            "Starting simulation",
+            extra={
+                "job_id": self.job_id,
+                "run_id": run_id,
+                "run_number": run_number,
+                "sim_days": run_info.get("sim_days"),
+            },
+        )
+
+        def report_progress(progress: dict) -> None:
+            logger.info(
+                "Simulation progress", extra={"job_id": self.job_id, "run_id": run_id, **progress}
+            )
+
+        with open(simulation_log, "w") as log_file:
             try:
-                result = subprocess.run(
+                returncode, output = self._stream_fred(
                     cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=3600,  # 1 hour timeout
-                    env={"FRED_HOME": str(self.config.fred_home)},
+                    log_file,
+                    stop_event,
+                    SIMULATION_TIMEOUT_SECONDS,
+                    total_days=run_info.get("sim_days"),
+                    on_progress=report_progress,
                 )
+            except OSError as e:
+                raise SimulationError(f"Failed to start FRED for run {run_id}: {e}") from e
+            except subprocess.TimeoutExpired as e:
+                raise SimulationError(
+                    f"FRED simulation timed out for run {run_id} (exceeded 1 hour)"
+                ) from e
 
-                # Write simulation log
-                with open(simulation_log, "w") as f:
-                    f.write(result.stdout)
-                    if result.stderr:
-                        f.write("\n\n=== STDERR ===\n")
-                        f.write(result.stderr)
+            if returncode is None:
+                raise RunCancelledError(f"FRED simulation for run {run_id} was stopped")
+            if returncode != 0:
+                log_file.write(f"\n\nSIMULATION FAILED (exit code {returncode})\n")
+                raise SimulationError(
+                    f"FRED simulation failed for run {run_id}. See {simulation_log} for details. "
+                    f"Last output:\n{output.tail()}"
+                )
 
-                run_info["output_dir"] = output_dir
-                run_info["simulation_log"] = simulation_log
+        run_info["output_dir"] = output_dir
+        run_info["simulation_log"] = simulation_log
+        run_info["simulated_days"] = output.progress.day
 
-                # Count output files
-                output_files = list(output_dir.rglob("*"))
-                output_count = len([f for f in output_files if f.is_file()])
+        # Count output files
+        output_files = list(output_dir.rglob("*"))
+        output_count = len([f for f in output_files if f.is_file()])
 
-                logger.info(
-                    "Simulation completed",
+        logger.info(
+            "Simulation completed",
+            extra={
+                "job_id": self.job_id,
+                "run_id": run_id,
+                "output_count": output_count,
+                "log": str(simulation_log),
+                "log_lines": output.line_count,
+                **output.progress.snapshot(),
+            },
+        )
+
+        return run_info
+
+    def _stream_fred(
+        self,
+        cmd: list[str],
+        log_file: TextIO,
+        stop_event: threading.Event,
+        timeout: float,
+        total_days: int | None = None,
+        on_progress: Callable[[dict], None] | None = None,
+    ) -> tuple[int | None, OutputStream]:
+        """
+        Run FRED, copying its stdout and stderr to log_file line by line.
+
+        Returns the exit code (None if stop_event stopped FRED) and the
+        OutputStream, whose tail holds the last lines of output. Raises
+        OSError if FRED cannot be started and subprocess.TimeoutExpired if
+        it runs longer than timeout.
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env={"FRED_HOME": str(self.config.fred_home)},
+            # Own process group, so stopping FRED also stops anything it started
+            start_new_session=True,
+        )
+        output = OutputStream(log_file, total_days=total_days, on_progress=on_progress)
+        output.start(process.stdout)
+        try:
+            returncode = wait_for_process(process, stop_event, timeout)
+        finally:
+            # The pipe closes when FRED exits or is terminated
+            output.join()
+        return returncode, output
+
+    def convert_results(self, completed_runs: list[dict]) -> list[dict]:
+        """
+        Convert each run's CSV outputs to Parquet with a byte-range manifest.
+
+        The results ZIP stays the source of truth, so a run whose outputs
+        cannot be converted is logged and uploaded without columnar results.
+
+        Parameters
+        ----------
+        completed_runs : list[dict]
+            List of completed run configurations with output_dir
+
+        Returns
+        -------
+        list[dict]
+            Input list with 'columnar_dir' added to each converted run
+        """
+        for run_info in completed_runs:
+            run_id = run_info["run_id"]
+            output_dir = run_info.get("output_dir")
+            if not output_dir:
+                continue
+
+            # Outside output_dir, so the results ZIP layout is unchanged
+            columnar_dir = self.workspace_dir / "COLUMNAR" / f"run_{run_id}"
+
+            try:
+                manifest = convert_results_to_parquet(output_dir, columnar_dir)
+            except ConversionError as e:
+                logger.warning(
+                    "Skipping columnar results",
                     extra={
                         "job_id": self.job_id,
                         "run_id": run_id,
-                        "output_count": output_count,
-                        "log": str(simulation_log),
+                        "error": str(e),
                     },
                 )
+                continue
 
-            except subprocess.CalledProcessError as e:
-                # Write error log
-                with open(simulation_log, "w") as f:
-                    f.write("SIMULATION FAILED\n\n")
-                    f.write(e.stdout)
-                    if e.stderr:
-                        f.write("\n\n=== STDERR ===\n")
-                        f.write(e.stderr)
+            run_info["columnar_dir"] = columnar_dir
 
-                raise SimulationError(
-                    f"FRED simulation failed for run {run_id}. "
-                    f"See {simulation_log} for details."
-                ) from e
-            except subprocess.TimeoutExpired as e:
-                raise SimulationError(
-                    f"FRED simulation timed out for run {run_id} " f"(exceeded 1 hour)"
-                ) from e
+            logger.info(
+                "Converted outputs to Parquet",
+                extra={
+                    "job_id": self.job_id,
+                    "run_id": run_id,
+                    "table_count": len(manifest["tables"]),
+                    "columnar_dir": str(columnar_dir),
+                },
+            )
 
-        return prepared_runs
+        return completed_runs
 
     def upload_results(self, completed_runs: list[dict]) -> list[dict]:
         """
-        Upload simulation results to S3 using epistemix-cli.
+        Upload simulation results to S3, in-process or using epistemix-cli.
 
         Parameters
         ----------
@@ -488,6 +876,8 @@ class SimulationWorkflow:
             },
         )
 
+        platform_client = self._get_platform_client()
+
         for run_info in completed_runs:
             run_id = run_info["run_id"]
             output_dir = run_info.get("output_dir")
@@ -513,6 +903,21 @@ class SimulationWorkflow:
                 },
             )
 
+            if platform_client is not None:
+                results_url = platform_client.upload_results(
+                    self.job_id, run_id, output_dir, run_info.get("columnar_dir")
+                )
+                logger.info(
+                    "Upload completed",
+                    extra={
+                        "job_id": self.job_id,
+                        "run_id": run_id,
+                        "results_url": results_url.split("?")[0],
+                    },
+                )
+                run_info["results_uploaded"] = True
+                continue
+
             # Build epistemix-cli upload command
             cmd = [
                 "epistemix-cli",
@@ -526,6 +931,8 @@ class SimulationWorkflow:
                 "--results-dir",
                 str(output_dir),
             ]
+            if run_info.get("columnar_dir"):
+                cmd.extend(["--columnar-dir", str(run_info["columnar_dir"])])
 
             try:
                 result = subprocess.run(
@@ -571,12 +978,16 @@ class SimulationWorkflow:
         """
         Execute complete simulation workflow.
 
-        This method runs all stages in sequence:
+        This method downloads and prepares the job, then streams each run
+        through its own stages (see run_pipeline):
         1. Download uploads
         2. Extract archives
         3. Prepare configs
-        4. Validate configs
-        5. Run simulations
+        4. Warm the population data cache (when population_cache_dir is set)
+        5. Validate each run's config
+        6. Run its simulation (several runs at once)
+        7. Convert its outputs to Parquet (when columnar_results is enabled)
+        8. Upload its results
 
         Returns
         -------
@@ -613,9 +1024,8 @@ class SimulationWorkflow:
             self.download_uploads()
             self.extract_archives()
             prepared_runs = self.prepare_configs()
-            validated_runs = self.validate_configs(prepared_runs)
-            completed_runs = self.run_simulations(validated_runs)
-            uploaded_runs = self.upload_results(completed_runs)
+            self.warm_population_cache(prepared_runs)
+            uploaded_runs = self.run_pipeline(prepared_runs)
 
             logger.info(
                 "Workflow completed",
@@ -632,6 +1042,7 @@ class SimulationWorkflow:
             DownloadError,
             ExtractionError,
             FREDConfigError,
+            PopulationCacheError,
             ValidationError,
             SimulationError,
             UploadError,
@@ -644,3 +1055,6 @@ class SimulationWorkflow:
                 },
             )
             raise WorkflowError(f"Simulation workflow failed: {e}") from e
+        finally:
+            if self._platform_client is not None:
+                self._platform_client.close()
@@ -0,0 +1,69 @@
+"""
+Tests for AWS Batch array-job manifest resolution.
+"""
+
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from simulation_runner.array_manifest import (
+    get_array_index,
+    load_manifest,
+    resolve_array_run_id,
+)
+from simulation_runner.exceptions import ConfigurationError
+
+
+class TestGetArrayIndex:
+    def test_reads_index_from_environment(self, monkeypatch):
+        monkeypatch.setenv("AWS_BATCH_JOB_ARRAY_INDEX", "3")
+
+        assert get_array_index() == 3
+
+    def test_raises_when_not_in_array_job(self, monkeypatch):
+        monkeypatch.delenv("AWS_BATCH_JOB_ARRAY_INDEX", raising=False)
+
+        with pytest.raises(ConfigurationError, match="AWS_BATCH_JOB_ARRAY_INDEX"):
+            get_array_index()
+
+
+class TestLoadManifest:
+    def test_downloads_and_parses_manifest(self):
+        s3_client = MagicMock()
+        s3_client.get_object.return_value = {
+            "Body": io.BytesIO(json.dumps({"jobId": 12, "runIds": [4, 5]}).encode())
+        }
+
+        manifest = load_manifest("jobs/12/manifest.json", "bucket", "us-east-1", s3_client)
+
+        assert manifest == {"jobId": 12, "runIds": [4, 5]}
+        s3_client.get_object.assert_called_once_with(Bucket="bucket", Key="jobs/12/manifest.json")
+
+    def test_raises_configuration_error_when_download_fails(self):
+        s3_client = MagicMock()
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey"}}, "GetObject"
+        )
+
+        with pytest.raises(ConfigurationError, match="Failed to read array manifest"):
+            load_manifest("missing.json", "bucket", "us-east-1", s3_client)
+
+    def test_raises_configuration_error_without_bucket(self):
+        with pytest.raises(ConfigurationError, match="EPISTEMIX_S3_BUCKET"):
+            load_manifest("jobs/12/manifest.json", "", "us-east-1", MagicMock())
+
+
+class TestResolveArrayRunId:
+    def test_maps_index_to_run_id(self):
+        assert resolve_array_run_id(12, {"jobId": 12, "runIds": [4, 5, 6]}, 2) == 6
+
+    def test_rejects_manifest_for_another_job(self):
+        with pytest.raises(ConfigurationError, match="not job 12"):
+            resolve_array_run_id(12, {"jobId": 13, "runIds": [4, 5]}, 0)
+
+    def test_rejects_out_of_range_index(self):
+        with pytest.raises(ConfigurationError, match="out of range"):
+            resolve_array_run_id(12, {"jobId": 12, "runIds": [4, 5]}, 2)
@@ -0,0 +1,123 @@
+"""
+Tests for Parquet conversion of FRED outputs.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pyarrow.parquet as pq
+import pytest
+
+from simulation_runner.columnar import MANIFEST_NAME, convert_results_to_parquet
+from simulation_runner.config import SimulationConfig
+from simulation_runner.exceptions import ConversionError
+from simulation_runner.workflow import SimulationWorkflow
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    """FRED output directory with two runs of per-day CSVs."""
+    output_dir = tmp_path / "OUT" / "run_4"
+    for run_name, scale in (("RUN1", 1), ("RUN2", 2)):
+        run_dir = output_dir / run_name
+        run_dir.mkdir(parents=True)
+        (run_dir / "out.csv").write_text(
+            "Day,N,Influenza.newExposed\n"
+            + "".join(f"{day},{1000 * scale},{day * scale}\n" for day in range(100))
+        )
+        (run_dir / "health_records.txt").write_text("not tabular")
+    return output_dir
+
+
+class TestConvertResultsToParquet:
+    def test_writes_parquet_and_manifest_per_run(self, output_dir, tmp_path):
+        columnar_dir = tmp_path / "COLUMNAR" / "run_4"
+
+        manifest = convert_results_to_parquet(output_dir, columnar_dir, row_group_days=30)
+
+        assert json.loads((columnar_dir / MANIFEST_NAME).read_text()) == manifest
+        assert sorted(manifest["tables"]) == ["RUN1/out", "RUN2/out"]
+
+        table = manifest["tables"]["RUN2/out"]
+        assert table["path"] == "RUN2/out.parquet"
+        assert table["rows"] == 100
+        assert table["day_column"] == "Day"
+        assert [column["name"] for column in table["columns"]] == [
+            "Day",
+            "N",
+            "Influenza.newExposed",
+        ]
+        assert [(group["day_min"], group["day_max"]) for group in table["row_groups"]] == [
+            (0, 29),
+            (30, 59),
+            (60, 89),
+            (90, 99),
+        ]
+        assert pq.read_table(columnar_dir / table["path"])["N"].to_pylist() == [2000] * 100
+
+    def test_manifest_byte_ranges_cover_column_chunks_and_footer(self, output_dir, tmp_path):
+        columnar_dir = tmp_path / "COLUMNAR" / "run_4"
+
+        table = convert_results_to_parquet(output_dir, columnar_dir)["tables"]["RUN1/out"]
+
+        data = (columnar_dir / table["path"]).read_bytes()
+        assert table["size"] == len(data)
+        footer = table["footer"]
+        assert footer["offset"] + footer["length"] == len(data)
+        assert data[-4:] == b"PAR1"
+
+        metadata = pq.ParquetFile(columnar_dir / table["path"]).metadata
+        for index, group in enumerate(table["row_groups"]):
+            for column_index, name in enumerate(["Day", "N", "Influenza.newExposed"]):
+                chunk = metadata.row_group(index).column(column_index)
+                byte_range = group["columns"][name]
+                assert byte_range["length"] == chunk.total_compressed_size
+                assert byte_range["offset"] + byte_range["length"] <= footer["offset"]
+
+    def test_single_run_directory(self, output_dir, tmp_path):
+        manifest = convert_results_to_parquet(output_dir / "RUN1", tmp_path / "columnar")
+
+        assert list(manifest["tables"]) == ["RUN1/out"]
+
+    def test_raises_when_no_csv_outputs(self, tmp_path):
+        (tmp_path / "RUN1").mkdir()
+
+        with pytest.raises(ConversionError, match="No CSV outputs"):
+            convert_results_to_parquet(tmp_path, tmp_path / "columnar")
+
+    def test_raises_on_malformed_csv(self, tmp_path):
+        run_dir = tmp_path / "RUN1"
+        run_dir.mkdir()
+        (run_dir / "out.csv").write_text("Day,N\n1,2\n3,4,5\n")
+
+        with pytest.raises(ConversionError, match="out.csv"):
+            convert_results_to_parquet(tmp_path, tmp_path / "columnar")
+
+
+class TestWorkflowConvertResults:
+    @pytest.fixture
+    def workflow(self, tmp_path):
+        config = MagicMock(spec=SimulationConfig)
+        config.job_id = 12
+        config.run_id = None
+        config.workspace_dir = tmp_path
+        return SimulationWorkflow(config)
+
+    def test_adds_columnar_dir_outside_results_dir(self, workflow, output_dir, tmp_path):
+        runs = [{"run_id": 4, "output_dir": output_dir}]
+
+        workflow.convert_results(runs)
+
+        assert runs[0]["columnar_dir"] == tmp_path / "COLUMNAR" / "run_4"
+        assert (tmp_path / "COLUMNAR" / "run_4" / MANIFEST_NAME).exists()
+        assert not list(output_dir.rglob("*.parquet"))
+
+    def test_conversion_failure_leaves_run_without_columnar_dir(self, workflow, tmp_path):
+        empty_output = tmp_path / "OUT" / "run_5"
+        (empty_output / "RUN1").mkdir(parents=True)
+        runs = [{"run_id": 5, "output_dir": empty_output}, {"run_id": 6}]
+
+        workflow.convert_results(runs)
+
+        assert "columnar_dir" not in runs[0]
+        assert "columnar_dir" not in runs[1]
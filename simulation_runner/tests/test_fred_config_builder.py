@@ -99,6 +99,12 @@ class TestFREDConfigBuilder:
         assert builder._locations == ["Allegheny_County_PA"]
         assert builder._seed == 12345
 
+    def test_builder_get_population_from_run_config(self, sample_run_config, sample_fred_file):
+        """Test reading the synthetic population version and locations."""
+        builder = FREDConfigBuilder.from_run_config(sample_run_config, sample_fred_file)
+
+        assert builder.get_population() == ("US_2010.v5", ["Allegheny_County_PA"])
+
     def test_builder_from_run_config_missing_file(self, tmp_path, sample_fred_file):
         """Test error when run config file is missing."""
         nonexistent = tmp_path / "missing.json"
@@ -124,6 +130,20 @@ class TestFREDConfigBuilder:
         run_number = builder.get_run_number()
         assert run_number == 1
 
+    def test_builder_get_sim_days(self, sample_fred_file):
+        """Test counting simulated days, both ends inclusive."""
+        builder = FREDConfigBuilder(sample_fred_file)
+        builder.with_dates("2020-01-01", "2020-03-31")
+
+        assert builder.get_sim_days() == 91
+
+    def test_builder_get_sim_days_without_end_date(self, sample_fred_file):
+        """Test that the day count is unknown without an end date."""
+        builder = FREDConfigBuilder(sample_fred_file)
+        builder.with_dates("2020-01-01")
+
+        assert builder.get_sim_days() is None
+
     def test_builder_fluent_api_chain(self, sample_fred_file, tmp_path):
         """Test that builder methods can be chained."""
         output = tmp_path / "output.fred"
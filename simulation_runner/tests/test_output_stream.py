@@ -0,0 +1,107 @@
+"""
+Unit tests for streaming FRED output to log files.
+"""
+
+import io
+
+import pytest
+
+from simulation_runner.output_stream import DayProgress, OutputStream, parse_day
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize(
+    "line, day",
+    [
+        ("day 12 finished\n", 12),
+        ("Day = 3\n", 3),
+        ("  day: 40 report took 0.1 seconds\n", 40),
+        ("Reading population\n", None),
+        ("today 5\n", None),
+    ],
+)
+def test_parse_day(line, day):
+    assert parse_day(line) == day
+
+
+class TestDayProgress:
+    def test_percent_throughput_and_eta(self):
+        clock = FakeClock()
+        progress = DayProgress(total_days=100, clock=clock)
+
+        progress.update(0)
+        clock.now += 10
+        progress.update(19)
+
+        snapshot = progress.snapshot()
+        assert snapshot["day"] == 19
+        assert snapshot["percent"] == 20.0
+        assert snapshot["days_per_second"] == 1.9
+        assert snapshot["eta_seconds"] == pytest.approx(80 / 1.9, abs=0.1)
+
+    def test_unknown_total_days(self):
+        progress = DayProgress()
+        progress.update(5)
+
+        snapshot = progress.snapshot()
+        assert snapshot["percent"] is None
+        assert snapshot["eta_seconds"] is None
+
+
+class TestOutputStream:
+    def test_copies_every_line_and_keeps_only_the_tail(self):
+        lines = b"".join(f"line {n}\n".encode() for n in range(1000))
+        log_file = io.StringIO()
+        output = OutputStream(log_file, tail_lines=3)
+
+        output.pump(io.BytesIO(lines))
+
+        assert log_file.getvalue().count("\n") == 1000
+        assert output.line_count == 1000
+        assert output.tail() == "line 997\nline 998\nline 999"
+        assert output.tail(1) == "line 999"
+
+    def test_invalid_utf8_is_replaced(self):
+        log_file = io.StringIO()
+        output = OutputStream(log_file)
+
+        output.pump(io.BytesIO(b"bad \xff byte\nok\n"))
+
+        assert log_file.getvalue() == "bad � byte\nok\n"
+
+    def test_reports_progress_while_running_and_at_the_end(self):
+        reports = []
+        output = OutputStream(
+            io.StringIO(), total_days=10, on_progress=reports.append, progress_interval=0
+        )
+
+        output.pump(io.BytesIO(b"setup\nday 0\nday 1\nday 1 report\nday 9\n"))
+
+        assert [report["day"] for report in reports] == [0, 1, 9]
+        assert reports[-1]["percent"] == 100.0
+
+    def test_no_day_counter__no_progress(self):
+        reports = []
+        output = OutputStream(io.StringIO(), on_progress=reports.append, progress_interval=0)
+
+        output.pump(io.BytesIO(b"no counter here\n"))
+
+        assert reports == []
+        assert output.progress.day is None
+
+    def test_start_and_join_pump_on_a_thread(self):
+        log_file = io.StringIO()
+        output = OutputStream(log_file)
+
+        output.start(io.BytesIO(b"day 0\nday 1\n"))
+        output.join(timeout=5)
+
+        assert output.progress.day == 1
+        assert log_file.getvalue() == "day 0\nday 1\n"
@@ -0,0 +1,126 @@
+"""
+Unit tests for the streaming per-run pipeline.
+"""
+
+import threading
+import time
+
+import pytest
+
+from simulation_runner.exceptions import RunCancelledError, SimulationError, UploadError
+from simulation_runner.pipeline import RunPipeline, Stage
+from simulation_runner.scheduler import CONTINUE, FAIL_FAST
+
+
+def _record(name, events, lock, delay=0.0):
+    def task(run_info, _stop_event):
+        with lock:
+            events.append((name, run_info["run_id"], "start"))
+        time.sleep(delay)
+        with lock:
+            events.append((name, run_info["run_id"], "end"))
+        run_info.setdefault("stages", []).append(name)
+        return run_info
+
+    return task
+
+
+class TestRunPipeline:
+    def test_every_run_goes_through_every_stage_in_order(self):
+        events, lock = [], threading.Lock()
+        stages = [
+            Stage("validate", _record("validate", events, lock)),
+            Stage("simulate", _record("simulate", events, lock), workers=3),
+            Stage("upload", _record("upload", events, lock), workers=2),
+        ]
+        runs = [{"run_id": run_id} for run_id in range(1, 7)]
+
+        outcome = RunPipeline(stages).run(runs)
+
+        assert sorted(run["run_id"] for run in outcome.completed) == [1, 2, 3, 4, 5, 6]
+        assert all(run["stages"] == ["validate", "simulate", "upload"] for run in runs)
+        assert outcome.failed == []
+        assert outcome.cancelled == []
+
+    def test_stages_overlap_across_runs(self):
+        events, lock = [], threading.Lock()
+        stages = [
+            Stage("simulate", _record("simulate", events, lock, delay=0.1)),
+            Stage("upload", _record("upload", events, lock, delay=0.1)),
+        ]
+        runs = [{"run_id": run_id} for run_id in range(1, 4)]
+
+        RunPipeline(stages).run(runs)
+
+        # Run 2 simulated while run 1 uploaded
+        assert events.index(("simulate", 2, "start")) < events.index(("upload", 1, "end"))
+
+    def test_bounded_queue__slow_stage_holds_back_earlier_stages(self):
+        simulated = []
+        release = threading.Event()
+
+        def simulate(run_info, _stop_event):
+            simulated.append(run_info["run_id"])
+            return run_info
+
+        def upload(run_info, _stop_event):
+            release.wait(timeout=5)
+            return run_info
+
+        stages = [Stage("simulate", simulate), Stage("upload", upload, queue_size=1)]
+        runs = [{"run_id": run_id} for run_id in range(1, 11)]
+        thread = threading.Thread(target=lambda: RunPipeline(stages).run(runs))
+        thread.start()
+        time.sleep(0.2)
+
+        # One run uploading, one waiting for upload, one waiting to be handed over
+        assert len(simulated) <= 3
+        release.set()
+        thread.join(timeout=5)
+        assert len(simulated) == 10
+
+    def test_fail_fast__cancels_runs_waiting_in_any_stage(self):
+        def simulate(run_info, stop_event):
+            if run_info["run_id"] == 1:
+                raise SimulationError("run 1 failed")
+            if not stop_event.wait(timeout=5):
+                return run_info
+            raise RunCancelledError(f"run {run_info['run_id']} stopped")
+
+        uploaded = []
+        stages = [
+            Stage("simulate", simulate, workers=2),
+            Stage("upload", lambda run_info, _: uploaded.append(run_info) or run_info),
+        ]
+        runs = [{"run_id": run_id} for run_id in range(1, 6)]
+
+        outcome = RunPipeline(stages, failure_policy=FAIL_FAST).run(runs)
+
+        assert [(run["run_id"], str(error)) for run, error in outcome.failed] == [
+            (1, "run 1 failed")
+        ]
+        assert sorted(run["run_id"] for run in outcome.cancelled) == [2, 3, 4, 5]
+        assert outcome.completed == []
+        assert uploaded == []
+
+    def test_continue__failed_run_leaves_pipeline_and_others_finish(self):
+        def upload(run_info, _stop_event):
+            if run_info["run_id"] == 2:
+                raise UploadError("upload of run 2 failed")
+            return run_info
+
+        stages = [Stage("simulate", lambda run_info, _: run_info), Stage("upload", upload)]
+        runs = [{"run_id": run_id} for run_id in range(1, 5)]
+
+        outcome = RunPipeline(stages, failure_policy=CONTINUE).run(runs)
+
+        assert sorted(run["run_id"] for run in outcome.completed) == [1, 3, 4]
+        assert [run["run_id"] for run, _ in outcome.failed] == [2]
+
+    def test_invalid_settings_raise_value_error(self):
+        with pytest.raises(ValueError, match="at least one stage"):
+            RunPipeline([])
+        with pytest.raises(ValueError, match="worker"):
+            RunPipeline([Stage("simulate", lambda run_info, _: run_info, workers=0)])
+        with pytest.raises(ValueError, match="failure_policy"):
+            RunPipeline([Stage("simulate", lambda run_info, _: run_info)], failure_policy="retry")
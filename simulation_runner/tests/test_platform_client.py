@@ -0,0 +1,248 @@
+"""
+Unit tests for the in-process platform client and how the workflow picks it.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from simulation_runner.config import SimulationConfig
+from simulation_runner.exceptions import ConfigurationError, DownloadError, UploadError
+from simulation_runner.platform_client import PlatformClient
+from simulation_runner.workflow import SimulationWorkflow
+
+
+returns_result = pytest.importorskip("returns.result")
+Failure, Success = returns_result.Failure, returns_result.Success
+
+
+@pytest.fixture
+def session():
+    return MagicMock()
+
+
+@pytest.fixture
+def job_controller():
+    return MagicMock()
+
+
+@pytest.fixture
+def client(job_controller, session):
+    return PlatformClient(job_controller, session_factory=lambda: session)
+
+
+@pytest.fixture
+def make_workflow(temp_workspace):
+    def make(transfer_mode):
+        config = SimulationConfig(
+            job_id=12,
+            run_id=None,
+            fred_home=Path("/fred"),
+            workspace_dir=temp_workspace,
+            s3_bucket="",
+            aws_region="us-east-1",
+            database_url="sqlite://",
+            transfer_mode=transfer_mode,
+        )
+        return SimulationWorkflow(config)
+
+    return make
+
+
+def _completed_run(temp_workspace, run_id=4):
+    output_dir = temp_workspace / "OUT" / f"run_{run_id}"
+    output_dir.mkdir(parents=True)
+    return {"run_id": run_id, "output_dir": output_dir}
+
+
+class TestPlatformClient:
+    def test_download_uploads__streams_with_force(self, client, job_controller, tmp_path):
+        outcome = {"downloaded": ["a.zip"], "unchanged": [], "skipped": [], "errors": []}
+        job_controller.stream_job_uploads.return_value = Success(outcome)
+
+        assert client.download_uploads(12, tmp_path) == outcome
+        job_controller.stream_job_uploads.assert_called_once_with(
+            job_id=12, base_path=tmp_path, should_force=True
+        )
+
+    def test_download_uploads__failure_raises_download_error(self, client, job_controller):
+        job_controller.stream_job_uploads.return_value = Failure("No uploads found for job 12")
+
+        with pytest.raises(DownloadError, match="No uploads found for job 12"):
+            client.download_uploads(12, Path("/workspace/job_12"))
+
+    def test_upload_results__commits_and_returns_url(self, client, job_controller, session):
+        job_controller.upload_results_from_directory.return_value = Success(
+            "https://s3/results.zip"
+        )
+
+        url = client.upload_results(12, 4, Path("/out/run_4"), Path("/columnar/run_4"))
+
+        assert url == "https://s3/results.zip"
+        job_controller.upload_results_from_directory.assert_called_once_with(
+            job_id=12,
+            run_id=4,
+            results_dir=Path("/out/run_4"),
+            columnar_dir=Path("/columnar/run_4"),
+        )
+        session.commit.assert_called_once()
+        session.rollback.assert_not_called()
+
+    def test_upload_results__failure_rolls_back(self, client, job_controller, session):
+        job_controller.upload_results_from_directory.return_value = Failure("Run 4 not found")
+
+        with pytest.raises(UploadError, match="run 4 \\(job 12\\): Run 4 not found"):
+            client.upload_results(12, 4, Path("/out/run_4"))
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+
+    def test_upload_results__commit_error_rolls_back(self, client, job_controller, session):
+        job_controller.upload_results_from_directory.return_value = Success(
+            "https://s3/results.zip"
+        )
+        session.commit.side_effect = RuntimeError("connection lost")
+
+        with pytest.raises(UploadError, match="connection lost"):
+            client.upload_results(12, 4, Path("/out/run_4"))
+
+        session.rollback.assert_called_once()
+
+    def test_upload_results__releases_each_worker_threads_session(self, job_controller, session):
+        job_controller.upload_results_from_directory.return_value = Success(
+            "https://s3/results.zip"
+        )
+        opened, released = [], []
+
+        def session_factory():
+            opened.append(threading.get_ident())
+            return session
+
+        client = PlatformClient(
+            job_controller,
+            session_factory=session_factory,
+            remove_session=lambda: released.append(threading.get_ident()),
+        )
+        barrier = threading.Barrier(2)
+
+        def upload(run_id):
+            barrier.wait()  # keep both uploads on separate worker threads
+            return client.upload_results(12, run_id, Path(f"/out/run_{run_id}"))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(upload, [4, 5]))
+
+        assert len(set(opened)) == 2
+        assert sorted(released) == sorted(opened)
+
+    def test_upload_results__failure_still_releases_session(self, job_controller, session):
+        job_controller.upload_results_from_directory.return_value = Failure("Run 4 not found")
+        remove_session = MagicMock()
+        client = PlatformClient(
+            job_controller, session_factory=lambda: session, remove_session=remove_session
+        )
+
+        with pytest.raises(UploadError):
+            client.upload_results(12, 4, Path("/out/run_4"))
+
+        remove_session.assert_called_once()
+
+    def test_from_environment__uses_platform_config_selection(self):
+        pytest.importorskip("epistemix_platform")
+        config_class = MagicMock(ENVIRONMENT="staging")
+
+        with (
+            patch("epistemix_platform.config.get_config", return_value=config_class),
+            patch("epistemix_platform.repositories.database.get_database_manager") as get_manager,
+            patch(
+                "epistemix_platform.utils.get_default_job_controller."
+                "create_job_controller_from_config"
+            ) as create_controller,
+        ):
+            client = PlatformClient.from_environment()
+
+        get_manager.assert_called_once_with(config_class.get_database_url.return_value)
+        create_controller.assert_called_once_with(
+            config_class, get_manager.return_value.get_session
+        )
+        assert client.job_controller is create_controller.return_value
+
+
+class TestWorkflowTransferMode:
+    def test_in_process__uploads_every_run_with_one_client(
+        self, make_workflow, client, job_controller, temp_workspace
+    ):
+        workflow = make_workflow("in-process")
+        job_controller.upload_results_from_directory.return_value = Success("https://s3/r.zip?X=1")
+        runs = [_completed_run(temp_workspace, 4), _completed_run(temp_workspace, 5)]
+
+        with (
+            patch.object(PlatformClient, "from_environment", return_value=client) as factory,
+            patch("subprocess.run") as subprocess_run,
+        ):
+            workflow.upload_results(runs[:1])
+            workflow.upload_results(runs[1:])
+
+        factory.assert_called_once()
+        subprocess_run.assert_not_called()
+        assert job_controller.upload_results_from_directory.call_count == 2
+        assert all(run["results_uploaded"] for run in runs)
+
+    def test_in_process__downloads_into_workspace(
+        self, make_workflow, client, job_controller, temp_workspace
+    ):
+        workflow = make_workflow("in-process")
+
+        def stream_job_uploads(base_path, **_kwargs):
+            (base_path / "job_input.zip").write_bytes(b"zip")
+            return Success(
+                {
+                    "downloaded": [str(base_path / "job_input.zip")],
+                    "unchanged": [],
+                    "skipped": [],
+                    "errors": [],
+                }
+            )
+
+        job_controller.stream_job_uploads.side_effect = stream_job_uploads
+
+        with patch.object(PlatformClient, "from_environment", return_value=client):
+            assert workflow.download_uploads() == temp_workspace
+
+        assert (temp_workspace / "job_input.zip").exists()
+
+    def test_in_process__unavailable_platform_raises(self, make_workflow, temp_workspace):
+        workflow = make_workflow("in-process")
+        unavailable = ConfigurationError("In-process transfers need epistemix_platform")
+
+        with patch.object(PlatformClient, "from_environment", side_effect=unavailable):
+            with pytest.raises(ConfigurationError, match="epistemix_platform"):
+                workflow.upload_results([_completed_run(temp_workspace)])
+
+    def test_auto__falls_back_to_epistemix_cli(self, make_workflow, temp_workspace):
+        workflow = make_workflow("auto")
+        unavailable = ConfigurationError("In-process transfers need epistemix_platform")
+
+        with (
+            patch.object(PlatformClient, "from_environment", side_effect=unavailable),
+            patch("subprocess.run") as subprocess_run,
+        ):
+            subprocess_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+            workflow.upload_results([_completed_run(temp_workspace)])
+
+        assert subprocess_run.call_args[0][0][:4] == ["epistemix-cli", "jobs", "results", "upload"]
+
+    def test_subprocess__never_builds_the_client(self, make_workflow, temp_workspace):
+        workflow = make_workflow("subprocess")
+
+        with (
+            patch.object(PlatformClient, "from_environment") as factory,
+            patch("subprocess.run") as subprocess_run,
+        ):
+            subprocess_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+            workflow.upload_results([_completed_run(temp_workspace)])
+
+        factory.assert_not_called()
@@ -0,0 +1,212 @@
+"""
+Unit tests for the shared population data cache.
+"""
+
+import hashlib
+import io
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from simulation_runner.config import SimulationConfig
+from simulation_runner.exceptions import PopulationCacheError
+from simulation_runner.population_cache import PopulationCache
+from simulation_runner.workflow import SimulationWorkflow
+
+
+BUCKET = "populations-bucket"
+
+
+class FakeS3:
+    """Dict-backed stand-in for the S3 client's get_object."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.get_object = MagicMock(side_effect=self._get_object)
+
+    def _get_object(self, Key, **_kwargs):  # noqa: N803
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def add_location(self, version, location, files):
+        entries = []
+        for path, content in files.items():
+            sha256 = hashlib.sha256(content).hexdigest()
+            self.objects[f"populations/objects/{sha256}"] = content
+            entries.append({"path": path, "sha256": sha256, "size": len(content)})
+        self.objects[f"populations/locations/{version}/{location}.json"] = json.dumps(
+            {"files": entries}
+        ).encode()
+
+    def object_reads(self):
+        return [
+            call.kwargs["Key"]
+            for call in self.get_object.call_args_list
+            if "/objects/" in call.kwargs["Key"]
+        ]
+
+
+@pytest.fixture
+def s3():
+    fake = FakeS3()
+    fake.add_location(
+        "US_2010.v5",
+        "Allegheny_County_PA",
+        {
+            "country/usa/US_2010.v5/42/42003/people.txt": b"p_id age\n1 34\n",
+            "country/usa/US_2010.v5/42/42003/households.txt": b"hh_id\n1\n",
+        },
+    )
+    return fake
+
+
+@pytest.fixture
+def make_cache(tmp_path, s3):
+    def make(data_dir="data", max_bytes=0):
+        return PopulationCache(
+            cache_dir=tmp_path / "cache",
+            data_dir=tmp_path / data_dir if data_dir else None,
+            s3_bucket=BUCKET,
+            max_bytes=max_bytes,
+            s3_client=s3,
+        )
+
+    return make
+
+
+POPULATION = [("US_2010.v5", "Allegheny_County_PA")]
+PEOPLE = "country/usa/US_2010.v5/42/42003/people.txt"
+
+
+class TestPopulationCache:
+    """Tests for PopulationCache.warm."""
+
+    def test_fetches_and_places_files(self, make_cache, tmp_path, s3):
+        result = make_cache().warm(POPULATION)
+
+        assert (tmp_path / "data" / PEOPLE).read_bytes() == b"p_id age\n1 34\n"
+        assert result.locations == ["US_2010.v5/Allegheny_County_PA"]
+        assert result.fetched == 2
+        assert len(s3.object_reads()) == 2
+
+    def test_reuses_cache_for_another_data_dir(self, make_cache, tmp_path, s3):
+        make_cache("data").warm(POPULATION)
+        result = make_cache("other_data").warm(POPULATION)
+
+        assert (tmp_path / "other_data" / PEOPLE).exists()
+        assert result.cached == 2
+        assert result.fetched == 0
+        assert len(s3.object_reads()) == 2
+
+    def test_skips_files_already_in_data_dir(self, make_cache, tmp_path):
+        (tmp_path / "data" / PEOPLE).parent.mkdir(parents=True)
+        (tmp_path / "data" / PEOPLE).write_bytes(b"from the image")
+
+        result = make_cache().warm(POPULATION)
+
+        assert result.present == 1
+        assert result.fetched == 1
+        assert (tmp_path / "data" / PEOPLE).read_bytes() == b"from the image"
+
+    def test_cache_only_without_data_dir(self, make_cache, tmp_path):
+        result = make_cache(data_dir=None).warm(POPULATION)
+
+        assert result.fetched == 2
+        assert not (tmp_path / "data").exists()
+        assert len(list((tmp_path / "cache" / "objects").iterdir())) == 2
+
+    def test_checksum_mismatch_raises_and_leaves_nothing(self, make_cache, tmp_path, s3):
+        key = next(key for key in s3.objects if "/objects/" in key)
+        s3.objects[key] = b"corrupted"
+
+        with pytest.raises(PopulationCacheError, match="Checksum mismatch"):
+            make_cache().warm(POPULATION)
+
+        assert [path.name for path in (tmp_path / "cache" / "objects").iterdir()] == []
+
+    def test_location_without_manifest_uses_image_data(self, make_cache, tmp_path, s3):
+        image_file = tmp_path / "data" / "country/usa/US_2010.v5/06/06037/people.txt"
+        image_file.parent.mkdir(parents=True)
+        image_file.write_bytes(b"from the image")
+
+        result = make_cache().warm([("US_2010.v5", "Los_Angeles_County_CA")] + POPULATION)
+
+        assert result.unpublished == ["US_2010.v5/Los_Angeles_County_CA"]
+        assert result.locations == ["US_2010.v5/Allegheny_County_PA"]
+        assert image_file.read_bytes() == b"from the image"
+        assert len(s3.object_reads()) == 2
+
+    def test_unreadable_manifest_raises(self, make_cache, s3):
+        s3.get_object.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "GetObject")
+
+        with pytest.raises(PopulationCacheError, match="Failed to read population manifest"):
+            make_cache().warm(POPULATION)
+
+    def test_rejects_paths_outside_data_dir(self, make_cache, s3):
+        s3.add_location("US_2010.v5", "Escape", {"../outside.txt": b"x"})
+
+        with pytest.raises(PopulationCacheError, match="Invalid entry"):
+            make_cache().warm([("US_2010.v5", "Escape")])
+
+    def test_evicts_least_recently_used_files(self, make_cache, tmp_path, s3):
+        s3.add_location("US_2010.v5", "Other_County", {"other.txt": b"0123456789" * 10})
+        make_cache().warm([("US_2010.v5", "Other_County")])
+        other = next((tmp_path / "cache" / "objects").iterdir())
+        os.utime(other, (0, 0))
+
+        result = make_cache(max_bytes=50).warm(POPULATION)
+
+        assert result.evicted == 1
+        assert not other.exists()
+        # Placed files are hard links or copies, so eviction leaves them intact
+        assert (tmp_path / "data" / "other.txt").exists()
+
+
+class TestWarmPopulationCache:
+    """Tests for SimulationWorkflow.warm_population_cache."""
+
+    @pytest.fixture
+    def make_workflow(self, tmp_path, monkeypatch):
+        warm = MagicMock()
+        monkeypatch.setattr(PopulationCache, "warm", warm)
+
+        def make(cache_dir):
+            config = SimulationConfig(
+                job_id=12,
+                run_id=None,
+                fred_home=tmp_path / "fred",
+                workspace_dir=tmp_path / "workspace",
+                s3_bucket=BUCKET,
+                aws_region="us-east-1",
+                database_url="sqlite:///:memory:",
+                population_cache_dir=cache_dir,
+                population_cache_bucket=BUCKET,
+            )
+            return SimulationWorkflow(config), warm
+
+        return make
+
+    def test_warms_each_runs_locations(self, make_workflow, tmp_path):
+        workflow, warm = make_workflow(tmp_path / "cache")
+        runs = [
+            {"run_id": 1, "population_version": "US_2010.v5", "locations": ["A", "B"]},
+            {"run_id": 2, "population_version": "US_2010.v5", "locations": ["A"]},
+            {"run_id": 3, "population_version": None, "locations": ["C"]},
+        ]
+
+        workflow.warm_population_cache(runs)
+
+        warm.assert_called_once_with(
+            [("US_2010.v5", "A"), ("US_2010.v5", "B"), ("US_2010.v5", "A")]
+        )
+
+    def test_disabled_without_cache_dir(self, make_workflow):
+        workflow, warm = make_workflow(None)
+        runs = [{"run_id": 1, "population_version": "US_2010.v5", "locations": ["A"]}]
+
+        assert workflow.warm_population_cache(runs) is None
+        warm.assert_not_called()
@@ -0,0 +1,162 @@
+"""
+Unit tests for the local run scheduler.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from simulation_runner import scheduler
+from simulation_runner.exceptions import RunCancelledError, SimulationError
+from simulation_runner.scheduler import (
+    CONTINUE,
+    FAIL_FAST,
+    RunScheduler,
+    detect_cpu_count,
+    detect_memory_bytes,
+    plan_parallelism,
+    wait_for_process,
+)
+
+
+class TestPlanParallelism:
+    def test_limited_by_cpus(self):
+        assert plan_parallelism(10, cpu_count=4, memory_bytes=64 * 1024**3, run_memory_mb=2048) == 4
+
+    def test_limited_by_memory(self):
+        assert plan_parallelism(10, cpu_count=4, memory_bytes=6 * 1024**3, run_memory_mb=2048) == 3
+
+    def test_limited_by_run_count(self):
+        assert plan_parallelism(2, cpu_count=8) == 2
+
+    def test_limited_by_max_parallel_runs(self):
+        assert plan_parallelism(10, max_parallel_runs=2, cpu_count=8) == 2
+
+    def test_never_below_one(self):
+        assert (
+            plan_parallelism(10, cpu_count=4, memory_bytes=512 * 1024**2, run_memory_mb=2048) == 1
+        )
+
+
+class TestResourceDetection:
+    def test_cpu_count__cgroup_quota__caps_affinity(self, tmp_path, monkeypatch):
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+        monkeypatch.setattr(scheduler, "_CGROUP_CPU_MAX", cpu_max)
+        monkeypatch.setattr(scheduler.os, "sched_getaffinity", lambda _pid: set(range(64)))
+
+        assert detect_cpu_count() == 2
+
+    def test_cpu_count__unlimited_quota__uses_affinity(self, tmp_path, monkeypatch):
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+        monkeypatch.setattr(scheduler, "_CGROUP_CPU_MAX", cpu_max)
+        monkeypatch.setattr(scheduler.os, "sched_getaffinity", lambda _pid: {0, 1, 2})
+
+        assert detect_cpu_count() == 3
+
+    def test_memory_bytes__reads_cgroup_limit(self, tmp_path, monkeypatch):
+        memory_max = tmp_path / "memory.max"
+        memory_max.write_text("8589934592\n")
+        monkeypatch.setattr(scheduler, "_CGROUP_MEMORY_LIMITS", (memory_max,))
+
+        assert detect_memory_bytes() == 8 * 1024**3
+
+    def test_memory_bytes__unlimited_cgroup__falls_back_to_physical_memory(
+        self, tmp_path, monkeypatch
+    ):
+        memory_max = tmp_path / "memory.max"
+        memory_max.write_text("max\n")
+        monkeypatch.setattr(scheduler, "_CGROUP_MEMORY_LIMITS", (memory_max,))
+
+        assert detect_memory_bytes() > 0
+
+
+class TestRunScheduler:
+    def test_runs_tasks_concurrently_up_to_max_workers(self):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def task(run_info, _stop_event):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return run_info
+
+        runs = [{"run_id": run_id} for run_id in range(1, 9)]
+
+        outcome = RunScheduler(max_workers=3).run(runs, task)
+
+        assert len(outcome.completed) == 8
+        assert 1 < peak <= 3
+
+    def test_fail_fast__stops_running_tasks_and_skips_queued_ones(self):
+        started = []
+
+        def task(run_info, stop_event):
+            started.append(run_info["run_id"])
+            if run_info["run_id"] == 1:
+                raise SimulationError("run 1 failed")
+            if not stop_event.wait(timeout=5):
+                return run_info
+            raise RunCancelledError(f"run {run_info['run_id']} stopped")
+
+        runs = [{"run_id": run_id} for run_id in range(1, 6)]
+
+        outcome = RunScheduler(max_workers=2, failure_policy=FAIL_FAST).run(runs, task)
+
+        assert [run["run_id"] for run, _ in outcome.failed] == [1]
+        assert outcome.completed == []
+        assert len(outcome.cancelled) == 4
+        assert len(started) < 5
+
+    def test_continue__lets_other_runs_finish(self):
+        def task(run_info, _stop_event):
+            if run_info["run_id"] == 2:
+                raise SimulationError("run 2 failed")
+            return run_info
+
+        runs = [{"run_id": run_id} for run_id in range(1, 5)]
+
+        outcome = RunScheduler(max_workers=2, failure_policy=CONTINUE).run(runs, task)
+
+        assert sorted(run["run_id"] for run in outcome.completed) == [1, 3, 4]
+        assert [(run["run_id"], str(error)) for run, error in outcome.failed] == [
+            (2, "run 2 failed")
+        ]
+
+    def test_invalid_settings_raise_value_error(self):
+        with pytest.raises(ValueError, match="max_workers"):
+            RunScheduler(max_workers=0)
+        with pytest.raises(ValueError, match="failure_policy"):
+            RunScheduler(max_workers=1, failure_policy="retry")
+
+
+class TestWaitForProcess:
+    def test_returns_exit_code(self):
+        process = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+
+        assert wait_for_process(process, threading.Event(), timeout=30) == 3
+
+    def test_stop_event__terminates_process_and_returns_none(self):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        stop_event = threading.Event()
+        threading.Timer(0.1, stop_event.set).start()
+
+        assert wait_for_process(process, stop_event, timeout=30, poll_interval=0.05) is None
+        assert process.returncode is not None
+
+    def test_timeout__terminates_process_and_raises(self):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            wait_for_process(process, threading.Event(), timeout=0.2, poll_interval=0.05)
+        assert process.returncode is not None
@@ -0,0 +1,241 @@
+"""
+Unit tests for running a job's simulations concurrently in SimulationWorkflow.
+
+A shell script stands in for the FRED binary: it echoes to stdout and
+stderr, writes an output file, and fails or hangs for chosen run numbers.
+Validation (-c) fails for config paths containing "invalid".
+"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from simulation_runner.config import SimulationConfig
+from simulation_runner.exceptions import SimulationError, UploadError, ValidationError
+from simulation_runner.workflow import SimulationWorkflow
+
+
+FAKE_FRED = """#!/bin/sh
+# FRED -p CONFIG -c
+if [ "$3" = "-c" ]; then
+  case "$2" in
+    *invalid*) echo "unknown parameter" >&2; exit 1 ;;
+  esac
+  echo "config ok"
+  exit 0
+fi
+# FRED -p CONFIG -r RUN_NUMBER -d OUTPUT_DIR
+echo "FRED starting run $4"
+echo "warning from run $4" >&2
+case "$4" in
+  2) exit 7 ;;
+  6) for day in 0 1 2 3 4; do echo "day $day finished"; done ;;
+  5) sleep 1 ;;
+  9) sleep 30 ;;
+esac
+echo "day,count" > "$6/out.csv"
+echo "FRED finished run $4"
+"""
+
+
+@pytest.fixture
+def fred_home(tmp_path):
+    fred_home = tmp_path / "fred"
+    (fred_home / "bin").mkdir(parents=True)
+    fred = fred_home / "bin" / "FRED"
+    fred.write_text(FAKE_FRED)
+    fred.chmod(0o755)
+    return fred_home
+
+
+@pytest.fixture(autouse=True)
+def container_resources():
+    """A 4-vCPU, 16 GiB container, whatever the test host has."""
+    with (
+        patch("simulation_runner.scheduler.detect_cpu_count", return_value=4),
+        patch("simulation_runner.scheduler.detect_memory_bytes", return_value=16 * 1024**3),
+    ):
+        yield
+
+
+@pytest.fixture
+def make_workflow(fred_home, temp_workspace):
+    def make(**settings):
+        config = SimulationConfig(
+            job_id=12,
+            run_id=None,
+            fred_home=fred_home,
+            workspace_dir=temp_workspace,
+            s3_bucket="",
+            aws_region="us-east-1",
+            database_url="sqlite://",
+            **settings,
+        )
+        return SimulationWorkflow(config)
+
+    return make
+
+
+def _runs(*run_numbers):
+    return [
+        {"run_id": 10 + n, "config_path": Path(f"run_{10 + n}_prepared.fred"), "run_number": n}
+        for n in run_numbers
+    ]
+
+
+class TestRunSimulations:
+    def test_reports_simulated_day_progress(self, make_workflow, temp_workspace, caplog):
+        workflow = make_workflow(max_parallel_runs=1)
+        runs = _runs(6)
+        runs[0]["sim_days"] = 5
+
+        with caplog.at_level("INFO", logger="simulation_runner.workflow"):
+            completed = workflow.run_simulations(runs)
+
+        assert completed[0]["simulated_days"] == 4
+        progress = [record for record in caplog.records if record.message == "Simulation progress"]
+        assert progress[-1].day == 4
+        assert progress[-1].percent == 100.0
+        assert "day 2 finished" in (temp_workspace / "run_16_simulation.log").read_text()
+
+    def test_streams_stdout_and_stderr_to_each_run_log(self, make_workflow, temp_workspace):
+        workflow = make_workflow(max_parallel_runs=2)
+
+        completed = workflow.run_simulations(_runs(1, 3))
+
+        assert [run["run_id"] for run in completed] == [11, 13]
+        log = (temp_workspace / "run_13_simulation.log").read_text()
+        assert "FRED starting run 3" in log
+        assert "warning from run 3" in log
+        assert (temp_workspace / "OUT" / "run_13" / "out.csv").exists()
+        assert completed[0]["simulation_log"] == temp_workspace / "run_11_simulation.log"
+
+    def test_failed_run__raises_simulation_error_and_marks_log(self, make_workflow, temp_workspace):
+        workflow = make_workflow(max_parallel_runs=1)
+
+        with pytest.raises(SimulationError, match="FRED simulation failed for run 12") as exc_info:
+            workflow.run_simulations(_runs(2))
+
+        # The last lines of output are in the error, not just in the log
+        assert "Last output:\nFRED starting run 2\nwarning from run 2" in str(exc_info.value)
+
+        log = (temp_workspace / "run_12_simulation.log").read_text()
+        assert "SIMULATION FAILED (exit code 7)" in log
+
+
+class TestRunPipeline:
+    def test_uploads_each_run_as_soon_as_it_finishes(self, make_workflow, temp_workspace):
+        workflow = make_workflow(max_parallel_runs=2)
+        slow_run_finished_at_upload = {}
+
+        def upload_results(runs):
+            for run in runs:
+                slow_output = temp_workspace / "OUT" / "run_15" / "out.csv"
+                slow_run_finished_at_upload[run["run_id"]] = slow_output.exists()
+                run["results_uploaded"] = True
+            return runs
+
+        with patch.object(workflow, "upload_results", side_effect=upload_results):
+            completed = workflow.run_pipeline(_runs(5, 1, 3))
+
+        # Runs 11 and 13 were uploaded while the slow run 15 was still executing
+        assert slow_run_finished_at_upload == {11: False, 13: False, 15: True}
+        assert all(run["results_uploaded"] for run in completed)
+
+    def test_fail_fast__stops_running_simulations(self, make_workflow, temp_workspace):
+        workflow = make_workflow(max_parallel_runs=2, failure_policy="fail-fast")
+
+        with patch.object(workflow, "upload_results") as upload_results:
+            started = time.monotonic()
+            with pytest.raises(SimulationError, match="run 12"):
+                workflow.run_pipeline(_runs(9, 2))
+
+        # The hanging run 9 was terminated instead of running for 30 seconds
+        assert time.monotonic() - started < 20
+        upload_results.assert_not_called()
+        assert not (temp_workspace / "OUT" / "run_19" / "out.csv").exists()
+
+    def test_continue__uploads_other_runs_then_reports_failures(self, make_workflow):
+        workflow = make_workflow(max_parallel_runs=2, failure_policy="continue")
+        lock = threading.Lock()
+        uploaded = []
+
+        def upload_results(runs):
+            if runs[0]["run_id"] == 14:
+                raise UploadError("Failed to upload results for run 14")
+            with lock:
+                uploaded.extend(run["run_id"] for run in runs)
+            return runs
+
+        with patch.object(workflow, "upload_results", side_effect=upload_results):
+            with pytest.raises(SimulationError, match="2 of 4 runs failed") as exc_info:
+                workflow.run_pipeline(_runs(1, 2, 3, 4))
+
+        assert sorted(uploaded) == [11, 13]
+        assert "run 12: FRED simulation failed" in str(exc_info.value)
+        assert "run 14: Failed to upload results for run 14" in str(exc_info.value)
+
+    def test_columnar_results__converts_each_run_before_upload(self, make_workflow):
+        workflow = make_workflow(max_parallel_runs=1, columnar_results=True)
+        calls = []
+
+        with (
+            patch.object(
+                workflow, "convert_results", side_effect=lambda _: calls.append("convert")
+            ),
+            patch.object(workflow, "upload_results", side_effect=lambda _: calls.append("upload")),
+        ):
+            workflow.run_pipeline(_runs(1, 3))
+
+        assert calls == ["convert", "upload", "convert", "upload"]
+
+    def test_validates_each_run_before_simulating_it(self, make_workflow, temp_workspace):
+        workflow = make_workflow(max_parallel_runs=2)
+
+        with patch.object(workflow, "upload_results"):
+            completed = workflow.run_pipeline(_runs(1, 3))
+
+        assert [run["validation_log"] for run in completed] == [
+            temp_workspace / "run_11_validation.log",
+            temp_workspace / "run_13_validation.log",
+        ]
+        assert "config ok" in (temp_workspace / "run_11_validation.log").read_text()
+
+    def test_invalid_config__raises_validation_error_without_simulating(
+        self, make_workflow, temp_workspace
+    ):
+        workflow = make_workflow(max_parallel_runs=2, failure_policy="fail-fast")
+        runs = _runs(1)
+        runs[0]["config_path"] = Path("run_11_invalid.fred")
+
+        with patch.object(workflow, "upload_results") as upload_results:
+            with pytest.raises(ValidationError, match="FRED validation failed for run 11"):
+                workflow.run_pipeline(runs)
+
+        upload_results.assert_not_called()
+        assert not (temp_workspace / "run_11_simulation.log").exists()
+        assert "VALIDATION FAILED" in (temp_workspace / "run_11_validation.log").read_text()
+
+    def test_next_run_simulates_while_previous_run_uploads(self, make_workflow, temp_workspace):
+        workflow = make_workflow(max_parallel_runs=1, upload_concurrency=1)
+        seen_during_upload = {}
+
+        def upload_results(runs):
+            time.sleep(0.3)
+            if runs[0]["run_id"] == 11:
+                seen_during_upload["run_15_started"] = (
+                    temp_workspace / "run_15_simulation.log"
+                ).exists()
+                seen_during_upload["run_15_finished"] = (
+                    temp_workspace / "OUT" / "run_15" / "out.csv"
+                ).exists()
+            return runs
+
+        with patch.object(workflow, "upload_results", side_effect=upload_results):
+            workflow.run_pipeline(_runs(1, 5))
+
+        # Run 15 (one second of FRED) was executing while run 11 uploaded
+        assert seen_during_upload == {"run_15_started": True, "run_15_finished": False}
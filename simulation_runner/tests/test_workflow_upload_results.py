@@ -22,6 +22,7 @@ def mock_config():
     config.job_id = 12
     config.run_id = None
     config.workspace_dir = Path("/workspace/job_12")
+    config.transfer_mode = "subprocess"
     return config
 
 
@@ -293,3 +294,25 @@ class TestUploadResults:
             error_msg = str(exc_info.value)
             assert "epistemix-cli" in error_msg.lower()
             assert "not found" in error_msg.lower()
+
+    def test_upload_results_passes_columnar_dir_when_converted(self, workflow, completed_runs):
+        """Verify upload_results uploads Parquet outputs alongside the ZIP.
+
+        From BDD scenario: Upload columnar results for a converted run
+        """
+        # ARRANGE
+        single_run = [
+            {**completed_runs[0], "columnar_dir": Path("/workspace/job_12/COLUMNAR/run_4")}
+        ]
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="Success", stderr="")
+
+            # ACT
+            workflow.upload_results(single_run)
+
+            # ASSERT
+            assert mock_run.call_args[0][0][-2:] == [
+                "--columnar-dir",
+                str(Path("/workspace/job_12/COLUMNAR/run_4")),
+            ]